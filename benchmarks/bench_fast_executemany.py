@@ -0,0 +1,93 @@
+"""
+Benchmark insert throughput (rows/sec) with and without `fast_executemany`.
+
+Usage:
+    python benchmarks/bench_fast_executemany.py path/to/db_config.yaml [--rows 100000] [--chunk-size 5000]
+
+The config file is used as-is, once with `fast_executemany: false` and once with `fast_executemany: true`.
+A scratch table `bench_fast_executemany` is created and dropped by the script.
+"""
+
+### --- Standard library imports --- ###
+import argparse
+import os
+import tempfile
+import time
+
+### --- Third-party imports --- ###
+import numpy as np
+import pandas as pd
+import yaml
+
+### --- Internal package imports --- ###
+from SQLThunder import DBClient
+from SQLThunder.utils.config import _load_config
+
+TABLE_NAME = "bench_fast_executemany"
+
+
+def make_dataframe(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "name": [f"name_{i}" for i in range(rows)],
+            "value": np.random.rand(rows),
+        }
+    )
+
+
+def run(config_path: str, df: pd.DataFrame, chunk_size: int) -> dict[str, float]:
+    client = DBClient(config_path)
+    results = {}
+    try:
+        for label in ("insert_many", "insert_batch", "execute_many"):
+            if label == "insert_batch" and client._db_type == "sqlite":
+                continue
+            client.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+            client.execute(
+                f"CREATE TABLE {TABLE_NAME} (id INT PRIMARY KEY, name VARCHAR(64), value FLOAT)"
+            )
+            start = time.perf_counter()
+            if label == "insert_many":
+                client.insert_many(df, TABLE_NAME)
+            elif label == "insert_batch":
+                client.insert_batch(df, TABLE_NAME, chunk_size=chunk_size)
+            else:
+                client.execute_many(
+                    f"INSERT INTO {TABLE_NAME} (id, name, value) VALUES (:id, :name, :value)",
+                    df,
+                )
+            results[label] = len(df) / (time.perf_counter() - start)
+        client.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+    finally:
+        client.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("config_file_path")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    config = _load_config(args.config_file_path)
+    df = make_dataframe(args.rows)
+
+    all_results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fast in (False, True):
+            path = os.path.join(tmp_dir, f"fast_{fast}.yaml")
+            with open(path, "w") as f:
+                yaml.safe_dump({**config, "fast_executemany": fast}, f)
+            all_results[fast] = run(path, df, args.chunk_size)
+
+    print(f"{args.rows} rows, db_type={config.get('db_type')}")
+    print(f"{'operation':<14}{'default rows/s':>16}{'fast rows/s':>16}{'speedup':>10}")
+    for label, before in all_results[False].items():
+        after = all_results[True][label]
+        print(f"{label:<14}{before:>16,.0f}{after:>16,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark the import time of SQLThunder and check that heavy modules stay lazy.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 10] [--max-ms 100]
+
+Each statement runs in a fresh interpreter, `--runs` times, and the median wall time is reported
+next to a bare `python -c pass`. The script exits with status 1 if a statement imports pandas,
+numpy, sqlparse, tqdm or openpyxl, or if its median overhead exceeds `--max-ms` (when given).
+"""
+
+### --- Standard library imports --- ###
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Statements timed, and the heavy modules they must not import
+STATEMENTS = {
+    "import SQLThunder": "import SQLThunder",
+    "import DBClient": "from SQLThunder import DBClient",
+    "CLI execute path": "import SQLThunder.__main__; from SQLThunder import DBClient",
+}
+LAZY_MODULES = ("pandas", "numpy", "sqlparse", "tqdm", "openpyxl")
+
+
+def time_statement(statement: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def loaded_lazy_modules(statement: str) -> list[str]:
+    check = (
+        f"{statement}\nimport sys\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", check], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return [name for name in output.split(",") if name]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    baseline = time_statement("pass", args.runs)
+    print(f"python startup: {baseline:.0f} ms (median of {args.runs})")
+    print(
+        f"{'statement':<20}{'median ms':>12}{'overhead ms':>14}  heavy modules loaded"
+    )
+
+    failed = False
+    for label, statement in STATEMENTS.items():
+        median = time_statement(statement, args.runs)
+        overhead = median - baseline
+        loaded = loaded_lazy_modules(statement)
+        print(
+            f"{label:<20}{median:>12.0f}{overhead:>14.0f}  {', '.join(loaded) or '-'}"
+        )
+        if loaded or (args.max_ms is not None and overhead > args.max_ms):
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
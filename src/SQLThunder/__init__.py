@@ -1,5 +1,48 @@
+### --- Standard library imports --- ###
+import importlib
+from typing import TYPE_CHECKING, Any
+
+### --- Internal package imports --- ###
 from .__version__ import __version__
-from .core import DBClient, DBSession
 from .logging_config import configure_logging, logger
 
-__all__ = ["DBClient", "DBSession", "configure_logging", "logger"]
+if TYPE_CHECKING:
+    from .core import (
+        AsyncDBClient,
+        DBClient,
+        DBSession,
+        ProgressEvent,
+        TqdmProgress,
+    )
+
+__all__ = [
+    "AsyncDBClient",
+    "DBClient",
+    "DBSession",
+    "ProgressEvent",
+    "TqdmProgress",
+    "configure_logging",
+    "logger",
+]
+
+# Public classes imported on first access (PEP 562), so `import SQLThunder` stays cheap
+_LAZY_ATTRIBUTES = {
+    "AsyncDBClient": ".core",
+    "DBClient": ".core",
+    "DBSession": ".core",
+    "ProgressEvent": ".core",
+    "TqdmProgress": ".core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -2,9 +2,10 @@
 import argparse
 import logging
 import sys
+from typing import Optional
 
 ### --- Internal package imports --- ###
-from .core import DBClient
+from .core import DBClient, TqdmProgress
 from .exceptions import (
     BaseSQLConversionError,
     ConfigFileError,
@@ -15,7 +16,8 @@ from .exceptions import (
     ThreadPoolLimitError,
 )
 from .logging_config import configure_logging
-from .utils.file_io import load_data, save_dataframe
+from .utils.file_io import save_dataframe
+from .utils.retry import DEFAULT_RETRY_BACKOFF
 
 KNOWN_ERRORS = (
     ConfigFileError,
@@ -30,6 +32,16 @@ KNOWN_ERRORS = (
 ### --- CLI --- ###
 
 
+def _cli_progress() -> Optional[TqdmProgress]:
+    """
+    Returns the tqdm progress callback used by the CLI, or None if tqdm is not installed.
+    """
+    try:
+        return TqdmProgress()
+    except ImportError:
+        return None
+
+
 def main() -> None:
     """
     Command-line interface for SQLThunder.
@@ -87,7 +99,9 @@ def main() -> None:
         "--print_limit", type=int, default=10, help="Max rows to print. Default: 10."
     )
     query_parser.add_argument(
-        "--output", choices=["csv", "excel"], help="Output format."
+        "--output",
+        choices=["csv", "excel", "parquet", "feather"],
+        help="Output format.",
     )
     query_parser.add_argument(
         "--output_path", type=str, help="Where to save output file."
@@ -101,7 +115,8 @@ def main() -> None:
         "--key_column",
         type=str,
         default=None,
-        help="For key_based mode, Primary key column name.",
+        help="For key_based mode, Primary key column name. "
+        "For batch mode, int/date column to split the query in key ranges instead of LIMIT/OFFSET.",
     )
     query_parser.add_argument(
         "--key_column_type",
@@ -158,7 +173,7 @@ def main() -> None:
         "insert", help="Insert data from file into SQL table."
     )
     insert_parser.add_argument(
-        "file_path", type=str, help="Path to input CSV or Excel file."
+        "file_path", type=str, help="Path to input CSV, Excel, Parquet or Feather file."
     )
     insert_parser.add_argument(
         "table_name",
@@ -175,9 +190,15 @@ def main() -> None:
         choices=["ignore", "replace"],
         help="Behavior for duplicate handling during insert. Default: None.",
     )
+    insert_parser.add_argument(
+        "--read_chunk_size",
+        type=int,
+        default=100_000,
+        help="Rows read from the file at a time, the file is streamed and never loaded whole. Default: 100000",
+    )
     insert_parser.add_argument(
         "--output",
-        choices=["csv", "excel"],
+        choices=["csv", "excel", "parquet", "feather"],
         help="Save failed rows to file. Requires --output_path to be given",
     )
     insert_parser.add_argument(
@@ -214,6 +235,35 @@ def main() -> None:
         default=None,
         help="For batch mode, Thread count. Should not be greater than pool_size+max_overflow",
     )
+    insert_parser.add_argument(
+        "--executor",
+        default="thread",
+        choices=["thread", "process"],
+        help="For batch mode, run the chunks on threads or on worker processes (method 'insert' only). Default: thread",
+    )
+    insert_parser.add_argument(
+        "--max_retries",
+        type=int,
+        default=0,
+        help="For batch mode, Retries of a chunk after a transient error (deadlock, timeout). Default: 0",
+    )
+    insert_parser.add_argument(
+        "--retry_backoff",
+        type=float,
+        default=DEFAULT_RETRY_BACKOFF,
+        help=f"For batch mode, Base delay in seconds of the backoff between retries. Default: {DEFAULT_RETRY_BACKOFF}",
+    )
+    insert_parser.add_argument(
+        "--bisect_failures",
+        action="store_true",
+        help="For batch mode, Split failed chunks to insert the good rows and only report the failing ones.",
+    )
+    insert_parser.add_argument(
+        "--method",
+        default="insert",
+        choices=["insert", "values", "copy", "load_data"],
+        help="Insert method. 'values' sends multi-row INSERT statements, 'copy' uses COPY (PostgreSQL), 'load_data' uses LOAD DATA LOCAL INFILE (MySQL). Default: insert",
+    )
 
     ### --- Execute parser (Other SQL ops) --- ###
 
@@ -284,15 +334,17 @@ def main() -> None:
         log_level = logging.DEBUG if args.verbose else logging.WARNING
         configure_logging(level=log_level)
 
-        # Setup DBClient
+        # Setup DBClient (execute runs a single statement, no progress bars nor tqdm import)
+        progress = _cli_progress() if args.command != "execute" else None
         if pool_given:
             client = DBClient(
                 config_file_path=args.config_path,
                 pool_size=args.pool_size,
                 max_overflow=args.max_overflow,
+                progress=progress,
             )
         else:
-            client = DBClient(config_file_path=args.config_path)
+            client = DBClient(config_file_path=args.config_path, progress=progress)
 
         ### --- Query --- ###
 
@@ -305,6 +357,7 @@ def main() -> None:
                     return_type="df",
                     print_result=args.print,
                     print_limit=args.print_limit,
+                    key_column=args.key_column,
                 )
             elif args.key_based:
                 result = client.query_keyed(
@@ -331,19 +384,21 @@ def main() -> None:
         ### --- Insert --- ###
 
         elif args.command == "insert":
-            data = load_data(args.file_path)
-            if args.batch:
-                failed, _ = client.insert_batch(
-                    df=data,
-                    table_name=args.table_name,
-                    chunk_size=args.chunk_size,
-                    max_workers=args.max_workers,
-                    on_duplicate=args.on_duplicate,
-                )
-            else:
-                failed, _ = client.insert_many(
-                    df=data, table_name=args.table_name, on_duplicate=args.on_duplicate
-                )
+            # Stream the file in chunks, each chunk goes through insert_batch / insert_many
+            failed, _ = client.insert_file(
+                file_path=args.file_path,
+                table_name=args.table_name,
+                read_chunk_size=args.read_chunk_size,
+                batch=args.batch,
+                chunk_size=args.chunk_size or 512,
+                max_workers=args.max_workers,
+                on_duplicate=args.on_duplicate,
+                method=args.method,
+                executor=args.executor,
+                max_retries=args.max_retries,
+                retry_backoff=args.retry_backoff,
+                bisect_failures=args.bisect_failures,
+            )
 
             if (
                 args.output
@@ -356,7 +411,13 @@ def main() -> None:
         ### --- Execute --- ###
 
         elif args.command == "execute":
-            client.execute(sql=args.sql)
+            # Status only: no failures DataFrame, so this path never imports pandas
+            _, success = client.execute(
+                sql=args.sql, return_failures=False, return_status=True
+            )
+            if not success:
+                print("Error: SQL statement failed.")
+                sys.exit(1)
             print("SQL statement executed successfully.")
 
     # Errors
@@ -1,4 +1,39 @@
-from .client import DBClient
-from .session import DBSession
+### --- Standard library imports --- ###
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["DBClient", "DBSession"]
+if TYPE_CHECKING:
+    from .async_client import AsyncDBClient
+    from .client import DBClient
+    from .progress import ProgressEvent, TqdmProgress
+    from .session import DBSession
+
+__all__ = [
+    "AsyncDBClient",
+    "DBClient",
+    "DBSession",
+    "ProgressEvent",
+    "TqdmProgress",
+]
+
+# Imported on first access (PEP 562): the client module pulls in SQLAlchemy
+_LAZY_ATTRIBUTES = {
+    "AsyncDBClient": ".async_client",
+    "DBClient": ".client",
+    "DBSession": ".session",
+    "ProgressEvent": ".progress",
+    "TqdmProgress": ".progress",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
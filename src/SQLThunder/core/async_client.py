@@ -0,0 +1,2074 @@
+from __future__ import annotations
+
+### --- Standard library imports --- ###
+import asyncio
+from datetime import datetime as dt
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    cast,
+)
+
+### --- Third-party imports --- ###
+from sqlalchemy import text
+from sqlalchemy.engine.row import Row
+from sqlalchemy.exc import NoSuchModuleError, OperationalError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions.base import (
+    BaseSQLConversionError,
+    ConfigFileError,
+    SQLExecutionError,
+)
+from SQLThunder.exceptions.config import LimitMaxWorkersError, UnsupportedDatabaseType
+from SQLThunder.exceptions.dbclient import (
+    DBClientClosedError,
+    DriverNotFoundError,
+    SQLAlchemyEngineError,
+)
+from SQLThunder.exceptions.execution import (
+    BadArgumentsBulk,
+    DatabaseConnectionError,
+    InvalidSQLOperation,
+    QueryDisallowedClauseError,
+    QueryExecutionError,
+    QueryResultFormatError,
+    QuerySelectOnlyError,
+    ReopenConnectionError,
+    UnsupportedMultiThreadedDatabase,
+)
+from SQLThunder.logging_config import logger
+from SQLThunder.utils.chunk_sizing import _check_chunk_size
+from SQLThunder.utils.config import _load_config, _resolve_ssl_paths
+from SQLThunder.utils.engine import (
+    _build_async_connect_args,
+    _build_engine_kwargs,
+    _get_async_db_url,
+)
+from SQLThunder.utils.insert_helpers import (
+    _apply_on_duplicate_clause,
+    _rows_per_insert_statement,
+)
+from SQLThunder.utils.lazy_imports import _is_dataframe, _LazyModule
+from SQLThunder.utils.partitioning import (
+    _build_key_bounds_query,
+    _build_key_range_query,
+    _build_keyed_page_query,
+    _build_null_key_query,
+    _build_offset_chunk_query,
+    _plan_key_partitions,
+)
+from SQLThunder.utils.result_conversion import (
+    ARROW_FETCH_SIZE,
+    ARROW_RETURN_TYPES,
+    _require_pyarrow,
+    _rows_to_arrow,
+)
+from SQLThunder.utils.sql_conversion import (
+    _build_insert_statement,
+    _build_multi_row_insert_statement,
+    _convert_args,
+    _convert_dbapi_to_sqlalchemy_style,
+    _dataframe_to_params,
+    _date_only_columns,
+    _flatten_rows_to_params,
+    _validate_args_for_bulk,
+    _validate_select_no_limit_offset,
+)
+from SQLThunder.utils.statement_cache import (
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    _StatementCache,
+)
+
+from .base import _BaseDBClient
+from .progress import ProgressCallback, _ProgressTracker
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = _LazyModule("pandas")
+
+### --- Core class AsyncDBClient --- ###
+
+
+class AsyncDBClient(_BaseDBClient):
+    """
+    AsyncDBClient is the asyncio counterpart of DBClient, built on a SQLAlchemy asyncio engine
+    (asyncpg, aiomysql or asyncmy, aiosqlite). Compatible with MySQL, PostgreSQL, and SQLite.
+
+    Every database call is a coroutine. Batch operations run their chunks as tasks on the event loop,
+    at most `max_workers` at a time (an asyncio.Semaphore), instead of on a thread pool.
+    """
+
+    def __init__(
+        self,
+        config_file_path: str,
+        db_type: Optional[str] = None,
+        pool_size: int = _BaseDBClient.DEFAULT_POOL_SIZE,
+        max_overflow: int = _BaseDBClient.DEFAULT_MAX_OVERFLOW,
+        max_workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        strict_sql_validation: bool = False,
+    ) -> None:
+        """
+        Initializes an AsyncDBClient instance from a config file, creating a SQLAlchemy asyncio engine.
+
+        No connection is opened here: use `async with AsyncDBClient(...) as client` or
+        `await client.test_connection()` to check the connection before the first operation.
+
+        Args:
+            config_file_path (str): Path to the YAML configuration file.
+            db_type (Optional[str]): Optional override for database type ("mysql", "postgresql", or "sqlite").
+            pool_size (int): Size of the SQLAlchemy engine connection pool. Defaults to DEFAULT_POOL_SIZE.
+            max_overflow (int): Maximum overflow connections allowed above pool_size. Defaults to DEFAULT_MAX_OVERFLOW.
+            max_workers (Optional[int]): Maximum number of concurrent chunks in batch operations.
+                If None, defaults to pool_size + max_overflow.
+            progress (Optional[ProgressCallback]): Called with a ProgressEvent as batch operations progress.
+                Defaults to None (no progress reporting).
+            statement_cache_size (int): Number of prepared statements kept in the LRU statement cache.
+                0 disables the cache. Defaults to DEFAULT_STATEMENT_CACHE_SIZE.
+            strict_sql_validation (bool): Validate queries with a full sqlparse parse instead of the lightweight
+                lexer. Defaults to False.
+
+        Raises:
+            ConfigFileError: If the config file is missing or invalid.
+            LimitMaxWorkersError: If max_workers exceeds the pool capacity.
+            DriverNotFoundError: If the asyncio driver module cannot be loaded.
+        """
+        # Load the config file and get SQLAlchemy asyncio db URL
+        try:
+            self._config = _load_config(config_file_path)
+            logger.debug(f"Config loaded from {config_file_path}")
+            self._db_url, self._driver, self._db_type = _get_async_db_url(
+                self._config, db_type
+            )
+            logger.debug(f"Async DB URL loaded from {self._config}")
+        except ConfigFileError as e:
+            logger.error(f"Failed to load config and get db_url: {e}")
+            raise
+
+        # Store pool settings
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+
+        # SSL file path check
+        try:
+            self._ssl_paths = _resolve_ssl_paths(self._config)
+            logger.info(f"SSL paths resolved: {self._ssl_paths}")
+        except ConfigFileError as e:
+            logger.error(f"Failed to load config and resolve SSL paths: {e}")
+            raise
+
+        # Connect args of the asyncio driver (SSL context, timeouts)
+        self._connect_args = _build_async_connect_args(
+            self._driver, self._ssl_paths, self._config
+        )
+
+        # Extra engine args for fast executemany, opt-in from the config
+        self._engine_kwargs = _build_engine_kwargs(self._driver, self._config)
+
+        # Close flag, operations raise once close() has been awaited
+        self._closed = False
+
+        # Progress callback of batch operations (None = silent)
+        self._progress = progress
+
+        # LRU cache of prepared statements, keyed on the raw SQL
+        self._statement_cache = _StatementCache(statement_cache_size)
+
+        # Full sqlparse validation of queries instead of the lexer
+        self._strict_sql_validation = strict_sql_validation
+
+        # Max workers logic (concurrent tasks, bounded by the pool)
+        self._total_pool_capacity = self._pool_size + self._max_overflow
+        if max_workers is not None and max_workers > self._total_pool_capacity:
+            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
+        self._max_workers = max_workers or self._total_pool_capacity
+
+        # Create engine
+        self._engine = self._create_engine_alchemy()
+
+    ### --- Initialization --- ###
+
+    def _create_engine_alchemy(self) -> AsyncEngine:
+        """
+        Creates and returns a SQLAlchemy AsyncEngine instance using internal config.
+
+        Returns:
+            AsyncEngine: SQLAlchemy AsyncEngine configured with SSL, pooling and executemany options.
+
+        Raises:
+            DriverNotFoundError: If the DB driver module cannot be loaded.
+            SQLAlchemyEngineError: For any SQLAlchemy-related engine creation failure.
+        """
+        # SQLite in-memory databases use a static pool, which takes no size
+        pool_kwargs: dict[str, Any] = {}
+        if self._db_url != "sqlite+aiosqlite://":
+            pool_kwargs = {
+                "pool_size": self._pool_size,
+                "max_overflow": self._max_overflow,
+            }
+
+        try:
+            return create_async_engine(
+                self._db_url,
+                connect_args=self._connect_args,
+                echo=False,
+                pool_pre_ping=True,
+                **pool_kwargs,
+                **self._engine_kwargs,
+            )
+        except (NoSuchModuleError, ModuleNotFoundError) as e:
+            logger.error(
+                f"Engine creation failed: missing or invalid driver module - {e}"
+            )
+            raise DriverNotFoundError(self._driver) from e
+        except SQLAlchemyError as e:
+            logger.error(f"Engine creation failed: SQLAlchemy internal error - {e}")
+            raise SQLAlchemyEngineError(e) from e
+        except Exception as e:
+            logger.error(f"Engine creation failed: unknown error - {e}")
+            raise SQLAlchemyEngineError(e) from e
+
+    async def _test_connection(self) -> None:
+        """
+        Tests the database connection by executing a lightweight query.
+
+        Raises:
+            DatabaseConnectionError: If connection test fails due to SSL, auth, or network issues.
+        """
+        try:
+            async with self._engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                logger.info("Connection test succeeded.")
+        except OperationalError as e:
+            logger.error(f"OperationalError during connection test: {e}")
+            msg = (
+                "SSL is required by the server but missing in configuration."
+                if "required_secure_transport" in str(e).lower()
+                else "Failed to establish database connection"
+            )
+            raise DatabaseConnectionError(msg, e)
+
+        except SQLAlchemyError as e:
+            logger.error(f"SQLAlchemyError during connection test: {e}")
+            raise DatabaseConnectionError("SQLAlchemy error during test connection", e)
+
+    ### --- Public connection controls and resources management --- ###
+
+    async def __aenter__(self) -> AsyncDBClient:
+        """
+        Tests the connection (reopening the client first if it was closed) and returns the client.
+
+        Returns:
+            AsyncDBClient: The client, ready for use.
+
+        Raises:
+            DatabaseConnectionError: If the connection test fails. The engine is disposed.
+            ReopenConnectionError: If the client was closed and could not be reopened.
+        """
+        if self._closed:
+            await self.reopen_connection()
+            return self
+        try:
+            await self._test_connection()
+        except DatabaseConnectionError:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """
+        Closes the client.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): Exception type, if one occurred.
+            exc_val (Optional[BaseException]): Exception instance, if one occurred.
+            exc_tb (Optional[TracebackType]): Traceback, if one occurred.
+        """
+        await self.close()
+
+    async def test_connection(self) -> bool:
+        """
+        Checks if the database connection is currently valid.
+
+        Returns:
+            bool: True if connection test succeeds, False otherwise.
+        """
+        try:
+            self._check_closed()
+            await self._test_connection()
+            return True
+        except DBClientClosedError as e:
+            logger.warning(f"Connection test failed: {e}")
+            return False
+        except DatabaseConnectionError as e:
+            logger.warning(f"Connection test failed: {e}")
+            return False
+
+    async def reopen_connection(self) -> None:
+        """
+        Reopen a previously closed AsyncDBClient by recreating the engine.
+
+        Raises:
+            ReopenConnectionError: If reconnection fails after engine creation.
+        """
+        if not self._closed:
+            logger.warning("AsyncDBClient connection is already open. Skipping reopen.")
+            return
+
+        logger.info("Reopening AsyncDBClient...")
+
+        try:
+            self._engine = self._create_engine_alchemy()
+            self._closed = False
+            await self._test_connection()
+            logger.info("AsyncDBClient successfully reopened.")
+        except Exception as e:
+            logger.error(f"Failed to reopen AsyncDBClient: {e}")
+            await self.close()  # Ensure partial resources are cleaned
+            raise ReopenConnectionError("Failed to reopen AsyncDBClient", e)
+
+    async def close(self) -> None:
+        """
+        Cleanly dispose of the SQLAlchemy asyncio engine.
+
+        After calling `close()`, the instance becomes unusable unless `reopen_connection()` is awaited.
+        """
+        if not self._closed:
+            await self._engine.dispose()
+            self._closed = True
+            logger.info("AsyncDBClient shut down")
+
+    @property
+    def fast_executemany(self) -> bool:
+        """
+        Indicates whether fast executemany is enabled (`fast_executemany: true` in the config).
+
+        Returns:
+            bool: True if the engine was created with fast executemany options.
+        """
+        return bool(self._config.get("fast_executemany"))
+
+    ### --- Argument helpers --- ###
+
+    @staticmethod
+    def _single_row_args(
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ],
+        method_name: str,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Converts the arguments of a single-row operation to one SQLAlchemy parameter dict.
+
+        Args:
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                A single dict or tuple, or a list containing exactly one such element.
+            method_name (str): Name of the calling public method, used in error messages.
+
+        Returns:
+            Optional[dict[str, Any]]: The parameters, or None if args is None.
+
+        Raises:
+            InvalidSQLOperation: If the arguments are malformed or contain several rows.
+        """
+        if args is None:
+            return None
+        try:
+            converted_args = _convert_args(args)
+            if isinstance(converted_args, list):
+                if len(converted_args) != 1:
+                    raise InvalidSQLOperation(
+                        f"{method_name}() only accepts one row of parameters."
+                    )
+                return converted_args[0]
+            return converted_args
+        except Exception as e:
+            logger.warning(f"Invalid SQL or args: {e}")
+            raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
+
+    @staticmethod
+    def _write_result(
+        failed_records: list[dict[str, Any]],
+        return_failures: bool,
+        return_status: bool,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Builds the (failures, status) return value of the write operations.
+
+        Args:
+            failed_records (list[dict[str, Any]]): Failed rows with their error message, empty on success.
+            return_failures (bool): Whether to return the failed rows as a DataFrame.
+            return_status (bool): Whether to return a success flag.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: The failures DataFrame (or None) and the success flag (or None).
+        """
+        failures = pd.DataFrame(failed_records) if return_failures else None
+        status = not failed_records if return_status else None
+        return cast(
+            Union[
+                tuple[pd.DataFrame, bool],
+                tuple[pd.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None],
+            ],
+            (failures, status),
+        )
+
+    def _check_max_workers(self, max_workers: Optional[int]) -> int:
+        """
+        Resolves the number of concurrent chunks of a batch operation.
+
+        Args:
+            max_workers (Optional[int]): Requested number, None for the client default.
+
+        Returns:
+            int: The number of concurrent chunks.
+
+        Raises:
+            LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
+        """
+        if max_workers is not None and max_workers > self._total_pool_capacity:
+            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
+        return max_workers or self._max_workers
+
+    ### --- Read operations --- ###
+
+    ### --- Query (Single transaction) --- ###
+
+    async def query(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
+        print_result: bool = False,
+        print_limit: int = 5,
+    ) -> Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None]:
+        """
+        Executes a single SQL SELECT query with optional bound parameters.
+
+        Args:
+            sql (str): A SQL SELECT statement. May include named placeholders (e.g., :id).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the query. Must be a single dict or tuple, or a list containing exactly one such element.
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result,
+                as in `DBClient.query()`.
+            print_result (bool): Whether to print the query result to stdout.
+            print_limit (int): Number of rows to display when printing. Only used if print_result is True.
+
+        Returns:
+            Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row], None]:
+                The query result in the specified format.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            InvalidSQLOperation: If the SQL is malformed or multiple argument sets are passed.
+            QueryExecutionError: If query execution fails.
+            QueryResultFormatError: If return_type is unsupported.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Check if it is a select statement and convert placeholders (cached per statement)
+        statement = self._prepare_statement(
+            sql, validate="select", convert=args is not None
+        )
+
+        # Check accepted return types
+        return_format = return_type.lower()
+        if return_format not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        bind_args = self._single_row_args(args, "query")
+
+        # Execute
+        try:
+            async with self._engine.connect() as conn:
+                result = await conn.execute(statement.clause, bind_args or {})
+                columns = list(result.keys())
+                if return_format in ARROW_RETURN_TYPES:
+                    tables = [
+                        _rows_to_arrow(batch, columns)
+                        for batch in result.partitions(ARROW_FETCH_SIZE)
+                    ]
+                else:
+                    rows = result.fetchall()
+                logger.info(f"Successfully executed query: {statement.sql}")
+        except SQLAlchemyError as e:
+            logger.warning(f"Query failed: {e}")
+            raise QueryExecutionError(e)
+
+        if return_format in ARROW_RETURN_TYPES:
+            return self._format_arrow_tables(
+                tables, columns, return_format, print_result, print_limit
+            )
+
+        # Print preview if requested
+        if print_result:
+            preview_df = pd.DataFrame(rows[:print_limit], columns=columns or None)
+            print(preview_df.to_string(index=False))
+
+        return self._format_rows(rows, columns, return_format)
+
+    ### --- Iter query (Single transaction, server-side cursor) --- ###
+
+    def iter_query(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        return_type: Literal["df", "raw", "list", "arrow", "df_arrow"] = "df",
+    ) -> AsyncIterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+        """
+        Streams the result of a single SQL SELECT query in fixed-size batches using a server-side cursor.
+
+        Use with `async for`. Validation happens when the method is called; the query only runs when
+        the returned iterator is first advanced.
+
+        Args:
+            sql (str): A SQL SELECT statement. May include named placeholders (e.g., :id).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the query. Must be a single dict or tuple, or a list containing exactly one such element.
+            chunk_size (int): Number of rows per yielded batch. Defaults to 10,000.
+            return_type (Literal["df", "raw", "list", "arrow", "df_arrow"]): Format of each yielded batch.
+
+        Returns:
+            AsyncIterator[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+                An asynchronous iterator over the result batches, in the order returned by the database.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            InvalidSQLOperation: If the SQL is malformed, multiple argument sets are passed or chunk_size is not positive.
+            QueryResultFormatError: If return_type is unsupported.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            QueryExecutionError: While iterating, if the query or a fetch fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Check if it is a select statement and convert placeholders (cached per statement)
+        statement = self._prepare_statement(
+            sql, validate="select", convert=args is not None
+        )
+
+        # Check accepted return types ("none" makes no sense for an iterator)
+        return_format = return_type.lower()
+        if return_format not in {"df", "list", "raw"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        if chunk_size <= 0:
+            raise InvalidSQLOperation("iter_query() requires a positive chunk_size.")
+
+        bind_args = self._single_row_args(args, "iter_query")
+
+        async def batch_iterator() -> (
+            AsyncIterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]
+        ):
+            try:
+                async with self._engine.connect() as conn:
+                    # stream() -> server-side cursor, max_row_buffer caps the client buffer
+                    result = await conn.stream(
+                        statement.clause,
+                        bind_args or {},
+                        execution_options={"max_row_buffer": chunk_size},
+                    )
+                    columns = list(result.keys())
+                    async for rows in result.partitions(chunk_size):
+                        yield cast(
+                            Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]],
+                            self._format_rows(rows, columns, return_format),
+                        )
+                    logger.info(f"Successfully streamed query: {statement.sql}")
+            except SQLAlchemyError as e:
+                logger.warning(f"Streamed query failed: {e}")
+                raise QueryExecutionError(e)
+
+        return batch_iterator()
+
+    ### --- Query keyed (Key-based pagination, multiple transactions) --- ###
+
+    async def query_keyed(
+        self,
+        sql: str,
+        key_column: str,
+        key_column_type: Literal["int", "string", "date"],
+        start_key: Optional[Union[int, dt, str]] = None,
+        end_key: Optional[Union[int, dt, str]] = None,
+        order: Literal["asc", "desc"] = "asc",
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
+        print_result: bool = False,
+        print_limit: int = 10,
+        return_last_key: bool = False,
+        return_status: bool = False,
+    ) -> Union[
+        pd.DataFrame,
+        list[dict[str, Any]],
+        Sequence[Row],
+        None,
+        tuple[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None], Any],
+        tuple[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool],
+        tuple[
+            Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool, Any
+        ],
+    ]:
+        """
+        Executes a large SQL SELECT query using key-based pagination on a sortable column.
+
+        Same arguments, pagination and return values as `DBClient.query_keyed()`.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or pagination conditions).
+            key_column (str): The column to use as the pagination key.
+            key_column_type (Literal["int", "string", "date"]): Type of the key column for proper formatting and validation.
+            start_key (Optional[Union[int, datetime.datetime, str]]): Key to start from.
+            end_key (Optional[Union[int, datetime.datetime, str]]): Inclusive upper bound key to stop at.
+            order (Literal["asc", "desc"]): Sort direction for pagination. Defaults to "asc".
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the SQL query. Must be a single dict/tuple or a list containing one such element.
+            chunk_size (int): Number of rows to fetch per chunk. Defaults to 10,000.
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result.
+            print_result (bool): Whether to print a preview of the query result.
+            print_limit (int): Number of rows to preview if printing is enabled.
+            return_last_key (bool): Whether to return the last key seen in the result set.
+            return_status (bool): Whether to return a boolean indicating query success.
+
+        Returns:
+            Union[
+                pandas.DataFrame,
+                list[dict[str, Any]],
+                Sequence[Row],
+                None,
+                tuple[result, last_key],
+                tuple[result, success],
+                tuple[result, success, last_key]
+            ]:
+                The query result in the specified format. Optionally includes the last key and/or a success flag.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL is not a SELECT statement.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            QueryResultFormatError: If return_type is not one of the supported formats.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the key column type or bound arguments are invalid,
+                or if required key values are missing or incorrectly typed.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Check accepted return types
+        return_format = return_type.lower()
+        if return_format not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        # Validate query, keys and args
+        sql, bind_args, current_key, max_key = self._prepare_keyed_query(
+            sql=sql,
+            key_column_type=key_column_type,
+            start_key=start_key,
+            end_key=end_key,
+            order=order,
+            args=args,
+            method_name="query_keyed",
+        )
+
+        arrow_output = return_format in ARROW_RETURN_TYPES
+        all_rows: list[Any] = []
+        column_names: list[str] = []
+
+        # Shared pagination state (updated by the page generator)
+        state: dict[str, Any] = {"success": True, "last_key": None}
+
+        async for rows, columns in self._iter_keyed_pages(
+            sql=sql,
+            key_column=key_column,
+            order=order or "asc",
+            bind_args=bind_args,
+            current_key=current_key,
+            has_end_key=max_key is not None,
+            chunk_size=chunk_size,
+            state=state,
+        ):
+            column_names = columns
+            if arrow_output:
+                all_rows.append(_rows_to_arrow(rows, columns))
+            else:
+                all_rows.extend(rows)
+
+        success = state["success"]
+        last_key = state["last_key"]
+
+        if arrow_output:
+            result = self._format_arrow_tables(
+                all_rows, column_names, return_format, print_result, print_limit
+            )
+        else:
+            if print_result and all_rows:
+                preview_df = pd.DataFrame(
+                    all_rows[:print_limit], columns=column_names or None
+                )
+                print(preview_df.to_string(index=False))
+            result = self._format_rows(all_rows, column_names, return_format)
+
+        if return_last_key and return_status:
+            return result, success, last_key
+        elif return_last_key:
+            return result, last_key
+        elif return_status:
+            return result, success
+        else:
+            return result
+
+    ### --- Iter keyed (Key-based pagination, streamed page by page) --- ###
+
+    def iter_keyed(
+        self,
+        sql: str,
+        key_column: str,
+        key_column_type: Literal["int", "string", "date"],
+        start_key: Optional[Union[int, dt, str]] = None,
+        end_key: Optional[Union[int, dt, str]] = None,
+        order: Literal["asc", "desc"] = "asc",
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        return_type: Literal["df", "raw", "list", "arrow", "df_arrow"] = "df",
+    ) -> AsyncIterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+        """
+        Streams a large SQL SELECT query page by page using key-based pagination.
+
+        Use with `async for`. Validation happens when the method is called; the first query only runs
+        when the returned iterator is first advanced.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or pagination conditions).
+            key_column (str): The column to use as the pagination key.
+            key_column_type (Literal["int", "string", "date"]): Type of the key column for proper formatting and validation.
+            start_key (Optional[Union[int, datetime.datetime, str]]): Inclusive key to start from.
+            end_key (Optional[Union[int, datetime.datetime, str]]): Inclusive upper bound key to stop at.
+            order (Literal["asc", "desc"]): Sort direction for pagination. Defaults to "asc".
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the SQL query. Must be a single dict/tuple or a list containing one such element.
+            chunk_size (int): Number of rows per yielded page. Defaults to 10,000.
+            return_type (Literal["df", "raw", "list", "arrow", "df_arrow"]): Format of each yielded page.
+
+        Returns:
+            AsyncIterator[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+                An asynchronous iterator over the pages, in key order.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL is not a SELECT statement.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            QueryResultFormatError: If return_type is not one of the supported formats.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the key column type or bound arguments are invalid,
+                or if required key values are missing or incorrectly typed.
+            QueryExecutionError: While iterating, if a page fails to be fetched.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Check accepted return types ("none" makes no sense for an iterator)
+        return_format = return_type.lower()
+        if return_format not in {"df", "list", "raw"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        # Validate query, keys and args
+        sql, bind_args, current_key, max_key = self._prepare_keyed_query(
+            sql=sql,
+            key_column_type=key_column_type,
+            start_key=start_key,
+            end_key=end_key,
+            order=order,
+            args=args,
+            method_name="iter_keyed",
+        )
+
+        async def page_iterator() -> (
+            AsyncIterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]
+        ):
+            state: dict[str, Any] = {"success": True, "last_key": None}
+            async for rows, columns in self._iter_keyed_pages(
+                sql=sql,
+                key_column=key_column,
+                order=order or "asc",
+                bind_args=bind_args,
+                current_key=current_key,
+                has_end_key=max_key is not None,
+                chunk_size=chunk_size,
+                state=state,
+            ):
+                yield cast(
+                    Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]],
+                    self._format_rows(rows, columns, return_format),
+                )
+            if not state["success"]:
+                raise QueryExecutionError(state["error"])
+
+        return page_iterator()
+
+    ### --- Key-based pagination helper --- ###
+
+    async def _iter_keyed_pages(
+        self,
+        sql: str,
+        key_column: str,
+        order: str,
+        bind_args: dict[str, Any],
+        current_key: Union[int, str, dt],
+        has_end_key: bool,
+        chunk_size: int,
+        state: dict[str, Any],
+    ) -> AsyncIterator[tuple[Sequence[Row], list[str]]]:
+        """
+        Walks a key-based pagination and yields each non-empty page as soon as it is fetched.
+
+        Same stopping rules as `DBClient._iter_keyed_pages`: failures are not raised, they are logged
+        and reported through `state`.
+
+        Args:
+            sql (str): Converted base SQL SELECT query.
+            key_column (str): The column to use as the pagination key.
+            order (str): "asc" or "desc".
+            bind_args (dict[str, Any]): Bind arguments (including `end_key` if bounded). Updated in place with `last_key`.
+            current_key (Union[int, str, datetime.datetime]): Key of the first page.
+            has_end_key (bool): Whether `bind_args` contains an `end_key` bound.
+            chunk_size (int): Number of rows per page.
+            state (dict[str, Any]): Mutable state updated with "success", "last_key" and, on failure, "error".
+
+        Yields:
+            tuple[Sequence[Row], list[str]]: The rows of the page and the result column names.
+        """
+        column_names: list[str] = []
+        key_index = 0
+        first_pass = True  # To add first row with >= operator in query
+
+        while True:
+            paginated_sql = _build_keyed_page_query(
+                sql,
+                key_column,
+                order,
+                chunk_size,
+                include_start=first_pass,
+                has_end_key=has_end_key,
+            )
+            bind_args["last_key"] = current_key
+
+            try:
+                async with self._engine.connect() as conn:
+                    result = await conn.execute(text(paginated_sql), bind_args)
+                    rows = result.fetchall()
+                    first_pass = False
+                    if not column_names and result.keys():
+                        column_names = list(result.keys())
+                        key_index = column_names.index(key_column)
+            except Exception as e:
+                logger.warning(f"Key-based chunk failed: {e}")
+                state["success"] = False
+                state["error"] = e
+                break
+
+            # Break if no more rows
+            if not rows:
+                break
+
+            # Last page if shorter than chunk_size
+            if len(rows) < chunk_size:
+                try:
+                    state["last_key"] = rows[-1][key_index]
+                except Exception as e:
+                    state["last_key"] = None
+                    logger.warning(f"Could not extract key from last row: {e}")
+                yield rows, column_names
+                break
+
+            # Update current key and last_key
+            try:
+                current_key = rows[-1][key_index]
+                state["last_key"] = current_key
+            except Exception as e:
+                state["last_key"] = None
+                state["success"] = False
+                state["error"] = e
+                logger.warning(f"Could not extract last key: {e}")
+                yield rows, column_names
+                break
+
+            yield rows, column_names
+
+    ### --- Query batch (Concurrent tasks, multiple transactions) --- ###
+
+    async def query_batch(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+                pd.DataFrame,
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        max_workers: Optional[int] = None,
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
+        return_status: bool = False,
+        print_result: bool = False,
+        print_limit: int = 10,
+        key_column: Optional[str] = None,
+    ) -> Union[
+        pd.DataFrame,
+        list[dict[str, Any]],
+        Sequence[Row],
+        None,
+        tuple[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool],
+    ]:
+        """
+        Executes a large SQL SELECT query in concurrent chunks, using key ranges or LIMIT and OFFSET.
+
+        Same chunking as `DBClient.query_batch()`, with the chunks fetched by tasks gathered on the event
+        loop, at most `max_workers` at a time.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or OFFSET clauses).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]]):
+                Parameters to bind to the query. Must represent a single row of parameters.
+            chunk_size (int): Number of rows to fetch per chunk. Defaults to 10,000.
+            max_workers (Optional[int]): Maximum number of concurrent chunks. Defaults to the client's max_workers.
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result.
+            return_status (bool): If True, returns a tuple with the result and a success flag.
+            print_result (bool): Whether to print a preview of the result to stdout.
+            print_limit (int): Number of rows to print if print_result is True.
+            key_column (Optional[str]): Int, date or datetime output column to partition the query on.
+                If None (default), LIMIT/OFFSET chunking is used. Rows with a NULL key are fetched as one extra chunk.
+
+        Returns:
+            Union[
+                pandas.DataFrame,
+                list[dict[str, Any]],
+                Sequence[Row],
+                None,
+                tuple[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool]
+            ]:
+                The query result in the specified format. If return_status is True, a tuple is returned with a success flag.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            QueryResultFormatError: If return_type is not one of the supported values.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the SQL or arguments are malformed or incompatible, if chunk_size is not
+                positive, or if key_column is not an int, date or datetime column.
+            LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
+            UnsupportedMultiThreadedDatabase: If concurrent reads are attempted on a SQLite database.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        if self._db_type == "sqlite":
+            logger.error(
+                "Concurrent reads are not supported on SQLite. Use query or query_keyed instead. "
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        # Validate select query
+        try:
+            _validate_select_no_limit_offset(
+                sql=sql, strict=self._strict_sql_validation
+            )
+        except QuerySelectOnlyError:
+            raise
+        except QueryDisallowedClauseError:
+            logger.error(
+                "query_batch() does not support the use of limit or offset clauses. "
+            )
+            raise
+
+        # Check if valid return type
+        return_format = return_type.lower()
+        if return_format not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        _check_chunk_size(chunk_size)
+        concurrency = self._check_max_workers(max_workers)
+
+        # Convert args
+        bind_args: Optional[dict[str, Any]] = None
+        try:
+            if args is not None:
+                sql, converted_args = _convert_dbapi_to_sqlalchemy_style(sql, args)
+                if isinstance(converted_args, list):
+                    if len(converted_args) != 1:
+                        raise InvalidSQLOperation(
+                            "query_batch() only accepts one row of parameters."
+                        )
+                    bind_args = converted_args[0]
+                else:
+                    bind_args = converted_args
+        except Exception as e:
+            logger.warning(f"Invalid SQL or args: {e}")
+            raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
+
+        # Each task converts its chunk to the output format as soon as it is fetched
+        convert_rows = self._chunk_converter(return_format)
+
+        if key_column is not None:
+            results, success_status = await self._query_key_ranges(
+                sql=sql,
+                args=bind_args,
+                key_column=key_column,
+                chunk_size=chunk_size,
+                max_workers=concurrency,
+                convert_rows=convert_rows,
+            )
+        else:
+            results, success_status = await self._query_offset_chunks(
+                sql=sql,
+                args=bind_args,
+                chunk_size=chunk_size,
+                max_workers=concurrency,
+                convert_rows=convert_rows,
+            )
+
+        res = self._assemble_chunks(results, return_format, print_result, print_limit)
+
+        if return_status:
+            return res, success_status
+        else:
+            return res
+
+    ### --- Query batch helpers --- ###
+
+    async def _query_offset_chunks(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        chunk_size: int,
+        max_workers: int,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[list[tuple[int, Any, Any]], bool]:
+        """
+        Fetches a SELECT query in concurrent LIMIT/OFFSET chunks until a chunk returns no rows.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            chunk_size (int): Number of rows per chunk.
+            max_workers (int): Number of concurrent fetch tasks.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and column
+                names of each chunk. Defaults to None (rows kept).
+
+        Returns:
+            tuple[list[tuple[int, Any, Any]], bool]:
+                The non-empty chunks as (chunk_index, rows or converted rows, column names) tuples, unordered,
+                and False if any chunk failed.
+        """
+        results: list[tuple[int, Any, Any]] = []
+        success = True
+
+        # Task k fetches chunks k, k + max_workers, k + 2 * max_workers, ... until one is empty
+        async def fetch_worker(first_index: int, progress: _ProgressTracker) -> None:
+            nonlocal success
+            chunk_index = first_index
+            while True:
+                try:
+                    payload, columns = await self._fetch_offset_chunk(
+                        sql, args, chunk_size, chunk_index, convert_rows
+                    )
+                except Exception as e:
+                    logger.warning(f"Chunk {chunk_index} failed: {e}")
+                    success = False
+                    return
+                # Stop naturally on the first empty chunk
+                if not len(payload):
+                    return
+                results.append((chunk_index, payload, columns))
+                progress.update(rows=len(payload), payload=payload)
+                chunk_index += max_workers
+
+        with self._track_progress("Querying chunks") as progress:
+            await asyncio.gather(
+                *(fetch_worker(i, progress) for i in range(max_workers))
+            )
+
+        return results, success
+
+    async def _query_key_ranges(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+        chunk_size: int,
+        max_workers: int,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[list[tuple[int, Any, Any]], bool]:
+        """
+        Fetches a SELECT query concurrently as disjoint key ranges of `key_column`.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Int, date or datetime output column of the query to partition on.
+            chunk_size (int): Target number of rows per sub-range.
+            max_workers (int): Maximum number of sub-ranges fetched at the same time.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and column
+                names of each sub-range. Defaults to None (rows kept).
+
+        Returns:
+            tuple[list[tuple[int, Any, Any]], bool]:
+                The non-empty sub-ranges as (partition_index, rows or converted rows, column names) tuples, unordered,
+                and False if the bounds query or any sub-range failed.
+
+        Raises:
+            InvalidSQLOperation: If the key column is not an int, date or datetime column.
+        """
+        try:
+            key_ranges = await self._plan_key_ranges(sql, args, key_column, chunk_size)
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not fetch bounds of key column '{key_column}': {e}")
+            return [], False
+        last_index = len(key_ranges) - 1
+
+        results: list[tuple[int, Any, Any]] = []
+        success = True
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch_range(
+            partition_index: int, start: Any, end: Any, progress: _ProgressTracker
+        ) -> None:
+            nonlocal success
+            async with semaphore:
+                try:
+                    rows, keys = await self._fetch_key_range(
+                        sql,
+                        args,
+                        key_column,
+                        start,
+                        end,
+                        partition_index == last_index,
+                        convert_rows,
+                    )
+                except Exception as e:
+                    logger.warning(f"Chunk {partition_index} failed: {e}")
+                    success = False
+                    progress.update()
+                    return
+            if len(rows):
+                results.append((partition_index, rows, keys))
+            progress.update(rows=len(rows), payload=rows)
+
+        with self._track_progress("Querying chunks", len(key_ranges)) as progress:
+            await asyncio.gather(
+                *(
+                    fetch_range(i, start, end, progress)
+                    for i, (start, end) in enumerate(key_ranges)
+                )
+            )
+
+        return results, success
+
+    async def _fetch_offset_chunk(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        chunk_size: int,
+        chunk_index: int,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[Any, list[str]]:
+        """
+        Fetches one LIMIT/OFFSET chunk of a SELECT query.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            chunk_size (int): Number of rows per chunk.
+            chunk_index (int): Index of the chunk (its offset is `chunk_index * chunk_size`).
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and
+                column names if the chunk is not empty. Defaults to None (rows kept).
+
+        Returns:
+            tuple[Any, list[str]]: The rows (or converted rows) of the chunk and the column names.
+
+        Raises:
+            SQLAlchemyError: If the chunk query fails.
+        """
+        paginated_sql = _build_offset_chunk_query(sql, chunk_size, chunk_index)
+        async with self._engine.connect() as conn:
+            result = await conn.execute(text(paginated_sql), args or {})
+            rows = result.fetchall()
+            columns = list(result.keys())
+        if rows and convert_rows:
+            return convert_rows(rows, columns), columns
+        return rows, columns
+
+    async def _plan_key_ranges(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+        chunk_size: int,
+    ) -> list[tuple[Any, Any]]:
+        """
+        Reads MIN/MAX/COUNT of `key_column` and splits its range into sub-ranges of about `chunk_size` rows.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Int, date or datetime output column of the query to partition on.
+            chunk_size (int): Target number of rows per sub-range.
+
+        Returns:
+            list[tuple[Any, Any]]: The (start, end) bounds of each sub-range, in key order, preceded by a
+                (None, None) partition if some rows have a NULL key. Empty if the query returns no rows.
+
+        Raises:
+            SQLAlchemyError: If the bounds query fails.
+            InvalidSQLOperation: If the key column is not an int, date or datetime column.
+        """
+        bounds_sql = _build_key_bounds_query(sql, key_column)
+
+        async with self._engine.connect() as conn:
+            result = await conn.execute(text(bounds_sql), args or {})
+            min_key, max_key, key_count, row_count = result.one()
+
+        if key_count != row_count:
+            logger.debug(
+                f"{row_count - key_count} row(s) have a NULL '{key_column}', fetched as one partition."
+            )
+        return _plan_key_partitions(min_key, max_key, key_count, row_count, chunk_size)
+
+    async def _fetch_key_range(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+        start: Any,
+        end: Any,
+        last_partition: bool,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[Any, list[str]]:
+        """
+        Fetches one key sub-range of a SELECT query, ordered by the key.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Output column the query is partitioned on.
+            start (Any): Inclusive lower bound of the sub-range, None for the rows with a NULL key.
+            end (Any): Exclusive upper bound of the sub-range (inclusive if last_partition).
+            last_partition (bool): Whether this is the last sub-range.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and
+                column names if the sub-range is not empty. Defaults to None (rows kept).
+
+        Returns:
+            tuple[Any, list[str]]: The rows (or converted rows) of the sub-range and the column names.
+
+        Raises:
+            SQLAlchemyError: If the sub-range query fails.
+        """
+        if start is None:
+            partition_sql = _build_null_key_query(sql, key_column)
+            bind_args = args or {}
+        else:
+            partition_sql = _build_key_range_query(
+                sql.strip().rstrip(";"), key_column, last_partition=last_partition
+            )
+            bind_args = {
+                **(args or {}),
+                "partition_start": start,
+                "partition_end": end,
+            }
+        async with self._engine.connect() as conn:
+            result = await conn.execute(text(partition_sql), bind_args)
+            rows = result.fetchall()
+            columns = list(result.keys())
+        if rows and convert_rows:
+            return convert_rows(rows, columns), columns
+        return rows, columns
+
+    ### --- Write operations --- ###
+
+    ### --- Execute (single transaction, single args) --- ###
+
+    async def execute(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Executes a single non-SELECT SQL statement (INSERT, UPDATE, DELETE, CREATE, ...) within a transaction.
+
+        Args:
+            sql (str): SQL statement with optional named placeholders (e.g., :id).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                A single row of bound parameters.
+            on_duplicate (Optional[str]): Optional duplicate-handling clause to apply (e.g., "ignore", "replace").
+            return_failures (bool): If True, returns a DataFrame with error details on failure. Defaults to True.
+            return_status (bool): If True, includes a boolean success flag in the return. Defaults to False.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of the failed record (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If the SQL or bound arguments are invalid or malformed.
+            SQLExecutionError: If duplicate-handling logic could not be applied.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Convert placeholders and apply duplicates logic (cached per statement)
+        try:
+            statement = self._prepare_statement(
+                sql, convert=args is not None, on_duplicate=on_duplicate
+            )
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+        bind_args = self._single_row_args(args, "execute")
+
+        failed_records: list[dict[str, Any]] = []
+        try:
+            async with self._engine.begin() as conn:
+                await conn.execute(statement.clause, bind_args or {})
+            logger.info("Single SQL statement executed successfully.")
+        except Exception as e:
+            logger.warning(f"Execution failed: {e}")
+            logger.debug(f"SQL: {statement.sql}")
+            logger.debug(f"Args: {bind_args}")
+            failed_records.append(
+                {
+                    **(bind_args or {}),
+                    "error_message": str(e),
+                    "sql": statement.sql[:300],  # preview of query
+                }
+            )
+
+        return self._write_result(failed_records, return_failures, return_status)
+
+    ### --- Execute many (Single transaction, Multiple args) --- ###
+
+    async def execute_many(
+        self,
+        sql: str,
+        args: Union[
+            list[tuple[Any, ...]],
+            list[dict[str, Any]],
+            tuple[Any, ...],
+            dict[str, Any],
+            pd.DataFrame,
+        ],
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Executes a bulk non-SELECT SQL operation (INSERT, UPDATE, or DELETE) in a single transaction.
+
+        This is an all-or-nothing operation: if any row in the batch fails, the entire transaction is rolled back.
+
+        Args:
+            sql (str): SQL statement with placeholders (e.g., :id, :value).
+            args (Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]):
+                Bound parameters to apply to the SQL query. Can be a list of tuples/dicts or a DataFrame.
+            on_duplicate (Optional[str]): Optional duplicate-handling mode ("ignore", "replace", or None).
+            return_failures (bool): If True, returns a DataFrame of failed rows with error messages on failure.
+            return_status (bool): If True, includes a success flag in the return value.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If the SQL or input arguments are malformed or cannot be converted.
+            SQLExecutionError: If duplicate-handling clause insertion fails.
+            BadArgumentsBulk: If no valid rows are provided for execution.
+            BaseSQLConversionError: If argument conversion fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        try:
+            _validate_args_for_bulk(args)
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for execute_many {e}")
+            raise
+
+        # Convert params to sqlalchemy compatible format
+        try:
+            converted_args = _convert_args(args)
+            if isinstance(converted_args, dict):
+                converted_args = [converted_args]
+            records = cast(list[dict[str, Any]], converted_args)
+        except BaseSQLConversionError as e:
+            logger.error(f"Invalid args format: {e}")
+            raise
+
+        # Convert placeholders and apply duplicates logic (cached per statement)
+        try:
+            statement = self._prepare_statement(sql, on_duplicate=on_duplicate)
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+        failed_records: list[dict[str, Any]] = []
+        try:
+            async with self._engine.begin() as conn:
+                await conn.execute(statement.clause, records)
+            logger.info("All records executed successfully in a single transaction.")
+        except Exception as e:
+            logger.warning(f"Transaction failed: {e}")
+            logger.debug(f"SQL: {statement.sql}")
+            failed_records = [{**row, "error_message": str(e)} for row in records]
+
+        return self._write_result(failed_records, return_failures, return_status)
+
+    ### --- Insert many (Single transaction, Multiple args, just for inserts) --- ###
+
+    async def insert_many(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+        method: Literal["insert", "values"] = "insert",
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Inserts a pandas DataFrame into a SQL table using a single atomic transaction.
+
+        Args:
+            df (pandas.DataFrame): DataFrame containing the rows to insert.
+            table_name (str): Target table name, e.g., "schema.table".
+            on_duplicate (Optional[str]): Conflict handling mode ("ignore", "replace", or None).
+            return_failures (bool): If True, returns a DataFrame of failed rows with error messages on failure.
+            return_status (bool): If True, includes a success flag in the return value.
+            method (Literal["insert", "values"]): "insert" (parameterized INSERT executed for all rows, default)
+                or "values" (multi-row INSERT statements). The "copy" and "load_data" bulk loads need the
+                synchronous drivers and are only available on DBClient.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If SQL insert generation fails or the insert method is not supported.
+            SQLExecutionError: If duplicate-handling clause generation fails.
+            UnsupportedDatabaseType: If the current database type is unsupported for insert generation.
+            BadArgumentsBulk: If the input DataFrame is empty or invalid.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        try:
+            _validate_args_for_bulk(df)
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for insert_many {e}")
+            raise
+
+        if self._check_async_insert_method(method) == "values":
+            return await self._insert_values_batches(
+                df=df,
+                table_name=table_name,
+                on_duplicate=on_duplicate,
+                chunk_size=None,
+                max_workers=None,
+                return_failures=return_failures,
+                return_status=return_status,
+            )
+
+        sql = self._insert_sql(df, table_name, on_duplicate)
+        return await self.execute_many(
+            sql=sql,
+            args=df,
+            on_duplicate=None,  # already applied
+            return_failures=return_failures,
+            return_status=return_status,
+        )
+
+    ### --- Execute batch (Concurrent tasks, Multiple transactions, Multiple args) --- ###
+
+    async def execute_batch(
+        self,
+        sql: str,
+        args: Union[
+            list[tuple[Any, ...]],
+            list[dict[str, Any]],
+            tuple[Any, ...],
+            dict[str, Any],
+            pd.DataFrame,
+        ],
+        chunk_size: int = 512,
+        max_workers: Optional[int] = None,
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Executes a SQL operation (INSERT, UPDATE, DELETE) in concurrent batches, one transaction per chunk.
+
+        Chunks are sliced lazily: the next chunk is only sliced (and a DataFrame chunk converted to
+        parameters) once one of the `max_workers` running chunks is done.
+
+        Args:
+            sql (str): SQL statement with placeholders (e.g., :id, :value).
+            args (Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]):
+                Rows of parameters to bind to the SQL query.
+            chunk_size (int): Number of rows per batch. Defaults to 512.
+            max_workers (Optional[int]): Maximum number of concurrent chunks. Defaults to the client's max_workers.
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            return_failures (bool): If True, includes failed records with error messages in the result.
+            return_status (bool): If True, includes a boolean success flag in the result.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If chunk_size is not positive.
+            BadArgumentsBulk: If no valid rows are provided.
+            SQLExecutionError: If duplicate-handling clause generation fails.
+            BaseSQLConversionError: If argument conversion fails during SQL preparation.
+            UnsupportedMultiThreadedDatabase: If concurrent writes are attempted on SQLite.
+            LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        try:
+            _validate_args_for_bulk(args)
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for execute_batch {e}")
+            raise
+
+        if self._db_type == "sqlite":
+            logger.error(
+                "Concurrent writes are not supported on SQLite. Use execute_many or execute instead. "
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        _check_chunk_size(chunk_size)
+        concurrency = self._check_max_workers(max_workers)
+
+        # Convert params to sqlalchemy compatible format, DataFrames are converted chunk by chunk
+        try:
+            records: list[dict[str, Any]] = []
+            if _is_dataframe(args):
+                df = cast(pd.DataFrame, args)
+            else:
+                df = None
+                converted_args = _convert_args(args)
+                if isinstance(converted_args, dict):
+                    converted_args = [converted_args]
+                records = cast(list[dict[str, Any]], converted_args)
+        except BaseSQLConversionError as e:
+            logger.error(f"Invalid args format: {e}")
+            raise
+
+        # Convert placeholders and apply duplicates logic (cached per statement)
+        try:
+            statement = self._prepare_statement(sql, on_duplicate=on_duplicate)
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+        rows = df if df is not None else records
+        if df is not None:
+            date_only_columns = _date_only_columns(df)
+        chunks = (
+            (
+                (
+                    df.iloc[i : i + chunk_size]
+                    if df is not None
+                    else records[i : i + chunk_size]
+                ),
+                i // chunk_size,
+            )
+            for i in range(0, len(rows), chunk_size)
+        )
+        failed_records: list[dict[str, Any]] = []
+
+        async def execute_chunk(
+            chunk: Union[list[dict[str, Any]], pd.DataFrame], chunk_num: int
+        ) -> None:
+            # Convert DataFrame rows just before they are sent
+            chunk_args = (
+                _dataframe_to_params(chunk, date_only_columns)
+                if _is_dataframe(chunk)
+                else chunk
+            )
+            try:
+                async with self._engine.begin() as conn:
+                    await conn.execute(statement.clause, chunk_args)
+            # Silent failing and collecting failed args
+            except Exception as e:
+                logger.warning(f"Chunk {chunk_num} failed: {e}")
+                logger.debug(f"SQL: {statement.sql}")
+                for record in chunk_args:
+                    failed_records.append(
+                        {**record, "chunk_index": chunk_num, "error_message": str(e)}
+                    )
+
+        await self._run_chunks(
+            execute_chunk,
+            chunks,
+            total=-(-len(rows) // chunk_size),
+            max_workers=concurrency,
+            desc="Inserting chunks",
+        )
+
+        if failed_records:
+            logger.warning(
+                f"{len(failed_records)} record(s) across some chunk(s) failed during execution. "
+                "You can inspect or retry them using the returned DataFrame if return_failures=True."
+            )
+        else:
+            logger.info("All chunks executed successfully.")
+
+        return self._write_result(failed_records, return_failures, return_status)
+
+    ### --- Insert batch (Concurrent tasks, Multiple transactions, Inserts Only) --- ###
+
+    async def insert_batch(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        chunk_size: int = 512,
+        max_workers: Optional[int] = None,
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+        method: Literal["insert", "values"] = "insert",
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Inserts a pandas DataFrame into a SQL table in concurrent chunks, one transaction per chunk.
+
+        This wraps `execute_batch()` by generating an INSERT statement from the DataFrame columns and table name.
+
+        Args:
+            df (pandas.DataFrame): The DataFrame containing rows to insert. Columns must match the target table schema.
+            table_name (str): Full table name, e.g., "schema.table".
+            chunk_size (int): Number of rows per batch. Defaults to 512.
+            max_workers (Optional[int]): Maximum number of concurrent chunks. Defaults to the client's max_workers.
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            return_failures (bool): If True, includes failed records with error messages in the result.
+            return_status (bool): If True, includes a boolean success flag in the result.
+            method (Literal["insert", "values"]): "insert" (parameterized INSERT executed for all rows of the chunk,
+                default) or "values" (multi-row INSERT statements). The "copy" and "load_data" bulk loads need the
+                synchronous drivers and are only available on DBClient.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If the insert method is not supported or chunk_size is not positive.
+            BadArgumentsBulk: If the input DataFrame is empty or invalid.
+            UnsupportedDatabaseType: If the current database type does not support insert generation.
+            UnsupportedMultiThreadedDatabase: If concurrent inserts are attempted on SQLite.
+            LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
+            SQLExecutionError: If duplicate-handling logic insertion fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        try:
+            _validate_args_for_bulk(df)
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for insert_batch {e}")
+            raise
+
+        if self._db_type == "sqlite":
+            logger.error(
+                "Concurrent writes are not supported on SQLite. Use insert_many or execute instead."
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        _check_chunk_size(chunk_size)
+        self._check_max_workers(max_workers)
+
+        if self._check_async_insert_method(method) == "values":
+            return await self._insert_values_batches(
+                df=df,
+                table_name=table_name,
+                on_duplicate=on_duplicate,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                return_failures=return_failures,
+                return_status=return_status,
+            )
+
+        sql = self._insert_sql(df, table_name, on_duplicate)
+        return await self.execute_batch(
+            sql=sql,
+            args=df,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            on_duplicate=None,  # already applied in here
+            return_failures=return_failures,
+            return_status=return_status,
+        )
+
+    ### --- Batch helpers --- ###
+
+    async def _run_chunks(
+        self,
+        worker: Callable[[Any, int], Awaitable[None]],
+        chunks: Iterable[tuple[Any, int]],
+        total: int,
+        max_workers: int,
+        desc: str,
+    ) -> None:
+        """
+        Runs `worker(chunk, chunk_num)` as tasks, at most `max_workers` at a time, pulling chunks lazily.
+
+        A semaphore slot is acquired before the next chunk is taken from the iterable, so a lazy iterable
+        is never sliced more than `max_workers` chunks ahead of the database.
+
+        Args:
+            worker (Callable[[Any, int], Awaitable[None]]): Coroutine function executing one chunk.
+                Expected to handle its own errors.
+            chunks (Iterable[tuple[Any, int]]): (chunk, chunk_num) pairs, ideally a generator.
+            total (int): Number of chunks, for progress reporting.
+            max_workers (int): Maximum number of running chunks, at least 1.
+            desc (str): Operation name for progress reporting.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+        pending: set[asyncio.Future[None]] = set()
+        chunk_iterator = iter(chunks)
+
+        with self._track_progress(desc, total) as progress:
+
+            async def run_chunk(chunk: Any, chunk_num: int) -> None:
+                try:
+                    await worker(chunk, chunk_num)
+                    progress.update(rows=len(chunk), payload=chunk)
+                finally:
+                    semaphore.release()
+
+            while True:
+                # Backpressure, wait for a slot before slicing the next chunk
+                await semaphore.acquire()
+                item = next(chunk_iterator, None)
+                if item is None:
+                    semaphore.release()
+                    break
+                task = asyncio.ensure_future(run_chunk(*item))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            await asyncio.gather(*pending)
+
+    def _check_async_insert_method(self, method: str) -> str:
+        """
+        Validates the insert method of insert_many or insert_batch for the asyncio drivers.
+
+        Args:
+            method (str): Requested insert method.
+
+        Returns:
+            str: The validated method, "insert" or "values".
+
+        Raises:
+            InvalidSQLOperation: If the method is unknown, unsupported by the database, or a bulk load method.
+        """
+        if self._check_insert_method(method) in {"copy", "load_data"}:
+            raise InvalidSQLOperation(
+                f"method='{method}' is not supported by AsyncDBClient. "
+                "Use 'insert' or 'values', or DBClient for native bulk loads."
+            )
+        return method
+
+    def _insert_sql(
+        self, df: pd.DataFrame, table_name: str, on_duplicate: Optional[str]
+    ) -> str:
+        """
+        Builds the parameterized INSERT statement of a DataFrame, with duplicate handling applied.
+
+        Args:
+            df (pandas.DataFrame): Rows to insert.
+            table_name (str): Target table name, e.g., "schema.table".
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+
+        Returns:
+            str: The INSERT statement.
+
+        Raises:
+            UnsupportedDatabaseType: If the current database type does not support insert generation.
+            SQLExecutionError: If duplicate-handling logic insertion fails.
+        """
+        try:
+            sql = _build_insert_statement(
+                table_name=table_name, columns=list(df.columns), db_type=self._db_type
+            )
+        except UnsupportedDatabaseType as e:
+            logger.error(
+                f"Could not generate insert statement for table '{table_name}': {e}"
+            )
+            raise
+
+        try:
+            return _apply_on_duplicate_clause(sql, self._db_type, on_duplicate)
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+    async def _insert_values_batches(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        on_duplicate: Optional[str],
+        chunk_size: Optional[int],
+        max_workers: Optional[int],
+        return_failures: bool,
+        return_status: bool,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Inserts a DataFrame with multi-row INSERT statements, one transaction per chunk.
+
+        Args:
+            df (pandas.DataFrame): Rows to insert. Columns must match the target table.
+            table_name (str): Target table name, e.g., "schema.table".
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            chunk_size (Optional[int]): Rows per chunk, inserted concurrently. If None, the whole DataFrame is
+                inserted in a single transaction.
+            max_workers (Optional[int]): Maximum number of concurrent chunks. Defaults to the client's max_workers.
+            return_failures (bool): If True, includes failed records with error messages in the result.
+            return_status (bool): If True, includes a boolean success flag in the result.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: The failures DataFrame (or None) and the success flag (or None).
+
+        Raises:
+            SQLExecutionError: If duplicate-handling logic is not supported by the database.
+        """
+        columns = list(df.columns)
+        rows_per_statement = _rows_per_insert_statement(self._db_type, len(columns))
+        try:
+            values_sql = _apply_on_duplicate_clause(
+                _build_multi_row_insert_statement(
+                    table_name=table_name,
+                    columns=columns,
+                    db_type=self._db_type,
+                    num_rows=rows_per_statement,
+                ),
+                self._db_type,
+                on_duplicate,
+            )
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+        failed_records: list[dict[str, Any]] = []
+        # Date-only datetime columns are detected on the whole DataFrame, not per chunk
+        date_only_columns = _date_only_columns(df)
+
+        async def insert_chunk(chunk: pd.DataFrame, chunk_num: Optional[int]) -> None:
+            rows = _dataframe_to_params(chunk, date_only_columns)
+            num_full = len(rows) // rows_per_statement * rows_per_statement
+            full_params = [
+                _flatten_rows_to_params(rows[i : i + rows_per_statement], columns)
+                for i in range(0, num_full, rows_per_statement)
+            ]
+            try:
+                async with self._engine.begin() as conn:
+                    if full_params:
+                        await conn.execute(text(values_sql), full_params)
+                    if num_full < len(rows):
+                        remainder_sql = _apply_on_duplicate_clause(
+                            _build_multi_row_insert_statement(
+                                table_name=table_name,
+                                columns=columns,
+                                db_type=self._db_type,
+                                num_rows=len(rows) - num_full,
+                            ),
+                            self._db_type,
+                            on_duplicate,
+                        )
+                        await conn.execute(
+                            text(remainder_sql),
+                            _flatten_rows_to_params(rows[num_full:], columns),
+                        )
+            # Silent failing and collecting failed rows
+            except Exception as e:
+                logger.warning(f"Insert (values) of chunk {chunk_num} failed: {e}")
+                for record in rows:
+                    if chunk_num is not None:
+                        record["chunk_index"] = chunk_num
+                    record["error_message"] = str(e)
+                    failed_records.append(record)
+
+        if chunk_size is None:
+            await insert_chunk(df, None)
+        else:
+            await self._run_chunks(
+                insert_chunk,
+                (
+                    (df.iloc[i : i + chunk_size], i // chunk_size)
+                    for i in range(0, len(df), chunk_size)
+                ),
+                total=-(-len(df) // chunk_size),
+                max_workers=self._check_max_workers(max_workers),
+                desc="Inserting chunks",
+            )
+
+        if failed_records:
+            logger.warning(
+                f"{len(failed_records)} record(s) failed during insert (values). "
+                "You can inspect or retry them using the returned DataFrame if return_failures=True."
+            )
+        else:
+            logger.info(f"{len(df)} record(s) inserted successfully (values).")
+
+        return self._write_result(failed_records, return_failures, return_status)
@@ -0,0 +1,551 @@
+from __future__ import annotations
+
+### --- Standard library imports --- ###
+from datetime import datetime as dt
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
+
+### --- Third-party imports --- ###
+from sqlalchemy.engine.row import Row
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions.dbclient import DBClientClosedError
+from SQLThunder.exceptions.execution import (
+    InvalidSQLOperation,
+    QueryDisallowedClauseError,
+    QueryResultFormatError,
+    QuerySelectOnlyError,
+)
+from SQLThunder.logging_config import logger
+from SQLThunder.utils.lazy_imports import _LazyModule
+from SQLThunder.utils.result_conversion import (
+    ARROW_RETURN_TYPES,
+    _arrow_to_pandas,
+    _concat_arrow_tables,
+    _concat_dataframes,
+    _rows_to_arrow,
+)
+from SQLThunder.utils.sql_conversion import (
+    _convert_dbapi_to_sqlalchemy_style,
+    _parse_datetime_key_based_pagination,
+    _validate_select_no_limit_offset,
+)
+from SQLThunder.utils.statement_cache import (
+    StatementCacheInfo,
+    _prepare_statement,
+    _PreparedStatement,
+    _StatementCache,
+)
+
+from .progress import ProgressCallback, _ProgressTracker
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = _LazyModule("pandas")
+
+### --- Shared base of DBClient and AsyncDBClient --- ###
+
+
+class _BaseDBClient:
+    """
+    Members shared by `DBClient` and `AsyncDBClient` that do no I/O: constants, closed-state checks,
+    progress reporting, the statement cache, key-based pagination setup and result formatting.
+
+    Subclasses set `_closed`, `_db_type`, `_progress`, `_statement_cache` and `_strict_sql_validation`
+    in their `__init__`.
+    """
+
+    # Supported datetime format
+    DATETIME_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]
+
+    # Default pool size and max_overflow
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_MAX_OVERFLOW = 5
+
+    # INFINITY VALUES
+    INT_NEG_INF = -(10**12)
+    INT_POS_INF = 10**15
+
+    # Native bulk load method of each database (insert_many / insert_batch)
+    BULK_LOAD_METHODS = {"postgresql": "copy", "mysql": "load_data"}
+
+    _closed: bool
+    _db_type: str
+    _progress: Optional[ProgressCallback]
+    _statement_cache: _StatementCache
+    _strict_sql_validation: bool
+
+    ### --- Closed state --- ###
+
+    def _check_closed(self) -> None:
+        """
+        Internal check to prevent operations on a closed client.
+
+        Raises:
+            DBClientClosedError: If the instance has already been closed.
+        """
+        if self._closed:
+            raise DBClientClosedError()
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Indicates whether the client has been closed.
+
+        Returns:
+            bool: True if `close()` was called and the instance is now inactive.
+        """
+        return self._closed
+
+    ### --- Progress reporting --- ###
+
+    @property
+    def progress(self) -> Optional[ProgressCallback]:
+        """
+        Progress callback of batch operations (`query_batch`, `query_keyed_parallel`, `execute_batch`,
+        `insert_batch` and `insert_file`, where available). Can be replaced at any time; None disables reporting.
+
+        Returns:
+            Optional[ProgressCallback]: The current callback, or None.
+        """
+        return self._progress
+
+    @progress.setter
+    def progress(self, callback: Optional[ProgressCallback]) -> None:
+        self._progress = callback
+
+    def _track_progress(
+        self, description: str, total_chunks: Optional[int] = None, unit: str = "chunk"
+    ) -> _ProgressTracker:
+        """
+        Creates the progress tracker of one batch operation, bound to the current progress callback.
+
+        Args:
+            description (str): Operation name shown to the user.
+            total_chunks (Optional[int]): Total number of chunks, or None if unknown.
+            unit (str): What a chunk is for this operation. Defaults to "chunk".
+
+        Returns:
+            _ProgressTracker: A tracker to use as a context manager.
+        """
+        return _ProgressTracker(self._progress, description, total_chunks, unit)
+
+    ### --- Statement cache --- ###
+
+    def statement_cache_info(self) -> StatementCacheInfo:
+        """
+        Returns the statistics of the prepared statement cache used by `query`, `iter_query`,
+        `execute`, `execute_many` and `execute_batch`.
+
+        Returns:
+            StatementCacheInfo: Named tuple (hits, misses, maxsize, currsize).
+        """
+        return self._statement_cache.info()
+
+    def clear_statement_cache(self) -> None:
+        """
+        Empties the prepared statement cache and resets its statistics.
+        """
+        self._statement_cache.clear()
+
+    def _prepare_statement(
+        self,
+        sql: str,
+        validate: Optional[str] = None,
+        convert: bool = True,
+        on_duplicate: Optional[str] = None,
+    ) -> _PreparedStatement:
+        """
+        Validates and converts a raw SQL string, going through the statement cache.
+
+        The cache key is the raw SQL plus every option that changes the prepared statement; the
+        database type is fixed for a client so it needs no key of its own.
+
+        Args:
+            sql (str): Raw SQL string as given by the caller.
+            validate (Optional[str]): "select" or "select_no_limit_offset" to check the statement, None to skip.
+            convert (bool): Whether to convert DBAPI-style placeholders. Defaults to True.
+            on_duplicate (Optional[str]): Duplicate handling mode ("ignore", "replace" or None).
+
+        Returns:
+            _PreparedStatement: The converted SQL (`.sql`) and its TextClause (`.clause`).
+
+        Raises:
+            QuerySelectOnlyError: If validation is requested and the SQL is not a SELECT.
+            QueryDisallowedClauseError: If "select_no_limit_offset" is requested and the SQL has LIMIT/OFFSET.
+            SQLExecutionError: If duplicate-handling logic could not be applied.
+        """
+        return self._statement_cache.get(
+            (sql, validate, convert, on_duplicate),
+            lambda: _prepare_statement(
+                sql,
+                self._db_type,
+                validate,
+                convert,
+                on_duplicate,
+                self._strict_sql_validation,
+            ),
+        )
+
+    ### --- Key-based pagination helper --- ###
+
+    def _prepare_keyed_query(
+        self,
+        sql: str,
+        key_column_type: str,
+        start_key: Optional[Union[int, dt, str]],
+        end_key: Optional[Union[int, dt, str]],
+        order: Optional[str],
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ],
+        method_name: str,
+    ) -> tuple[str, dict[str, Any], Union[int, str, dt], Optional[Union[int, str, dt]]]:
+        """
+        Validates a key-based pagination request and resolves its bind arguments and key bounds.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or pagination conditions).
+            key_column_type (str): One of "int", "string" or "date".
+            start_key (Optional[Union[int, datetime.datetime, str]]): Key to start from.
+            end_key (Optional[Union[int, datetime.datetime, str]]): Inclusive key to stop at.
+            order (Optional[str]): "asc" or "desc". None defaults to "asc".
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the SQL query.
+            method_name (str): Name of the calling public method, used in error messages.
+
+        Returns:
+            tuple[str, dict[str, Any], Union[int, str, datetime.datetime], Optional[Union[int, str, datetime.datetime]]]:
+                The converted SQL, the bind arguments (including `end_key` if any), the starting key and the end key.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL is not a SELECT statement.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            InvalidSQLOperation: If the key column type, keys or bound arguments are invalid.
+        """
+        # Validate select query
+        try:
+            _validate_select_no_limit_offset(
+                sql=sql, strict=self._strict_sql_validation
+            )
+        except QuerySelectOnlyError:
+            raise
+        except QueryDisallowedClauseError:
+            logger.error(
+                "Use start_key and end_key if you want to achieve a similar result to offset and limit"
+            )
+            raise
+
+        # Check key_column_type
+        accepted_key_column_type = {"int", "string", "date"}
+        if key_column_type not in accepted_key_column_type:
+            raise InvalidSQLOperation(
+                f"{method_name}() requires a key_column_type to be one of {accepted_key_column_type}."
+            )
+
+        # Set order to default to asc if None
+        order = order or "asc"
+
+        try:
+            if args is not None:
+                sql, converted_args = _convert_dbapi_to_sqlalchemy_style(sql, args)
+                if isinstance(converted_args, list):
+                    if len(converted_args) != 1:
+                        raise InvalidSQLOperation(
+                            f"{method_name}() only accepts one row of parameters."
+                        )
+                    args = converted_args[0]
+                else:
+                    args = converted_args
+        except Exception as e:
+            logger.warning(f"Invalid SQL or args: {e}")
+            raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
+
+        # Create new args dic for current_key and last key, start key depending
+        bind_args = args.copy() if args else {}
+
+        # For mypy
+        current_key: Union[int, str, dt]
+        max_key: Optional[Union[int, str, dt]]
+
+        ### --- Initialize current_key and max key --- ###
+
+        # Convert to datetime format if using a date as key (key_column_type="date")
+        if key_column_type == "date":
+            if (start_key is None) or (not isinstance(start_key, (dt, str))):
+                raise InvalidSQLOperation(
+                    f"{method_name}() requires a start_key when key_column_type='date'. "
+                    f"It must either be a string in one of the {self.DATETIME_FORMATS} formats or a datetime object. "
+                )
+            else:
+                try:
+                    current_key = _parse_datetime_key_based_pagination(
+                        start_key, "start_key", accepted_formats=self.DATETIME_FORMATS
+                    )
+                except InvalidSQLOperation:
+                    raise
+                if end_key is not None:
+                    try:
+                        max_key = _parse_datetime_key_based_pagination(
+                            end_key, "end_key", accepted_formats=self.DATETIME_FORMATS
+                        )
+                    except InvalidSQLOperation:
+                        raise
+                else:
+                    max_key = None
+
+        # Initialize as string if key_column_type="string"
+        elif key_column_type == "string":
+            if (start_key is None) or (not isinstance(start_key, str)):
+                raise InvalidSQLOperation(
+                    f"{method_name}() requires a start_key when key_column_type='string'. "
+                    "It must be a string. "
+                    "You can use '' as a start_key with order 'asc' to get all rows from the beginning. "
+                    "Using '' as a surrogate is unsafe unless you guarantee no empty-string keys. "
+                )
+            else:
+                current_key = start_key
+                if end_key is not None:
+                    if isinstance(end_key, str):
+                        max_key = end_key
+                    else:
+                        raise InvalidSQLOperation(
+                            f"{method_name}() requires end_key to be a string when key_column_type='string'"
+                        )
+                else:
+                    max_key = None
+
+        else:  # key_column_type == "int"
+            # Start key
+            if start_key is None:
+                current_key = self.INT_NEG_INF if order == "asc" else self.INT_POS_INF
+            elif isinstance(start_key, int):
+                current_key = start_key
+            else:
+                raise InvalidSQLOperation(
+                    f"{method_name}() requires start_key to be an int when key_column_type='int'"
+                )
+            # Max key
+            if end_key is not None:
+                if isinstance(end_key, int):
+                    max_key = end_key
+                else:
+                    raise InvalidSQLOperation(
+                        f"{method_name}() requires end_key to be an int when key_column_type='int'"
+                    )
+            else:
+                max_key = None
+
+        # Assign max_key
+        if max_key is not None:
+            bind_args["end_key"] = max_key
+
+        return sql, bind_args, current_key, max_key
+
+    ### --- Result formatting helpers --- ###
+
+    @staticmethod
+    def _format_rows(
+        rows: Sequence[Row], columns: list[str], return_format: str
+    ) -> Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None]:
+        """
+        Converts fetched rows into the requested return format.
+
+        Args:
+            rows (Sequence[Row]): Rows returned by SQLAlchemy.
+            columns (list[str]): Result column names.
+            return_format (str): One of "df", "list", "raw", "none", "arrow" or "df_arrow" (case-insensitive).
+
+        Returns:
+            Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row], None]: The formatted result.
+
+        Raises:
+            QueryResultFormatError: If return_format is not supported.
+        """
+        fmt = return_format.lower()
+        if fmt == "df":
+            return pd.DataFrame(rows, columns=columns or None)
+        elif fmt == "none":
+            return None
+        elif fmt == "raw":
+            return rows
+        elif fmt == "list":
+            return [dict(zip(columns, row)) for row in rows] if columns else []
+        elif fmt == "arrow":
+            return _rows_to_arrow(rows, columns)
+        elif fmt == "df_arrow":
+            return _arrow_to_pandas(_rows_to_arrow(rows, columns))
+        else:
+            raise QueryResultFormatError(return_format)
+
+    @staticmethod
+    def _format_arrow_tables(
+        tables: list[Any],
+        columns: list[str],
+        return_format: str,
+        print_result: bool = False,
+        print_limit: int = 10,
+    ) -> Union[pd.DataFrame, Any]:
+        """
+        Concatenates per-batch pyarrow tables into the requested Arrow return format.
+
+        Args:
+            tables (list[pyarrow.Table]): Batches of the result, in result order.
+            columns (list[str]): Result column names.
+            return_format (str): "arrow" or "df_arrow" (case-insensitive).
+            print_result (bool): Whether to print a preview of the result to stdout.
+            print_limit (int): Number of rows to print if print_result is True.
+
+        Returns:
+            Union[pyarrow.Table, pandas.DataFrame]: A pyarrow.Table for "arrow", or a DataFrame
+                with Arrow-backed columns for "df_arrow".
+
+        Raises:
+            QueryResultFormatError: If return_format is not an Arrow return type.
+        """
+        table = _concat_arrow_tables(tables, columns)
+
+        if print_result and table.num_rows:
+            print(table.slice(0, print_limit).to_pandas().to_string(index=False))
+
+        fmt = return_format.lower()
+        if fmt == "arrow":
+            return table
+        elif fmt == "df_arrow":
+            return _arrow_to_pandas(table)
+        else:
+            raise QueryResultFormatError(return_format)
+
+    @staticmethod
+    def _chunk_converter(
+        return_format: str,
+    ) -> Optional[Callable[[Sequence[Row], list[str]], Any]]:
+        """
+        Returns the conversion applied to each chunk of a batched query as soon as it is fetched.
+
+        Converting chunk by chunk (DataFrame, dicts or pyarrow table) means no Row list outlives its chunk.
+
+        Args:
+            return_format (str): Lowercase return format of the query.
+
+        Returns:
+            Optional[Callable[[Sequence[Row], list[str]], Any]]: The conversion, or None to keep the rows.
+        """
+        if return_format in ARROW_RETURN_TYPES:
+            return _rows_to_arrow
+        if return_format in {"df", "list"}:
+            return partial(_BaseDBClient._format_rows, return_format=return_format)
+        return None
+
+    def _assemble_chunks(
+        self,
+        results: list[tuple[int, Any, Any]],
+        return_format: str,
+        print_result: bool = False,
+        print_limit: int = 10,
+    ) -> Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], Any, None]:
+        """
+        Assembles the chunks of a batched query, in chunk order, into the requested return format.
+
+        Args:
+            results (list[tuple[int, Any, Any]]): (chunk_index, rows or converted rows, column names) tuples,
+                in any order. The list is emptied.
+            return_format (str): Lowercase return format ("df", "list", "raw", "none", "arrow" or "df_arrow").
+            print_result (bool): Whether to print a preview of the result to stdout.
+            print_limit (int): Number of rows to print if print_result is True.
+
+        Returns:
+            Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row], pyarrow.Table, None]: The result.
+
+        Raises:
+            QueryResultFormatError: If return_format is not supported.
+        """
+        # Sort chunks
+        results.sort(key=lambda x: x[0])
+        # Extract first valid column names
+        column_names = []
+        for _, _, cols in results:
+            if cols:
+                column_names = list(cols)
+                break
+        # Keep only the converted chunks, in order
+        chunks = [chunk for _, chunk, _ in results]
+        results.clear()
+
+        # If no rows
+        if not chunks:
+            logger.info("Query executed successfully but returned no rows.")
+        # If no column_names
+        if not column_names:
+            logger.info("Query returned no column names: check your sql statement.")
+
+        if return_format in ARROW_RETURN_TYPES:
+            return self._format_arrow_tables(
+                chunks, column_names, return_format, print_result, print_limit
+            )
+
+        # Assemble the result once, releasing each chunk as soon as it is consumed
+        res: Any
+        if return_format == "df":
+            res = _concat_dataframes(chunks, column_names)
+            preview_df = res.head(print_limit)
+        elif return_format in {"list", "raw", "none"}:
+            all_rows: list[Any] = []
+            chunks.reverse()
+            while chunks:
+                all_rows.extend(chunks.pop())
+            if return_format == "list":
+                res = all_rows if column_names else []
+                preview_df = pd.DataFrame(
+                    res[:print_limit], columns=column_names or None
+                )
+            else:
+                res = all_rows if return_format == "raw" else None
+                preview_df = pd.DataFrame(
+                    all_rows[:print_limit], columns=column_names or None
+                )
+        else:
+            raise QueryResultFormatError(return_format)
+
+        # Optional print
+        if print_result:
+            print(preview_df.to_string(index=False))
+
+        return res
+
+    ### --- Insert method helper --- ###
+
+    def _check_insert_method(self, method: str) -> str:
+        """
+        Validates the insert method requested by insert_many or insert_batch.
+
+        Args:
+            method (str): Requested insert method.
+
+        Returns:
+            str: The validated method.
+
+        Raises:
+            InvalidSQLOperation: If the method is unknown or unsupported by the current database.
+        """
+        if method not in {"insert", "values", "copy", "load_data"}:
+            raise InvalidSQLOperation(
+                f"Unknown insert method '{method}'. "
+                "Expected 'insert', 'values', 'copy' or 'load_data'."
+            )
+        if (
+            method in {"copy", "load_data"}
+            and self.BULK_LOAD_METHODS.get(self._db_type) != method
+        ):
+            raise InvalidSQLOperation(
+                f"method='{method}' is not supported on {self._db_type}. "
+                "Use 'copy' on PostgreSQL and 'load_data' on MySQL."
+            )
+        return method
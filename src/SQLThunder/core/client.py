@@ -1,17 +1,42 @@
+from __future__ import annotations
+
 ### --- Standard library imports --- ###
+import multiprocessing
+import os
+import tempfile
 import threading
-from concurrent.futures import ThreadPoolExecutor, wait
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import nullcontext
 from datetime import datetime as dt
-from queue import Empty, Queue
-from typing import Any, Literal, Optional, Sequence, Union, cast
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
 ### --- Third-party imports --- ###
-import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import NoSuchModuleError, OperationalError, SQLAlchemyError
-from tqdm import tqdm
+from sqlalchemy.sql.elements import TextClause
 
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions.base import (
@@ -37,45 +62,109 @@ from SQLThunder.exceptions.execution import (
     UnsupportedMultiThreadedDatabase,
 )
 from SQLThunder.logging_config import logger
+from SQLThunder.utils.chunk_sizing import (
+    ADAPTIVE_INITIAL_READ_CHUNK_SIZE,
+    ADAPTIVE_INITIAL_WRITE_CHUNK_SIZE,
+    ADAPTIVE_MAX_CHUNK_BYTES,
+    ADAPTIVE_MAX_STATEMENT_BYTES,
+    _AdaptiveChunkSizer,
+    _check_chunk_size,
+    _estimate_row_bytes,
+    _iter_adaptive_chunks,
+)
+from SQLThunder.utils.concurrency import ConcurrencyInfo, _ConcurrencyLimiter
 from SQLThunder.utils.config import _load_config, _resolve_ssl_paths
-from SQLThunder.utils.engine import _build_connect_args, _get_db_url
-from SQLThunder.utils.insert_helpers import _apply_on_duplicate_clause
+from SQLThunder.utils.engine import (
+    _build_connect_args,
+    _build_engine_kwargs,
+    _get_db_url,
+)
+from SQLThunder.utils.file_io import iter_data
+from SQLThunder.utils.insert_helpers import (
+    _apply_on_duplicate_clause,
+    _build_copy_statements,
+    _build_load_data_statement,
+    _dataframe_to_csv_buffer,
+    _dataframe_to_tsv,
+    _rows_per_insert_statement,
+)
+from SQLThunder.utils.lazy_imports import _is_dataframe, _LazyModule
+from SQLThunder.utils.partitioning import (
+    _build_key_bounds_query,
+    _build_key_range_query,
+    _build_keyed_page_query,
+    _build_limit_offset_query,
+    _build_null_key_query,
+    _build_offset_chunk_query,
+    _next_key_bound,
+    _plan_key_partitions,
+    _split_key_range,
+)
+from SQLThunder.utils.process_pool import (
+    _execute_shard,
+    _init_worker,
+    _make_shard,
+    _ShardResult,
+)
+from SQLThunder.utils.result_conversion import (
+    ARROW_FETCH_SIZE,
+    ARROW_RETURN_TYPES,
+    _require_pyarrow,
+    _rows_to_arrow,
+)
+from SQLThunder.utils.retry import (
+    DEFAULT_RETRY_BACKOFF,
+    _check_retry_arguments,
+    _execute_with_retry,
+)
 from SQLThunder.utils.sql_conversion import (
     _build_insert_statement,
+    _build_multi_row_insert_statement,
+    _convert_args,
     _convert_dbapi_to_sqlalchemy_style,
-    _parse_datetime_key_based_pagination,
+    _dataframe_to_params,
+    _date_only_columns,
+    _flatten_rows_to_params,
     _validate_args_for_bulk,
-    _validate_select,
     _validate_select_no_limit_offset,
 )
+from SQLThunder.utils.statement_cache import (
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    _StatementCache,
+)
+from SQLThunder.utils.transient_errors import _is_transient_error
+
+from .base import _BaseDBClient
+from .progress import ProgressCallback, _payload_nbytes, _ProgressTracker
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = _LazyModule("pandas")
 
 ### --- Core class DBClient --- ###
 
 
-class DBClient:
+class DBClient(_BaseDBClient):
     """
     DBClient handles all SQL database interactions, including threaded bulk insert/update operations,
     query batching, and efficient pagination. Compatible with MySQL, PostgreSQL, and SQLite.
     """
 
-    # Supported datetime format
-    DATETIME_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]
-
-    # Default pool size and max_overflow
-    DEFAULT_POOL_SIZE = 10
-    DEFAULT_MAX_OVERFLOW = 5
-
-    # INFINITY VALUES
-    INT_NEG_INF = -(10**12)
-    INT_POS_INF = 10**15
+    # Chunks submitted ahead of the workers in batch writes, per worker (backpressure)
+    DEFAULT_IN_FLIGHT_PER_WORKER = 2
 
     def __init__(
         self,
         config_file_path: str,
         db_type: Optional[str] = None,
-        pool_size: int = DEFAULT_POOL_SIZE,
-        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_size: int = _BaseDBClient.DEFAULT_POOL_SIZE,
+        max_overflow: int = _BaseDBClient.DEFAULT_MAX_OVERFLOW,
         max_workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        strict_sql_validation: bool = False,
     ) -> None:
         """
         Initializes a DBClient instance from a config file, creating a SQLAlchemy engine and thread pool.
@@ -87,6 +176,13 @@ class DBClient:
             max_overflow (int): Maximum overflow connections allowed above pool_size. Defaults to DEFAULT_MAX_OVERFLOW.
             max_workers (Optional[int]): Maximum number of threads for concurrent execution.
                 If None, defaults to pool_size + max_overflow.
+            progress (Optional[ProgressCallback]): Called with a ProgressEvent (chunks, rows, bytes and rates)
+                as batch operations progress. Defaults to None (no progress reporting). Use
+                `SQLThunder.TqdmProgress()` for tqdm bars.
+            statement_cache_size (int): Number of prepared statements (converted SQL and `text()` clause)
+                kept in the LRU statement cache. 0 disables the cache. Defaults to DEFAULT_STATEMENT_CACHE_SIZE.
+            strict_sql_validation (bool): Validate queries with a full sqlparse parse instead of the lightweight
+                lexer (also rejects LIMIT/OFFSET inside subqueries where they are disallowed). Defaults to False.
 
         Raises:
             ConfigFileError: If the config file is missing or invalid.
@@ -124,9 +220,25 @@ class DBClient:
             self._driver, self._ssl_paths, self._config
         )
 
+        # Extra engine args for fast executemany, opt-in from the config
+        self._engine_kwargs = _build_engine_kwargs(self._driver, self._config)
+
         # Create a close flag so when close() is called we make instance unusable for error prevention
         self._closed = False
 
+        # Progress callback of batch operations (None = silent)
+        self._progress = progress
+
+        # LRU cache of prepared statements, keyed on the raw SQL
+        self._statement_cache = _StatementCache(statement_cache_size)
+
+        # Full sqlparse validation of queries instead of the lexer
+        self._strict_sql_validation = strict_sql_validation
+
+        # Per-thread adaptive concurrency state: `info` of the last batch operation with max_workers="auto",
+        # and `shared_limiter`, the limiter of an insert_file() call reused by each of its file chunks
+        self._concurrency_state = threading.local()
+
         # Create engine
         self._engine = self._create_engine_alchemy()
 
@@ -153,7 +265,7 @@ class DBClient:
         Creates and returns a SQLAlchemy Engine instance using internal config.
 
         Returns:
-            Engine: SQLAlchemy Engine configured with SSL and pooling options.
+            Engine: SQLAlchemy Engine configured with SSL, pooling and executemany options.
 
         Raises:
             DriverNotFoundError: If the DB driver module cannot be loaded.
@@ -169,6 +281,7 @@ class DBClient:
                 echo=False,
                 future=True,
                 pool_pre_ping=True,
+                **self._engine_kwargs,
             )
         except NoSuchModuleError as e:
             logger.error(
@@ -206,16 +319,6 @@ class DBClient:
             logger.error(f"SQLAlchemyError during connection test: {e}")
             raise DatabaseConnectionError("SQLAlchemy error during test connection", e)
 
-    def _check_closed(self) -> None:
-        """
-        Internal check to prevent operations on a closed DBClient.
-
-        Raises:
-            DBClientClosedError: If the instance has already been closed.
-        """
-        if self._closed:
-            raise DBClientClosedError()
-
     ### --- Public connection controls and resources management --- ###
 
     def test_connection(self) -> bool:
@@ -278,14 +381,16 @@ class DBClient:
             logger.info("DBClient shut down")
 
     @property
-    def is_closed(self) -> bool:
+    def fast_executemany(self) -> bool:
         """
-        Indicates whether the DBClient has been closed.
+        Indicates whether fast executemany is enabled (`fast_executemany: true` in the config).
+
+        Applies to `execute_many`, `execute_batch`, `insert_many` and `insert_batch`.
 
         Returns:
-            bool: True if `close()` was called and the instance is now inactive.
+            bool: True if the engine was created with fast executemany options.
         """
-        return self._closed
+        return bool(self._config.get("fast_executemany"))
 
     ### --- Read operations --- ###
 
@@ -302,7 +407,7 @@ class DBClient:
                 dict[str, Any],
             ]
         ] = None,
-        return_type: Literal["df", "raw", "list", "none"] = "df",
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
         print_result: bool = False,
         print_limit: int = 5,
     ) -> Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None]:
@@ -313,11 +418,13 @@ class DBClient:
             sql (str): A SQL SELECT statement. May include named placeholders (e.g., :id).
             args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
                 Parameters to bind to the query. Must be a single dict or tuple, or a list containing exactly one such element.
-            return_type (Literal["df", "raw", "list", "none"]): Format of the returned result. One of:
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result. One of:
                 - "df": Return a pandas.DataFrame (default)
                 - "list": Return a list of dictionaries
                 - "raw": Return a list of SQLAlchemy Row objects
                 - "none": Return None
+                - "arrow": Return a pyarrow.Table (requires pyarrow)
+                - "df_arrow": Return a pandas.DataFrame with Arrow-backed columns (requires pyarrow)
             print_result (bool): Whether to print the query result to stdout.
             print_limit (int): Number of rows to display when printing. Only used if print_result is True.
 
@@ -330,25 +437,34 @@ class DBClient:
             InvalidSQLOperation: If the SQL is malformed or multiple argument sets are passed.
             QueryExecutionError: If query execution fails.
             QueryResultFormatError: If return_type is unsupported.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
             DBClientClosedError: If the instance has already been closed.
         """
         self._check_closed()
 
-        # Check if it is a select statement
+        # Check if it is a select statement and convert placeholders (cached per statement)
         try:
-            _validate_select(sql=sql)
+            statement = self._prepare_statement(
+                sql, validate="select", convert=args is not None
+            )
         except QuerySelectOnlyError:
             raise
 
         # Check accepted return types
         return_format: str = return_type
-        if return_format.lower() not in {"df", "list", "raw", "none"}:
+        if (
+            return_format.lower()
+            not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES
+        ):
             raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
 
         # Convert args
+        sql = statement.sql
         try:
             if args is not None:
-                sql, converted_args = _convert_dbapi_to_sqlalchemy_style(sql, args)
+                converted_args = _convert_args(args)
                 if isinstance(converted_args, list):
                     if len(converted_args) != 1:
                         raise InvalidSQLOperation(
@@ -362,25 +478,37 @@ class DBClient:
             raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
 
         # Execute
+        return_format = return_format.lower()
         try:
             with self._engine.connect() as conn:
-                result = conn.execute(text(sql), args or {})
-                rows = result.fetchall()
+                result = conn.execute(statement.clause, args or {})
                 columns = list(
                     result.keys()
                 )  # For static type checking consistency (would work at runtime w/o list)
+                if return_format in ARROW_RETURN_TYPES:
+                    # Convert batch by batch, never holding the full list of rows
+                    tables = [
+                        _rows_to_arrow(batch, columns)
+                        for batch in result.partitions(ARROW_FETCH_SIZE)
+                    ]
+                else:
+                    rows = result.fetchall()
                 logger.info(f"Successfully executed query: {sql}")
         except SQLAlchemyError as e:
             logger.warning(f"Query failed: {e}")
             raise QueryExecutionError(e)
 
+        if return_format in ARROW_RETURN_TYPES:
+            return self._format_arrow_tables(
+                tables, columns, return_format, print_result, print_limit
+            )
+
         # Print preview if requested
         if print_result:
             preview_df = pd.DataFrame(rows[:print_limit], columns=columns or None)
             print(preview_df.to_string(index=False))
 
         # Return according to requested format
-        return_format = return_format.lower()
         if return_format == "df":
             return pd.DataFrame(rows, columns=columns or None)
         elif return_format == "list":
@@ -392,6 +520,117 @@ class DBClient:
         else:
             raise QueryResultFormatError(return_type)
 
+    ### --- Iter query (Single transaction, server-side cursor) --- ###
+
+    def iter_query(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        return_type: Literal["df", "raw", "list", "arrow", "df_arrow"] = "df",
+    ) -> Iterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+        """
+        Streams the result of a single SQL SELECT query in fixed-size batches using a server-side cursor.
+
+        Unlike `query()`, the result set is not buffered on the client: rows are pulled from the
+        database `chunk_size` at a time (psycopg2 named cursor, PyMySQL SSCursor). Memory stays bounded
+        by `chunk_size` and the first batch is available as soon as the server produces it, which makes
+        this the right choice for exporting queries that cannot be paginated (joins, aggregates, ...).
+
+        The connection stays checked out from the pool until the iterator is exhausted or closed.
+        Validation happens when the method is called; the query only runs when the returned iterator
+        is first advanced.
+
+        Args:
+            sql (str): A SQL SELECT statement. May include named placeholders (e.g., :id).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the query. Must be a single dict or tuple, or a list containing exactly one such element.
+            chunk_size (int): Number of rows per yielded batch. Defaults to 10,000.
+            return_type (Literal["df", "raw", "list", "arrow", "df_arrow"]): Format of each yielded batch. One of:
+                - "df": Yield pandas.DataFrame batches (default)
+                - "list": Yield lists of dictionaries
+                - "raw": Yield lists of SQLAlchemy Row objects
+                - "arrow": Yield pyarrow.Table batches (requires pyarrow)
+                - "df_arrow": Yield pandas.DataFrame batches with Arrow-backed columns (requires pyarrow)
+
+        Returns:
+            Iterator[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+                An iterator over the result batches, in the order returned by the database.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            InvalidSQLOperation: If the SQL is malformed, multiple argument sets are passed or chunk_size is not positive.
+            QueryResultFormatError: If return_type is unsupported.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            QueryExecutionError: While iterating, if the query or a fetch fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Check if it is a select statement and convert placeholders (cached per statement)
+        try:
+            statement = self._prepare_statement(
+                sql, validate="select", convert=args is not None
+            )
+        except QuerySelectOnlyError:
+            raise
+
+        # Check accepted return types ("none" makes no sense for an iterator)
+        return_format: str = return_type
+        if return_format.lower() not in {"df", "list", "raw"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        if chunk_size <= 0:
+            raise InvalidSQLOperation("iter_query() requires a positive chunk_size.")
+
+        # Convert args
+        sql = statement.sql
+        try:
+            if args is not None:
+                converted_args = _convert_args(args)
+                if isinstance(converted_args, list):
+                    if len(converted_args) != 1:
+                        raise InvalidSQLOperation(
+                            "iter_query() only accepts one row of parameters."
+                        )
+                    args = converted_args[0]
+                else:
+                    args = converted_args
+        except Exception as e:
+            logger.warning(f"Invalid SQL or args: {e}")
+            raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
+
+        def batch_iterator() -> (
+            Iterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]
+        ):
+            try:
+                with self._engine.connect() as conn:
+                    # stream_results -> server-side cursor, max_row_buffer caps the client buffer
+                    result = conn.execution_options(
+                        stream_results=True, max_row_buffer=chunk_size
+                    ).execute(statement.clause, args or {})
+                    columns = list(result.keys())
+                    for rows in result.partitions(chunk_size):
+                        yield cast(
+                            Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]],
+                            self._format_rows(rows, columns, return_format),
+                        )
+                    logger.info(f"Successfully streamed query: {sql}")
+            except SQLAlchemyError as e:
+                logger.warning(f"Streamed query failed: {e}")
+                raise QueryExecutionError(e)
+
+        return batch_iterator()
+
     ### --- Query keyed (Key-based pagination, multiple transactions) --- ###
 
     def query_keyed(
@@ -411,7 +650,7 @@ class DBClient:
             ]
         ] = None,
         chunk_size: int = 10_000,
-        return_type: Literal["df", "raw", "list", "none"] = "df",
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
         print_result: bool = False,
         print_limit: int = 10,
         return_last_key: bool = False,
@@ -444,11 +683,13 @@ class DBClient:
             args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
                 Parameters to bind to the SQL query. Must be a single dict/tuple or a list containing one such element.
             chunk_size (int): Number of rows to fetch per chunk. Defaults to 10,000.
-            return_type (Literal["df", "raw", "list", "none"]): Format of the returned result. One of:
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result. One of:
                 - "df": Return a pandas.DataFrame (default)
                 - "list": Return a list of dictionaries
                 - "raw": Return a list of SQLAlchemy Row objects
                 - "none": Return None
+                - "arrow": Return a pyarrow.Table (requires pyarrow)
+                - "df_arrow": Return a pandas.DataFrame with Arrow-backed columns (requires pyarrow)
             print_result (bool): Whether to print a preview of the query result.
             print_limit (int): Number of rows to preview if printing is enabled.
             return_last_key (bool): Whether to return the last key seen in the result set.
@@ -470,233 +711,79 @@ class DBClient:
             QuerySelectOnlyError: If the SQL is not a SELECT statement.
             QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
             QueryResultFormatError: If return_type is not one of the supported formats.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
             InvalidSQLOperation: If the key column type or bound arguments are invalid,
                 or if required key values are missing or incorrectly typed.
             DBClientClosedError: If the instance has already been closed.
         """
         self._check_closed()
 
-        # Validate select query
-        try:
-            _validate_select_no_limit_offset(sql=sql)
-        except QuerySelectOnlyError:
-            raise
-        except QueryDisallowedClauseError:
-            logger.error(
-                "Use start_key and end_key if you want to achieve a similar result to offset and limit"
-            )
-            raise
-
         # Check accepted return types
         return_format: str = return_type
-        if return_format.lower() not in {"df", "list", "raw", "none"}:
+        if (
+            return_format.lower()
+            not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES
+        ):
             raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
 
-        # Check key_column_type
-        accepted_key_column_type = {"int", "string", "date"}
-        if key_column_type not in accepted_key_column_type:
-            raise InvalidSQLOperation(
-                f"query_keyed() requires a key_column_type to be one of {accepted_key_column_type}."
-            )
+        # Validate query, keys and args
+        sql, bind_args, current_key, max_key = self._prepare_keyed_query(
+            sql=sql,
+            key_column_type=key_column_type,
+            start_key=start_key,
+            end_key=end_key,
+            order=order,
+            args=args,
+            method_name="query_keyed",
+        )
 
         # Set order to default to asc if None
         order = order or "asc"
 
-        try:
-            if args is not None:
-                sql, converted_args = _convert_dbapi_to_sqlalchemy_style(sql, args)
-                if isinstance(converted_args, list):
-                    if len(converted_args) != 1:
-                        raise InvalidSQLOperation(
-                            "query_keyed() only accepts one row of parameters."
-                        )
-                    args = converted_args[0]
-                else:
-                    args = converted_args
-        except Exception as e:
-            logger.warning(f"Invalid SQL or args: {e}")
-            raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
-
-        # Create new args dic for current_key and last key, start key depending
-        bind_args = args.copy() if args else {}
-
-        # For mypy
-        current_key: Union[int, str, dt]
-        max_key: Optional[Union[int, str, dt]]
-
-        ### --- Initialize current_key and max key --- ###
-
-        # Convert to datetime format if using a date as key (key_column_type="date")
-        if key_column_type == "date":
-            if (start_key is None) or (not isinstance(start_key, (dt, str))):
-                raise InvalidSQLOperation(
-                    "query_keyed() requires a start_key when key_column_type='date'. "
-                    f"It must either be a string in one of the {self.DATETIME_FORMATS} formats or a datetime object. "
-                )
-            else:
-                try:
-                    current_key = _parse_datetime_key_based_pagination(
-                        start_key, "start_key", accepted_formats=self.DATETIME_FORMATS
-                    )
-                except InvalidSQLOperation:
-                    raise
-                if end_key is not None:
-                    try:
-                        max_key = _parse_datetime_key_based_pagination(
-                            end_key, "end_key", accepted_formats=self.DATETIME_FORMATS
-                        )
-                    except InvalidSQLOperation:
-                        raise
-                else:
-                    max_key = None
-
-        # Initialize as string if key_column_type="string"
-        elif key_column_type == "string":
-            if (start_key is None) or (not isinstance(start_key, str)):
-                raise InvalidSQLOperation(
-                    "query_keyed() requires a start_key when key_column_type='string'. "
-                    "It must be a string. "
-                    "You can use '' as a start_key with order 'asc' to get all rows from the beginning. "
-                    "Using '' as a surrogate is unsafe unless you guarantee no empty-string keys. "
-                )
-            else:
-                current_key = start_key
-                if end_key is not None:
-                    if isinstance(end_key, str):
-                        max_key = end_key
-                    else:
-                        raise InvalidSQLOperation(
-                            "query_keyed() requires end_key to be a string when key_column_type='string'"
-                        )
-                else:
-                    max_key = None
-
-        else:  # key_column_type == "int"
-            # Start key
-            if start_key is None:
-                current_key = self.INT_NEG_INF if order == "asc" else self.INT_POS_INF
-            elif isinstance(start_key, int):
-                current_key = start_key
-            else:
-                raise InvalidSQLOperation(
-                    "query_keyed() requires start_key to be an int when key_column_type='int'"
-                )
-            # Max key
-            if end_key is not None:
-                if isinstance(end_key, int):
-                    max_key = end_key
-                else:
-                    raise InvalidSQLOperation(
-                        "query_keyed() requires end_key to be an int when key_column_type='int'"
-                    )
-            else:
-                max_key = None
-
-        # Assign max_key
-        if max_key is not None:
-            bind_args["end_key"] = max_key
-
         ### --- Main logic --- ###
-        # Initiate empty all_rows and column names to store results
-        all_rows = []
+        # Initiate empty all_rows (pyarrow tables for Arrow return types) and column names to store results
+        arrow_output = return_format.lower() in ARROW_RETURN_TYPES
+        all_rows: list[Any] = []
         column_names: list[str] = []
 
-        # Initialize state (if start_key provided)
-        last_key = None  # Last seen key
-        success = True
-        first_pass = True  # To add first row with >= operator in query
-
-        # Start query logic
-        while True:
-            # create where clause for key base pagination (key_column + end_key)
-            where_clauses = []
+        # Shared pagination state (updated by the page generator)
+        state: dict[str, Any] = {"success": True, "last_key": None}
 
-            if order == "asc":
-                operator = ">=" if first_pass else ">"
-                where_clauses.append(f"{key_column} {operator} :last_key")
-                if end_key is not None:
-                    where_clauses.append(f"{key_column} <= :end_key")
+        for rows, columns in self._iter_keyed_pages(
+            sql=sql,
+            key_column=key_column,
+            order=order,
+            bind_args=bind_args,
+            current_key=current_key,
+            has_end_key=max_key is not None,
+            chunk_size=chunk_size,
+            state=state,
+        ):
+            column_names = columns
+            if arrow_output:
+                all_rows.append(_rows_to_arrow(rows, columns))
             else:
-                operator = "<=" if first_pass else "<"
-                where_clauses.append(f"{key_column} {operator} :last_key")
-                if end_key is not None:
-                    where_clauses.append(f"{key_column} >= :end_key")
-
-            where_sql = " AND ".join(where_clauses)
-            paginated_sql = f"""
-                {sql.strip().rstrip(';')}
-                {"AND" if "where" in sql.lower() else "WHERE"} {where_sql}
-                ORDER BY {key_column} {order.upper()}
-                LIMIT {chunk_size}
-            """
-
-            # Update last key value
-            bind_args["last_key"] = current_key
-
-            try:
-                with self._engine.connect() as conn:
-                    result = conn.execute(text(paginated_sql), bind_args)
-                    rows = result.fetchall()
-                    first_pass = False  # Not first pass anymore
-                    if not column_names and result.keys():
-                        column_names = list(result.keys())
-                        column_index_map = {
-                            col: idx for idx, col in enumerate(column_names)
-                        }  # Used to get last_key
-                        key_index = column_index_map[key_column]
-            except Exception as e:
-                logger.warning(f"Key-based chunk failed: {e}")
-                success = False
-                break
-
-            # Break if no more rows
-            if not rows:
-                break
-
-            all_rows.extend(rows)
-
-            # Break if length of rows is smaller than chunk_size
-            if len(rows) < chunk_size:
-                try:
-                    last_key = rows[-1][key_index]
-                except Exception as e:
-                    last_key = None
-                    logger.warning(f"Could not extract key from last row: : {e}")
-                break
-
-            # Update current key and last_key
-            try:
-                current_key = rows[-1][key_index]
-                last_key = current_key
-            except Exception as e:
-                last_key = None
-                success = False
-                logger.warning(f"Could not extract last key: {e}")
-                break
+                all_rows.extend(rows)
 
-        # Print results
-        if print_result and all_rows:
-            preview_df = pd.DataFrame(
-                all_rows[:print_limit], columns=column_names or None
-            )
-            print(preview_df.to_string(index=False))
+        success = state["success"]
+        last_key = state["last_key"]
 
-        # Return
-        return_format = return_format.lower()
-        if return_format == "df":
-            result = pd.DataFrame(all_rows, columns=column_names or None)
-        elif return_format == "none":
-            result = None
-        elif return_format == "raw":
-            result = all_rows
-        elif return_format == "list":
-            result = (
-                [dict(zip(column_names, row)) for row in all_rows]
-                if column_names
-                else []
+        if arrow_output:
+            result = self._format_arrow_tables(
+                all_rows, column_names, return_format, print_result, print_limit
             )
         else:
-            raise QueryResultFormatError(return_type)
+            # Print results
+            if print_result and all_rows:
+                preview_df = pd.DataFrame(
+                    all_rows[:print_limit], columns=column_names or None
+                )
+                print(preview_df.to_string(index=False))
+
+            # Return
+            result = self._format_rows(all_rows, column_names, return_format)
 
         if return_last_key and return_status:
             return result, success, last_key
@@ -707,26 +794,31 @@ class DBClient:
         else:
             return result
 
-    ### --- Query batch (Threaded, multiple transactions) --- ###
+    ### --- Query keyed parallel (Key-based pagination over disjoint key ranges, threaded) --- ###
 
-    def query_batch(
+    def query_keyed_parallel(
         self,
         sql: str,
+        key_column: str,
+        key_column_type: Literal["int", "date"],
+        start_key: Union[int, dt, str],
+        end_key: Union[int, dt, str],
+        order: Literal["asc", "desc"] = "asc",
         args: Optional[
             Union[
                 list[tuple[Any, ...]],
                 list[dict[str, Any]],
                 tuple[Any, ...],
                 dict[str, Any],
-                pd.DataFrame,
             ]
         ] = None,
         chunk_size: int = 10_000,
-        max_workers: int = 15,
-        return_type: Literal["df", "raw", "list", "none"] = "df",
-        return_status: bool = False,
+        num_ranges: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
         print_result: bool = False,
         print_limit: int = 10,
+        return_status: bool = False,
     ) -> Union[
         pd.DataFrame,
         list[dict[str, Any]],
@@ -735,26 +827,36 @@ class DBClient:
         tuple[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool],
     ]:
         """
-        Executes a large SQL SELECT query in parallel chunks using LIMIT and OFFSET.
+        Executes a large SQL SELECT query using key-based pagination over disjoint key ranges in parallel.
 
-        This method divides a SELECT query into chunks and fetches them concurrently using a thread pool.
-        It stops automatically when a chunk returns no rows. Useful for large data extractions where
-        key-based pagination is not possible.
+        `query_keyed()` is sequential: each page waits for the last key of the previous one. When both
+        bounds of an int or date key are known, this method splits `[start_key, end_key]` into
+        `num_ranges` disjoint sub-ranges, walks each of them with an independent key-based pagination on
+        the thread pool, and concatenates the results in key order. Throughput then scales with
+        `max_workers` instead of being limited by the latency of a single connection.
 
         Args:
-            sql (str): Base SQL SELECT query (without LIMIT or OFFSET clauses).
-            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]]):
-                Parameters to bind to the query. Must represent a single row of parameters.
-            chunk_size (int): Number of rows to fetch per chunk. Defaults to 10,000.
-            max_workers (int): Number of threads to run in parallel. Defaults to 15.
-            return_type (Literal["df", "raw", "list", "none"]): Format of the returned result. One of:
+            sql (str): Base SQL SELECT query (without LIMIT or pagination conditions).
+            key_column (str): The column to use as the pagination key.
+            key_column_type (Literal["int", "date"]): Type of the key column. String keys cannot be split.
+            start_key (Union[int, datetime.datetime, str]): Inclusive key to start from (the highest key if order is "desc").
+            end_key (Union[int, datetime.datetime, str]): Inclusive key to stop at (the lowest key if order is "desc").
+            order (Literal["asc", "desc"]): Sort direction of the result. Defaults to "asc".
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the SQL query. Must be a single dict/tuple or a list containing one such element.
+            chunk_size (int): Number of rows to fetch per page within a range. Defaults to 10,000.
+            num_ranges (Optional[int]): Number of key sub-ranges. Defaults to the number of workers.
+            max_workers (Optional[int]): Maximum number of concurrent threads. Defaults to internal pool size.
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result. One of:
                 - "df": Return a pandas.DataFrame (default)
                 - "list": Return a list of dictionaries
                 - "raw": Return a list of SQLAlchemy Row objects
                 - "none": Return None
+                - "arrow": Return a pyarrow.Table (requires pyarrow)
+                - "df_arrow": Return a pandas.DataFrame with Arrow-backed columns (requires pyarrow)
+            print_result (bool): Whether to print a preview of the query result.
+            print_limit (int): Number of rows to preview if printing is enabled.
             return_status (bool): If True, returns a tuple with the result and a success flag.
-            print_result (bool): Whether to print a preview of the result to stdout.
-            print_limit (int): Number of rows to print if print_result is True.
 
         Returns:
             Union[
@@ -767,44 +869,531 @@ class DBClient:
                 The query result in the specified format. If return_status is True, a tuple is returned with a success flag.
 
         Raises:
-            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            QuerySelectOnlyError: If the SQL is not a SELECT statement.
             QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
-            QueryResultFormatError: If return_type is not one of the supported values.
-            InvalidSQLOperation: If the SQL or arguments are malformed or incompatible.
+            QueryResultFormatError: If return_type is not one of the supported formats.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the key column type, keys or bound arguments are invalid.
             LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
             UnsupportedMultiThreadedDatabase: If multithreaded reads are attempted on a SQLite database.
             DBClientClosedError: If the instance has already been closed.
         """
-        # Check if engine was closed
         self._check_closed()
 
         # If SQLite raises
         if self._db_type == "sqlite":
             logger.error(
-                "Threaded reads are not supported on SQLite. Use query or query_keyed instead. "
+                "Threaded reads are not supported on SQLite. Use query_keyed instead. "
             )
             raise UnsupportedMultiThreadedDatabase(self._db_type)
 
-        # Validate select query
-        try:
-            _validate_select_no_limit_offset(sql=sql)
-        except QuerySelectOnlyError:
-            raise
-        except QueryDisallowedClauseError:
-            logger.error(
-                "query_batch() does not support the use of limit or offset clauses. "
-            )
-            raise
-
-        # Check if valid return type
+        # Check accepted return types
         return_format: str = return_type
-        if return_format.lower() not in {"df", "list", "raw", "none"}:
+        if (
+            return_format.lower()
+            not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES
+        ):
             raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        # Only int and date ranges can be split
+        if key_column_type not in {"int", "date"}:
+            raise InvalidSQLOperation(
+                "query_keyed_parallel() requires key_column_type to be 'int' or 'date'."
+            )
+        if start_key is None or end_key is None:
+            raise InvalidSQLOperation(
+                "query_keyed_parallel() requires both start_key and end_key."
+            )
 
         # Check if max_worker given by user above total_pool_size
-        if max_workers > self._total_pool_capacity:
+        if max_workers is not None and max_workers > self._total_pool_capacity:
             raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
 
+        # Set order to default to asc if None
+        order = order or "asc"
+
+        # Validate query, keys and args
+        sql, bind_args, first_key, last_key = self._prepare_keyed_query(
+            sql=sql,
+            key_column_type=key_column_type,
+            start_key=start_key,
+            end_key=end_key,
+            order=order,
+            args=args,
+            method_name="query_keyed_parallel",
+        )
+        bind_args.pop("end_key", None)  # Set per range below
+
+        # Split the key range (always in ascending order)
+        low_key, high_key = (
+            (first_key, last_key) if order == "asc" else (last_key, first_key)
+        )
+        workers = max_workers or self._max_workers
+        key_ranges = _split_key_range(
+            cast(Union[int, dt], low_key),
+            cast(Union[int, dt], high_key),
+            num_ranges or workers,
+        )
+        last_index = len(key_ranges) - 1
+        arrow_output = return_format.lower() in ARROW_RETURN_TYPES
+
+        # Walk one key range with an independent key-based pagination (pages are converted to pyarrow tables for Arrow return types)
+        def fetch_range(range_index: int) -> tuple[list[Any], list[str], bool]:
+            range_start, range_end = cast(
+                tuple[Union[int, dt], Union[int, dt]], key_ranges[range_index]
+            )
+            is_last = range_index == last_index
+            range_args = bind_args.copy()
+            state: dict[str, Any] = {"success": True, "last_key": None}
+            rows: list[Any] = []
+            columns: list[str] = []
+
+            if order == "asc":
+                range_args["end_key"] = range_end
+                pages = self._iter_keyed_pages(
+                    sql=sql,
+                    key_column=key_column,
+                    order=order,
+                    bind_args=range_args,
+                    current_key=range_start,
+                    has_end_key=True,
+                    chunk_size=chunk_size,
+                    state=state,
+                    end_inclusive=is_last,
+                )
+            else:
+                range_args["end_key"] = range_start
+                pages = self._iter_keyed_pages(
+                    sql=sql,
+                    key_column=key_column,
+                    order=order,
+                    bind_args=range_args,
+                    current_key=range_end,
+                    has_end_key=True,
+                    chunk_size=chunk_size,
+                    state=state,
+                    start_inclusive=is_last,
+                )
+
+            for page_rows, page_columns in pages:
+                columns = page_columns
+                if arrow_output:
+                    rows.append(_rows_to_arrow(page_rows, page_columns))
+                else:
+                    rows.extend(page_rows)
+            return rows, columns, state["success"]
+
+        # Create new executor if max_workers != self._max_workers
+        if max_workers is not None and max_workers != self._max_workers:
+            query_executor = ThreadPoolExecutor(max_workers=max_workers)
+            temp_executor = True
+        else:
+            query_executor = self._executor
+            temp_executor = False
+
+        range_results: dict[int, tuple[list[Any], list[str]]] = {}
+        success = True
+        try:
+            futures = {
+                query_executor.submit(fetch_range, i): i for i in range(len(key_ranges))
+            }
+            with self._track_progress(
+                "Querying key ranges", len(futures), unit="range"
+            ) as progress:
+                for future in as_completed(futures):
+                    range_index = futures[future]
+                    try:
+                        rows, columns, range_success = future.result()
+                        range_results[range_index] = (rows, columns)
+                        success = success and range_success
+                    except Exception as e:
+                        logger.warning(f"Key range {range_index} failed: {e}")
+                        success = False
+                        rows = []
+                    progress.update(
+                        rows=(
+                            sum(len(table) for table in rows)
+                            if arrow_output
+                            else len(rows)
+                        )
+                    )
+        finally:
+            # Shutdown temp executor if created
+            if temp_executor:
+                query_executor.shutdown(wait=False)
+
+        # Concatenate ranges in key order
+        range_order = sorted(range_results, reverse=(order == "desc"))
+        all_rows = [row for i in range_order for row in range_results[i][0]]
+        column_names: list[str] = next(
+            (range_results[i][1] for i in range_order if range_results[i][1]), []
+        )
+
+        if arrow_output:
+            result = self._format_arrow_tables(
+                all_rows, column_names, return_format, print_result, print_limit
+            )
+        else:
+            # Print results
+            if print_result and all_rows:
+                preview_df = pd.DataFrame(
+                    all_rows[:print_limit], columns=column_names or None
+                )
+                print(preview_df.to_string(index=False))
+
+            # Return
+            result = self._format_rows(all_rows, column_names, return_format)
+
+        if return_status:
+            return result, success
+        else:
+            return result
+
+    ### --- Iter keyed (Key-based pagination, streamed page by page) --- ###
+
+    def iter_keyed(
+        self,
+        sql: str,
+        key_column: str,
+        key_column_type: Literal["int", "string", "date"],
+        start_key: Optional[Union[int, dt, str]] = None,
+        end_key: Optional[Union[int, dt, str]] = None,
+        order: Literal["asc", "desc"] = "asc",
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        return_type: Literal["df", "raw", "list", "arrow", "df_arrow"] = "df",
+    ) -> Iterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+        """
+        Streams a large SQL SELECT query page by page using key-based pagination.
+
+        Same pagination logic as `query_keyed()`, but each key-ordered page is yielded as soon as
+        it is fetched instead of being accumulated. Memory usage stays bounded by `chunk_size`, and
+        the caller can process a page while the next one has not been requested yet.
+
+        Validation happens when the method is called; the first query only runs when the
+        returned iterator is first advanced.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or pagination conditions).
+            key_column (str): The column to use as the pagination key.
+            key_column_type (Literal["int", "string", "date"]): Type of the key column for proper formatting and validation.
+            start_key (Optional[Union[int, datetime.datetime, str]]): Inclusive key to start from.
+            end_key (Optional[Union[int, datetime.datetime, str]]): Inclusive upper bound key to stop at.
+            order (Literal["asc", "desc"]): Sort direction for pagination. Defaults to "asc".
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                Parameters to bind to the SQL query. Must be a single dict/tuple or a list containing one such element.
+            chunk_size (int): Number of rows per yielded page. Defaults to 10,000.
+            return_type (Literal["df", "raw", "list", "arrow", "df_arrow"]): Format of each yielded page. One of:
+                - "df": Yield pandas.DataFrame pages (default)
+                - "list": Yield lists of dictionaries
+                - "raw": Yield lists of SQLAlchemy Row objects
+                - "arrow": Yield pyarrow.Table pages (requires pyarrow)
+                - "df_arrow": Yield pandas.DataFrame pages with Arrow-backed columns (requires pyarrow)
+
+        Returns:
+            Iterator[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+                An iterator over the pages, in key order.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL is not a SELECT statement.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            QueryResultFormatError: If return_type is not one of the supported formats.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the key column type or bound arguments are invalid,
+                or if required key values are missing or incorrectly typed.
+            QueryExecutionError: While iterating, if a page fails to be fetched.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        self._check_closed()
+
+        # Check accepted return types ("none" makes no sense for an iterator)
+        return_format: str = return_type
+        if return_format.lower() not in {"df", "list", "raw"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        # Validate query, keys and args
+        sql, bind_args, current_key, max_key = self._prepare_keyed_query(
+            sql=sql,
+            key_column_type=key_column_type,
+            start_key=start_key,
+            end_key=end_key,
+            order=order,
+            args=args,
+            method_name="iter_keyed",
+        )
+
+        def page_iterator() -> (
+            Iterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]
+        ):
+            state: dict[str, Any] = {"success": True, "last_key": None}
+            for rows, columns in self._iter_keyed_pages(
+                sql=sql,
+                key_column=key_column,
+                order=order or "asc",
+                bind_args=bind_args,
+                current_key=current_key,
+                has_end_key=max_key is not None,
+                chunk_size=chunk_size,
+                state=state,
+            ):
+                yield cast(
+                    Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]],
+                    self._format_rows(rows, columns, return_format),
+                )
+            if not state["success"]:
+                raise QueryExecutionError(state["error"])
+
+        return page_iterator()
+
+    ### --- Key-based pagination helpers --- ###
+
+    def _iter_keyed_pages(
+        self,
+        sql: str,
+        key_column: str,
+        order: str,
+        bind_args: dict[str, Any],
+        current_key: Union[int, str, dt],
+        has_end_key: bool,
+        chunk_size: int,
+        state: dict[str, Any],
+        start_inclusive: bool = True,
+        end_inclusive: bool = True,
+    ) -> Iterator[tuple[Sequence[Row], list[str]]]:
+        """
+        Walks a key-based pagination and yields each non-empty page as soon as it is fetched.
+
+        The generator stops on the first empty or short page, or on the first failure. Failures are
+        not raised: they are logged and reported through `state`, so callers can decide whether to
+        return partial results or raise.
+
+        Args:
+            sql (str): Converted base SQL SELECT query.
+            key_column (str): The column to use as the pagination key.
+            order (str): "asc" or "desc".
+            bind_args (dict[str, Any]): Bind arguments (including `end_key` if bounded). Updated in place with `last_key`.
+            current_key (Union[int, str, datetime.datetime]): Key of the first page.
+            has_end_key (bool): Whether `bind_args` contains an `end_key` bound.
+            chunk_size (int): Number of rows per page.
+            state (dict[str, Any]): Mutable state updated with "success", "last_key" and, on failure, "error".
+            start_inclusive (bool): Whether rows equal to `current_key` are included. Defaults to True.
+            end_inclusive (bool): Whether rows equal to `end_key` are included. Defaults to True.
+
+        Yields:
+            tuple[Sequence[Row], list[str]]: The rows of the page and the result column names.
+        """
+        column_names: list[str] = []
+        key_index = 0
+        first_pass = True  # To add first row with >= operator in query
+
+        # Start query logic
+        while True:
+            # Page query after the last key seen (inclusive on the first page)
+            paginated_sql = _build_keyed_page_query(
+                sql,
+                key_column,
+                order,
+                chunk_size,
+                include_start=first_pass and start_inclusive,
+                has_end_key=has_end_key,
+                end_inclusive=end_inclusive,
+            )
+
+            # Update last key value
+            bind_args["last_key"] = current_key
+
+            try:
+                with self._engine.connect() as conn:
+                    result = conn.execute(text(paginated_sql), bind_args)
+                    rows = result.fetchall()
+                    first_pass = False  # Not first pass anymore
+                    if not column_names and result.keys():
+                        column_names = list(result.keys())
+                        column_index_map = {
+                            col: idx for idx, col in enumerate(column_names)
+                        }  # Used to get last_key
+                        key_index = column_index_map[key_column]
+            except Exception as e:
+                logger.warning(f"Key-based chunk failed: {e}")
+                state["success"] = False
+                state["error"] = e
+                break
+
+            # Break if no more rows
+            if not rows:
+                break
+
+            # Break if length of rows is smaller than chunk_size
+            if len(rows) < chunk_size:
+                try:
+                    state["last_key"] = rows[-1][key_index]
+                except Exception as e:
+                    state["last_key"] = None
+                    logger.warning(f"Could not extract key from last row: : {e}")
+                yield rows, column_names
+                break
+
+            # Update current key and last_key
+            try:
+                current_key = rows[-1][key_index]
+                state["last_key"] = current_key
+            except Exception as e:
+                state["last_key"] = None
+                state["success"] = False
+                state["error"] = e
+                logger.warning(f"Could not extract last key: {e}")
+                yield rows, column_names
+                break
+
+            yield rows, column_names
+
+    ### --- Query batch (Threaded, multiple transactions) --- ###
+
+    def query_batch(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+                pd.DataFrame,
+            ]
+        ] = None,
+        chunk_size: Union[int, Literal["auto"]] = 10_000,
+        max_workers: Union[int, Literal["auto"]] = 15,
+        return_type: Literal["df", "raw", "list", "none", "arrow", "df_arrow"] = "df",
+        return_status: bool = False,
+        print_result: bool = False,
+        print_limit: int = 10,
+        key_column: Optional[str] = None,
+    ) -> Union[
+        pd.DataFrame,
+        list[dict[str, Any]],
+        Sequence[Row],
+        None,
+        tuple[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool],
+    ]:
+        """
+        Executes a large SQL SELECT query in parallel chunks, using key ranges or LIMIT and OFFSET.
+
+        This method divides a SELECT query into chunks and fetches them concurrently using a thread pool.
+
+        If `key_column` is given (int, date or datetime column), the MIN/MAX of the key are read first and
+        the range is split into disjoint `key >= start AND key < end` slices of about `chunk_size` rows.
+        Each slice is read once, so the total work stays linear in the table size, and the result is
+        ordered by the key.
+
+        Otherwise, chunks are read with LIMIT and OFFSET until a chunk returns no rows. Each chunk
+        re-scans and discards the rows before its offset, so this fallback gets slower on deep chunks
+        and the row order is not guaranteed.
+
+        With `chunk_size="auto"`, chunks are not planned up front: each worker claims the next key range or
+        offset with the size given by the throughput measured on the previous chunks, steering chunks toward
+        DEFAULT_TARGET_CHUNK_SECONDS within a memory budget (see `execute_batch()`).
+
+        With `max_workers="auto"`, the number of concurrent fetches is adjusted by an AIMD limiter up to the pool
+        capacity, see `execute_batch()` and `concurrency_info()`.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or OFFSET clauses).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]]):
+                Parameters to bind to the query. Must represent a single row of parameters.
+            chunk_size (Union[int, Literal["auto"]]): Number of rows to fetch per chunk, or "auto" to adapt it
+                to the measured latency. Defaults to 10,000.
+            max_workers (Union[int, Literal["auto"]]): Number of threads to run in parallel, or "auto" to adapt it
+                to the throughput of the server. Defaults to 15.
+            return_type (Literal["df", "raw", "list", "none", "arrow", "df_arrow"]): Format of the returned result. One of:
+                - "df": Return a pandas.DataFrame (default)
+                - "list": Return a list of dictionaries
+                - "raw": Return a list of SQLAlchemy Row objects
+                - "none": Return None
+                - "arrow": Return a pyarrow.Table (requires pyarrow)
+                - "df_arrow": Return a pandas.DataFrame with Arrow-backed columns (requires pyarrow)
+            return_status (bool): If True, returns a tuple with the result and a success flag.
+            print_result (bool): Whether to print a preview of the result to stdout.
+            print_limit (int): Number of rows to print if print_result is True.
+            key_column (Optional[str]): Int, date or datetime output column to partition the query on.
+                If None (default), LIMIT/OFFSET chunking is used. Rows with a NULL key are fetched as one extra chunk.
+
+        Returns:
+            Union[
+                pandas.DataFrame,
+                list[dict[str, Any]],
+                Sequence[Row],
+                None,
+                tuple[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row], None], bool]
+            ]:
+                The query result in the specified format. If return_status is True, a tuple is returned with a success flag.
+
+        Raises:
+            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            QueryResultFormatError: If return_type is not one of the supported values.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the SQL, arguments, chunk size or max_workers are malformed or incompatible,
+                or if key_column is not an int, date or datetime column.
+            LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
+            UnsupportedMultiThreadedDatabase: If multithreaded reads are attempted on a SQLite database.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        # Check if engine was closed
+        self._check_closed()
+
+        # If SQLite raises
+        if self._db_type == "sqlite":
+            logger.error(
+                "Threaded reads are not supported on SQLite. Use query or query_keyed instead. "
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        # Validate select query
+        try:
+            _validate_select_no_limit_offset(
+                sql=sql, strict=self._strict_sql_validation
+            )
+        except QuerySelectOnlyError:
+            raise
+        except QueryDisallowedClauseError:
+            logger.error(
+                "query_batch() does not support the use of limit or offset clauses. "
+            )
+            raise
+
+        # Check if valid return type
+        return_format: str = return_type
+        if (
+            return_format.lower()
+            not in {"df", "list", "raw", "none"} | ARROW_RETURN_TYPES
+        ):
+            raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+
+        _check_chunk_size(chunk_size)
+
+        # Adaptive concurrency: threads are created up to the pool capacity and the limiter decides how many fetch
+        limiter = self._concurrency_limiter(max_workers)
+        num_workers = (
+            limiter.max_limit if limiter is not None else cast(int, max_workers)
+        )
+
+        # Check if max_worker given by user above total_pool_size
+        if num_workers > self._total_pool_capacity:
+            raise LimitMaxWorkersError(num_workers, self._total_pool_capacity)
+
         # Convert args
         try:
             if args is not None:
@@ -826,145 +1415,1158 @@ class DBClient:
                 "SQLite supports concurrent reads, but using many threads on file-based DBs may be suboptimal."
             )
 
-        # Initialize work queue and results
-        work_queue: Queue[int] = Queue()
-        results = []
-        success = {"status": True}
-        results_lock = threading.Lock()
-        success_lock = threading.Lock()
+        # Create new executor if max_workers != self._max_workers
+        if num_workers != self._max_workers:
+            query_executor = ThreadPoolExecutor(max_workers=num_workers)
+            temp_executor = True
+        else:
+            query_executor = self._executor
+            temp_executor = False
+
+        # Each worker converts its chunk to the output format as soon as it is fetched
+        return_format = return_format.lower()
+        convert_rows = self._chunk_converter(return_format)
+
+        try:
+            if chunk_size == "auto":
+                results, success_status = self._query_adaptive_chunks(
+                    sql=sql,
+                    args=args,
+                    key_column=key_column,
+                    max_workers=num_workers,
+                    executor=query_executor,
+                    convert_rows=convert_rows,
+                    limiter=limiter,
+                )
+            elif key_column is not None:
+                results, success_status = self._query_key_ranges(
+                    sql=sql,
+                    args=args,
+                    key_column=key_column,
+                    chunk_size=chunk_size,
+                    executor=query_executor,
+                    convert_rows=convert_rows,
+                    limiter=limiter,
+                )
+            else:
+                results, success_status = self._query_offset_chunks(
+                    sql=sql,
+                    args=args,
+                    chunk_size=chunk_size,
+                    max_workers=num_workers,
+                    executor=query_executor,
+                    convert_rows=convert_rows,
+                    limiter=limiter,
+                )
+        finally:
+            # Shutdown temp executor if created
+            if temp_executor:
+                query_executor.shutdown(wait=False)
+
+        self._store_concurrency_info(limiter)
+
+        res = self._assemble_chunks(results, return_format, print_result, print_limit)
+
+        if return_status:
+            return res, success_status
+        else:
+            return res
+
+    ### --- Iter query batch (Threaded, streamed in chunk order) --- ###
+
+    def iter_query_batch(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+                pd.DataFrame,
+            ]
+        ] = None,
+        chunk_size: int = 10_000,
+        max_workers: int = 15,
+        return_type: Literal["df", "raw", "list", "arrow", "df_arrow"] = "df",
+        key_column: Optional[str] = None,
+        max_buffered_chunks: Optional[int] = None,
+    ) -> Iterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+        """
+        Fetches a large SQL SELECT query in parallel chunks and yields the chunks in order as they complete.
+
+        Same chunking as `query_batch()` (key ranges if `key_column` is given, LIMIT/OFFSET otherwise),
+        but each chunk is yielded as soon as it and all the chunks before it are fetched, so the caller
+        can write or load a chunk while the following ones are still being queried.
+
+        At most `max_buffered_chunks` chunks are fetched ahead of the chunk being consumed: fast workers
+        wait for a slow chunk (or a slow consumer) instead of filling memory with out-of-order results.
+
+        Validation happens when the method is called; the queries only start when the returned iterator
+        is first advanced. Closing the iterator early cancels the chunks that have not started.
+
+        Args:
+            sql (str): Base SQL SELECT query (without LIMIT or OFFSET clauses).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]]):
+                Parameters to bind to the query. Must represent a single row of parameters.
+            chunk_size (int): Number of rows to fetch per chunk. Defaults to 10,000.
+            max_workers (int): Number of threads to run in parallel. Defaults to 15.
+            return_type (Literal["df", "raw", "list", "arrow", "df_arrow"]): Format of each yielded chunk. One of:
+                - "df": Yield pandas.DataFrame chunks (default)
+                - "list": Yield lists of dictionaries
+                - "raw": Yield lists of SQLAlchemy Row objects
+                - "arrow": Yield pyarrow.Table chunks (requires pyarrow)
+                - "df_arrow": Yield pandas.DataFrame chunks with Arrow-backed columns (requires pyarrow)
+            key_column (Optional[str]): Int, date or datetime output column to partition the query on.
+                If None (default), LIMIT/OFFSET chunking is used. Rows with a NULL key are fetched as one extra chunk.
+            max_buffered_chunks (Optional[int]): Maximum number of chunks fetched or in flight ahead of the
+                next chunk to yield. Defaults to twice the number of workers.
+
+        Returns:
+            Iterator[Union[pandas.DataFrame, list[dict[str, Any]], Sequence[Row]]]:
+                An iterator over the non-empty chunks, in chunk order (key order if key_column is given).
+
+        Raises:
+            QuerySelectOnlyError: If the SQL statement is not a SELECT query.
+            QueryDisallowedClauseError: If LIMIT or OFFSET is present in the SQL.
+            QueryResultFormatError: If return_type is not one of the supported values.
+            QueryResultDependencyError: If return_type is "arrow" or "df_arrow" and pyarrow is not installed.
+            InvalidSQLOperation: If the SQL or arguments are malformed or incompatible, if chunk_size or
+                max_buffered_chunks is not positive, or (while iterating) if key_column is not an int, date or
+                datetime column.
+            LimitMaxWorkersError: If max_workers exceeds the connection pool capacity.
+            UnsupportedMultiThreadedDatabase: If multithreaded reads are attempted on a SQLite database.
+            QueryExecutionError: While iterating, if the bounds query or a chunk fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        # Check if engine was closed
+        self._check_closed()
+
+        # If SQLite raises
+        if self._db_type == "sqlite":
+            logger.error(
+                "Threaded reads are not supported on SQLite. Use iter_query or iter_keyed instead. "
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        # Validate select query
+        try:
+            _validate_select_no_limit_offset(
+                sql=sql, strict=self._strict_sql_validation
+            )
+        except QuerySelectOnlyError:
+            raise
+        except QueryDisallowedClauseError:
+            logger.error(
+                "iter_query_batch() does not support the use of limit or offset clauses. "
+            )
+            raise
+
+        # Check accepted return types ("none" makes no sense for an iterator)
+        return_format: str = return_type
+        if return_format.lower() not in {"df", "list", "raw"} | ARROW_RETURN_TYPES:
+            raise QueryResultFormatError(return_type)
+        if return_format.lower() in ARROW_RETURN_TYPES:
+            _require_pyarrow(return_format)
+        return_format = return_format.lower()
+
+        # Check if max_worker given by user above total_pool_size
+        if max_workers > self._total_pool_capacity:
+            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
+
+        _check_chunk_size(chunk_size)
+
+        buffer_size = max_buffered_chunks or 2 * max_workers
+        if buffer_size <= 0:
+            raise InvalidSQLOperation(
+                "iter_query_batch() requires a positive max_buffered_chunks."
+            )
+
+        # Convert args
+        bind_args: Optional[dict[str, Any]] = None
+        try:
+            if args is not None:
+                sql, converted_args = _convert_dbapi_to_sqlalchemy_style(sql, args)
+                if isinstance(converted_args, list):
+                    if len(converted_args) != 1:
+                        raise InvalidSQLOperation(
+                            "iter_query_batch() only accepts one row of parameters."
+                        )
+                    bind_args = converted_args[0]
+                else:
+                    bind_args = converted_args
+        except Exception as e:
+            logger.warning(f"Invalid SQL or args: {e}")
+            raise InvalidSQLOperation(f"Failed to prepare SQL/args: {e}")
+
+        # Chunks are converted to the output format in the worker
+        convert_rows = partial(self._format_rows, return_format=return_format)
+
+        def chunk_iterator() -> (
+            Iterator[Union[pd.DataFrame, list[dict[str, Any]], Sequence[Row]]]
+        ):
+            # One fetch function per chunk index, and the number of chunks (None if unknown)
+            fetch_chunk: Callable[[int], tuple[Any, list[str]]]
+            total: Optional[int]
+            if key_column is not None:
+                try:
+                    key_ranges = self._plan_key_ranges(
+                        sql, bind_args, key_column, chunk_size
+                    )
+                except SQLAlchemyError as e:
+                    logger.warning(
+                        f"Could not fetch bounds of key column '{key_column}': {e}"
+                    )
+                    raise QueryExecutionError(e)
+                total = len(key_ranges)
+
+                def fetch_chunk(index: int) -> tuple[Any, list[str]]:
+                    start, end = key_ranges[index]
+                    return self._fetch_key_range(
+                        sql,
+                        bind_args,
+                        key_column,
+                        start,
+                        end,
+                        index == len(key_ranges) - 1,
+                        convert_rows,
+                    )
+
+            else:
+                total = None
+
+                def fetch_chunk(index: int) -> tuple[Any, list[str]]:
+                    return self._fetch_offset_chunk(
+                        sql, bind_args, chunk_size, index, convert_rows
+                    )
+
+            # Create new executor if max_workers != self._max_workers
+            if max_workers != self._max_workers:
+                query_executor = ThreadPoolExecutor(max_workers=max_workers)
+                temp_executor = True
+            else:
+                query_executor = self._executor
+                temp_executor = False
+
+            # Reorder buffer: futures of the chunks between the next one to yield and the last one submitted
+            pending: dict[int, Future[tuple[Any, list[str]]]] = {}
+            next_submit = 0
+            next_yield = 0
+            exhausted = False
+            try:
+                while True:
+                    # Keep at most buffer_size chunks ahead of the consumer
+                    while (
+                        not exhausted
+                        and (total is None or next_submit < total)
+                        and next_submit - next_yield < buffer_size
+                    ):
+                        pending[next_submit] = query_executor.submit(
+                            fetch_chunk, next_submit
+                        )
+                        next_submit += 1
+
+                    if next_yield not in pending:
+                        break
+
+                    try:
+                        chunk, _ = pending.pop(next_yield).result()
+                    except SQLAlchemyError as e:
+                        logger.warning(f"Chunk {next_yield} failed: {e}")
+                        raise QueryExecutionError(e)
+                    next_yield += 1
+
+                    if not len(chunk):
+                        # Past the end of an OFFSET query: later chunks are empty too
+                        if total is None:
+                            exhausted = True
+                            for future in pending.values():
+                                future.cancel()
+                            pending.clear()
+                        continue
+
+                    yield chunk
+                logger.info(f"Successfully streamed query in chunks: {sql}")
+            finally:
+                for future in pending.values():
+                    future.cancel()
+                # Shutdown temp executor if created
+                if temp_executor:
+                    query_executor.shutdown(wait=False)
+
+        return chunk_iterator()
+
+    ### --- Query batch helpers --- ###
+
+    def _query_offset_chunks(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        chunk_size: int,
+        max_workers: int,
+        executor: ThreadPoolExecutor,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+        limiter: Optional[_ConcurrencyLimiter] = None,
+    ) -> tuple[list[tuple[int, Any, Any]], bool]:
+        """
+        Fetches a SELECT query in concurrent LIMIT/OFFSET chunks until a chunk returns no rows.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            chunk_size (int): Number of rows per chunk.
+            max_workers (int): Number of concurrent fetch workers.
+            executor (ThreadPoolExecutor): Executor running the workers.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied by the worker to
+                the rows and column names of each chunk (e.g. to build a pyarrow table). Defaults to None (rows kept).
+            limiter (Optional[_ConcurrencyLimiter]): Adaptive limit on the number of concurrent fetches.
+                Defaults to None (all workers fetch at once).
+
+        Returns:
+            tuple[list[tuple[int, Any, Any]], bool]:
+                The non-empty chunks as (chunk_index, rows or converted rows, column names) tuples, unordered,
+                and False if any chunk failed.
+        """
+        # Initialize results
+        results = []
+        success = {"status": True}
+        results_lock = threading.Lock()
+        success_lock = threading.Lock()
+
+        # Worker k fetches chunks k, k + max_workers, k + 2 * max_workers, ... until one is empty
+        # (chunks are sequential per worker, so there is no shared queue to poll or time out on)
+        def fetch_worker(first_index: int, progress: _ProgressTracker) -> None:
+            chunk_index = first_index
+            while True:
+                # noinspection PyShadowingNames
+                try:
+                    payload, columns = self._limited_fetch(
+                        limiter,
+                        self._fetch_offset_chunk,
+                        sql,
+                        args,
+                        chunk_size,
+                        chunk_index,
+                        convert_rows,
+                    )
+                except Exception as e:
+                    logger.warning(f"Chunk {chunk_index} failed: {e}")
+                    with success_lock:
+                        success["status"] = False
+                    return
+                # Stop naturally on the first empty chunk
+                if not len(payload):
+                    return
+                with results_lock:
+                    results.append((chunk_index, payload, columns))
+                progress.update(rows=len(payload), payload=payload)
+                chunk_index += max_workers
+
+        # Progress (total unknown): reported by the workers as chunks complete, while the main thread blocks in wait()
+        with self._track_progress("Querying chunks") as progress:
+            futures = [
+                executor.submit(fetch_worker, i, progress) for i in range(max_workers)
+            ]
+            wait(futures)
+
+        return results, success["status"]
+
+    def _query_key_ranges(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+        chunk_size: int,
+        executor: ThreadPoolExecutor,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+        limiter: Optional[_ConcurrencyLimiter] = None,
+    ) -> tuple[list[tuple[int, Any, Any]], bool]:
+        """
+        Fetches a SELECT query concurrently as disjoint key ranges of `key_column`.
+
+        MIN/MAX/COUNT of the key are read first, then the key range is split into roughly
+        `count / chunk_size` sub-ranges which are fetched in parallel with
+        `WHERE key >= start AND key < end` predicates. Unlike OFFSET, no rows are scanned and
+        discarded, and each sub-range is ordered by the key, so the concatenated result is
+        deterministic. Rows whose key is NULL are fetched as one extra partition, returned first.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Int, date or datetime output column of the query to partition on.
+            chunk_size (int): Target number of rows per sub-range (exact only for evenly distributed keys).
+            executor (ThreadPoolExecutor): Executor running the sub-range queries.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied by the worker to
+                the rows and column names of each sub-range (e.g. to build a pyarrow table). Defaults to None (rows kept).
+            limiter (Optional[_ConcurrencyLimiter]): Adaptive limit on the number of concurrent fetches.
+                Defaults to None (all workers fetch at once).
+
+        Returns:
+            tuple[list[tuple[int, Any, Any]], bool]:
+                The non-empty sub-ranges as (partition_index, rows or converted rows, column names) tuples, unordered,
+                and False if the bounds query or any sub-range failed.
+
+        Raises:
+            InvalidSQLOperation: If the key column is not an int, date or datetime column.
+        """
+        # Find the key bounds of the query
+        try:
+            key_ranges = self._plan_key_ranges(sql, args, key_column, chunk_size)
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not fetch bounds of key column '{key_column}': {e}")
+            return [], False
+        last_index = len(key_ranges) - 1
+
+        futures = {
+            executor.submit(
+                self._limited_fetch,
+                limiter,
+                self._fetch_key_range,
+                sql,
+                args,
+                key_column,
+                start,
+                end,
+                i == last_index,
+                convert_rows,
+            ): i
+            for i, (start, end) in enumerate(key_ranges)
+        }
+
+        results = []
+        success = True
+        with self._track_progress("Querying chunks", len(futures)) as progress:
+            for future in as_completed(futures):
+                partition_index = futures[future]
+                try:
+                    rows, keys = future.result()
+                    if len(rows):
+                        results.append((partition_index, rows, keys))
+                    progress.update(rows=len(rows), payload=rows)
+                except Exception as e:
+                    logger.warning(f"Chunk {partition_index} failed: {e}")
+                    success = False
+                    progress.update()
+
+        return results, success
+
+    def _query_adaptive_chunks(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: Optional[str],
+        max_workers: int,
+        executor: ThreadPoolExecutor,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+        limiter: Optional[_ConcurrencyLimiter] = None,
+    ) -> tuple[list[tuple[int, Any, Any]], bool]:
+        """
+        Fetches a SELECT query in chunks sized from the measured throughput (`chunk_size="auto"`).
+
+        Workers claim chunks one at a time from a shared cursor: the next key range of `key_column`
+        (its span estimated from MIN/MAX/COUNT of the key, rows with a NULL key claimed first as one chunk)
+        or the next LIMIT/OFFSET window. The size of each
+        claimed chunk is the current size of an `_AdaptiveChunkSizer`, updated with the rows and duration of
+        every fetched chunk. Without a key, fetching stops at the first chunk shorter than its size.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (Optional[str]): Int, date or datetime output column to partition on, or None for
+                LIMIT/OFFSET chunks.
+            max_workers (int): Number of concurrent fetch workers.
+            executor (ThreadPoolExecutor): Executor running the workers.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied by the worker to
+                the rows and column names of each chunk (e.g. to build a pyarrow table). Defaults to None (rows kept).
+            limiter (Optional[_ConcurrencyLimiter]): Adaptive limit on the number of concurrent fetches.
+                Defaults to None (all workers fetch at once).
+
+        Returns:
+            tuple[list[tuple[int, Any, Any]], bool]:
+                The non-empty chunks as (chunk_index, rows or converted rows, column names) tuples, unordered,
+                and False if the bounds query or any chunk failed.
+
+        Raises:
+            InvalidSQLOperation: If the key column is not an int, date or datetime column.
+        """
+        sizer = _AdaptiveChunkSizer(
+            ADAPTIVE_INITIAL_READ_CHUNK_SIZE, max_bytes=ADAPTIVE_MAX_CHUNK_BYTES
+        )
+
+        # Shared cursor: next offset, or next key range start
+        cursor: dict[str, Any] = {
+            "position": 0,
+            "index": 0,
+            "done": False,
+            "null_keys": False,
+        }
+        if key_column is not None:
+            try:
+                bounds = self._fetch_key_bounds(sql, args, key_column)
+            except SQLAlchemyError as e:
+                logger.warning(
+                    f"Could not fetch bounds of key column '{key_column}': {e}"
+                )
+                return [], False
+            min_key, max_key, key_count, row_count = bounds
+            if not row_count:
+                return [], True
+            # Rows with a NULL key are claimed first, as one chunk
+            cursor["null_keys"] = row_count > key_count
+            cursor["done"] = not key_count
+            if key_count:
+                # Raises on unsupported key types before any worker starts
+                _next_key_bound(min_key, min_key, max_key, 0.0)
+                cursor["position"] = min_key
+
+        results = []
+        success = {"status": True}
+        lock = threading.Lock()
+
+        def claim_chunk() -> Optional[tuple[int, int, str, dict[str, Any]]]:
+            with lock:
+                if cursor["done"] and not cursor["null_keys"]:
+                    return None
+                size = sizer.size
+                chunk_index = cursor["index"]
+                cursor["index"] += 1
+                if cursor["null_keys"]:
+                    cursor["null_keys"] = False
+                    return (
+                        chunk_index,
+                        size,
+                        _build_null_key_query(sql, cast(str, key_column)),
+                        args or {},
+                    )
+                start = cursor["position"]
+                if key_column is None:
+                    cursor["position"] += size
+                    return (
+                        chunk_index,
+                        size,
+                        _build_limit_offset_query(sql, size, start),
+                        args or {},
+                    )
+                end, last = _next_key_bound(start, min_key, max_key, size / key_count)
+                cursor["position"] = end
+                cursor["done"] = last
+                return (
+                    chunk_index,
+                    size,
+                    _build_key_range_query(sql, key_column, last_partition=last),
+                    {**(args or {}), "partition_start": start, "partition_end": end},
+                )
+
+        def fetch_worker(progress: _ProgressTracker) -> None:
+            while True:
+                # The slot is taken before claiming, so each chunk is sized when it starts
+                with limiter.slot() if limiter is not None else nullcontext():
+                    claimed = claim_chunk()
+                    if claimed is None:
+                        return
+                    chunk_index, size, chunk_sql, bind_args = claimed
+                    started = time.perf_counter()
+                    # noinspection PyShadowingNames
+                    try:
+                        payload, columns = self._fetch_rows(
+                            chunk_sql, bind_args, convert_rows
+                        )
+                    except Exception as e:
+                        if limiter is not None:
+                            limiter.record(
+                                0,
+                                time.perf_counter() - started,
+                                failed=True,
+                                transient=_is_transient_error(e),
+                            )
+                        logger.warning(f"Chunk {chunk_index} failed: {e}")
+                        with lock:
+                            success["status"] = False
+                        return
+                    elapsed = time.perf_counter() - started
+                    if limiter is not None:
+                        limiter.record(len(payload), elapsed)
+                sizer.record(len(payload), elapsed, _payload_nbytes(payload))
+                with lock:
+                    if len(payload):
+                        results.append((chunk_index, payload, columns))
+                    # A short OFFSET chunk is the end of the result
+                    if key_column is None and len(payload) < size:
+                        cursor["done"] = True
+                progress.update(rows=len(payload), payload=payload)
+
+        # Progress (total unknown): reported by the workers as chunks complete
+        with self._track_progress("Querying chunks") as progress:
+            futures = [
+                executor.submit(fetch_worker, progress) for _ in range(max_workers)
+            ]
+            wait(futures)
+
+        return results, success["status"]
+
+    @staticmethod
+    def _limited_fetch(
+        limiter: Optional[_ConcurrencyLimiter],
+        fetch: Callable[..., tuple[Any, list[str]]],
+        *args: Any,
+    ) -> tuple[Any, list[str]]:
+        """
+        Runs one chunk fetch in a slot of the concurrency limiter and reports its duration and outcome to it.
+
+        Args:
+            limiter (Optional[_ConcurrencyLimiter]): Adaptive concurrency limit. If None, `fetch` is just called.
+            fetch (Callable[..., tuple[Any, list[str]]]): Function fetching the chunk, returning (rows, columns).
+            *args (Any): Arguments of `fetch`.
+
+        Returns:
+            tuple[Any, list[str]]: The result of `fetch`.
+
+        Raises:
+            Exception: Any error raised by `fetch`.
+        """
+        if limiter is None:
+            return fetch(*args)
+        with limiter.slot():
+            started = time.perf_counter()
+            try:
+                payload, columns = fetch(*args)
+            except Exception as e:
+                limiter.record(
+                    0,
+                    time.perf_counter() - started,
+                    failed=True,
+                    transient=_is_transient_error(e),
+                )
+                raise
+            limiter.record(len(payload), time.perf_counter() - started)
+        return payload, columns
+
+    def _fetch_offset_chunk(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        chunk_size: int,
+        chunk_index: int,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[Any, list[str]]:
+        """
+        Fetches one LIMIT/OFFSET chunk of a SELECT query.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            chunk_size (int): Number of rows per chunk.
+            chunk_index (int): Index of the chunk (its offset is `chunk_index * chunk_size`).
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and
+                column names if the chunk is not empty. Defaults to None (rows kept).
+
+        Returns:
+            tuple[Any, list[str]]: The rows (or converted rows) of the chunk and the column names.
+                The rows are an empty list if the chunk is past the end of the result.
+
+        Raises:
+            SQLAlchemyError: If the chunk query fails.
+        """
+        paginated_sql = _build_offset_chunk_query(sql, chunk_size, chunk_index)
+        return self._fetch_rows(paginated_sql, args, convert_rows)
+
+    def _plan_key_ranges(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+        chunk_size: int,
+    ) -> list[tuple[Any, Any]]:
+        """
+        Reads MIN/MAX/COUNT of `key_column` and splits its range into sub-ranges of about `chunk_size` rows.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Int, date or datetime output column of the query to partition on.
+            chunk_size (int): Target number of rows per sub-range.
+
+        Returns:
+            list[tuple[Any, Any]]: The (start, end) bounds of each sub-range, in key order, preceded by a
+                (None, None) partition if some rows have a NULL key. Empty if the query returns no rows.
+
+        Raises:
+            SQLAlchemyError: If the bounds query fails.
+            InvalidSQLOperation: If the key column is not an int, date or datetime column.
+        """
+        min_key, max_key, key_count, row_count = self._fetch_key_bounds(
+            sql, args, key_column
+        )
+        return _plan_key_partitions(min_key, max_key, key_count, row_count, chunk_size)
+
+    def _fetch_key_bounds(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+    ) -> tuple[Any, Any, int, int]:
+        """
+        Reads MIN/MAX/COUNT of `key_column` and the number of rows over the result of a SELECT query.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Output column of the query to partition on.
+
+        Returns:
+            tuple[Any, Any, int, int]: The smallest key, largest key (None if every key is NULL), number of
+                non-NULL keys and number of rows.
+
+        Raises:
+            SQLAlchemyError: If the bounds query fails.
+        """
+        bounds_sql = _build_key_bounds_query(sql, key_column)
+
+        with self._engine.connect() as conn:
+            min_key, max_key, key_count, row_count = conn.execute(
+                text(bounds_sql), args or {}
+            ).one()
+
+        if key_count != row_count:
+            logger.debug(
+                f"{row_count - key_count} row(s) have a NULL '{key_column}', fetched as one partition."
+            )
+        return min_key, max_key, key_count, row_count
+
+    def _fetch_key_range(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        key_column: str,
+        start: Any,
+        end: Any,
+        last_partition: bool,
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[Any, list[str]]:
+        """
+        Fetches one key sub-range of a SELECT query, ordered by the key.
+
+        Args:
+            sql (str): Converted base SQL SELECT query (without LIMIT or OFFSET).
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            key_column (str): Output column the query is partitioned on.
+            start (Any): Inclusive lower bound of the sub-range, None for the rows with a NULL key.
+            end (Any): Exclusive upper bound of the sub-range (inclusive if last_partition).
+            last_partition (bool): Whether this is the last sub-range.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and
+                column names if the sub-range is not empty. Defaults to None (rows kept).
+
+        Returns:
+            tuple[Any, list[str]]: The rows (or converted rows) of the sub-range and the column names.
+
+        Raises:
+            SQLAlchemyError: If the sub-range query fails.
+        """
+        if start is None:
+            return self._fetch_rows(
+                _build_null_key_query(sql, key_column), args, convert_rows
+            )
+        partition_sql = _build_key_range_query(
+            sql.strip().rstrip(";"), key_column, last_partition=last_partition
+        )
+        bind_args = {**(args or {}), "partition_start": start, "partition_end": end}
+        return self._fetch_rows(partition_sql, bind_args, convert_rows)
+
+    def _fetch_rows(
+        self,
+        sql: str,
+        args: Optional[dict[str, Any]],
+        convert_rows: Optional[Callable[[Sequence[Row], list[str]], Any]] = None,
+    ) -> tuple[Any, list[str]]:
+        """
+        Fetches all rows of one chunk query on its own connection.
+
+        Args:
+            sql (str): Chunk SQL SELECT query.
+            args (Optional[dict[str, Any]]): Bind parameters of the query.
+            convert_rows (Optional[Callable[[Sequence[Row], list[str]], Any]]): Applied to the rows and
+                column names if the chunk is not empty. Defaults to None (rows kept).
+
+        Returns:
+            tuple[Any, list[str]]: The rows (or converted rows) of the chunk and the column names.
+
+        Raises:
+            SQLAlchemyError: If the query fails.
+        """
+        with self._engine.connect() as conn:
+            result = conn.execute(text(sql), args or {})
+            rows = result.fetchall()
+            columns = list(result.keys())
+        if rows and convert_rows:
+            return convert_rows(rows, columns), columns
+        return rows, columns
+
+    ### --- Write operations --- ###
+
+    ### --- Single transaction --- ###
+
+    ### --- Execute (single transaction, single args) --- ###
+
+    def execute(
+        self,
+        sql: str,
+        args: Optional[
+            Union[
+                list[tuple[Any, ...]],
+                list[dict[str, Any]],
+                tuple[Any, ...],
+                dict[str, Any],
+            ]
+        ] = None,
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Executes a single non-SELECT SQL statement (INSERT, UPDATE, DELETE, CREATE, ...) within a transaction.
+
+        This method is intended for single-row or non-batch operations. For multi-row or large-scale writes,
+        consider using `execute_many()` or `execute_batch()` instead.
+
+        Args:
+            sql (str): SQL statement with optional named placeholders (e.g., :id).
+            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
+                A single row of bound parameters.
+            on_duplicate (Optional[str]): Optional duplicate-handling clause to apply (e.g., "ignore", "replace").
+            return_failures (bool): If True, returns a DataFrame with error details on failure. Defaults to True.
+            return_status (bool): If True, includes a boolean success flag in the return. Defaults to False.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of the failed record (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If the SQL or bound arguments are invalid or malformed.
+            SQLExecutionError: If duplicate-handling logic could not be applied.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        # Check if close hasn't been called yet
+        self._check_closed()
+
+        # Convert placeholders and apply duplicates logic (cached per statement)
+        try:
+            statement = self._prepare_statement(
+                sql, convert=args is not None, on_duplicate=on_duplicate
+            )
+            sql = statement.sql
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+        # Convert args to sqlalchemy compatible params and check them
+        try:
+            if args is not None:
+                converted_args = _convert_args(args)
+                # Ensure args is always a single dict
+                if isinstance(converted_args, list):
+                    if len(converted_args) != 1:
+                        raise InvalidSQLOperation(
+                            "execute() only accepts a single row of parameters."
+                        )
+                    args = converted_args[0]
+                else:
+                    args = converted_args
+        except Exception as e:
+            raise InvalidSQLOperation(f"Failed to convert SQL/args: {e}")
+
+        # Execute transaction
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(statement.clause, args or {})
+            logger.info("Single SQL statement executed successfully.")
+            if return_failures and return_status:
+                return pd.DataFrame(), True
+            elif return_failures:
+                return pd.DataFrame(), None
+            elif return_status:
+                return None, True
+            else:
+                return None, None
+        except Exception as e:
+            logger.warning(f"Execution failed: {e}")
+            logger.debug(f"SQL: {sql}")
+            logger.debug(f"Args: {args}")
+            if return_failures:
+                df_failures = pd.DataFrame(
+                    [
+                        {
+                            **(args or {}),
+                            "error_message": str(e),
+                            "sql": sql[:300],  # preview of query
+                        }
+                    ]
+                )
+                if return_status:
+                    return df_failures, False
+                else:
+                    return df_failures, None
+            else:
+                if return_status:
+                    return None, False
+                else:
+                    return None, None
+
+    ### --- Execute many (Single transaction, Multiple args) --- ###
+
+    def execute_many(
+        self,
+        sql: str,
+        args: Union[
+            list[tuple[Any, ...]],
+            list[dict[str, Any]],
+            tuple[Any, ...],
+            dict[str, Any],
+            pd.DataFrame,
+        ],
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Executes a bulk non-SELECT SQL operation (INSERT, UPDATE, or DELETE) in a single transaction.
+
+        This is an all-or-nothing operation: if any row in the batch fails, the entire transaction is rolled back.
+        Useful for applying a uniform statement across many rows (e.g., bulk inserts with conflict handling).
+
+        Args:
+            sql (str): SQL statement with placeholders (e.g., :id, :value).
+            args (Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]):
+                Bound parameters to apply to the SQL query. Can be a list of tuples/dicts or a DataFrame.
+            on_duplicate (Optional[str]): Optional duplicate-handling mode ("ignore", "replace", or None).
+            return_failures (bool): If True, returns a DataFrame of failed rows with error messages on failure.
+            return_status (bool): If True, includes a success flag in the return value.
+
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
+
+        Raises:
+            InvalidSQLOperation: If the SQL or input arguments are malformed or cannot be converted.
+            SQLExecutionError: If duplicate-handling clause insertion fails.
+            BadArgumentsBulk: If no valid rows are provided for execution.
+            BaseSQLConversionError: If argument conversion fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+
+        # Check if close hasn't been called yet
+        self._check_closed()
+
+        # Check if args were provided (necessary for chunks otherwise use execute single)
+        try:
+            _validate_args_for_bulk(args)
+            logger.debug("Valid args for execute_many")
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for execute_many {e}")
+            raise
+
+        # Convert params to sqlalchemy compatible format
+        try:
+            args = _convert_args(args)
+            if isinstance(args, dict):  # In case only 1 row was used with execute_many
+                args = [args]
+            # Narrow the type explicitly for MyPy
+            args = cast(list[dict[str, Any]], args)
+        except BaseSQLConversionError as e:
+            logger.error(f"Invalid args format: {e}")
+            raise
+
+        # Convert placeholders and apply duplicates logic (cached per statement)
+        try:
+            statement = self._prepare_statement(sql, on_duplicate=on_duplicate)
+            sql = statement.sql
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
+
+        # Execute transaction
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(statement.clause, args)
+            logger.info("All records executed successfully in a single transaction.")
+            if return_failures and return_status:
+                return pd.DataFrame(), True
+            elif return_failures:
+                return pd.DataFrame(), None
+            elif return_status:
+                return None, True
+            else:
+                return None, None
+        except Exception as e:
+            logger.warning(f"Transaction failed: {e}")
+            logger.debug(f"SQL: {sql}")
+            logger.debug(f"Args: {args}")
+
+            # Return success flag and failures df logic
+            if return_failures and return_status:
+                return (
+                    pd.DataFrame([{**row, "error_message": str(e)} for row in args]),
+                    False,
+                )
+            elif return_failures:
+                return (
+                    pd.DataFrame([{**row, "error_message": str(e)} for row in args]),
+                    None,
+                )
+            elif return_status:
+                return None, False
+            else:
+                return None, None
 
-        # Seed the first `max_workers` chunk indices
-        for i in range(max_workers):
-            work_queue.put(i)
+    ### --- Insert many (Single transaction, Multiple args, just for inserts) --- ###
 
-        # Thread function (dynamic queuing since unknown number of chunks)
-        def fetch_worker() -> None:
-            while True:
-                try:
-                    chunk_index = work_queue.get(timeout=1)
-                except Empty:
-                    break
+    def insert_many(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        on_duplicate: Optional[str] = None,
+        return_failures: bool = True,
+        return_status: bool = False,
+        method: Literal["insert", "values", "copy", "load_data"] = "insert",
+    ) -> Union[
+        tuple[pd.DataFrame, bool],
+        tuple[pd.DataFrame, None],
+        tuple[None, bool],
+        tuple[None, None],
+    ]:
+        """
+        Inserts a pandas DataFrame into a SQL table using a single atomic transaction.
 
-                offset = chunk_index * chunk_size
-                paginated_sql = (
-                    f"{sql.strip().rstrip(';')} LIMIT {chunk_size} OFFSET {offset}"
-                )
+        This method builds a parameterized INSERT statement and executes it with the data from the DataFrame.
+        All rows are inserted in a single commit. If any row fails, the entire transaction is rolled back.
 
-                # noinspection PyShadowingNames
-                try:
-                    with self._engine.connect() as conn:
-                        result = conn.execute(text(paginated_sql), args or {})
-                        rows = result.fetchall()
-                        if rows:
-                            with results_lock:
-                                results.append((chunk_index, rows, result.keys()))
-                            # Queue the next sequential chunk
-                            work_queue.put(chunk_index + max_workers)
-                        # else: stop naturally — don't queue anything
-                except Exception as e:
-                    logger.warning(f"Chunk {chunk_index} failed: {e}")
-                    with success_lock:
-                        success["status"] = False
-                finally:
-                    work_queue.task_done()
+        Args:
+            df (pandas.DataFrame): DataFrame containing the rows to insert.
+            table_name (str): Target table name, e.g., "schema.table".
+            on_duplicate (Optional[str]): Conflict handling mode ("ignore", "replace", or None).
+            return_failures (bool): If True, returns a DataFrame of failed rows with error messages on failure.
+            return_status (bool): If True, includes a success flag in the return value.
+            method (Literal["insert", "values", "copy", "load_data"]): How rows are sent to the database. One of:
+                - "insert": Parameterized INSERT executed for all rows (default)
+                - "values": Multi-row INSERT statements, sized to the bound parameter limit of the database
+                - "copy": PostgreSQL only. Streams the rows as CSV with COPY, much faster for large DataFrames
+                - "load_data": MySQL only. Loads the rows from a temporary file with LOAD DATA LOCAL INFILE.
+                  Requires `local_infile: true` in the config and on the server
 
-        # Create new executor if max_workers != self._max_workers
-        if max_workers != self._max_workers:
-            query_executor = ThreadPoolExecutor(max_workers=max_workers)
-            temp_executor = True
-        else:
-            query_executor = self._executor
-            temp_executor = False
+        Returns:
+            Union[
+                tuple[pandas.DataFrame, bool],
+                tuple[pandas.DataFrame, None],
+                tuple[None, bool],
+                tuple[None, None]
+            ]: A tuple containing:
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A success flag (if `return_status` is True), otherwise None.
 
-        # Launch query with progress bar
-        futures = [query_executor.submit(fetch_worker) for _ in range(max_workers)]
-
-        # Progress bar (can't have the end final for progress bar so update as it runs but start at max_workers)
-        with tqdm(total=max_workers, desc="Querying chunks") as pbar:
-            previous_max = 0
-            while any(f.done() is False for f in futures):
-                current_size = len(results)
-                if current_size > previous_max:
-                    if current_size > pbar.total:
-                        pbar.total = current_size
-                        pbar.refresh()
-                    pbar.update(current_size - previous_max)
-                    previous_max = current_size
-
-        # Stop main thread (using futures -> all futures are done only if all tasks are done in fetch_worker logic)
-        wait(futures)
-
-        # Shutdown temp executor if created
-        if temp_executor:
-            query_executor.shutdown(wait=False)
-
-        # Sort and flatten results
-        results.sort(key=lambda x: x[0])
-        # Extract first valid column names
-        column_names = []
-        for _, _, cols in results:
-            if cols:
-                column_names = list(cols)
-                break
-        # Flatten rows from all chunks
-        all_rows = [row for _, rows, _ in results for row in rows]
+        Raises:
+            InvalidSQLOperation: If SQL insert generation fails, arguments are malformed or the insert method is
+                unknown or unsupported by the database.
+            SQLExecutionError: If duplicate-handling clause generation fails.
+            UnsupportedDatabaseType: If the current database type is unsupported for insert generation.
+            BadArgumentsBulk: If the input DataFrame is empty or invalid.
+            BaseSQLConversionError: If argument conversion during delegated insert fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        # Check if close hasn't been called yet
+        self._check_closed()
 
-        # If no rows
-        if not all_rows:
-            logger.info("Query executed successfully but returned no rows.")
-        # If no column_names
-        if not column_names:
-            logger.info("Query returned no column names: check your sql statement.")
+        # Check that df is not empty
+        try:
+            _validate_args_for_bulk(df)
+            logger.debug("Valid args for insert_many")
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for insert_many {e}")
+            raise
 
-        # Optional print
-        if print_result:
-            preview_df = pd.DataFrame(
-                all_rows[:print_limit], columns=column_names or None
+        # Multi-row or bulk load path, a single chunk in a single transaction
+        if self._check_insert_method(method) != "insert":
+            return self._insert_batch_with_method(
+                df=df,
+                table_name=table_name,
+                method=method,
+                on_duplicate=on_duplicate,
+                chunk_size=None,
+                max_workers=None,
+                return_failures=return_failures,
+                return_status=return_status,
             )
-            print(preview_df.to_string(index=False))
 
-        # Return
-        return_format = return_format.lower()
-        if return_format == "df":
-            res = pd.DataFrame(all_rows, columns=column_names or None)
-        elif return_format == "none":
-            res = None
-        elif return_format == "raw":
-            res = all_rows
-        elif return_format == "list":
-            res = (
-                [dict(zip(column_names, row)) for row in all_rows]
-                if column_names
-                else []
+        try:
+            column_name = list(df.columns)
+            sql = _build_insert_statement(
+                table_name=table_name, columns=column_name, db_type=self._db_type
             )
-        else:
-            raise QueryResultFormatError(return_type)
+        except UnsupportedDatabaseType as e:
+            logger.error(
+                f"Could not generate insert statement for table '{table_name}': {e}"
+            )
+            raise
 
-        if return_status:
-            return res, success["status"]
-        else:
-            return res
+        # Ignore duplicates logic
+        try:
+            sql = _apply_on_duplicate_clause(sql, self._db_type, on_duplicate)
+        except SQLExecutionError as e:
+            logger.error(f"Duplicate handling logic error {e}")
+            raise
 
-    ### --- Write operations --- ###
+        return self.execute_many(
+            sql=sql,
+            args=df,
+            on_duplicate=None,  # already applied
+            return_failures=return_failures,
+            return_status=return_status,
+        )
 
-    ### --- Single transaction --- ###
+    ### --- Multiple transactions (not atomic) --- ###
 
-    ### --- Execute (single transaction, single args) --- ###
+    ### --- Execute batch (Threaded, Multiple transactions, Multiple args) --- ###
 
-    def execute(
+    def execute_batch(
         self,
         sql: str,
-        args: Optional[
-            Union[
-                list[tuple[Any, ...]],
-                list[dict[str, Any]],
-                tuple[Any, ...],
-                dict[str, Any],
-            ]
-        ] = None,
+        args: Union[
+            list[tuple[Any, ...]],
+            list[dict[str, Any]],
+            tuple[Any, ...],
+            dict[str, Any],
+            pd.DataFrame,
+        ],
+        chunk_size: Union[int, Literal["auto"]] = 512,
+        max_workers: Optional[Union[int, Literal["auto"]]] = None,
         on_duplicate: Optional[str] = None,
         return_failures: bool = True,
         return_status: bool = False,
+        max_in_flight: Optional[int] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_retries: int = 0,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        bisect_failures: bool = False,
     ) -> Union[
         tuple[pd.DataFrame, bool],
         tuple[pd.DataFrame, None],
@@ -972,18 +2574,55 @@ class DBClient:
         tuple[None, None],
     ]:
         """
-        Executes a single non-SELECT SQL statement (INSERT, UPDATE, DELETE, CREATE, ...) within a transaction.
+        Executes a SQL operation (INSERT, UPDATE, DELETE) in parallel batches using threads.
 
-        This method is intended for single-row or non-batch operations. For multi-row or large-scale writes,
-        consider using `execute_many()` or `execute_batch()` instead.
+        The input data is split into chunks and each chunk is executed in a separate thread. The method supports
+        error capture per chunk, duplicate-handling clauses, and optional success/failure reporting.
+
+        Chunks are sliced lazily and at most `max_in_flight` of them are submitted at a time. A DataFrame chunk is
+        converted to parameters by the worker that sends it, so peak memory is bounded by
+        `max_in_flight * chunk_size` rows rather than the whole input.
+
+        With `executor="process"`, chunks are executed by a pool of worker processes instead, each with its own
+        engine and connection. Converting rows to parameters and the driver's encoding then run on all cores
+        instead of contending for the GIL. DataFrame chunks are sent to the workers as Arrow IPC streams when
+        pyarrow is installed. Worker processes are spawned for each call, so scripts must guard their entry point
+        with `if __name__ == "__main__":`.
+
+        With `chunk_size="auto"`, the first chunks have ADAPTIVE_INITIAL_WRITE_CHUNK_SIZE rows, then each chunk is
+        sized from the measured throughput of the previous ones to take about DEFAULT_TARGET_CHUNK_SECONDS, within
+        a memory and a statement size budget estimated from the size of the rows.
+
+        With `max_workers="auto"`, the number of chunks executed at once starts at ADAPTIVE_INITIAL_CONCURRENCY and
+        is adjusted by an AIMD limiter: one more worker while throughput improves, half as many after a deadlock,
+        timeout or latency spike, up to the pool capacity (threads) or the number of CPUs (processes). The
+        concurrency it settled on is returned by `concurrency_info()`.
+
+        A chunk failing with a transient error (deadlock, lock or statement timeout, dropped connection) is retried
+        up to `max_retries` times, after an exponential backoff with jitter. With `bisect_failures`, a chunk failing
+        for another reason is split in halves executed in their own transactions, recursively, so that only the
+        rows that fail on their own are returned as failures and the others are written.
 
         Args:
-            sql (str): SQL statement with optional named placeholders (e.g., :id).
-            args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any]]]):
-                A single row of bound parameters.
-            on_duplicate (Optional[str]): Optional duplicate-handling clause to apply (e.g., "ignore", "replace").
-            return_failures (bool): If True, returns a DataFrame with error details on failure. Defaults to True.
-            return_status (bool): If True, includes a boolean success flag in the return. Defaults to False.
+            sql (str): SQL statement with placeholders (e.g., :id, :value).
+            args (Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]):
+                Rows of parameters to bind to the SQL query.
+            chunk_size (Union[int, Literal["auto"]]): Number of rows per batch, or "auto" to adapt it to the
+                measured latency. Defaults to 512.
+            max_workers (Optional[Union[int, Literal["auto"]]]): Maximum number of concurrent threads, or "auto" to
+                adapt it to the throughput of the server. Defaults to internal pool size.
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            return_failures (bool): If True, includes failed records with error messages in the result.
+            return_status (bool): If True, includes a boolean success flag in the result.
+            max_in_flight (Optional[int]): Maximum number of chunks submitted but not yet executed. Defaults to
+                DEFAULT_IN_FLIGHT_PER_WORKER times the number of threads.
+            executor (Literal["thread", "process"]): "thread" (default) runs the chunks on the client's thread pool,
+                "process" on `max_workers` worker processes (defaults to the number of CPUs).
+            max_retries (int): Retries of a chunk after a transient error. Defaults to 0.
+            retry_backoff (float): Base delay in seconds of the exponential backoff between retries, doubled at
+                each retry. Defaults to DEFAULT_RETRY_BACKOFF.
+            bisect_failures (bool): If True, failed chunks are split recursively to isolate the failing rows.
+                Defaults to False (all rows of a failed chunk are returned).
 
         Returns:
             Union[
@@ -992,92 +2631,273 @@ class DBClient:
                 tuple[None, bool],
                 tuple[None, None]
             ]: A tuple containing:
-                - A DataFrame of the failed record (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
                 - A success flag (if `return_status` is True), otherwise None.
 
         Raises:
-            InvalidSQLOperation: If the SQL or bound arguments are invalid or malformed.
-            SQLExecutionError: If duplicate-handling logic could not be applied.
+            InvalidSQLOperation: If the SQL, arguments, chunk size, executor or retry arguments are invalid or cannot
+                be processed.
+            BadArgumentsBulk: If no valid rows are provided.
+            SQLExecutionError: If duplicate-handling clause generation fails.
+            BaseSQLConversionError: If argument conversion fails during SQL preparation.
+            UnsupportedMultiThreadedDatabase: If multithreaded writes are attempted on SQLite.
+            LimitMaxWorkersError: If max_workers exceeds the available thread pool capacity (thread executor).
             DBClientClosedError: If the instance has already been closed.
         """
         # Check if close hasn't been called yet
         self._check_closed()
 
-        # Convert params to sqlalchemy compatible placeholders and check args
+        # Check if args were provided (necessary for chunks otherwise use execute single)
         try:
-            if args is not None:
-                sql, converted_args = _convert_dbapi_to_sqlalchemy_style(sql, args)
-                # Ensure args is always a single dict
-                if isinstance(converted_args, list):
-                    if len(converted_args) != 1:
-                        raise InvalidSQLOperation(
-                            "execute() only accepts a single row of parameters."
-                        )
-                    args = converted_args[0]
-                else:
-                    args = converted_args
-        except Exception as e:
-            raise InvalidSQLOperation(f"Failed to convert SQL/args: {e}")
+            _validate_args_for_bulk(args)
+            logger.debug("Valid args for execute_batch")
+        except BadArgumentsBulk as e:
+            logger.error(f"Invalid arguments for execute_batch {e}")
+            raise
 
-        # Ignore duplicates logic
+        if self._db_type == "sqlite":
+            logger.error(
+                "Threaded writes are not supported on SQLite. Use execute_many or execute instead. "
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        self._check_executor(executor)
+        _check_chunk_size(chunk_size)
+        _check_retry_arguments(max_retries, retry_backoff)
+
+        # Check if max_worker given by user above total_pool_size (processes have their own engines)
+        if (
+            executor == "thread"
+            and isinstance(max_workers, int)
+            and max_workers > self._total_pool_capacity
+        ):
+            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
+
+        # Adaptive concurrency: workers are created up to the cap and the limiter decides how many chunks run
+        limiter = self._concurrency_limiter(max_workers, executor)
+        num_workers = self._resolve_num_workers(max_workers, limiter)
+
+        # Convert params to sqlalchemy compatible format, DataFrames are converted chunk by chunk
         try:
-            sql = _apply_on_duplicate_clause(sql, self._db_type, on_duplicate)
+            records: list[dict[str, Any]] = []
+            if _is_dataframe(args):
+                df = cast(pd.DataFrame, args)
+            else:
+                df = None
+                converted_args = _convert_args(args)
+                if isinstance(converted_args, dict):
+                    converted_args = [converted_args]
+                # Narrow the type explicitly for MyPy
+                records = cast(list[dict[str, Any]], converted_args)
+        except BaseSQLConversionError as e:
+            logger.error(f"Invalid args format: {e}")
+            raise
+
+        # Convert placeholders and apply duplicates logic (cached per statement)
+        try:
+            statement = self._prepare_statement(sql, on_duplicate=on_duplicate)
+            sql = statement.sql
         except SQLExecutionError as e:
             logger.error(f"Duplicate handling logic error {e}")
             raise
 
-        # Execute transaction
-        try:
-            with self._engine.begin() as conn:
-                conn.execute(text(sql), args or {})
-            logger.info("Single SQL statement executed successfully.")
+        # Chunks are sliced lazily, when a slot frees up, and initialize failed_record list
+        rows = df if df is not None else records
+        date_only_columns = _date_only_columns(df) if df is not None else None
+        sizer = self._write_chunk_sizer(rows) if chunk_size == "auto" else None
+        num_chunks: Optional[int]
+        if sizer is not None:
+            # Chunk count unknown, each chunk is sliced with the size of the latest measurement
+            num_chunks = None
+            chunks = _iter_adaptive_chunks(rows, sizer)
+        else:
+            fixed_size = cast(int, chunk_size)
+            num_chunks = -(-len(rows) // fixed_size)
+            chunks = (
+                (
+                    (
+                        df.iloc[i : i + fixed_size]
+                        if df is not None
+                        else records[i : i + fixed_size]
+                    ),
+                    i // fixed_size,
+                )
+                for i in range(0, len(rows), fixed_size)
+            )
+        failed_records: list[dict[str, Any]] = []
+
+        # Create insert chunk function
+        def execute_chunk(
+            chunk: Union[list[dict[str, Any]], pd.DataFrame], chunk_num: int
+        ) -> None:
+            # Convert DataFrame rows just before they are sent
+            chunk_args = (
+                _dataframe_to_params(chunk, date_only_columns)
+                if _is_dataframe(chunk)
+                else chunk
+            )
+            started = time.perf_counter()
+            # Silent failing, retries and bisection, failed rows are collected in df
+            failures = _execute_with_retry(
+                partial(self._execute_params, statement.clause),
+                chunk_args,
+                max_retries=max_retries,
+                retry_backoff=retry_backoff,
+                bisect=bisect_failures,
+                on_transient_error=(
+                    partial(self._record_transient_error, limiter)
+                    if limiter is not None
+                    else None
+                ),
+            )
+            elapsed = time.perf_counter() - started
+            if not failures:
+                if sizer is not None:
+                    sizer.record(len(chunk_args), elapsed)
+                if limiter is not None:
+                    limiter.record(len(chunk_args), elapsed)
+                return
+
+            # Transient errors were already reported to the limiter
+            if limiter is not None:
+                limiter.record(0, elapsed, failed=True)
+            for failed_args, e in failures:
+                logger.warning(
+                    f"Chunk {chunk_num} failed ({len(failed_args)} row(s)): {e}"
+                )
+                logger.debug(f"SQL: {sql}")
+                logger.debug(f"Args: {failed_args}")
+                for record in failed_args:
+                    failed_records.append(
+                        {**record, "chunk_index": chunk_num, "error_message": str(e)}
+                    )
+
+        if executor == "process":
+            # Worker processes with their own engine, chunks are sent as shards and failed records sent back
+            num_processes: int = num_workers or os.cpu_count() or 1
+
+            def collect_shard(result: _ShardResult, shard: Any) -> None:
+                failed_records.extend(result.failures)
+                failed = bool(result.failures)
+                if sizer is not None and not failed:
+                    sizer.record(len(shard), result.seconds)
+                if limiter is not None:
+                    limiter.record(
+                        0 if failed else len(shard),
+                        result.seconds,
+                        failed=failed,
+                        transient=result.transient,
+                    )
+
+            process_executor = ProcessPoolExecutor(
+                max_workers=num_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=partial(
+                    _init_worker,
+                    self._db_url,
+                    self._connect_args,
+                    self._engine_kwargs,
+                ),
+            )
+            try:
+                self._run_chunks(
+                    partial(
+                        _execute_shard,
+                        sql,
+                        date_only_columns,
+                        max_retries,
+                        retry_backoff,
+                        bisect_failures,
+                    ),
+                    ((_make_shard(chunk), chunk_num) for chunk, chunk_num in chunks),
+                    total=num_chunks,
+                    executor=process_executor,
+                    max_in_flight=max_in_flight
+                    or self.DEFAULT_IN_FLIGHT_PER_WORKER * num_processes,
+                    desc="Inserting chunks",
+                    on_result=collect_shard,
+                    limiter=limiter,
+                )
+            finally:
+                # Wait for the workers to exit, which disposes their engines
+                process_executor.shutdown(wait=True)
+        else:
+            # Create new executor that we'll dispose later if max_workers specified and different from max_workers at init
+            if num_workers is not None:
+                execute_executor = ThreadPoolExecutor(max_workers=num_workers)
+                temp_executor = True
+            else:
+                execute_executor = self._executor
+                temp_executor = False
+
+            # Launch threads with executor, bounded number of chunks in flight
+            try:
+                self._run_chunks(
+                    execute_chunk,
+                    chunks,
+                    total=num_chunks,
+                    executor=execute_executor,
+                    max_in_flight=max_in_flight
+                    or self.DEFAULT_IN_FLIGHT_PER_WORKER
+                    * (num_workers or self._max_workers),
+                    desc="Inserting chunks",
+                    limiter=limiter,
+                )
+            finally:
+                # Shutdown temp executor if was created
+                if temp_executor:
+                    execute_executor.shutdown(wait=False)
+
+        self._store_concurrency_info(limiter)
+
+        if failed_records:
+            logger.warning(
+                f"{len(failed_records)} record(s) across some chunk(s) failed during execution. "
+                "You can inspect or retry them using the returned DataFrame if return_failures=True."
+            )
             if return_failures and return_status:
-                return pd.DataFrame(), True
+                return pd.DataFrame(failed_records), False
             elif return_failures:
-                return pd.DataFrame(), None
+                return pd.DataFrame(failed_records), None
             elif return_status:
+                logger.info(
+                    "return_failures=False, failed records will not be returned."
+                )
                 return None, False
             else:
-                return None, None
-        except Exception as e:
-            logger.warning(f"Execution failed: {e}")
-            logger.debug(f"SQL: {sql}")
-            logger.debug(f"Args: {args}")
-            if return_failures:
-                df_failures = pd.DataFrame(
-                    [
-                        {
-                            **(args or {}),
-                            "error_message": str(e),
-                            "sql": sql[:300],  # preview of query
-                        }
-                    ]
-                )
-                if return_status:
-                    return df_failures, False
-                else:
-                    return df_failures, None
+                logger.info(
+                    "return_failures=False, failed records will not be returned."
+                )
+                return None, None
+
+        else:
+            logger.info("All chunks executed successfully.")
+            if return_failures and return_status:
+                return pd.DataFrame(), True
+            elif return_failures:
+                return pd.DataFrame(), None
+            elif return_status:
+                return None, True
             else:
-                if return_status:
-                    return None, False
-                else:
-                    return None, None
+                return None, None
 
-    ### --- Execute many (Single transaction, Multiple args) --- ###
+    ### --- Insert batch (Threaded, Multiple transactions, Multiple args, Inserts Only) --- ###
 
-    def execute_many(
+    def insert_batch(
         self,
-        sql: str,
-        args: Union[
-            list[tuple[Any, ...]],
-            list[dict[str, Any]],
-            tuple[Any, ...],
-            dict[str, Any],
-            pd.DataFrame,
-        ],
+        df: pd.DataFrame,
+        table_name: str,
+        chunk_size: Union[int, Literal["auto"]] = 512,
+        max_workers: Optional[Union[int, Literal["auto"]]] = None,
         on_duplicate: Optional[str] = None,
         return_failures: bool = True,
         return_status: bool = False,
+        method: Literal["insert", "values", "copy", "load_data"] = "insert",
+        max_in_flight: Optional[int] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_retries: int = 0,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        bisect_failures: bool = False,
     ) -> Union[
         tuple[pd.DataFrame, bool],
         tuple[pd.DataFrame, None],
@@ -1085,18 +2905,36 @@ class DBClient:
         tuple[None, None],
     ]:
         """
-        Executes a bulk non-SELECT SQL operation (INSERT, UPDATE, or DELETE) in a single transaction.
+        Inserts a pandas DataFrame into a SQL table using concurrent threaded chunking.
 
-        This is an all-or-nothing operation: if any row in the batch fails, the entire transaction is rolled back.
-        Useful for applying a uniform statement across many rows (e.g., bulk inserts with conflict handling).
+        This wraps `execute_batch()` by automatically generating an INSERT statement based on the DataFrame
+        columns and table name. Data is split into chunks and written concurrently using a thread pool.
 
         Args:
-            sql (str): SQL statement with placeholders (e.g., :id, :value).
-            args (Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]):
-                Bound parameters to apply to the SQL query. Can be a list of tuples/dicts or a DataFrame.
-            on_duplicate (Optional[str]): Optional duplicate-handling mode ("ignore", "replace", or None).
-            return_failures (bool): If True, returns a DataFrame of failed rows with error messages on failure.
-            return_status (bool): If True, includes a success flag in the return value.
+            df (pandas.DataFrame): The DataFrame containing rows to insert. Columns must match the target table schema.
+            table_name (str): Full table name, e.g., "schema.table".
+            chunk_size (Union[int, Literal["auto"]]): Number of rows per batch, or "auto" to adapt it to the
+                measured latency (see `execute_batch()`). Defaults to 512.
+            max_workers (Optional[Union[int, Literal["auto"]]]): Maximum number of concurrent threads, or "auto" to
+                adapt it to the throughput of the server (see `execute_batch()`). Defaults to internal pool size.
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            return_failures (bool): If True, includes failed records with error messages in the result.
+            return_status (bool): If True, includes a boolean success flag in the result.
+            method (Literal["insert", "values", "copy", "load_data"]): How each chunk is sent to the database. One of:
+                - "insert": Parameterized INSERT executed for all rows of the chunk (default)
+                - "values": Multi-row INSERT statements, sized to the bound parameter limit of the database
+                - "copy": PostgreSQL only. Streams each chunk as CSV with COPY, much faster for large DataFrames
+                - "load_data": MySQL only. Loads each chunk from a temporary file with LOAD DATA LOCAL INFILE.
+                  Requires `local_infile: true` in the config and on the server
+            max_in_flight (Optional[int]): Maximum number of chunks sliced and submitted but not yet written, which
+                bounds peak memory. Defaults to DEFAULT_IN_FLIGHT_PER_WORKER times the number of threads.
+            executor (Literal["thread", "process"]): "thread" (default) or "process" to insert the chunks from
+                worker processes, see `execute_batch()`. Only supported with method="insert".
+            max_retries (int): Retries of a chunk after a transient error, see `execute_batch()`. Defaults to 0.
+            retry_backoff (float): Base delay in seconds of the exponential backoff between retries. Defaults to
+                DEFAULT_RETRY_BACKOFF.
+            bisect_failures (bool): If True, failed chunks are split recursively so that only the failing rows are
+                returned, see `execute_batch()`. Defaults to False.
 
         Returns:
             Union[
@@ -1109,33 +2947,78 @@ class DBClient:
                 - A success flag (if `return_status` is True), otherwise None.
 
         Raises:
-            InvalidSQLOperation: If the SQL or input arguments are malformed or cannot be converted.
-            SQLExecutionError: If duplicate-handling clause insertion fails.
-            BadArgumentsBulk: If no valid rows are provided for execution.
-            BaseSQLConversionError: If argument conversion fails.
+            InvalidSQLOperation: If the insert method or executor is unknown or unsupported by the database,
+                or if the chunk size or retry arguments are invalid.
+            BadArgumentsBulk: If the input DataFrame is empty or invalid.
+            UnsupportedDatabaseType: If the current database type does not support insert generation.
+            UnsupportedMultiThreadedDatabase: If multithreaded inserts are attempted on SQLite.
+            LimitMaxWorkersError: If max_workers exceeds available thread pool capacity.
+            SQLExecutionError: If duplicate-handling logic insertion fails.
+            BaseSQLConversionError: If argument conversion fails internally.
             DBClientClosedError: If the instance has already been closed.
         """
 
-        # Check if close hasn't been called yet
+        # Check engine is not closed
         self._check_closed()
 
-        # Check if args were provided (necessary for chunks otherwise use execute single)
+        # Check that df is not empty
         try:
-            _validate_args_for_bulk(args)
-            logger.debug("Valid args for execute_many")
+            _validate_args_for_bulk(df)
+            logger.debug("Valid args for insert_many")
         except BadArgumentsBulk as e:
-            logger.error(f"Invalid arguments for execute_many {e}")
+            logger.error(f"Invalid arguments for insert_many {e}")
             raise
 
-        # Convert params to sqlalchemy compatible placeholders
+        # Check that it is not a sqlite db
+        if self._db_type == "sqlite":
+            logger.error(
+                "Threaded writes are not supported on SQLite. Use insert_many or execute instead."
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        self._check_executor(executor)
+        _check_chunk_size(chunk_size)
+        _check_retry_arguments(max_retries, retry_backoff)
+
+        # Check if max_worker given by user above total_pool_size (processes have their own engines)
+        if (
+            executor == "thread"
+            and isinstance(max_workers, int)
+            and max_workers > self._total_pool_capacity
+        ):
+            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
+
+        # Multi-row or bulk load path, one transaction per chunk
+        if self._check_insert_method(method) != "insert":
+            if executor != "thread":
+                raise InvalidSQLOperation(
+                    f"executor='{executor}' is only supported with method='insert', got method='{method}'."
+                )
+            return self._insert_batch_with_method(
+                df=df,
+                table_name=table_name,
+                method=method,
+                on_duplicate=on_duplicate,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                return_failures=return_failures,
+                return_status=return_status,
+                max_in_flight=max_in_flight,
+                max_retries=max_retries,
+                retry_backoff=retry_backoff,
+                bisect_failures=bisect_failures,
+            )
+
+        # Get a sql string for the table to use it in execute_chunk
         try:
-            sql, args = _convert_dbapi_to_sqlalchemy_style(sql, args)
-            if isinstance(args, dict):  # In case only 1 row was used with execute_many
-                args = [args]
-            # Narrow the type explicitly for MyPy
-            args = cast(list[dict[str, Any]], args)
-        except BaseSQLConversionError as e:
-            logger.error(f"Invalid args format: {e}")
+            column_name = list(df.columns)
+            sql = _build_insert_statement(
+                table_name=table_name, columns=column_name, db_type=self._db_type
+            )
+        except UnsupportedDatabaseType as e:
+            logger.error(
+                f"Could not generate insert statement for table '{table_name}': {e}"
+            )
             raise
 
         # Ignore duplicates logic
@@ -1145,49 +3028,41 @@ class DBClient:
             logger.error(f"Duplicate handling logic error {e}")
             raise
 
-        # Execute transaction
-        try:
-            with self._engine.begin() as conn:
-                conn.execute(text(sql), args)
-            logger.info("All records executed successfully in a single transaction.")
-            if return_failures and return_status:
-                return pd.DataFrame(), True
-            elif return_failures:
-                return pd.DataFrame(), None
-            elif return_status:
-                return None, False
-            else:
-                return None, None
-        except Exception as e:
-            logger.warning(f"Transaction failed: {e}")
-            logger.debug(f"SQL: {sql}")
-            logger.debug(f"Args: {args}")
-
-            # Return success flag and failures df logic
-            if return_failures and return_status:
-                return (
-                    pd.DataFrame([{**row, "error_message": str(e)} for row in args]),
-                    False,
-                )
-            elif return_failures:
-                return (
-                    pd.DataFrame([{**row, "error_message": str(e)} for row in args]),
-                    None,
-                )
-            elif return_status:
-                return None, False
-            else:
-                return None, None
+        # Call execute_batch
+        return self.execute_batch(
+            sql=sql,
+            args=df,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            on_duplicate=None,  # already applied in here
+            return_failures=return_failures,
+            return_status=return_status,
+            max_in_flight=max_in_flight,
+            executor=executor,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            bisect_failures=bisect_failures,
+        )
 
-    ### --- Insert many (Single transaction, Multiple args, just for inserts) --- ###
+    ### --- Insert file (Streamed, Multiple transactions, Inserts Only) --- ###
 
-    def insert_many(
+    def insert_file(
         self,
-        df: pd.DataFrame,
+        file_path: str,
         table_name: str,
+        read_chunk_size: int = 100_000,
+        batch: bool = True,
+        chunk_size: Union[int, Literal["auto"]] = 512,
+        max_workers: Optional[Union[int, Literal["auto"]]] = None,
         on_duplicate: Optional[str] = None,
         return_failures: bool = True,
         return_status: bool = False,
+        method: Literal["insert", "values", "copy", "load_data"] = "insert",
+        max_in_flight: Optional[int] = None,
+        executor: Literal["thread", "process"] = "thread",
+        max_retries: int = 0,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        bisect_failures: bool = False,
     ) -> Union[
         tuple[pd.DataFrame, bool],
         tuple[pd.DataFrame, None],
@@ -1195,17 +3070,39 @@ class DBClient:
         tuple[None, None],
     ]:
         """
-        Inserts a pandas DataFrame into a SQL table using a single atomic transaction.
+        Inserts a CSV, Excel, Parquet or Feather file into a SQL table, streaming it in chunks of `read_chunk_size` rows.
 
-        This method builds a parameterized INSERT statement and executes it with the data from the DataFrame.
-        All rows are inserted in a single commit. If any row fails, the entire transaction is rolled back.
+        The file is never loaded whole: each chunk read from disk goes through `insert_batch()` (or `insert_many()`
+        if `batch` is False) before the next one is read, so files larger than memory can be inserted. Each chunk
+        is committed independently, a failure does not roll back the chunks already inserted.
 
         Args:
-            df (pandas.DataFrame): DataFrame containing the rows to insert.
-            table_name (str): Target table name, e.g., "schema.table".
-            on_duplicate (Optional[str]): Conflict handling mode ("ignore", "replace", or None).
-            return_failures (bool): If True, returns a DataFrame of failed rows with error messages on failure.
-            return_status (bool): If True, includes a success flag in the return value.
+            file_path (str): Path to the input file (.csv, .xls, .xlsx, .parquet, .feather, .arrow). Columns must
+                match the table.
+            table_name (str): Full table name, e.g., "schema.table".
+            read_chunk_size (int): Number of rows read from the file at a time. Defaults to 100_000.
+            batch (bool): If True, each file chunk is inserted with `insert_batch()` in concurrent sub-chunks of
+                `chunk_size` rows. If False, each file chunk is inserted with `insert_many()` in a single
+                transaction (required on SQLite).
+            chunk_size (Union[int, Literal["auto"]]): Number of rows per batch in `insert_batch()`, or "auto".
+                Defaults to 512.
+            max_workers (Optional[Union[int, Literal["auto"]]]): Maximum number of concurrent threads, or "auto".
+                With "auto", one limiter adapts the concurrency over the whole file instead of restarting at every
+                file chunk. Defaults to internal pool size.
+            on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            return_failures (bool): If True, includes failed records with error messages in the result.
+            return_status (bool): If True, includes a boolean success flag in the result.
+            method (Literal["insert", "values", "copy", "load_data"]): How rows are sent to the database, see
+                `insert_batch()`.
+            max_in_flight (Optional[int]): Maximum number of chunks submitted but not yet written in
+                `insert_batch()`.
+            executor (Literal["thread", "process"]): "thread" (default) or "process" to insert the chunks from
+                worker processes in `insert_batch()`. Only supported with method="insert".
+            max_retries (int): Retries of a chunk after a transient error in `insert_batch()`. Defaults to 0.
+            retry_backoff (float): Base delay in seconds of the exponential backoff between retries. Defaults to
+                DEFAULT_RETRY_BACKOFF.
+            bisect_failures (bool): If True, chunks failing in `insert_batch()` are split recursively so that only
+                the failing rows are returned. Defaults to False.
 
         Returns:
             Union[
@@ -1214,73 +3111,349 @@ class DBClient:
                 tuple[None, bool],
                 tuple[None, None]
             ]: A tuple containing:
-                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
+                - A DataFrame of failed records across the whole file (if any, else empty DataFrame, and
+                  `return_failures` is True) or None. Failed records include a `file_chunk_index` column.
                 - A success flag (if `return_status` is True), otherwise None.
 
-        Raises:
-            InvalidSQLOperation: If SQL insert generation fails or arguments are malformed.
-            SQLExecutionError: If duplicate-handling clause generation fails.
-            UnsupportedDatabaseType: If the current database type is unsupported for insert generation.
-            BadArgumentsBulk: If the input DataFrame is empty or invalid.
-            BaseSQLConversionError: If argument conversion during delegated insert fails.
-            DBClientClosedError: If the instance has already been closed.
+        Raises:
+            DataFileLoadError: If the file is missing, unsupported or cannot be read.
+            BadArgumentsBulk: If the file has no rows.
+            InvalidSQLOperation: If the insert method or executor is unknown or unsupported by the database,
+                if the retry arguments are invalid, or if max_workers is a string other than "auto".
+            UnsupportedDatabaseType: If the current database type does not support insert generation.
+            UnsupportedMultiThreadedDatabase: If `batch` is True on SQLite.
+            LimitMaxWorkersError: If max_workers exceeds available thread pool capacity.
+            SQLExecutionError: If duplicate-handling logic insertion fails.
+            DBClientClosedError: If the instance has already been closed.
+        """
+        # Check engine is not closed
+        self._check_closed()
+
+        if batch and self._db_type == "sqlite":
+            logger.error(
+                "Threaded writes are not supported on SQLite. Use insert_file with batch=False instead."
+            )
+            raise UnsupportedMultiThreadedDatabase(self._db_type)
+
+        # Fail before reading the file rather than on its first chunk
+        self._check_executor(executor)
+        _check_retry_arguments(max_retries, retry_backoff)
+
+        # One adaptive limiter for the whole file, picked up by insert_batch() for every file chunk
+        limiter = self._concurrency_limiter(max_workers, executor) if batch else None
+
+        failures = []
+        success = True
+        total_rows = 0
+
+        self._concurrency_state.shared_limiter = limiter
+        try:
+            with self._track_progress("Inserting file", unit="file chunk") as progress:
+                for file_chunk_index, chunk in enumerate(
+                    iter_data(file_path, read_chunk_size)
+                ):
+                    if chunk.empty:
+                        continue
+                    if batch:
+                        # Time spent reading the file is not counted against the throughput
+                        if limiter is not None:
+                            limiter.resume()
+                        chunk_failures, chunk_success = self.insert_batch(
+                            df=chunk,
+                            table_name=table_name,
+                            chunk_size=chunk_size,
+                            max_workers=max_workers,
+                            on_duplicate=on_duplicate,
+                            return_failures=return_failures,
+                            return_status=True,
+                            method=method,
+                            max_in_flight=max_in_flight,
+                            executor=executor,
+                            max_retries=max_retries,
+                            retry_backoff=retry_backoff,
+                            bisect_failures=bisect_failures,
+                        )
+                    else:
+                        chunk_failures, chunk_success = self.insert_many(
+                            df=chunk,
+                            table_name=table_name,
+                            on_duplicate=on_duplicate,
+                            return_failures=return_failures,
+                            return_status=True,
+                            method=method,
+                        )
+
+                    success = success and bool(chunk_success)
+                    if chunk_failures is not None and not chunk_failures.empty:
+                        failures.append(
+                            chunk_failures.assign(file_chunk_index=file_chunk_index)
+                        )
+                    total_rows += len(chunk)
+                    progress.update(rows=len(chunk), payload=chunk)
+        finally:
+            self._concurrency_state.shared_limiter = None
+        self._store_concurrency_info(limiter)
+
+        if total_rows == 0:
+            raise BadArgumentsBulk(
+                f"Bad arguments for insert_file: no rows in file {file_path}"
+            )
+
+        failed_df = (
+            pd.concat(failures, ignore_index=True) if failures else pd.DataFrame()
+        )
+        if not success:
+            logger.warning(
+                f"{len(failed_df)} of {total_rows} record(s) failed during file insert. "
+                "You can inspect or retry them using the returned DataFrame if return_failures=True."
+            )
+        else:
+            logger.info(
+                f"{total_rows} record(s) inserted successfully from {file_path}."
+            )
+
+        if return_failures and return_status:
+            return failed_df, success
+        elif return_failures:
+            return failed_df, None
+        elif return_status:
+            return None, success
+        else:
+            return None, None
+
+    ### --- Adaptive concurrency --- ###
+
+    def concurrency_info(self) -> Optional[ConcurrencyInfo]:
+        """
+        Returns the concurrency chosen by the last batch operation run with `max_workers="auto"`
+        (`execute_batch`, `insert_batch`, `insert_file` or `query_batch`) from the calling thread.
+
+        Batch operations run at the same time from other threads do not overwrite it. For `insert_file`,
+        it covers the whole file: its file chunks share one limiter.
+
+        Returns:
+            Optional[ConcurrencyInfo]: Named tuple (initial, final, peak, max_limit, increases, decreases),
+                or None if no adaptive batch operation was run yet from this thread.
+        """
+        info: Optional[ConcurrencyInfo] = getattr(self._concurrency_state, "info", None)
+        return info
+
+    ### --- Batch write helpers --- ###
+
+    @staticmethod
+    def _check_executor(executor: str) -> None:
+        """
+        Validates the `executor` argument of batch writes.
+
+        Args:
+            executor (str): "thread" or "process".
+
+        Raises:
+            InvalidSQLOperation: If the executor is unknown.
+        """
+        if executor not in ("thread", "process"):
+            raise InvalidSQLOperation(
+                f"Unknown executor '{executor}', expected 'thread' or 'process'."
+            )
+
+    @staticmethod
+    def _write_chunk_sizer(rows: Any) -> _AdaptiveChunkSizer:
+        """
+        Creates the chunk size controller of an adaptive batch write (`chunk_size="auto"`).
+
+        Chunks are capped so that their estimated size fits both the memory budget of one in-flight chunk and
+        the statement size budget, from the size of a sample of the rows.
+
+        Args:
+            rows (Any): DataFrame or list of parameters to write.
+
+        Returns:
+            _AdaptiveChunkSizer: Controller starting at ADAPTIVE_INITIAL_WRITE_CHUNK_SIZE rows.
+        """
+        return _AdaptiveChunkSizer(
+            ADAPTIVE_INITIAL_WRITE_CHUNK_SIZE,
+            max_bytes=min(ADAPTIVE_MAX_CHUNK_BYTES, ADAPTIVE_MAX_STATEMENT_BYTES),
+            row_bytes=_estimate_row_bytes(rows),
+        )
+
+    def _concurrency_limiter(
+        self, max_workers: Optional[Union[int, str]], executor: str = "thread"
+    ) -> Optional[_ConcurrencyLimiter]:
+        """
+        Creates the adaptive concurrency limiter of a batch operation if `max_workers="auto"`.
+
+        Within an `insert_file` call, the limiter of the file is returned instead, so that the limit
+        keeps adapting from one file chunk to the next.
+
+        Args:
+            max_workers (Optional[Union[int, str]]): The `max_workers` argument of the operation.
+            executor (str): "thread" (capped by the connection pool capacity) or "process" (capped by the
+                number of CPUs).
+
+        Returns:
+            Optional[_ConcurrencyLimiter]: The limiter, or None for a fixed number of workers.
+
+        Raises:
+            InvalidSQLOperation: If max_workers is a string other than "auto".
+        """
+        if max_workers is None or isinstance(max_workers, int):
+            return None
+        if max_workers != "auto":
+            raise InvalidSQLOperation(
+                f"max_workers must be an integer or 'auto'. Got: {max_workers!r}"
+            )
+        shared_limiter: Optional[_ConcurrencyLimiter] = getattr(
+            self._concurrency_state, "shared_limiter", None
+        )
+        if shared_limiter is not None:
+            return shared_limiter
+        if executor == "process":
+            return _ConcurrencyLimiter(os.cpu_count() or 1)
+        return _ConcurrencyLimiter(self._total_pool_capacity)
+
+    def _execute_params(self, clause: TextClause, params: list[dict[str, Any]]) -> None:
+        """
+        Executes a statement for rows of parameters in one transaction (rolled back on error).
+
+        Args:
+            clause (TextClause): Prepared statement.
+            params (list[dict[str, Any]]): Rows of parameters.
+        """
+        with self._engine.begin() as conn:
+            conn.execute(clause, params)
+
+    @staticmethod
+    def _record_transient_error(
+        limiter: _ConcurrencyLimiter, error: BaseException
+    ) -> None:
+        """
+        Reports a transient error of a chunk (possibly retried) to the concurrency limiter.
+
+        Args:
+            limiter (_ConcurrencyLimiter): Adaptive concurrency limit of the operation.
+            error (BaseException): The transient error.
+        """
+        limiter.record(0, 0.0, failed=True, transient=True)
+
+    @staticmethod
+    def _resolve_num_workers(
+        max_workers: Optional[Union[int, str]],
+        limiter: Optional[_ConcurrencyLimiter],
+    ) -> Optional[int]:
+        """
+        Resolves the number of workers to create for a batch operation.
+
+        Args:
+            max_workers (Optional[Union[int, str]]): Number of workers given by the user, None or "auto".
+            limiter (Optional[_ConcurrencyLimiter]): Adaptive concurrency limit, built when max_workers is "auto".
+
+        Returns:
+            Optional[int]: The cap of the limiter with "auto", max_workers if given, otherwise None (default
+                executor).
+        """
+        if limiter is not None:
+            return limiter.max_limit
+        return max_workers if isinstance(max_workers, int) else None
+
+    def _store_concurrency_info(self, limiter: Optional[_ConcurrencyLimiter]) -> None:
+        """
+        Keeps the concurrency chosen by an adaptive batch operation for `concurrency_info()`.
+
+        The limiter shared by the file chunks of an `insert_file` call is only stored once, by `insert_file`.
+
+        Args:
+            limiter (Optional[_ConcurrencyLimiter]): The limiter of the operation, None if it had a fixed
+                number of workers.
+        """
+        if limiter is None or limiter is getattr(
+            self._concurrency_state, "shared_limiter", None
+        ):
+            return
+        info = limiter.info()
+        self._concurrency_state.info = info
+        logger.info(
+            f"Adaptive concurrency settled at {info.final} worker(s) "
+            f"(peak {info.peak}, max {info.max_limit})."
+        )
+
+    def _run_chunks(
+        self,
+        worker: Callable[[Any, int], Any],
+        chunks: Iterable[tuple[Any, int]],
+        total: Optional[int],
+        executor: Executor,
+        max_in_flight: int,
+        desc: str,
+        on_result: Optional[Callable[[Any, Any], None]] = None,
+        limiter: Optional[_ConcurrencyLimiter] = None,
+    ) -> None:
         """
-        # Check if close hasn't been called yet
-        self._check_closed()
+        Runs `worker(chunk, chunk_num)` on the executor, pulling chunks lazily from `chunks`.
 
-        # Check that df is not empty
-        try:
-            _validate_args_for_bulk(df)
-            logger.debug("Valid args for insert_many")
-        except BadArgumentsBulk as e:
-            logger.error(f"Invalid arguments for insert_many {e}")
-            raise
+        The next chunk is only taken from the iterable when fewer than `max_in_flight` chunks are submitted and
+        not yet done, so a lazy iterable is never materialized beyond that bound. With a `limiter`, the bound is
+        its current limit instead, read again after every completed chunk.
 
-        try:
-            column_name = list(df.columns)
-            sql = _build_insert_statement(
-                table_name=table_name, columns=column_name, db_type=self._db_type
-            )
-        except UnsupportedDatabaseType as e:
-            logger.error(
-                f"Could not generate insert statement for table '{table_name}': {e}"
-            )
-            raise
+        Args:
+            worker (Callable[[Any, int], Any]): Function executing one chunk. Expected to handle its own errors.
+            chunks (Iterable[tuple[Any, int]]): (chunk, chunk_num) pairs, ideally a generator.
+            total (Optional[int]): Number of chunks, for progress reporting. None if unknown.
+            executor (Executor): Thread or process pool running the workers.
+            max_in_flight (int): Maximum number of submitted but unfinished chunks, at least 1.
+            desc (str): Operation name for progress reporting.
+            on_result (Optional[Callable[[Any, Any], None]]): Called in the calling thread with the return value
+                of each worker and its chunk, e.g. to collect failures from worker processes.
+            limiter (Optional[_ConcurrencyLimiter]): Adaptive limit on the number of chunks in flight, fed by
+                the workers. Defaults to None (fixed `max_in_flight`).
+        """
+        # Chunk of each submitted future, for progress reporting
+        in_flight: dict[Future[Any], Any] = {}
 
-        # Ignore duplicates logic
-        try:
-            sql = _apply_on_duplicate_clause(sql, self._db_type, on_duplicate)
-        except SQLExecutionError as e:
-            logger.error(f"Duplicate handling logic error {e}")
-            raise
+        def collect(future: Future[Any], chunk: Any) -> None:
+            result = future.result()
+            if on_result is not None:
+                on_result(result, chunk)
 
-        return self.execute_many(
-            sql=sql,
-            args=df,
-            on_duplicate=None,  # already applied
-            return_failures=return_failures,
-            return_status=return_status,
-        )
+        def bound() -> int:
+            return limiter.limit if limiter is not None else max(1, max_in_flight)
 
-    ### --- Multiple transactions (not atomic) --- ###
+        chunk_iterator = iter(chunks)
+        with self._track_progress(desc, total) as progress:
+            while True:
+                # Backpressure, wait for a slot before slicing the next chunk
+                while len(in_flight) >= bound():
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        done_chunk = in_flight.pop(future)
+                        collect(future, done_chunk)
+                        progress.update(rows=len(done_chunk), payload=done_chunk)
+                item = next(chunk_iterator, None)
+                if item is None:
+                    break
+                chunk, chunk_num = item
+                in_flight[executor.submit(worker, chunk, chunk_num)] = chunk
 
-    ### --- Execute batch (Threaded, Multiple transactions, Multiple args) --- ###
+            for future in as_completed(in_flight):
+                done_chunk = in_flight[future]
+                collect(future, done_chunk)
+                progress.update(rows=len(done_chunk), payload=done_chunk)
 
-    def execute_batch(
+    ### --- Insert method helpers --- ###
+
+    def _insert_batch_with_method(
         self,
-        sql: str,
-        args: Union[
-            list[tuple[Any, ...]],
-            list[dict[str, Any]],
-            tuple[Any, ...],
-            dict[str, Any],
-            pd.DataFrame,
-        ],
-        chunk_size: int = 512,
-        max_workers: Optional[int] = None,
-        on_duplicate: Optional[str] = None,
-        return_failures: bool = True,
-        return_status: bool = False,
+        df: pd.DataFrame,
+        table_name: str,
+        method: str,
+        on_duplicate: Optional[str],
+        chunk_size: Optional[Union[int, str]],
+        max_workers: Optional[Union[int, str]],
+        return_failures: bool,
+        return_status: bool,
+        max_in_flight: Optional[int] = None,
+        max_retries: int = 0,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        bisect_failures: bool = False,
     ) -> Union[
         tuple[pd.DataFrame, bool],
         tuple[pd.DataFrame, None],
@@ -1288,20 +3461,32 @@ class DBClient:
         tuple[None, None],
     ]:
         """
-        Executes a SQL operation (INSERT, UPDATE, DELETE) in parallel batches using threads.
+        Inserts a DataFrame into a table with a method other than executemany, one transaction per chunk.
 
-        The input data is split into chunks and each chunk is executed in a separate thread. The method supports
-        error capture per chunk, duplicate-handling clauses, and optional success/failure reporting.
+        - "values" (all databases): rows are sent as multi-row `INSERT ... VALUES (...), (...)` statements, as many
+          rows per statement as the bound parameter limit of the database allows.
+        - "copy" (PostgreSQL): each chunk is serialized to CSV and streamed with psycopg2 `copy_expert`. With
+          `on_duplicate`, chunks go through a temporary staging table so that conflicting rows are handled as with
+          regular inserts.
+        - "load_data" (MySQL): each chunk is written to a temporary tab-separated file and loaded with
+          `LOAD DATA LOCAL INFILE`. `on_duplicate` maps to the native IGNORE and REPLACE keywords.
 
         Args:
-            sql (str): SQL statement with placeholders (e.g., :id, :value).
-            args (Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]):
-                Rows of parameters to bind to the SQL query.
-            chunk_size (int): Number of rows per batch. Defaults to 512.
-            max_workers (Optional[int]): Maximum number of concurrent threads. Defaults to internal pool size.
+            df (pandas.DataFrame): Rows to load. Columns must match the target table.
+            table_name (str): Target table name, e.g., "schema.table".
+            method (str): "values", "copy" or "load_data", already validated against the database type.
             on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
+            chunk_size (Optional[Union[int, str]]): Rows per chunk, loaded concurrently, or "auto" to adapt it to the
+                measured latency. If None, the whole DataFrame is loaded in a single transaction from the calling thread.
+            max_workers (Optional[Union[int, str]]): Maximum number of concurrent threads, or "auto" to adapt it to
+                the throughput of the server. Defaults to internal pool size.
             return_failures (bool): If True, includes failed records with error messages in the result.
             return_status (bool): If True, includes a boolean success flag in the result.
+            max_in_flight (Optional[int]): Maximum number of chunks submitted but not yet loaded. Defaults to
+                DEFAULT_IN_FLIGHT_PER_WORKER times the number of threads.
+            max_retries (int): Retries of a chunk after a transient error. Defaults to 0.
+            retry_backoff (float): Base delay in seconds of the exponential backoff between retries.
+            bisect_failures (bool): If True, failed chunks are split recursively to isolate the failing rows.
 
         Returns:
             Union[
@@ -1314,98 +3499,148 @@ class DBClient:
                 - A success flag (if `return_status` is True), otherwise None.
 
         Raises:
-            InvalidSQLOperation: If the SQL or arguments are invalid or cannot be processed.
-            BadArgumentsBulk: If no valid rows are provided.
-            SQLExecutionError: If duplicate-handling clause generation fails.
-            BaseSQLConversionError: If argument conversion fails during SQL preparation.
-            UnsupportedMultiThreadedDatabase: If multithreaded writes are attempted on SQLite.
-            LimitMaxWorkersError: If max_workers exceeds the available thread pool capacity.
-            DBClientClosedError: If the instance has already been closed.
+            SQLExecutionError: If duplicate-handling logic is not supported by the database.
         """
-        # Check if close hasn't been called yet
-        self._check_closed()
-
-        # Check if args were provided (necessary for chunks otherwise use execute single)
-        try:
-            _validate_args_for_bulk(args)
-            logger.debug("Valid args for execute_batch")
-        except BadArgumentsBulk as e:
-            logger.error(f"Invalid arguments for execute_batch {e}")
-            raise
-
-        if self._db_type == "sqlite":
-            logger.error(
-                "Threaded writes are not supported on SQLite. Use execute_many or execute instead. "
-            )
-            raise UnsupportedMultiThreadedDatabase(self._db_type)
-
-        # Check if max_worker given by user above total_pool_size
-        if max_workers is not None and max_workers > self._total_pool_capacity:
-            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
-
-        # Convert params to sqlalchemy compatible placeholders
-        try:
-            sql, args = _convert_dbapi_to_sqlalchemy_style(sql, args)
-            if isinstance(args, dict):
-                args = [args]
-            # Narrow the type explicitly for MyPy
-            args = cast(list[dict[str, Any]], args)
-        except BaseSQLConversionError as e:
-            logger.error(f"Invalid args format: {e}")
-            raise
-
-        # Ignore duplicates logic
+        # Build statements, raises on unsupported on_duplicate
         try:
-            sql = _apply_on_duplicate_clause(sql, self._db_type, on_duplicate)
+            if method == "values":
+                rows_per_statement = _rows_per_insert_statement(
+                    self._db_type, len(df.columns)
+                )
+                # Date-only datetime columns are detected on the whole DataFrame, not per chunk
+                date_only_columns = _date_only_columns(df)
+                values_sql = _apply_on_duplicate_clause(
+                    _build_multi_row_insert_statement(
+                        table_name=table_name,
+                        columns=list(df.columns),
+                        db_type=self._db_type,
+                        num_rows=rows_per_statement,
+                    ),
+                    self._db_type,
+                    on_duplicate,
+                )
+            elif method == "copy":
+                copy_statements = _build_copy_statements(
+                    table_name=table_name,
+                    columns=list(df.columns),
+                    on_duplicate=on_duplicate,
+                )
+            else:
+                load_statement = _build_load_data_statement(
+                    table_name=table_name,
+                    columns=list(df.columns),
+                    on_duplicate=on_duplicate,
+                )
         except SQLExecutionError as e:
             logger.error(f"Duplicate handling logic error {e}")
             raise
 
-        # Split up insert/update in chunks and initialize failed_record list
-        chunks = [args[i : i + chunk_size] for i in range(0, len(args), chunk_size)]
-        failed_records = []
-
-        # Create insert chunk function
-        def execute_chunk(chunk_args: list[dict[str, Any]], chunk_num: int) -> None:
-            # noinspection PyShadowingNames
-            try:
-                with self._engine.begin() as conn:
-                    conn.execute(text(sql), chunk_args)
-            # Silent failing and collecting failed args in df
-            except Exception as e:
-                logger.warning(f"Chunk {chunk_num} failed: {e}")
-                logger.debug(f"SQL: {sql}")
-                logger.debug(f"Args: {chunk_args}")
-                for record in chunk_args:
-                    failed_records.append(
-                        {**record, "chunk_index": chunk_num, "error_message": str(e)}
-                    )
+        failed_records: list[dict[str, Any]] = []
+        sizer = self._write_chunk_sizer(df) if chunk_size == "auto" else None
+        limiter = self._concurrency_limiter(max_workers, "thread")
+
+        # Load rows in one transaction
+        def load_rows(rows: pd.DataFrame) -> None:
+            if method == "values":
+                self._insert_values_chunk(
+                    rows,
+                    table_name,
+                    on_duplicate,
+                    values_sql,
+                    rows_per_statement,
+                    date_only_columns,
+                )
+            elif method == "copy":
+                self._copy_chunk(rows, copy_statements)
+            else:
+                self._load_data_chunk(
+                    rows, load_statement, check_row_count=on_duplicate is None
+                )
 
-        # Create new executor that we'll dispose later if max_workers specified and different from max_workers at init
-        if max_workers is not None:
-            execute_executor = ThreadPoolExecutor(max_workers=max_workers)
-            temp_executor = True
+        # Load one chunk in its own transaction, with retries and bisection
+        def load_chunk(chunk: pd.DataFrame, chunk_num: Optional[int]) -> None:
+            started = time.perf_counter()
+            failures = _execute_with_retry(
+                load_rows,
+                chunk,
+                max_retries=max_retries,
+                retry_backoff=retry_backoff,
+                bisect=bisect_failures,
+                on_transient_error=(
+                    partial(self._record_transient_error, limiter)
+                    if limiter is not None
+                    else None
+                ),
+            )
+            elapsed = time.perf_counter() - started
+            if not failures:
+                if sizer is not None:
+                    sizer.record(len(chunk), elapsed)
+                if limiter is not None:
+                    limiter.record(len(chunk), elapsed)
+                return
+
+            # Silent failing and collecting failed rows, transient errors were already reported to the limiter
+            if limiter is not None:
+                limiter.record(0, elapsed, failed=True)
+            for failed_rows, e in failures:
+                logger.warning(
+                    f"Insert ({method}) of chunk {chunk_num} failed ({len(failed_rows)} row(s)): {e}"
+                )
+                chunk_failures = failed_rows.astype(object).where(
+                    failed_rows.notna(), None
+                )
+                for record in chunk_failures.to_dict(orient="records"):
+                    if chunk_num is not None:
+                        record["chunk_index"] = chunk_num
+                    record["error_message"] = str(e)
+                    failed_records.append(record)
+
+        if chunk_size is None:
+            load_chunk(df, None)
         else:
-            execute_executor = self._executor
-            temp_executor = False
-
-        # Launch threads with executor
-        iterable = zip(chunks, range(len(chunks)))
+            num_chunks: Optional[int]
+            if sizer is not None:
+                num_chunks = None
+                chunks = _iter_adaptive_chunks(df, sizer)
+            else:
+                fixed_size = cast(int, chunk_size)
+                num_chunks = -(-len(df) // fixed_size)
+                chunks = (
+                    (df.iloc[i : i + fixed_size], i // fixed_size)
+                    for i in range(0, len(df), fixed_size)
+                )
 
-        for _ in tqdm(
-            execute_executor.map(lambda x: execute_chunk(*x), iterable),
-            total=len(chunks),
-            desc="Inserting chunks",
-        ):
-            pass
+            # Create new executor that we'll dispose later if max_workers specified
+            num_workers = self._resolve_num_workers(max_workers, limiter)
+            if num_workers is not None:
+                load_executor = ThreadPoolExecutor(max_workers=num_workers)
+                temp_executor = True
+            else:
+                load_executor = self._executor
+                temp_executor = False
 
-        # Shutdown temp executor if was created
-        if temp_executor:
-            execute_executor.shutdown(wait=False)
+            try:
+                self._run_chunks(
+                    load_chunk,
+                    chunks,
+                    total=num_chunks,
+                    executor=load_executor,
+                    max_in_flight=max_in_flight
+                    or self.DEFAULT_IN_FLIGHT_PER_WORKER
+                    * (num_workers or self._max_workers),
+                    desc="Inserting chunks",
+                    limiter=limiter,
+                )
+            finally:
+                # Shutdown temp executor if was created
+                if temp_executor:
+                    load_executor.shutdown(wait=False)
+            self._store_concurrency_info(limiter)
 
         if failed_records:
             logger.warning(
-                f"{len(failed_records)} record(s) across some chunk(s) failed during execution. "
+                f"{len(failed_records)} record(s) failed during insert ({method}). "
                 "You can inspect or retry them using the returned DataFrame if return_failures=True."
             )
             if return_failures and return_status:
@@ -1413,127 +3648,125 @@ class DBClient:
             elif return_failures:
                 return pd.DataFrame(failed_records), None
             elif return_status:
-                logger.info(
-                    "return_failures=False, failed records will not be returned."
-                )
                 return None, False
             else:
-                logger.info(
-                    "return_failures=False, failed records will not be returned."
-                )
                 return None, None
 
+        logger.info(f"{len(df)} record(s) inserted successfully ({method}).")
+        if return_failures and return_status:
+            return pd.DataFrame(), True
+        elif return_failures:
+            return pd.DataFrame(), None
+        elif return_status:
+            return None, True
         else:
-            logger.info("All chunks executed successfully.")
-            if return_failures and return_status:
-                return pd.DataFrame(), True
-            elif return_failures:
-                return pd.DataFrame(), None
-            elif return_status:
-                return None, False
-            else:
-                return None, None
+            return None, None
 
-    ### --- Insert batch (Threaded, Multiple transactions, Multiple args, Inserts Only) --- ###
-
-    def insert_batch(
+    def _insert_values_chunk(
         self,
-        df: pd.DataFrame,
+        chunk: pd.DataFrame,
         table_name: str,
-        chunk_size: int = 512,
-        max_workers: Optional[int] = None,
-        on_duplicate: Optional[str] = None,
-        return_failures: bool = True,
-        return_status: bool = False,
-    ) -> Union[
-        tuple[pd.DataFrame, bool],
-        tuple[pd.DataFrame, None],
-        tuple[None, bool],
-        tuple[None, None],
-    ]:
+        on_duplicate: Optional[str],
+        values_sql: str,
+        rows_per_statement: int,
+        date_only_columns: Optional[set[int]] = None,
+    ) -> None:
         """
-        Inserts a pandas DataFrame into a SQL table using concurrent threaded chunking.
+        Inserts one chunk with multi-row INSERT statements in a single transaction.
 
-        This wraps `execute_batch()` by automatically generating an INSERT statement based on the DataFrame
-        columns and table name. Data is split into chunks and written concurrently using a thread pool.
+        Full groups of `rows_per_statement` rows share `values_sql` and are sent with one executemany call. The
+        remaining rows, if any, get their own statement.
 
         Args:
-            df (pandas.DataFrame): The DataFrame containing rows to insert. Columns must match the target table schema.
-            table_name (str): Full table name, e.g., "schema.table".
-            chunk_size (int): Number of rows per batch. Defaults to 512.
-            max_workers (Optional[int]): Maximum number of concurrent threads. Defaults to internal pool size.
+            chunk (pandas.DataFrame): Rows to insert.
+            table_name (str): Target table name, e.g., "schema.table".
             on_duplicate (Optional[str]): Conflict resolution mode ("ignore", "replace", or None).
-            return_failures (bool): If True, includes failed records with error messages in the result.
-            return_status (bool): If True, includes a boolean success flag in the result.
-
-        Returns:
-            Union[
-                tuple[pandas.DataFrame, bool],
-                tuple[pandas.DataFrame, None],
-                tuple[None, bool],
-                tuple[None, None]
-            ]: A tuple containing:
-                - A DataFrame of failed records (if any, else empty DataFrame, and `return_failures` is True) or None.
-                - A success flag (if `return_status` is True), otherwise None.
-
-        Raises:
-            BadArgumentsBulk: If the input DataFrame is empty or invalid.
-            UnsupportedDatabaseType: If the current database type does not support insert generation.
-            UnsupportedMultiThreadedDatabase: If multithreaded inserts are attempted on SQLite.
-            LimitMaxWorkersError: If max_workers exceeds available thread pool capacity.
-            SQLExecutionError: If duplicate-handling logic insertion fails.
-            BaseSQLConversionError: If argument conversion fails internally.
-            DBClientClosedError: If the instance has already been closed.
+            values_sql (str): Statement inserting `rows_per_statement` rows, duplicate handling applied.
+            rows_per_statement (int): Number of rows per full statement.
+            date_only_columns (Optional[set[int]]): Positions of the datetime columns bound as dates, computed on
+                the whole DataFrame so that every chunk binds a column the same way. If None, computed on the chunk.
         """
+        columns = list(chunk.columns)
+        rows = _dataframe_to_params(chunk, date_only_columns)
+
+        num_full = len(rows) // rows_per_statement * rows_per_statement
+        full_params = [
+            _flatten_rows_to_params(rows[i : i + rows_per_statement], columns)
+            for i in range(0, num_full, rows_per_statement)
+        ]
+
+        with self._engine.begin() as conn:
+            if full_params:
+                conn.execute(text(values_sql), full_params)
+            if num_full < len(rows):
+                remainder_sql = _apply_on_duplicate_clause(
+                    _build_multi_row_insert_statement(
+                        table_name=table_name,
+                        columns=columns,
+                        db_type=self._db_type,
+                        num_rows=len(rows) - num_full,
+                    ),
+                    self._db_type,
+                    on_duplicate,
+                )
+                conn.execute(
+                    text(remainder_sql),
+                    _flatten_rows_to_params(rows[num_full:], columns),
+                )
 
-        # Check engine is not closed
-        self._check_closed()
+    def _copy_chunk(self, chunk: pd.DataFrame, statements: list[str]) -> None:
+        """
+        Loads one chunk into PostgreSQL with COPY in a single transaction.
 
-        # Check that df is not empty
-        try:
-            _validate_args_for_bulk(df)
-            logger.debug("Valid args for insert_many")
-        except BadArgumentsBulk as e:
-            logger.error(f"Invalid arguments for insert_many {e}")
-            raise
+        Args:
+            chunk (pandas.DataFrame): Rows to load.
+            statements (list[str]): Statements built by `_build_copy_statements`.
+        """
+        with self._engine.begin() as conn:
+            cursor = conn.connection.cursor()
+            try:
+                for statement in statements:
+                    if statement.startswith("COPY"):
+                        cursor.copy_expert(statement, _dataframe_to_csv_buffer(chunk))
+                    else:
+                        cursor.execute(statement)
+            finally:
+                cursor.close()
 
-        # Check that it is not a sqlite db
-        if self._db_type == "sqlite":
-            logger.error(
-                "Threaded writes are not supported on SQLite. Use insert_many or execute instead."
-            )
-            raise UnsupportedMultiThreadedDatabase(self._db_type)
+    def _load_data_chunk(
+        self, chunk: pd.DataFrame, statement: str, check_row_count: bool
+    ) -> None:
+        """
+        Loads one chunk into MySQL with LOAD DATA LOCAL INFILE in a single transaction.
 
-        # Check if max_worker given by user above total_pool_size
-        if max_workers is not None and max_workers > self._total_pool_capacity:
-            raise LimitMaxWorkersError(max_workers, self._total_pool_capacity)
+        With LOCAL, MySQL skips duplicate-key and conversion errors with a warning instead of failing. When no
+        duplicate handling was requested, the chunk is rolled back if fewer rows than expected were loaded, so that
+        it is reported as failed like a regular insert.
 
-        # Get a sql string for the table to use it in execute_chunk
-        try:
-            column_name = list(df.columns)
-            sql = _build_insert_statement(
-                table_name=table_name, columns=column_name, db_type=self._db_type
-            )
-        except UnsupportedDatabaseType as e:
-            logger.error(
-                f"Could not generate insert statement for table '{table_name}': {e}"
-            )
-            raise
+        Args:
+            chunk (pandas.DataFrame): Rows to load.
+            statement (str): Statement built by `_build_load_data_statement`.
+            check_row_count (bool): Whether to fail if some rows were skipped.
 
-        # Ignore duplicates logic
+        Raises:
+            SQLExecutionError: If check_row_count is True and some rows were skipped.
+        """
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".tsv", encoding="utf-8", newline="", delete=False
+        ) as tsv_file:
+            tsv_file.write(_dataframe_to_tsv(chunk))
         try:
-            sql = _apply_on_duplicate_clause(sql, self._db_type, on_duplicate)
-        except SQLExecutionError as e:
-            logger.error(f"Duplicate handling logic error {e}")
-            raise
-
-        # Call execute_batch
-        return self.execute_batch(
-            sql=sql,
-            args=df,
-            chunk_size=chunk_size,
-            max_workers=max_workers,
-            on_duplicate=None,  # already applied in here
-            return_failures=return_failures,
-            return_status=return_status,
-        )
+            with self._engine.begin() as conn:
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.execute(statement, (tsv_file.name,))
+                    loaded_rows = cursor.rowcount
+                finally:
+                    cursor.close()
+                if check_row_count and loaded_rows != len(chunk):
+                    raise SQLExecutionError(
+                        f"LOAD DATA loaded {loaded_rows} of {len(chunk)} row(s); "
+                        "the others were skipped (duplicate key or invalid value)."
+                    )
+        finally:
+            os.remove(tsv_file.name)
@@ -0,0 +1,244 @@
+### --- Standard library imports --- ###
+import itertools
+import threading
+import time
+from types import TracebackType
+from typing import Any, Callable, Optional, Type
+
+### --- Progress reporting for batch operations --- ###
+
+
+class ProgressEvent:
+    """
+    Snapshot of the progress of one batch operation, passed to progress callbacks.
+
+    Counters are cumulative since the start of the operation. `bytes` is the in-memory size of the
+    chunks when it is cheap to know (DataFrame and Arrow chunks), otherwise it stays 0.
+    """
+
+    def __init__(
+        self,
+        operation_id: int,
+        description: str,
+        unit: str,
+        chunks: int,
+        total_chunks: Optional[int],
+        rows: int,
+        nbytes: int,
+        elapsed: float,
+        finished: bool,
+    ) -> None:
+        """
+        Initializes a ProgressEvent.
+
+        Args:
+            operation_id (int): Identifier of the operation, unique within the process.
+            description (str): Human-readable operation name (e.g. "Querying chunks").
+            unit (str): What a chunk is for this operation ("chunk", "range", "file chunk", ...).
+            chunks (int): Number of chunks completed so far.
+            total_chunks (Optional[int]): Total number of chunks, or None if unknown in advance.
+            rows (int): Number of rows processed so far.
+            nbytes (int): Approximate number of bytes processed so far (0 if unknown).
+            elapsed (float): Seconds since the operation started.
+            finished (bool): True for the last event of the operation.
+        """
+        self.operation_id = operation_id
+        self.description = description
+        self.unit = unit
+        self.chunks = chunks
+        self.total_chunks = total_chunks
+        self.rows = rows
+        self.bytes = nbytes
+        self.elapsed = elapsed
+        self.finished = finished
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Completed chunks per second since the start of the operation."""
+        return self.chunks / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Processed rows per second since the start of the operation."""
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Processed bytes per second since the start of the operation."""
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        total = "?" if self.total_chunks is None else self.total_chunks
+        return (
+            f"ProgressEvent({self.description!r}, {self.chunks}/{total} {self.unit}, "
+            f"{self.rows} rows, {self.bytes} bytes, {self.elapsed:.2f}s"
+            f"{', finished' if self.finished else ''})"
+        )
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class TqdmProgress:
+    """
+    Progress callback drawing one tqdm bar per batch operation, with rows/s and MB/s in the postfix.
+
+    This is what the `sqlthunder` CLI uses. tqdm is imported when the callback is created, so it
+    is only needed by code that asks for bars.
+    """
+
+    def __init__(self, **tqdm_kwargs: Any) -> None:
+        """
+        Initializes a TqdmProgress callback.
+
+        Args:
+            **tqdm_kwargs (Any): Extra keyword arguments for every `tqdm` bar (e.g. `file`, `leave`, `disable`).
+
+        Raises:
+            ImportError: If tqdm is not installed.
+        """
+        try:
+            from tqdm import tqdm
+        except ImportError as e:
+            raise ImportError(
+                "TqdmProgress requires 'tqdm'. Install it with `pip install tqdm`."
+            ) from e
+        self._tqdm = tqdm
+        self._tqdm_kwargs = tqdm_kwargs
+        self._bars: dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ProgressEvent) -> None:
+        """
+        Creates, updates or closes the bar of the event's operation.
+
+        Args:
+            event (ProgressEvent): The progress snapshot.
+        """
+        with self._lock:
+            bar = self._bars.get(event.operation_id)
+            if bar is None:
+                bar = self._tqdm(
+                    total=event.total_chunks,
+                    desc=event.description,
+                    unit=event.unit,
+                    **self._tqdm_kwargs,
+                )
+                self._bars[event.operation_id] = bar
+            postfix = {"rows/s": f"{event.rows_per_second:,.0f}"}
+            if event.bytes:
+                postfix["MB/s"] = f"{event.bytes_per_second / 1e6:,.1f}"
+            bar.set_postfix(postfix, refresh=False)
+            bar.update(event.chunks - bar.n)
+            if event.finished:
+                bar.close()
+                del self._bars[event.operation_id]
+
+
+def _payload_nbytes(payload: Any) -> int:
+    """
+    Returns the in-memory size of a chunk when it is cheap to compute, else 0.
+
+    DataFrames report their shallow memory usage (object columns count pointers, not the objects),
+    and pyarrow tables and NumPy arrays their buffer size. Lists of rows or dicts report 0.
+
+    Args:
+        payload (Any): A chunk of rows (DataFrame, pyarrow.Table, list, ...).
+
+    Returns:
+        int: Size in bytes, or 0 if unknown.
+    """
+    memory_usage = getattr(payload, "memory_usage", None)
+    if callable(memory_usage):
+        return int(memory_usage(index=False, deep=False).sum())
+    nbytes = getattr(payload, "nbytes", None)
+    return int(nbytes) if isinstance(nbytes, int) else 0
+
+
+class _ProgressTracker:
+    """
+    Thread-safe progress accumulator for one batch operation, forwarding snapshots to a callback.
+
+    With no callback every method is a no-op, so library calls pay nothing for progress reporting.
+    Used as a context manager: the final event (`finished=True`) is sent on exit.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(
+        self,
+        callback: Optional[ProgressCallback],
+        description: str,
+        total_chunks: Optional[int] = None,
+        unit: str = "chunk",
+    ) -> None:
+        """
+        Initializes a _ProgressTracker.
+
+        Args:
+            callback (Optional[ProgressCallback]): Receives a ProgressEvent after every update. None disables tracking.
+            description (str): Operation name shown to the user.
+            total_chunks (Optional[int]): Total number of chunks, or None if unknown.
+            unit (str): What a chunk is for this operation. Defaults to "chunk".
+        """
+        self._callback = callback
+        self._description = description
+        self._total_chunks = total_chunks
+        self._unit = unit
+        self._operation_id = next(self._ids)
+        self._chunks = 0
+        self._rows = 0
+        self._bytes = 0
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "_ProgressTracker":
+        if self._callback is not None:
+            with self._lock:
+                self._emit(finished=False)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if self._callback is not None:
+            with self._lock:
+                self._emit(finished=True)
+
+    def update(self, chunks: int = 1, rows: int = 0, payload: Any = None) -> None:
+        """
+        Records completed chunks and reports the new totals. Safe to call from worker threads.
+
+        Args:
+            chunks (int): Number of chunks completed. Defaults to 1.
+            rows (int): Number of rows in those chunks.
+            payload (Any): The chunk itself, used to estimate bytes. Defaults to None.
+        """
+        if self._callback is None:
+            return
+        nbytes = _payload_nbytes(payload) if payload is not None else 0
+        with self._lock:
+            self._chunks += chunks
+            self._rows += rows
+            self._bytes += nbytes
+            self._emit(finished=False)
+
+    def _emit(self, finished: bool) -> None:
+        """Sends the current totals to the callback. Must be called with the lock held."""
+        assert self._callback is not None
+        self._callback(
+            ProgressEvent(
+                operation_id=self._operation_id,
+                description=self._description,
+                unit=self._unit,
+                chunks=self._chunks,
+                total_chunks=self._total_chunks,
+                rows=self._rows,
+                nbytes=self._bytes,
+                elapsed=time.perf_counter() - self._start,
+                finished=finished,
+            )
+        )
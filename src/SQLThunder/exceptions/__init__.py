@@ -33,6 +33,7 @@ from .execution import (
     InvalidSQLOperation,
     QueryDisallowedClauseError,
     QueryExecutionError,
+    QueryResultDependencyError,
     QueryResultFormatError,
     QuerySelectOnlyError,
     ReopenConnectionError,
@@ -43,6 +44,7 @@ from .file_io import (
     DataFileLoadErrorUnknown,
     DataFileNotFoundError,
     FileOutputSaveError,
+    MissingOptionalDependencyError,
     UnsupportedDataFormatError,
 )
 from .sql_conversion import UnsupportedSQLArgsFormat
@@ -79,11 +81,13 @@ __all__ = [
     "UnsupportedMultiThreadedDatabase",
     "QueryExecutionError",
     "QueryResultFormatError",
+    "QueryResultDependencyError",
     "QuerySelectOnlyError",
     "QueryDisallowedClauseError",
     "FileOutputSaveError",
     "DataFileNotFoundError",
     "UnsupportedDataFormatError",
     "DataFileLoadErrorUnknown",
+    "MissingOptionalDependencyError",
     "UnsupportedSQLArgsFormat",
 ]
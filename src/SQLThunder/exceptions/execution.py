@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 ### --- Standard library imports --- ###
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 ### --- Third-party imports --- ###
-from sqlparse.sql import Token
+if TYPE_CHECKING:
+    from sqlparse.sql import Token
 
 ### --- Internal package imports --- ###
 from .base import SQLExecutionError
@@ -106,11 +109,21 @@ class QueryResultFormatError(SQLExecutionError):
     def __init__(self, original_return_type: str) -> None:
         message = (
             f"Unsupported return type for query: {original_return_type} "
-            "Supported return types: 'df', 'list', 'raw', 'None'"
+            "Supported return types: 'df', 'list', 'raw', 'arrow', 'df_arrow', 'None'"
         )
         super().__init__(message)
 
 
+class QueryResultDependencyError(SQLExecutionError):
+    """Raised when a query return_type requires a package that is not installed."""
+
+    def __init__(self, package: str, return_type: str) -> None:
+        super().__init__(
+            f"return_type='{return_type}' requires '{package}'. "
+            f"Install it with `pip install {package}`."
+        )
+
+
 class QuerySelectOnlyError(SQLExecutionError):
     """Raised when another operation than SELECT is used with query."""
 
@@ -121,9 +134,10 @@ class QuerySelectOnlyError(SQLExecutionError):
 class QueryDisallowedClauseError(SQLExecutionError):
     """Raised when an unsupported clause (limit/offset) is used with query_keyed() or query_batch()"""
 
-    def __init__(self, wrong_token: Token) -> None:
+    def __init__(self, wrong_token: Union[Token, str]) -> None:
+        clause = wrong_token if isinstance(wrong_token, str) else wrong_token.value
         message = (
-            f"Disallowed clause '{wrong_token.value.upper()}' found. "
+            f"Disallowed clause '{clause.upper()}' found. "
             "Don't use LIMIT or OFFSET in your SQL statement when using query_keyed or query_batch."
         )
         super().__init__(message)
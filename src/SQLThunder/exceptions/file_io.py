@@ -21,14 +21,21 @@ class DataFileNotFoundError(DataFileLoadError):
 class UnsupportedDataFormatError(DataFileLoadError):
     """Raised when data file format is unsupported"""
 
-    def __init__(self, ext: str) -> None:
-        message = (
-            f"Unsupported file extension '{ext}' ."
-            "Only .csv, .xls, and .xlsx are supported."
-        )
+    def __init__(self, ext: str, supported: str = ".csv, .xls, and .xlsx") -> None:
+        message = f"Unsupported file extension '{ext}' .Only {supported} are supported."
         super().__init__(message)
 
 
+class MissingOptionalDependencyError(DataFileLoadError):
+    """Raised when reading or writing a file format requires a package that is not installed"""
+
+    def __init__(self, package: str, file_format: str) -> None:
+        super().__init__(
+            f"{file_format} files require '{package}'. "
+            f"Install it with `pip install {package}`."
+        )
+
+
 class DataFileLoadErrorUnknown(DataFileLoadError):
     """Raised when unknown error happen during data file loading"""
 
@@ -0,0 +1,208 @@
+### --- Standard library imports --- ###
+import sys
+import threading
+from typing import Any, Iterator, Optional, Union
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import InvalidSQLOperation
+from SQLThunder.utils.lazy_imports import _is_dataframe
+
+### --- Utils --- ###
+
+# Duration each chunk is sized to take (seconds)
+DEFAULT_TARGET_CHUNK_SECONDS = 0.2
+
+# Size of the first chunks, before any measurement (rows)
+ADAPTIVE_INITIAL_READ_CHUNK_SIZE = 10_000
+ADAPTIVE_INITIAL_WRITE_CHUNK_SIZE = 512
+
+# Bounds of adaptive chunk sizes (rows)
+ADAPTIVE_MIN_CHUNK_SIZE = 16
+ADAPTIVE_MAX_CHUNK_SIZE = 1_000_000
+
+# In-memory size of one chunk (bytes), times max_in_flight chunks held at once
+ADAPTIVE_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Size of the parameters sent for one write chunk (bytes), under MySQL's default max_allowed_packet (64 MiB)
+ADAPTIVE_MAX_STATEMENT_BYTES = 16 * 1024 * 1024
+
+# Weight of the latest chunk in the throughput and row size averages
+_SMOOTHING = 0.3
+
+# Rows sampled to estimate the size of a row
+_ROW_SAMPLE_SIZE = 1000
+
+
+def _check_chunk_size(chunk_size: Union[int, str]) -> None:
+    """
+    Validate a `chunk_size` argument: a positive number of rows or "auto".
+
+    Args:
+        chunk_size (Union[int, str]): Rows per chunk, or "auto" for adaptive sizing.
+
+    Raises:
+        InvalidSQLOperation: If chunk_size is neither a positive integer nor "auto".
+    """
+    if chunk_size == "auto":
+        return
+    if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+        raise InvalidSQLOperation(
+            f"chunk_size must be a positive integer or 'auto'. Got: {chunk_size!r}"
+        )
+    if chunk_size <= 0:
+        raise InvalidSQLOperation(
+            f"chunk_size must be a positive integer or 'auto'. Got: {chunk_size}"
+        )
+
+
+def _estimate_row_bytes(rows: Any) -> int:
+    """
+    Estimate the size of one row from a sample of a DataFrame or a list of parameter dicts/tuples.
+
+    DataFrames use their deep memory usage (string contents included). Lists sum the size of the
+    values of each sampled row. The in-memory size is an upper bound of the size sent to the driver.
+
+    Args:
+        rows (Any): DataFrame, or list of dicts or tuples.
+
+    Returns:
+        int: Estimated bytes per row, 0 if there are no rows.
+    """
+    sample = (
+        rows[:_ROW_SAMPLE_SIZE]
+        if not _is_dataframe(rows)
+        else rows.iloc[:_ROW_SAMPLE_SIZE]
+    )
+    if not len(sample):
+        return 0
+    if _is_dataframe(sample):
+        return int(sample.memory_usage(index=False, deep=True).sum()) // len(sample)
+    total = 0
+    for row in sample:
+        values = row.values() if isinstance(row, dict) else row
+        total += sum(sys.getsizeof(value) for value in values)
+    return total // len(sample)
+
+
+class _AdaptiveChunkSizer:
+    """
+    Thread-safe chunk size controller steering chunks toward a target duration.
+
+    Each finished chunk reports its row count and duration. The throughput (rows/second) is smoothed with an
+    exponential moving average and the next chunk size is `throughput * target_seconds`, changed by at most
+    a factor of 2 per chunk so that one slow or fast outlier does not swing the size. Sizes are then capped by
+    `max_size` rows and by `max_bytes` divided by the estimated row size.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        target_seconds: float = DEFAULT_TARGET_CHUNK_SECONDS,
+        min_size: int = ADAPTIVE_MIN_CHUNK_SIZE,
+        max_size: int = ADAPTIVE_MAX_CHUNK_SIZE,
+        max_bytes: Optional[int] = None,
+        row_bytes: int = 0,
+    ) -> None:
+        """
+        Initializes the controller.
+
+        Args:
+            initial_size (int): Size of the first chunks, before any measurement.
+            target_seconds (float): Duration each chunk is sized to take.
+            min_size (int): Smallest chunk size (rows).
+            max_size (int): Largest chunk size (rows).
+            max_bytes (Optional[int]): Largest estimated chunk size in bytes. None for no memory cap.
+            row_bytes (int): Initial estimate of the size of a row (bytes), 0 if unknown. Updated by `record`.
+
+        Raises:
+            InvalidSQLOperation: If target_seconds is not positive or min_size > max_size.
+        """
+        if target_seconds <= 0:
+            raise InvalidSQLOperation(
+                f"target_seconds must be positive. Got: {target_seconds}"
+            )
+        if not 1 <= min_size <= max_size:
+            raise InvalidSQLOperation(
+                f"Invalid chunk size bounds: min_size={min_size}, max_size={max_size}"
+            )
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._row_bytes = float(row_bytes)
+        self._rows_per_second: Optional[float] = None
+        self._lock = threading.Lock()
+        self._size = self._capped(initial_size)
+
+    @property
+    def size(self) -> int:
+        """Rows of the next chunk."""
+        return self._size
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        """Smoothed throughput of one chunk, None before the first measurement."""
+        return self._rows_per_second
+
+    def record(self, rows: int, seconds: float, nbytes: int = 0) -> None:
+        """
+        Records a finished chunk and adjusts the size of the next ones.
+
+        Args:
+            rows (int): Rows in the chunk. Empty chunks are ignored.
+            seconds (float): Time taken to execute or fetch the chunk.
+            nbytes (int): In-memory size of the chunk, 0 if unknown.
+        """
+        if rows <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            rate = rows / seconds
+            self._rows_per_second = (
+                rate
+                if self._rows_per_second is None
+                else _SMOOTHING * rate + (1 - _SMOOTHING) * self._rows_per_second
+            )
+            if nbytes > 0:
+                self._row_bytes = (
+                    nbytes / rows
+                    if not self._row_bytes
+                    else _SMOOTHING * nbytes / rows + (1 - _SMOOTHING) * self._row_bytes
+                )
+            ideal = self._rows_per_second * self.target_seconds
+            damped = min(max(ideal, self._size / 2), self._size * 2)
+            self._size = self._capped(int(damped))
+
+    def _capped(self, size: int) -> int:
+        """Applies the row and memory bounds to a chunk size."""
+        upper = self.max_size
+        if self.max_bytes is not None and self._row_bytes > 0:
+            upper = min(upper, int(self.max_bytes // self._row_bytes))
+        return max(1, min(max(size, self.min_size), upper))
+
+
+def _iter_adaptive_chunks(
+    rows: Any, sizer: _AdaptiveChunkSizer
+) -> Iterator[tuple[Any, int]]:
+    """
+    Slice a DataFrame or a list lazily into chunks of the current size of `sizer`.
+
+    The size is read when each chunk is sliced, so chunks taken after a measurement follow the new size.
+
+    Args:
+        rows (Any): DataFrame or list of parameters.
+        sizer (_AdaptiveChunkSizer): Controller giving the size of each chunk.
+
+    Yields:
+        tuple[Any, int]: (chunk, chunk_num) pairs, in order.
+    """
+    start = 0
+    chunk_num = 0
+    while start < len(rows):
+        size = sizer.size
+        yield (
+            rows.iloc[start : start + size]
+            if _is_dataframe(rows)
+            else rows[start : start + size]
+        ), chunk_num
+        start += size
+        chunk_num += 1
@@ -0,0 +1,216 @@
+### --- Standard library imports --- ###
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import InvalidSQLOperation
+from SQLThunder.logging_config import logger
+
+### --- Utils --- ###
+
+# Concurrency of the first chunks of a batch with max_workers="auto"
+ADAPTIVE_INITIAL_CONCURRENCY = 2
+
+# A chunk slower per row than this multiple of the smoothed latency is a latency spike
+LATENCY_SPIKE_FACTOR = 3.0
+
+# Relative throughput gain over the previous window for which one more worker is added
+_IMPROVEMENT_THRESHOLD = 0.05
+
+# Relative throughput loss over the previous window for which one worker is removed
+_REGRESSION_THRESHOLD = 0.10
+
+# Weight of the latest chunk in the smoothed per-row latency
+_SMOOTHING = 0.3
+
+
+class ConcurrencyInfo(NamedTuple):
+    """Concurrency chosen by the adaptive limiter of a batch operation (`max_workers="auto"`)."""
+
+    initial: int
+    final: int
+    peak: int
+    max_limit: int
+    increases: int
+    decreases: int
+
+
+class _ConcurrencyLimiter:
+    """
+    Thread-safe AIMD (additive increase, multiplicative decrease) limit on the number of chunks run at once.
+
+    Finished chunks are grouped in windows of `limit` chunks. At the end of a window, the throughput
+    (rows/second of wall time) is compared to the previous window: one worker is added if it improved, one
+    removed if it dropped, and the limit is kept otherwise. A deadlock, timeout or dropped connection, or a
+    chunk much slower per row than usual (latency spike), halves the limit at once.
+
+    The limit is applied either by the dispatcher (`limit`, for chunks submitted to an executor) or by the
+    workers themselves (`slot()`, blocking while `limit` chunks are running).
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial: int = ADAPTIVE_INITIAL_CONCURRENCY,
+        min_limit: int = 1,
+    ) -> None:
+        """
+        Initializes the limiter.
+
+        Args:
+            max_limit (int): Largest concurrency, e.g. the connection pool capacity.
+            initial (int): Starting concurrency, capped by max_limit.
+            min_limit (int): Smallest concurrency.
+
+        Raises:
+            InvalidSQLOperation: If min_limit is not between 1 and max_limit.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise InvalidSQLOperation(
+                f"Invalid concurrency bounds: min_limit={min_limit}, max_limit={max_limit}"
+            )
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self._limit = max(min_limit, min(initial, max_limit))
+        self._initial = self._limit
+        self._peak = self._limit
+        self._increases = 0
+        self._decreases = 0
+        self._active = 0
+        self._row_latency: Optional[float] = None
+        self._previous_throughput: Optional[float] = None
+        self._window_start = time.perf_counter()
+        self._window_rows = 0
+        self._window_chunks = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Number of chunks allowed to run at once."""
+        return self._limit
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Blocks until fewer than `limit` chunks are running, and holds a slot for the duration of the block.
+        """
+        with self._condition:
+            while self._active >= self._limit:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify()
+
+    def record(
+        self, rows: int, seconds: float, failed: bool = False, transient: bool = False
+    ) -> None:
+        """
+        Records a finished chunk and adjusts the limit.
+
+        Args:
+            rows (int): Rows executed or fetched by the chunk.
+            seconds (float): Time taken by the chunk.
+            failed (bool): Whether the chunk failed.
+            transient (bool): Whether the failure is transient (see `_is_transient_error`). Failures due to
+                the data say nothing about the load of the server and are ignored.
+        """
+        with self._condition:
+            if failed:
+                if transient:
+                    self._decrease("a transient error")
+                return
+
+            if rows > 0 and seconds > 0:
+                row_latency = seconds / rows
+                usual = self._row_latency
+                # Spikes are averaged in too, so that a lasting slowdown becomes the new usual latency
+                self._row_latency = (
+                    row_latency
+                    if usual is None
+                    else _SMOOTHING * row_latency + (1 - _SMOOTHING) * usual
+                )
+                if usual is not None and row_latency > LATENCY_SPIKE_FACTOR * usual:
+                    self._decrease(
+                        f"a latency spike ({row_latency * 1000:.3f} ms/row, usual "
+                        f"{usual * 1000:.3f} ms/row)"
+                    )
+                    return
+
+            self._window_rows += rows
+            self._window_chunks += 1
+            if self._window_chunks >= self._limit:
+                self._end_window()
+
+    def resume(self) -> None:
+        """
+        Starts a new measurement window, to reuse the limiter after a pause (e.g. between the file chunks
+        of `insert_file`) without counting the pause as lost throughput. The limit is kept.
+        """
+        with self._condition:
+            self._reset_window(time.perf_counter())
+
+    def info(self) -> ConcurrencyInfo:
+        """
+        Returns the concurrency chosen so far.
+
+        Returns:
+            ConcurrencyInfo: Named tuple (initial, final, peak, max_limit, increases, decreases).
+        """
+        return ConcurrencyInfo(
+            initial=self._initial,
+            final=self._limit,
+            peak=self._peak,
+            max_limit=self.max_limit,
+            increases=self._increases,
+            decreases=self._decreases,
+        )
+
+    def _end_window(self) -> None:
+        """Compares the throughput of the window to the previous one and steps the limit (lock held)."""
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        throughput = self._window_rows / elapsed if elapsed > 0 else 0.0
+        previous = self._previous_throughput
+
+        if previous is None or throughput > previous * (1 + _IMPROVEMENT_THRESHOLD):
+            if self._limit < self.max_limit:
+                self._set_limit(self._limit + 1)
+                self._increases += 1
+        elif throughput < previous * (1 - _REGRESSION_THRESHOLD):
+            if self._limit > self.min_limit:
+                self._set_limit(self._limit - 1)
+                self._decreases += 1
+
+        self._previous_throughput = throughput
+        self._reset_window(now)
+
+    def _decrease(self, reason: str) -> None:
+        """Halves the limit and starts a new window (lock held)."""
+        if self._limit > self.min_limit:
+            logger.info(
+                f"Reducing concurrency from {self._limit} to "
+                f"{max(self.min_limit, self._limit // 2)} after {reason}"
+            )
+            self._set_limit(max(self.min_limit, self._limit // 2))
+            self._decreases += 1
+        # Throughput measured at the previous limit is not comparable anymore
+        self._previous_throughput = None
+        self._reset_window(time.perf_counter())
+
+    def _set_limit(self, limit: int) -> None:
+        """Sets the limit and wakes up workers waiting for a slot (lock held)."""
+        self._limit = limit
+        self._peak = max(self._peak, limit)
+        self._condition.notify_all()
+
+    def _reset_window(self, now: float) -> None:
+        """Starts a new measurement window (lock held)."""
+        self._window_start = now
+        self._window_rows = 0
+        self._window_chunks = 0
@@ -1,11 +1,16 @@
 ### --- Standard library imports --- ###
 import os
+import ssl
 import sys
 from typing import Any, Optional
 from urllib.parse import quote_plus
 
+### --- Third-party imports --- ###
+from sqlalchemy import __version__ as sqlalchemy_version
+
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions import (
+    ConfigFileError,
     InvalidDatabaseConfiguration,
     MissingSQLitePath,
     UnsupportedDatabaseType,
@@ -117,7 +122,7 @@ def _build_connect_args(
 
     Notes:
         - For SQLite: disables thread check.
-        - For MySQL: supports SSL, timeouts.
+        - For MySQL: supports SSL, timeouts and LOAD DATA LOCAL INFILE.
         - For PostgreSQL: supports SSL and extra metadata.
     """
     if driver == "sqlite":
@@ -143,6 +148,10 @@ def _build_connect_args(
         connect_args["read_timeout"] = config.get("read_timeout", 30)
         connect_args["write_timeout"] = config.get("write_timeout", 30)
 
+        # Client-side LOAD DATA LOCAL INFILE (insert method "load_data"), off by default
+        if config.get("local_infile"):
+            connect_args["local_infile"] = True
+
     elif driver == "psycopg2":
         # SSL
         ssl_mode = config.get("ssl_mode")
@@ -162,3 +171,174 @@ def _build_connect_args(
             connect_args["options"] = config["pg_options"]
 
     return connect_args
+
+
+def _build_engine_kwargs(driver: str, config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Construct extra `create_engine` keyword arguments for fast executemany, based on config.
+
+    Enabled with `fast_executemany: true` in the config. Off by default, the engine then keeps the
+    default executemany behavior of SQLAlchemy and the driver.
+
+    Args:
+        driver (str): One of "sqlite", "pymysql", or "psycopg2".
+        config (dict[str, Any]): Configuration options, may contain `fast_executemany`,
+            `executemany_batch_page_size` and `insertmanyvalues_page_size`.
+
+    Returns:
+        dict[str, Any]: Keyword arguments to pass to `create_engine`.
+
+    Notes:
+        - For PostgreSQL: `executemany_mode="values_plus_batch"`, so that executemany of text statements
+          goes through psycopg2 `execute_batch` (pages of `executemany_batch_page_size` rows per round-trip)
+          and INSERT constructs through `execute_values`.
+        - On SQLAlchemy 2.x: `insertmanyvalues` is enabled with `insertmanyvalues_page_size` rows per
+          statement. On 1.4 the page size maps to the psycopg2 `executemany_values_page_size`.
+        - For MySQL and SQLite there is no driver option: PyMySQL already rewrites executemany of INSERT
+          statements into multi-row INSERTs, and sqlite3 runs executemany in-process.
+    """
+    if not config.get("fast_executemany"):
+        return {}
+
+    engine_kwargs: dict[str, Any] = {}
+    batch_page_size = config.get("executemany_batch_page_size")
+    values_page_size = config.get("insertmanyvalues_page_size")
+    sqlalchemy_2 = int(sqlalchemy_version.split(".")[0]) >= 2
+
+    if sqlalchemy_2:
+        engine_kwargs["use_insertmanyvalues"] = True
+        if values_page_size is not None:
+            engine_kwargs["insertmanyvalues_page_size"] = int(values_page_size)
+
+    if driver == "psycopg2":
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
+        if batch_page_size is not None:
+            engine_kwargs["executemany_batch_page_size"] = int(batch_page_size)
+        if not sqlalchemy_2 and values_page_size is not None:
+            engine_kwargs["executemany_values_page_size"] = int(values_page_size)
+
+    return engine_kwargs
+
+
+def _get_async_db_url(
+    config: dict[str, Any], db_type: Optional[str] = None
+) -> tuple[str, str, str]:
+    """
+    Build a SQLAlchemy asyncio database URL string based on configuration.
+
+    Same resolution as `_get_db_url`, with the asyncio driver of each database: asyncpg for PostgreSQL,
+    aiomysql (or asyncmy with `async_driver: asyncmy`) for MySQL and aiosqlite for SQLite.
+
+    Args:
+        config (dict[str, Any]): Configuration dictionary with DB credentials and options.
+        db_type (Optional[str]): Optional override for DB type ("mysql", "postgresql", "sqlite").
+
+    Returns:
+        tuple[str, str, str]: A tuple containing:
+            - SQLAlchemy asyncio connection string
+            - Driver name (e.g., "asyncpg", "aiomysql", "aiosqlite")
+            - Normalized db_type ("mysql", "postgresql", or "sqlite")
+
+    Raises:
+        MissingSQLitePath: If SQLite path is not provided.
+        InvalidDatabaseConfiguration: If required MySQL/PostgreSQL keys are missing.
+        UnsupportedDatabaseType: If db_type is not supported.
+        ConfigFileError: If the configured MySQL async_driver is not supported.
+    """
+    url, _, db_type = _get_db_url(config, db_type)
+
+    if db_type == "sqlite":
+        return (
+            url.replace("sqlite://", "sqlite+aiosqlite://", 1),
+            "aiosqlite",
+            db_type,
+        )
+
+    if db_type == "mysql":
+        driver = config.get("async_driver", "aiomysql")
+        if driver not in {"aiomysql", "asyncmy"}:
+            raise ConfigFileError(
+                f"Unsupported async_driver '{driver}' for mysql. Supported: aiomysql, asyncmy."
+            )
+        return (
+            url.replace("mysql+pymysql://", f"mysql+{driver}://", 1),
+            driver,
+            db_type,
+        )
+
+    # asyncpg takes the connect timeout as a connect argument, not in the URL
+    url = url.split("?", 1)[0]
+    return (
+        url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1),
+        "asyncpg",
+        db_type,
+    )
+
+
+def _build_ssl_context(ssl_paths: dict[str, str]) -> Optional[ssl.SSLContext]:
+    """
+    Build an SSL context from the SSL file paths, as expected by the asyncio drivers.
+
+    Args:
+        ssl_paths (dict[str, str]): Dictionary with SSL file paths.
+
+    Returns:
+        Optional[ssl.SSLContext]: The context, or None if no SSL file is configured.
+    """
+    if not ssl_paths:
+        return None
+    context = ssl.create_default_context(cafile=ssl_paths.get("ssl_ca"))
+    if "ssl_cert" in ssl_paths:
+        context.load_cert_chain(ssl_paths["ssl_cert"], ssl_paths.get("ssl_key"))
+    return context
+
+
+def _build_async_connect_args(
+    driver: str, ssl_paths: dict[str, str], config: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Construct SQLAlchemy `connect_args` dictionary for an asyncio driver.
+
+    Args:
+        driver (str): One of "aiosqlite", "aiomysql", "asyncmy" or "asyncpg".
+        ssl_paths (dict[str, str]): Dictionary with SSL file paths.
+        config (dict[str, Any]): Configuration options such as timeouts or metadata.
+
+    Returns:
+        dict[str, Any]: SQLAlchemy-compatible connect_args dictionary.
+
+    Notes:
+        - For SQLite: no arguments (aiosqlite runs each connection in its own thread).
+        - For MySQL: supports SSL (as an SSL context), connect timeout and LOAD DATA LOCAL INFILE.
+          aiomysql and asyncmy have no read or write timeout.
+        - For PostgreSQL: supports SSL (an SSL context from the SSL files, else `ssl_mode`), connect
+          timeout and extra metadata as server settings.
+    """
+    if driver == "aiosqlite":
+        return {}
+
+    connect_args: dict[str, Any] = {}
+    ssl_context = _build_ssl_context(ssl_paths)
+
+    if driver in {"aiomysql", "asyncmy"}:
+        if ssl_context is not None:
+            connect_args["ssl"] = ssl_context
+        connect_args["connect_timeout"] = config.get("connect_timeout", 10)
+        if config.get("local_infile"):
+            connect_args["local_infile"] = True
+
+    elif driver == "asyncpg":
+        if ssl_context is not None:
+            connect_args["ssl"] = ssl_context
+        elif config.get("ssl_mode"):
+            connect_args["ssl"] = config["ssl_mode"]
+        connect_args["timeout"] = config.get("connect_timeout", 10)
+
+        # Metadata, sent as server settings (asyncpg has no options string)
+        server_settings = {}
+        if "application_name" in config:
+            server_settings["application_name"] = config["application_name"]
+        if server_settings:
+            connect_args["server_settings"] = server_settings
+
+    return connect_args
@@ -1,27 +1,40 @@
+from __future__ import annotations
+
 ### --- Standard library imports --- ###
 import os
-
-### --- Third-party imports --- ###
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions import (
     DataFileLoadErrorUnknown,
     DataFileNotFoundError,
     FileOutputSaveError,
+    MissingOptionalDependencyError,
     UnsupportedDataFormatError,
 )
+from SQLThunder.utils.lazy_imports import _LazyModule
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = _LazyModule("pandas")
 
 ### --- Utils --- ###
 
+# Columnar file extensions and their pyarrow dataset format
+ARROW_FORMATS = {".parquet": "parquet", ".feather": "ipc", ".arrow": "ipc"}
+
 
 def save_dataframe(df: pd.DataFrame, output: str, output_path: str) -> None:
     """
-    Save a pandas DataFrame to disk in CSV or Excel format.
+    Save a pandas DataFrame to disk in CSV, Excel, Parquet or Feather (Arrow IPC) format.
+
+    Parquet and Feather are much faster to write and smaller than Excel, and require pyarrow.
 
     Args:
         df (pd.DataFrame): The DataFrame to save.
-        output (str): Output format, either "csv" or "excel".
+        output (str): Output format, one of "csv", "excel", "parquet" or "feather".
         output_path (str): Path to the output file. Can be relative or absolute.
 
     Raises:
@@ -41,9 +54,16 @@ def save_dataframe(df: pd.DataFrame, output: str, output_path: str) -> None:
             df.to_csv(abs_path, index=False)
         elif output == "excel":
             df.to_excel(abs_path, index=False)
+        elif output == "parquet":
+            _import_pyarrow("Parquet")
+            df.to_parquet(abs_path, index=False)
+        elif output == "feather":
+            _import_pyarrow("Feather")
+            df.reset_index(drop=True).to_feather(abs_path)
         else:
             raise FileOutputSaveError(
-                f"Unsupported output format: '{output}'. Must be 'csv' or 'excel'."
+                f"Unsupported output format: '{output}'. "
+                "Must be 'csv', 'excel', 'parquet' or 'feather'."
             )
 
     except Exception as e:
@@ -52,19 +72,30 @@ def save_dataframe(df: pd.DataFrame, output: str, output_path: str) -> None:
         ) from e
 
 
-def load_data(file_path: str) -> pd.DataFrame:
+def load_data(
+    file_path: str,
+    columns: Optional[list[str]] = None,
+    filters: Optional[list[Any]] = None,
+) -> pd.DataFrame:
     """
-    Load a CSV or Excel file into a pandas DataFrame.
+    Load a CSV, Excel, Parquet or Feather (Arrow IPC) file into a pandas DataFrame.
+
+    For Parquet and Feather, only the requested columns are read and `filters` are pushed down to the reader,
+    so row groups that cannot match are skipped.
 
     Args:
-        file_path (str): Path to the input file (.csv, .xls, .xlsx).
+        file_path (str): Path to the input file (.csv, .xls, .xlsx, .parquet, .feather, .arrow).
+        columns (Optional[list[str]]): Columns to read. If None, all columns are read.
+        filters (Optional[list[Any]]): Row filters in pyarrow DNF format, e.g. `[("year", ">=", 2024)]`.
+            Parquet and Feather only.
 
     Returns:
         pd.DataFrame: The loaded data.
 
     Raises:
         DataFileNotFoundError: If the file is not found.
-        UnsupportedDataFormatError: If the file format is not supported.
+        UnsupportedDataFormatError: If the file format is not supported, or filters are given for CSV or Excel.
+        MissingOptionalDependencyError: If a Parquet or Feather file is read without pyarrow installed.
         DataFileLoadErrorUnknown: If an unexpected error occurs during file reading.
     """
     try:
@@ -77,14 +108,145 @@ def load_data(file_path: str) -> pd.DataFrame:
 
         # Check extension
         ext = os.path.splitext(abs_path)[1].lower()
+        if ext in ARROW_FORMATS:
+            return _read_arrow(abs_path, ext, columns, filters)
+        if filters:
+            raise UnsupportedDataFormatError(
+                ext, "filters on .parquet, .feather, and .arrow files"
+            )
         if ext == ".csv":
-            return pd.read_csv(abs_path)
+            return pd.read_csv(abs_path, usecols=columns)
         elif ext in {".xls", ".xlsx"}:
-            return pd.read_excel(abs_path)
+            return pd.read_excel(abs_path, usecols=columns)
+        else:
+            raise UnsupportedDataFormatError(
+                ext, ".csv, .xls, .xlsx, .parquet, .feather, and .arrow"
+            )
+
+    except (
+        DataFileNotFoundError,
+        UnsupportedDataFormatError,
+        MissingOptionalDependencyError,
+    ):
+        raise  # Reraise cleanly
+    except Exception as e:
+        raise DataFileLoadErrorUnknown(file_path, e)
+
+
+def iter_data(file_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV, Excel, Parquet or Feather file as pandas DataFrames of at most `chunk_size` rows.
+
+    Only one chunk is held in memory at a time, so files larger than memory can be read:
+        - .csv: `pd.read_csv(chunksize=...)`
+        - .xlsx: rows of the first sheet read with openpyxl in read-only mode
+        - .parquet, .feather, .arrow: record batches scanned with pyarrow (optional dependency)
+        - .xls: no streaming reader, the sheet is read at once and then split in chunks
+
+    Args:
+        file_path (str): Path to the input file (.csv, .xls, .xlsx, .parquet, .feather, .arrow).
+        chunk_size (int): Maximum number of rows per DataFrame.
+
+    Yields:
+        pd.DataFrame: The next chunk of rows, with the columns of the file.
+
+    Raises:
+        DataFileNotFoundError: If the file is not found.
+        UnsupportedDataFormatError: If the file format is not supported.
+        MissingOptionalDependencyError: If a Parquet or Feather file is read without pyarrow installed.
+        DataFileLoadErrorUnknown: If an unexpected error occurs during file reading.
+    """
+    try:
+        # Expand and normalize path
+        expanded_path = os.path.expanduser(file_path)
+        abs_path = os.path.abspath(os.path.normpath(expanded_path))
+
+        if not os.path.isfile(abs_path):
+            raise DataFileNotFoundError(file_path)
+
+        # Check extension
+        ext = os.path.splitext(abs_path)[1].lower()
+        if ext == ".csv":
+            yield from pd.read_csv(abs_path, chunksize=chunk_size)
+        elif ext == ".xlsx":
+            yield from _iter_xlsx(abs_path, chunk_size)
+        elif ext == ".xls":
+            yield from _iter_frame(pd.read_excel(abs_path), chunk_size)
+        elif ext in ARROW_FORMATS:
+            yield from _iter_arrow(abs_path, ext, chunk_size)
         else:
-            raise UnsupportedDataFormatError(ext)
+            raise UnsupportedDataFormatError(
+                ext, ".csv, .xls, .xlsx, .parquet, .feather, and .arrow"
+            )
 
-    except (DataFileNotFoundError, UnsupportedDataFormatError):
+    except (
+        DataFileNotFoundError,
+        UnsupportedDataFormatError,
+        MissingOptionalDependencyError,
+    ):
         raise  # Reraise cleanly
     except Exception as e:
         raise DataFileLoadErrorUnknown(file_path, e)
+
+
+def _iter_frame(df: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Split an in-memory DataFrame in chunks of at most `chunk_size` rows."""
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def _iter_xlsx(path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Stream the first sheet of an .xlsx file, using its first row as header."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = list(header)
+
+        buffer: list[tuple[Any, ...]] = []
+        for row in rows:
+            buffer.append(row)
+            if len(buffer) == chunk_size:
+                yield pd.DataFrame(buffer, columns=columns)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _import_pyarrow(file_format: str) -> Any:
+    """Import `pyarrow.dataset`, raising a clear error if pyarrow is not installed."""
+    try:
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise MissingOptionalDependencyError("pyarrow", file_format) from e
+    return ds
+
+
+def _read_arrow(
+    path: str, ext: str, columns: Optional[list[str]], filters: Optional[list[Any]]
+) -> pd.DataFrame:
+    """Read a Parquet or Feather file with column projection and filter pushdown."""
+    ds = _import_pyarrow(ext)
+    import pyarrow.parquet as pq
+
+    dataset = ds.dataset(path, format=ARROW_FORMATS[ext])
+    table = dataset.to_table(
+        columns=columns,
+        filter=pq.filters_to_expression(filters) if filters else None,
+    )
+    return table.to_pandas()
+
+
+def _iter_arrow(path: str, ext: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Stream a Parquet or Feather file in record batches of at most `chunk_size` rows."""
+    ds = _import_pyarrow(ext)
+    dataset = ds.dataset(path, format=ARROW_FORMATS[ext])
+    for batch in dataset.to_batches(batch_size=chunk_size):
+        if batch.num_rows:
+            yield batch.to_pandas()
@@ -1,12 +1,35 @@
+from __future__ import annotations
+
 ### --- Standard library imports --- ###
+import io
 import re
-from typing import Optional
+import sqlite3
+from typing import TYPE_CHECKING, Optional
 
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions import UnsupportedDatabaseType, UnsupportedDuplicateHandling
+from SQLThunder.utils.lazy_imports import _LazyModule
+from SQLThunder.utils.sql_conversion import _quote_identifier
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = _LazyModule("pandas")
 
 ### --- Utils --- ###
 
+# Maximum number of bound parameters in one statement
+MAX_BIND_PARAMS = {
+    "postgresql": 65535,
+    "mysql": 65535,
+    # SQLITE_MAX_VARIABLE_NUMBER default was raised from 999 in SQLite 3.32.0
+    "sqlite": 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999,
+}
+
+# Upper bound of rows per multi-row INSERT, keeps statements well below packet size limits
+MAX_ROWS_PER_INSERT = 1000
+
 
 def _apply_on_duplicate_clause(
     sql: str, db_type: str, on_duplicate: Optional[str]
@@ -67,3 +90,225 @@ def _apply_on_duplicate_clause(
                 "This is not currently supported "
                 "Write your own query logic and select on_duplicate: None"
             )
+
+
+def _quote_table_name(table_name: str, db_type: str) -> str:
+    """
+    Quote an optionally schema-qualified table name.
+
+    Args:
+        table_name (str): Table name, e.g. "table" or "schema.table".
+        db_type (str): Target DB type ("mysql", "sqlite", "postgresql").
+
+    Returns:
+        str: Quoted table name, e.g. '"schema"."table"'.
+
+    Raises:
+        UnsupportedDatabaseType: If db_type is not recognized.
+    """
+    return ".".join(_quote_identifier(part, db_type) for part in table_name.split("."))
+
+
+def _build_copy_statements(
+    table_name: str, columns: list[str], on_duplicate: Optional[str]
+) -> list[str]:
+    """
+    Build the PostgreSQL statements loading a CSV stream into a table with COPY.
+
+    Without duplicate handling the stream is copied straight into the target table. Otherwise,
+    COPY cannot skip conflicting rows, so the stream is copied into a temporary staging table
+    (dropped on commit) and moved to the target with an `INSERT ... SELECT` that reuses the
+    duplicate-handling clause of regular inserts.
+
+    Args:
+        table_name (str): Target table name (optionally schema-qualified).
+        columns (list[str]): Columns of the CSV stream, in order.
+        on_duplicate (Optional[str]): One of {"ignore", "replace", None}.
+
+    Returns:
+        list[str]: Statements to execute in order, in a single transaction.
+
+    Raises:
+        UnsupportedDuplicateHandling: If on_duplicate is not supported on PostgreSQL.
+    """
+    quoted_table = _quote_table_name(table_name, "postgresql")
+    quoted_cols = ", ".join(_quote_identifier(col, "postgresql") for col in columns)
+    copy_options = "WITH (FORMAT csv)"
+
+    if on_duplicate is None:
+        return [f"COPY {quoted_table} ({quoted_cols}) FROM STDIN {copy_options}"]
+
+    staging_table = "sqlthunder_copy_staging"
+    insert_sql = _apply_on_duplicate_clause(
+        f"INSERT INTO {quoted_table} ({quoted_cols}) "
+        f"SELECT {quoted_cols} FROM {staging_table}",
+        "postgresql",
+        on_duplicate,
+    )
+    return [
+        f"CREATE TEMPORARY TABLE {staging_table} ON COMMIT DROP AS "
+        f"SELECT {quoted_cols} FROM {quoted_table} WITH NO DATA",
+        f"COPY {staging_table} ({quoted_cols}) FROM STDIN {copy_options}",
+        insert_sql,
+    ]
+
+
+def _whole_floats_to_int(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert float columns holding only whole numbers to the nullable Int64 dtype.
+
+    Integer columns with missing values are upcast to float by pandas and would be serialized as
+    "1.0", which bulk loaders reject for integer columns. "1" loads into both integer and float columns.
+
+    Args:
+        df (pandas.DataFrame): Rows to serialize.
+
+    Returns:
+        pandas.DataFrame: The same DataFrame, or a shallow copy with converted columns.
+    """
+    converted = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_float_dtype(series):
+            values = series.dropna()
+            if (values == values.round()).all() and (values.abs() < 2**53).all():
+                converted[col] = series.astype("Int64")
+    return df.assign(**converted) if converted else df
+
+
+def _dataframe_to_csv_buffer(df: pd.DataFrame) -> io.StringIO:
+    """
+    Serialize a DataFrame to an in-memory CSV stream readable by PostgreSQL COPY.
+
+    Missing values are written as unquoted empty fields, the default NULL of the CSV format. Every
+    other non-numeric value is quoted, so empty strings and strings such as `\\N` are loaded as text
+    rather than NULL. Whole-number float columns are written without a decimal part.
+
+    Args:
+        df (pandas.DataFrame): Rows to serialize. The index is not written.
+
+    Returns:
+        io.StringIO: CSV stream without header, positioned at its start.
+    """
+    df = _whole_floats_to_int(df)
+
+    fields = []
+    for col in df.columns:
+        series = df[col]
+        nulls = series.isna()
+        text = series.astype(str)
+        if not pd.api.types.is_numeric_dtype(series):
+            text = '"' + text.str.replace('"', '""', regex=False) + '"'
+        fields.append(text.where(~nulls, ""))
+
+    buffer = io.StringIO()
+    if fields and len(df):
+        lines = fields[0].str.cat(fields[1:], sep=",") if len(fields) > 1 else fields[0]
+        buffer.write("\n".join(lines) + "\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _build_load_data_statement(
+    table_name: str, columns: list[str], on_duplicate: Optional[str]
+) -> str:
+    """
+    Build a MySQL LOAD DATA LOCAL INFILE statement reading a tab-separated file into a table.
+
+    The file path is left as a `%s` DBAPI placeholder, to be bound by the driver. Duplicate handling
+    maps to the native IGNORE and REPLACE keywords.
+
+    Args:
+        table_name (str): Target table name (optionally schema-qualified).
+        columns (list[str]): Columns of the file, in order.
+        on_duplicate (Optional[str]): One of {"ignore", "replace", None}.
+
+    Returns:
+        str: LOAD DATA statement.
+
+    Raises:
+        UnsupportedDuplicateHandling: If on_duplicate is not recognized.
+    """
+    if on_duplicate is not None and on_duplicate.lower() not in {"ignore", "replace"}:
+        raise UnsupportedDuplicateHandling(
+            f"Unknown on_duplicate value: {on_duplicate}"
+        )
+
+    quoted_table = _quote_table_name(table_name, "mysql")
+    quoted_cols = ", ".join(_quote_identifier(col, "mysql") for col in columns)
+    duplicate_keyword = f"{on_duplicate.upper()} " if on_duplicate else ""
+
+    return (
+        f"LOAD DATA LOCAL INFILE %s {duplicate_keyword}INTO TABLE {quoted_table} "
+        "CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+        "LINES TERMINATED BY '\\n' "
+        f"({quoted_cols})"
+    )
+
+
+def _dataframe_to_tsv(df: pd.DataFrame) -> str:
+    """
+    Serialize a DataFrame to tab-separated text readable by MySQL LOAD DATA with default escaping.
+
+    Backslashes, tabs, newlines, carriage returns and NUL characters are escaped with a backslash,
+    missing values are written as `\\N` and booleans as 1/0. Whole-number float columns are written
+    without a decimal part.
+
+    Args:
+        df (pandas.DataFrame): Rows to serialize. The index is not written.
+
+    Returns:
+        str: One line per row, each terminated by a newline.
+    """
+    df = _whole_floats_to_int(df)
+    escapes = [
+        ("\\", "\\\\"),
+        ("\t", "\\t"),
+        ("\n", "\\n"),
+        ("\r", "\\r"),
+        ("\0", "\\0"),
+    ]
+
+    fields = []
+    for col in df.columns:
+        series = df[col]
+        nulls = series.isna()
+        if pd.api.types.is_bool_dtype(series):
+            text = series.astype(int).astype(str)
+        else:
+            text = series.astype(str)
+            if not (
+                pd.api.types.is_numeric_dtype(series)
+                or pd.api.types.is_datetime64_any_dtype(series)
+            ):
+                for char, escaped in escapes:
+                    text = text.str.replace(char, escaped, regex=False)
+        fields.append(text.where(~nulls, "\\N"))
+
+    if not fields:
+        return ""
+    lines = fields[0].str.cat(fields[1:], sep="\t") if len(fields) > 1 else fields[0]
+    return "\n".join(lines) + "\n"
+
+
+def _rows_per_insert_statement(db_type: str, num_columns: int) -> int:
+    """
+    Compute how many rows fit in one multi-row INSERT statement.
+
+    The number of bound parameters (rows x columns) is kept under the limit of the database, and the
+    number of rows under `MAX_ROWS_PER_INSERT`.
+
+    Args:
+        db_type (str): Target DB type ("mysql", "sqlite", "postgresql").
+        num_columns (int): Number of columns inserted per row.
+
+    Returns:
+        int: Rows per statement, at least 1.
+
+    Raises:
+        UnsupportedDatabaseType: If db_type is not recognized.
+    """
+    if db_type not in MAX_BIND_PARAMS:
+        raise UnsupportedDatabaseType(db_type)
+    return max(1, min(MAX_ROWS_PER_INSERT, MAX_BIND_PARAMS[db_type] // num_columns))
@@ -0,0 +1,71 @@
+### --- Standard library imports --- ###
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Optional
+
+### --- Utils --- ###
+
+
+class _LazyModule:
+    """
+    Stand-in for a heavy third-party module (pandas, numpy), imported on first attribute access.
+
+    Modules bind it at import time in place of the real module, e.g. `pd = _LazyModule("pandas")`,
+    so `import SQLThunder` and code paths that never touch a DataFrame do not pay for the import.
+    After the first access the module's attributes are copied onto the proxy, so later lookups
+    cost the same as on the real module.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initializes a _LazyModule.
+
+        Args:
+            name (str): Absolute name of the module to import (e.g. "pandas").
+        """
+        self._lazy_name = name
+        self._lazy_module: Optional[ModuleType] = None
+        self._lazy_lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        """Imports the module once, even when several threads get here together."""
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                module = importlib.import_module(self._lazy_name)
+                self.__dict__.update(
+                    (key, value)
+                    for key, value in vars(module).items()
+                    if not key.startswith("_lazy_")
+                )
+                self._lazy_module = module
+            return self._lazy_module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not copied yet (first access, or module-level __getattr__)
+        if attr.startswith("_lazy_"):
+            raise AttributeError(attr)
+        module = self._lazy_module or self._load()
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module {self._lazy_name!r} ({state})>"
+
+
+def _is_dataframe(obj: Any) -> bool:
+    """
+    Check whether an object is a pandas DataFrame without importing pandas.
+
+    If pandas was never imported, no DataFrame can exist, so the check is free on code paths
+    (e.g. `execute` with tuples or dicts) that never use pandas.
+
+    Args:
+        obj (Any): Object to check.
+
+    Returns:
+        bool: True if `obj` is a pandas DataFrame.
+    """
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(obj, pandas.DataFrame)
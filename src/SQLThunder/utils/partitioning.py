@@ -0,0 +1,345 @@
+### --- Standard library imports --- ###
+import datetime
+from datetime import datetime as dt
+from typing import Optional, Union, cast
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import InvalidSQLOperation
+
+### --- Utils --- ###
+
+KeyBound = Union[int, datetime.date, dt]
+
+
+def _split_key_range(
+    min_key: KeyBound, max_key: KeyBound, num_partitions: int
+) -> list[tuple[KeyBound, KeyBound]]:
+    """
+    Split an inclusive key range into contiguous, disjoint sub-ranges.
+
+    Every sub-range is half-open `[start, end)` except the last one, which is closed `[start, end]`
+    so that `max_key` is included. Integer and date ranges never produce empty sub-ranges: the number
+    of partitions is capped by the number of distinct keys in the range.
+
+    Args:
+        min_key (Union[int, datetime.date, datetime.datetime]): Smallest key of the range (inclusive).
+        max_key (Union[int, datetime.date, datetime.datetime]): Largest key of the range (inclusive).
+        num_partitions (int): Requested number of sub-ranges.
+
+    Returns:
+        list[tuple[Union[int, datetime.date, datetime.datetime], Union[int, datetime.date, datetime.datetime]]]:
+            The `(start, end)` bounds of each sub-range, in ascending key order.
+
+    Raises:
+        InvalidSQLOperation: If the keys are not int/date/datetime, have different types,
+            if min_key > max_key or if num_partitions is not positive.
+
+    Example:
+        _split_key_range(0, 99, 4)
+        → [(0, 25), (25, 50), (50, 75), (75, 99)]
+    """
+    if num_partitions <= 0:
+        raise InvalidSQLOperation(
+            f"num_partitions must be a positive integer. Got: {num_partitions}"
+        )
+
+    # bool is a subclass of int but is not a valid key
+    if isinstance(min_key, bool) or isinstance(max_key, bool):
+        raise InvalidSQLOperation("Key range bounds cannot be booleans.")
+
+    if type(min_key) is not type(max_key):
+        raise InvalidSQLOperation(
+            "Key range bounds must have the same type. "
+            f"Got: {type(min_key).__name__} and {type(max_key).__name__}"
+        )
+
+    if min_key > max_key:  # type: ignore[operator]
+        raise InvalidSQLOperation(
+            f"Key range start ({min_key}) is greater than its end ({max_key})."
+        )
+
+    # Datetime: split the time span evenly
+    if isinstance(min_key, dt) and isinstance(max_key, dt):
+        span = max_key - min_key
+        if span == datetime.timedelta(0):
+            return [(min_key, max_key)]
+        step = span / num_partitions
+        starts = [min_key + step * i for i in range(num_partitions)]
+        dt_bounds: list[tuple[KeyBound, KeyBound]] = [
+            (starts[i], starts[i + 1]) for i in range(num_partitions - 1)
+        ]
+        dt_bounds.append((starts[-1], max_key))
+        return dt_bounds
+
+    # Date: split on day ordinals and convert back
+    if isinstance(min_key, datetime.date) and isinstance(max_key, datetime.date):
+        return [
+            (
+                datetime.date.fromordinal(cast(int, start)),
+                datetime.date.fromordinal(cast(int, end)),
+            )
+            for start, end in _split_key_range(
+                min_key.toordinal(), max_key.toordinal(), num_partitions
+            )
+        ]
+
+    # Integer: ceil-divide the number of distinct keys
+    if isinstance(min_key, int) and isinstance(max_key, int):
+        total = max_key - min_key + 1
+        num_partitions = min(num_partitions, total)
+        int_step = -(-total // num_partitions)  # ceil division
+        int_bounds: list[tuple[KeyBound, KeyBound]] = []
+        int_start = min_key
+        while int_start + int_step <= max_key:
+            int_bounds.append((int_start, int_start + int_step))
+            int_start += int_step
+        int_bounds.append((int_start, max_key))
+        return int_bounds
+
+    raise InvalidSQLOperation(
+        "Key range partitioning only supports int, date and datetime keys. "
+        f"Got: {type(min_key).__name__}"
+    )
+
+
+def _plan_key_partitions(
+    min_key: Optional[KeyBound],
+    max_key: Optional[KeyBound],
+    key_count: int,
+    row_count: int,
+    chunk_size: int,
+) -> list[tuple[Optional[KeyBound], Optional[KeyBound]]]:
+    """
+    Plan the partitions of a query result from the bounds and counts of its key column.
+
+    The non-NULL keys are split into sub-ranges of about `chunk_size` rows. If some rows have a NULL
+    key, a `(None, None)` partition selecting them (see `_build_null_key_query`) is put first, so that
+    partitioning on a nullable key returns the same rows as an unpartitioned query.
+
+    Args:
+        min_key (Optional[Union[int, datetime.date, datetime.datetime]]): Smallest key, None if every key is NULL.
+        max_key (Optional[Union[int, datetime.date, datetime.datetime]]): Largest key, None if every key is NULL.
+        key_count (int): Number of rows with a non-NULL key.
+        row_count (int): Number of rows of the result.
+        chunk_size (int): Target number of rows per sub-range.
+
+    Returns:
+        list[tuple[Optional[Union[int, datetime.date, datetime.datetime]], Optional[Union[int, datetime.date, datetime.datetime]]]]:
+            The `(start, end)` bounds of each partition: the NULL partition first if any, then the key
+            sub-ranges in ascending order. Empty if the result has no rows.
+
+    Raises:
+        InvalidSQLOperation: If the keys are not int/date/datetime.
+
+    Example:
+        _plan_key_partitions(0, 99, 100, 105, 50)
+        → [(None, None), (0, 50), (50, 99)]
+    """
+    partitions: list[tuple[Optional[KeyBound], Optional[KeyBound]]] = []
+    if row_count > key_count:
+        partitions.append((None, None))
+    if key_count:
+        num_partitions = max(1, -(-key_count // chunk_size))
+        partitions.extend(
+            _split_key_range(
+                cast(KeyBound, min_key), cast(KeyBound, max_key), num_partitions
+            )
+        )
+    return partitions
+
+
+def _next_key_bound(
+    start: KeyBound, min_key: KeyBound, max_key: KeyBound, fraction: float
+) -> tuple[KeyBound, bool]:
+    """
+    Find the end of a key sub-range covering about `fraction` of the key span, starting at `start`.
+
+    Used to cut sub-ranges one at a time when their size is only known when they are dispatched
+    (adaptive chunk sizing). Integer and date sub-ranges always hold at least one distinct key.
+
+    Args:
+        start (Union[int, datetime.date, datetime.datetime]): Inclusive start of the sub-range.
+        min_key (Union[int, datetime.date, datetime.datetime]): Smallest key of the whole range.
+        max_key (Union[int, datetime.date, datetime.datetime]): Largest key of the whole range (inclusive).
+        fraction (float): Share of the whole key span the sub-range should cover, e.g. rows / key count.
+
+    Returns:
+        tuple[Union[int, datetime.date, datetime.datetime], bool]: The exclusive end of the sub-range and
+            whether it is the last one, in which case the end is `max_key` and inclusive.
+
+    Raises:
+        InvalidSQLOperation: If the keys are not int/date/datetime.
+
+    Example:
+        _next_key_bound(0, 0, 99, 0.25)
+        → (25, False)
+    """
+    if isinstance(min_key, bool) or isinstance(max_key, bool):
+        raise InvalidSQLOperation("Key range bounds cannot be booleans.")
+
+    # Datetime: fraction of the time span
+    if isinstance(start, dt) and isinstance(min_key, dt) and isinstance(max_key, dt):
+        dt_end = start + (max_key - min_key) * fraction
+        if dt_end >= max_key or dt_end <= start:
+            return max_key, True
+        return dt_end, False
+
+    # Date: on day ordinals
+    if isinstance(start, datetime.date) and isinstance(max_key, datetime.date):
+        end_ordinal, last = _next_key_bound(
+            start.toordinal(),
+            cast(datetime.date, min_key).toordinal(),
+            max_key.toordinal(),
+            fraction,
+        )
+        return datetime.date.fromordinal(cast(int, end_ordinal)), last
+
+    # Integer: at least one distinct key per sub-range
+    if isinstance(start, int) and isinstance(min_key, int) and isinstance(max_key, int):
+        int_end = start + max(1, int((max_key - min_key + 1) * fraction))
+        if int_end > max_key:
+            return max_key, True
+        return int_end, False
+
+    raise InvalidSQLOperation(
+        "Key range partitioning only supports int, date and datetime keys. "
+        f"Got: {type(min_key).__name__}"
+    )
+
+
+def _build_key_range_query(sql: str, key_column: str, last_partition: bool) -> str:
+    """
+    Wrap a SELECT statement so that it only returns rows within one key sub-range.
+
+    The original statement is used as a derived table, which keeps joins, GROUP BY and WHERE
+    clauses intact. The sub-range bounds are bound as `:partition_start` and `:partition_end`.
+
+    Args:
+        sql (str): Base SQL SELECT query (without LIMIT or OFFSET).
+        key_column (str): Output column of the query to partition on.
+        last_partition (bool): If True the upper bound is inclusive, otherwise exclusive.
+
+    Returns:
+        str: SQL selecting the sub-range, ordered by the key column.
+    """
+    end_operator = "<=" if last_partition else "<"
+    return (
+        f"SELECT * FROM ({sql.strip().rstrip(';')}) AS sqlthunder_partition "
+        f"WHERE {key_column} >= :partition_start AND {key_column} {end_operator} :partition_end "
+        f"ORDER BY {key_column}"
+    )
+
+
+def _build_null_key_query(sql: str, key_column: str) -> str:
+    """
+    Wrap a SELECT statement so that it only returns the rows whose key is NULL.
+
+    Args:
+        sql (str): Base SQL SELECT query (without LIMIT or OFFSET).
+        key_column (str): Output column of the query to partition on.
+
+    Returns:
+        str: SQL selecting the rows with a NULL key.
+    """
+    return (
+        f"SELECT * FROM ({sql.strip().rstrip(';')}) AS sqlthunder_partition "
+        f"WHERE {key_column} IS NULL"
+    )
+
+
+def _build_key_bounds_query(sql: str, key_column: str) -> str:
+    """
+    Build the query reading the bounds of a key column over the result of a SELECT statement.
+
+    Args:
+        sql (str): Base SQL SELECT query (without LIMIT or OFFSET).
+        key_column (str): Output column of the query to partition on.
+
+    Returns:
+        str: SQL returning one row with MIN, MAX and COUNT of the key, then COUNT(*).
+    """
+    return (
+        f"SELECT MIN({key_column}), MAX({key_column}), COUNT({key_column}), COUNT(*) "
+        f"FROM ({sql.strip().rstrip(';')}) AS sqlthunder_bounds"
+    )
+
+
+def _build_offset_chunk_query(sql: str, chunk_size: int, chunk_index: int) -> str:
+    """
+    Append LIMIT and OFFSET to a SELECT statement to read one fixed-size chunk of its result.
+
+    Args:
+        sql (str): Base SQL SELECT query (without LIMIT or OFFSET).
+        chunk_size (int): Number of rows per chunk.
+        chunk_index (int): Index of the chunk (its offset is `chunk_index * chunk_size`).
+
+    Returns:
+        str: SQL selecting the chunk.
+    """
+    return _build_limit_offset_query(sql, chunk_size, chunk_index * chunk_size)
+
+
+def _build_limit_offset_query(sql: str, limit: int, offset: int) -> str:
+    """
+    Append LIMIT and OFFSET to a SELECT statement.
+
+    Args:
+        sql (str): Base SQL SELECT query (without LIMIT or OFFSET).
+        limit (int): Maximum number of rows.
+        offset (int): Number of rows skipped.
+
+    Returns:
+        str: SQL selecting the rows.
+    """
+    return f"{sql.strip().rstrip(';')} LIMIT {limit} OFFSET {offset}"
+
+
+def _build_keyed_page_query(
+    sql: str,
+    key_column: str,
+    order: str,
+    chunk_size: int,
+    include_start: bool,
+    has_end_key: bool,
+    end_inclusive: bool = True,
+) -> str:
+    """
+    Build one page of a key-based pagination over a SELECT statement.
+
+    The page starts after (or at, if `include_start`) the key bound as `:last_key` and, if
+    `has_end_key`, stops at the key bound as `:end_key`.
+
+    Args:
+        sql (str): Base SQL SELECT query (without LIMIT or pagination conditions).
+        key_column (str): The column to use as the pagination key.
+        order (str): "asc" or "desc".
+        chunk_size (int): Number of rows per page.
+        include_start (bool): Whether rows equal to `:last_key` are included.
+        has_end_key (bool): Whether an `:end_key` bound is applied.
+        end_inclusive (bool): Whether rows equal to `:end_key` are included. Defaults to True.
+
+    Returns:
+        str: SQL selecting the page, ordered by the key column.
+    """
+    where_clauses = []
+
+    if order == "asc":
+        operator = ">=" if include_start else ">"
+        where_clauses.append(f"{key_column} {operator} :last_key")
+        if has_end_key:
+            end_operator = "<=" if end_inclusive else "<"
+            where_clauses.append(f"{key_column} {end_operator} :end_key")
+    else:
+        operator = "<=" if include_start else "<"
+        where_clauses.append(f"{key_column} {operator} :last_key")
+        if has_end_key:
+            end_operator = ">=" if end_inclusive else ">"
+            where_clauses.append(f"{key_column} {end_operator} :end_key")
+
+    where_sql = " AND ".join(where_clauses)
+    return f"""
+                {sql.strip().rstrip(';')}
+                {"AND" if "where" in sql.lower() else "WHERE"} {where_sql}
+                ORDER BY {key_column} {order.upper()}
+                LIMIT {chunk_size}
+            """
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+### --- Standard library imports --- ###
+import atexit
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+### --- Third-party imports --- ###
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+
+### --- Internal package imports --- ###
+from SQLThunder.logging_config import logger
+from SQLThunder.utils.lazy_imports import _is_dataframe
+from SQLThunder.utils.retry import _execute_with_retry
+from SQLThunder.utils.sql_conversion import _dataframe_to_params
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+### --- Process pool execution of batch writes --- ###
+
+# Engine of the current worker process, created by `_init_worker`
+_worker_engine: Optional[Engine] = None
+
+
+class _Shard:
+    """
+    One chunk of a batch write, as sent to a worker process.
+
+    DataFrame chunks are serialized as an Arrow IPC stream when pyarrow is installed (columnar buffers,
+    no per-row Python objects to pickle), otherwise the DataFrame slice itself is sent. Lists of
+    parameter dicts are sent as they are.
+    """
+
+    def __init__(
+        self, payload: Union[bytes, pd.DataFrame, list[dict[str, Any]]], num_rows: int
+    ) -> None:
+        """
+        Initializes a shard.
+
+        Args:
+            payload (Union[bytes, pandas.DataFrame, list[dict[str, Any]]]): Arrow IPC stream, DataFrame or records.
+            num_rows (int): Number of rows of the chunk.
+        """
+        self.payload = payload
+        self.num_rows = num_rows
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def nbytes(self) -> int:
+        """Size of an Arrow IPC payload in bytes, 0 for the other payloads."""
+        return len(self.payload) if isinstance(self.payload, bytes) else 0
+
+
+class _ShardResult(NamedTuple):
+    """Outcome of one shard, sent back to the parent process."""
+
+    failures: list[dict[str, Any]]
+    seconds: float
+    transient: bool
+
+
+def _make_shard(chunk: Union[pd.DataFrame, list[dict[str, Any]]]) -> _Shard:
+    """
+    Wrap a chunk of a batch write for a worker process, serializing DataFrames to Arrow IPC if possible.
+
+    Args:
+        chunk (Union[pandas.DataFrame, list[dict[str, Any]]]): Rows of the chunk.
+
+    Returns:
+        _Shard: The shard to submit.
+    """
+    if not _is_dataframe(chunk):
+        return _Shard(chunk, len(chunk))
+
+    try:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return _Shard(sink.getvalue().to_pybytes(), len(chunk))
+    except ImportError:
+        return _Shard(chunk, len(chunk))
+    except Exception as e:
+        # Column types Arrow cannot represent (e.g. mixed objects): send the DataFrame slice
+        logger.debug(
+            f"Arrow serialization of a chunk failed, sending the DataFrame: {e}"
+        )
+        return _Shard(chunk, len(chunk))
+
+
+def _shard_to_params(
+    shard: _Shard, date_only_columns: Optional[set[int]]
+) -> list[dict[str, Any]]:
+    """
+    Convert a shard back to SQLAlchemy parameter dicts, in the worker process.
+
+    Args:
+        shard (_Shard): The shard received from the parent process.
+        date_only_columns (Optional[set[int]]): Positions of the datetime columns bound as dates,
+            computed on the whole DataFrame by the parent.
+
+    Returns:
+        list[dict[str, Any]]: Parameters keyed by column name.
+    """
+    payload = shard.payload
+    if isinstance(payload, bytes):
+        import pyarrow as pa
+
+        payload = pa.ipc.open_stream(payload).read_all().to_pandas()
+    if _is_dataframe(payload):
+        return _dataframe_to_params(payload, date_only_columns)
+    return payload
+
+
+def _init_worker(
+    db_url: str, connect_args: dict[str, Any], engine_kwargs: dict[str, Any]
+) -> None:
+    """
+    Create the engine of a worker process (one connection, disposed when the process exits).
+
+    Args:
+        db_url (str): SQLAlchemy database URL.
+        connect_args (dict[str, Any]): Driver connect arguments.
+        engine_kwargs (dict[str, Any]): Extra `create_engine` arguments (fast executemany).
+    """
+    global _worker_engine
+    _worker_engine = create_engine(
+        db_url,
+        connect_args=connect_args,
+        pool_size=1,
+        max_overflow=0,
+        future=True,
+        pool_pre_ping=True,
+        **engine_kwargs,
+    )
+    atexit.register(_worker_engine.dispose)
+
+
+@lru_cache(maxsize=32)
+def _worker_clause(sql: str) -> TextClause:
+    """Compile the statement once per worker process."""
+    return text(sql)
+
+
+def _execute_shard(
+    sql: str,
+    date_only_columns: Optional[set[int]],
+    max_retries: int,
+    retry_backoff: float,
+    bisect: bool,
+    shard: _Shard,
+    chunk_num: int,
+) -> _ShardResult:
+    """
+    Execute one shard of a batch write in its own transaction, in a worker process.
+
+    Failures are not raised: the failed rows are returned with their error message, like the failed
+    records of a threaded batch write. Transient errors are retried and failed shards bisected as in
+    `_execute_with_retry`.
+
+    Args:
+        sql (str): Converted SQL statement (placeholders and duplicate handling applied).
+        date_only_columns (Optional[set[int]]): Positions of the datetime columns bound as dates.
+        max_retries (int): Retries after a transient error.
+        retry_backoff (float): Base delay of the exponential backoff (seconds).
+        bisect (bool): Whether to split failed shards to isolate the bad rows.
+        shard (_Shard): Rows of the chunk.
+        chunk_num (int): Index of the chunk.
+
+    Returns:
+        _ShardResult: The failed records (empty on success), the time taken to execute the shard in seconds,
+            and whether a transient error (deadlock, timeout, dropped connection) occurred.
+    """
+    assert _worker_engine is not None, "worker process was not initialized"
+    params = _shard_to_params(shard, date_only_columns)
+    transient_errors: list[BaseException] = []
+
+    def execute(rows: list[dict[str, Any]]) -> None:
+        with _worker_engine.begin() as conn:
+            conn.execute(_worker_clause(sql), rows)
+
+    started = time.perf_counter()
+    failed_groups = _execute_with_retry(
+        execute,
+        params,
+        max_retries=max_retries,
+        retry_backoff=retry_backoff,
+        bisect=bisect,
+        on_transient_error=transient_errors.append,
+    )
+    failures: list[dict[str, Any]] = []
+    for rows, e in failed_groups:
+        logger.warning(f"Chunk {chunk_num} failed ({len(rows)} row(s)): {e}")
+        failures.extend(
+            {**record, "chunk_index": chunk_num, "error_message": str(e)}
+            for record in rows
+        )
+    return _ShardResult(failures, time.perf_counter() - started, bool(transient_errors))
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+### --- Standard library imports --- ###
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+### --- Third-party imports --- ###
+from sqlalchemy.engine.row import Row
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import QueryResultDependencyError
+from SQLThunder.utils.lazy_imports import _LazyModule
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+else:
+    np = _LazyModule("numpy")
+    pd = _LazyModule("pandas")
+
+### --- Utils --- ###
+
+# Return types assembled as pyarrow tables instead of lists of rows
+ARROW_RETURN_TYPES = {"arrow", "df_arrow"}
+
+# Number of rows converted at once when a single result is read as Arrow
+ARROW_FETCH_SIZE = 10_000
+
+
+def _require_pyarrow(return_type: str) -> Any:
+    """
+    Import pyarrow for an Arrow return type, raising a clear error if it is not installed.
+
+    Args:
+        return_type (str): The requested return type ("arrow" or "df_arrow"), used in the error message.
+
+    Returns:
+        module: The `pyarrow` module.
+
+    Raises:
+        QueryResultDependencyError: If pyarrow is not installed, or if pandas has no `ArrowDtype`
+            (pandas < 1.5) when return_type is "df_arrow".
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise QueryResultDependencyError("pyarrow", return_type) from e
+    if return_type.lower() == "df_arrow" and not hasattr(pd, "ArrowDtype"):
+        raise QueryResultDependencyError("pandas>=1.5", return_type)
+    return pa
+
+
+def _rows_to_arrow(rows: Sequence[Row], columns: list[str]) -> Any:
+    """
+    Convert a batch of fetched rows into a pyarrow Table, one column at a time.
+
+    The rows are transposed once and each column is handed to `pyarrow.array`, which infers
+    the Arrow type and stores the values in a contiguous buffer. The Row objects of the batch
+    can then be released, so only one batch is ever held as Python objects.
+
+    Args:
+        rows (Sequence[Row]): Rows returned by SQLAlchemy.
+        columns (list[str]): Result column names.
+
+    Returns:
+        pyarrow.Table: The batch as a table with one column per result column.
+    """
+    import pyarrow as pa
+
+    column_values = zip(*rows) if rows else ([] for _ in columns)
+    arrays = [pa.array(values) for values in column_values]
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def _concat_arrow_tables(tables: Iterable[Any], columns: list[str]) -> Any:
+    """
+    Concatenate per-batch pyarrow Tables into a single Table.
+
+    Types are inferred per batch, so a column that is entirely NULL in one batch (null type) or
+    narrower in another is promoted to the common type instead of failing.
+
+    Args:
+        tables (Iterable[pyarrow.Table]): Batches, in result order.
+        columns (list[str]): Result column names, used to build an empty table if there is no batch.
+
+    Returns:
+        pyarrow.Table: The concatenated result.
+    """
+    import pyarrow as pa
+
+    tables = list(tables)
+    if not tables:
+        return _rows_to_arrow([], columns)
+    if len(tables) == 1:
+        return tables[0]
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def _concat_dataframes(frames: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    """
+    Concatenate per-chunk DataFrames into a single DataFrame with a fresh index.
+
+    Each chunk infers its own dtypes, so a column that is entirely NULL in one chunk comes out as
+    `object` there. Such chunk columns are cast to the dtype the column has in the other chunks
+    (float for integer columns, object for booleans) before concatenating, so the result has the same
+    dtypes as a DataFrame built from all the rows at once.
+
+    Args:
+        frames (list[pd.DataFrame]): Non-empty chunks, in result order. The list is emptied.
+        columns (list[str]): Result column names, used to build an empty DataFrame if there is no chunk.
+
+    Returns:
+        pd.DataFrame: The concatenated result.
+    """
+    if not frames:
+        return pd.DataFrame(columns=columns or None)
+    if len(frames) == 1:
+        return frames.pop().reset_index(drop=True)
+
+    names = frames[0].columns
+    if names.is_unique:
+        for name in names:
+            if len({frame[name].dtype for frame in frames}) == 1:
+                continue
+            has_values = [frame[name].notna().any() for frame in frames]
+            target = next(
+                (f[name].dtype for f, present in zip(frames, has_values) if present),
+                None,
+            )
+            if target is None:
+                continue
+            if target.kind in "iu":
+                target = np.dtype("float64")
+            elif target.kind == "b":
+                target = np.dtype(object)
+            for i, present in enumerate(has_values):
+                if not present and frames[i][name].dtype != target:
+                    frames[i] = frames[i].astype({name: target})
+
+    result = pd.concat(frames, ignore_index=True)
+    frames.clear()
+    return result
+
+
+def _arrow_to_pandas(table: Any) -> pd.DataFrame:
+    """
+    Convert a pyarrow Table into a pandas DataFrame backed by Arrow arrays (`pd.ArrowDtype` columns).
+
+    The column buffers are reused rather than converted to NumPy or Python objects, and NULLs stay
+    missing values in every column type (no int to float casts).
+
+    Args:
+        table (pyarrow.Table): The table to convert.
+
+    Returns:
+        pd.DataFrame: A DataFrame with Arrow-backed columns.
+    """
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
@@ -0,0 +1,126 @@
+### --- Standard library imports --- ###
+import random
+import time
+from typing import Any, Callable, Optional
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import InvalidSQLOperation
+from SQLThunder.logging_config import logger
+from SQLThunder.utils.lazy_imports import _is_dataframe
+from SQLThunder.utils.transient_errors import _is_transient_error
+
+### --- Utils --- ###
+
+# Default base delay of the exponential backoff between retries (seconds)
+DEFAULT_RETRY_BACKOFF = 0.5
+
+# Longest delay between two retries (seconds)
+MAX_RETRY_BACKOFF = 30.0
+
+
+def _check_retry_arguments(max_retries: int, retry_backoff: float) -> None:
+    """
+    Validate the retry arguments of a batch write.
+
+    Args:
+        max_retries (int): Retries of a chunk after a transient error.
+        retry_backoff (float): Base delay of the exponential backoff (seconds).
+
+    Raises:
+        InvalidSQLOperation: If max_retries is not a non-negative integer or retry_backoff is negative.
+    """
+    if isinstance(max_retries, bool) or not isinstance(max_retries, int):
+        raise InvalidSQLOperation(
+            f"max_retries must be a non-negative integer. Got: {max_retries!r}"
+        )
+    if max_retries < 0:
+        raise InvalidSQLOperation(
+            f"max_retries must be a non-negative integer. Got: {max_retries}"
+        )
+    if retry_backoff < 0:
+        raise InvalidSQLOperation(
+            f"retry_backoff must be non-negative. Got: {retry_backoff}"
+        )
+
+
+def _backoff_delay(attempt: int, base: float) -> float:
+    """
+    Delay before a retry: exponential backoff with full jitter.
+
+    The delay is drawn uniformly between 0 and `base * 2 ** attempt` (capped at MAX_RETRY_BACKOFF), so
+    workers that failed together on a deadlock do not retry together.
+
+    Args:
+        attempt (int): Number of the failed attempt, from 0.
+        base (float): Base delay (seconds).
+
+    Returns:
+        float: Seconds to wait.
+    """
+    return random.uniform(0, min(MAX_RETRY_BACKOFF, base * 2**attempt))
+
+
+def _split_rows(rows: Any) -> tuple[Any, Any]:
+    """Split a DataFrame or a list of rows in two halves."""
+    middle = len(rows) // 2
+    if _is_dataframe(rows):
+        return rows.iloc[:middle], rows.iloc[middle:]
+    return rows[:middle], rows[middle:]
+
+
+def _execute_with_retry(
+    execute: Callable[[Any], None],
+    rows: Any,
+    max_retries: int = 0,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    bisect: bool = False,
+    on_transient_error: Optional[Callable[[BaseException], None]] = None,
+) -> list[tuple[Any, BaseException]]:
+    """
+    Execute a chunk of rows, retrying transient errors and isolating the bad rows of data errors.
+
+    `execute(rows)` must run the rows in one transaction, rolled back on error. Transient errors (see
+    `_is_transient_error`) are retried up to `max_retries` times with exponential backoff. With `bisect`,
+    a chunk failing with another error is split in two halves executed separately, recursively, until the
+    failing rows are isolated: the other rows are committed and only the failing ones are returned. A chunk
+    with k bad rows among n costs about 2 * k * log2(n) extra transactions.
+
+    Args:
+        execute (Callable[[Any], None]): Executes rows in one transaction.
+        rows (Any): DataFrame or list of parameter rows.
+        max_retries (int): Retries after a transient error. Defaults to 0.
+        retry_backoff (float): Base delay of the exponential backoff (seconds). Defaults to DEFAULT_RETRY_BACKOFF.
+        bisect (bool): Whether to split failed chunks to isolate the bad rows. Defaults to False.
+        on_transient_error (Optional[Callable[[BaseException], None]]): Called with every transient error,
+            e.g. to lower the concurrency.
+
+    Returns:
+        list[tuple[Any, BaseException]]: The failed rows and their error, empty if every row was executed.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            execute(rows)
+            return []
+        except Exception as e:
+            error = e
+            transient = _is_transient_error(e)
+            if transient and on_transient_error is not None:
+                on_transient_error(e)
+            if not transient or attempt == max_retries:
+                break
+            delay = _backoff_delay(attempt, retry_backoff)
+            logger.info(
+                f"Transient error on {len(rows)} row(s), retry {attempt + 1}/{max_retries} in {delay:.2f}s: {e}"
+            )
+            time.sleep(delay)
+
+    # Transient errors that outlived the retries are not due to the data, splitting would not help
+    if not bisect or len(rows) <= 1 or transient:
+        return [(rows, error)]
+
+    first, second = _split_rows(rows)
+    return _execute_with_retry(
+        execute, first, max_retries, retry_backoff, bisect, on_transient_error
+    ) + _execute_with_retry(
+        execute, second, max_retries, retry_backoff, bisect, on_transient_error
+    )
@@ -1,15 +1,11 @@
+from __future__ import annotations
+
 ### --- Standard library imports --- ###
-import datetime
+import functools
+import itertools
 import re
 from datetime import datetime as dt
-from typing import Any, Optional, Union, cast
-
-import numpy as np
-
-### --- Third-party imports --- ###
-import pandas as pd
-import sqlparse
-from sqlparse.tokens import DML, Keyword
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions import (
@@ -20,10 +16,103 @@ from SQLThunder.exceptions import (
     UnsupportedDatabaseType,
     UnsupportedSQLArgsFormat,
 )
+from SQLThunder.utils.lazy_imports import _is_dataframe, _LazyModule
+
+# Heavy third-party modules are imported on first use
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+else:
+    np = _LazyModule("numpy")
+    pd = _LazyModule("pandas")
 
 ### --- Utils --- ###
 
 
+# DBAPI placeholders, compiled once: %(name)s and positional %s / ?
+_NAMED_PLACEHOLDER = re.compile(r"%\((\w+)\)s")
+_POSITIONAL_PLACEHOLDER = re.compile(r"(%s|\?)")
+
+
+def _convert_placeholders(sql: str) -> str:
+    """
+    Converts DBAPI-style placeholders in a SQL string to SQLAlchemy named binds.
+
+        - %(name)s → :name
+        - %s or ?  → :param1, :param2, ...
+
+    The result only depends on the SQL string, so it can be cached per statement.
+
+    Args:
+        sql (str): SQL query string containing DBAPI-style placeholders.
+
+    Returns:
+        str: The SQL string with converted placeholders.
+    """
+    # Replace named placeholders: %(param)s → :param
+    sql = _NAMED_PLACEHOLDER.sub(r":\1", sql)
+
+    # Replace positional placeholders: %s and ? → :param1, :param2, ...
+    counter = itertools.count(1)
+    return _POSITIONAL_PLACEHOLDER.sub(lambda _: f":param{next(counter)}", sql)
+
+
+def _convert_args(
+    args: Optional[
+        Union[
+            list[tuple[Any, ...]],
+            list[dict[str, Any]],
+            tuple[Any, ...],
+            dict[str, Any],
+            pd.DataFrame,
+        ]
+    ],
+) -> Union[list[dict[str, Any]], dict[str, Any], None]:
+    """
+    Converts bound arguments to the format expected by SQLAlchemy's `text()` execution model.
+
+    Tuples are keyed `param1`, `param2`, ... to match the binds produced by `_convert_placeholders`.
+
+    Args:
+        args (Optional[Union[list[tuple[Any, ...]], list[dict[str, Any]], tuple[Any, ...], dict[str, Any], pandas.DataFrame]]):
+            Bound parameters. Can be a single dict or tuple, a list of those, or a DataFrame.
+
+    Returns:
+        Union[list[dict[str, Any]], dict[str, Any], None]: The transformed arguments, or None if no arguments provided.
+
+    Raises:
+        UnsupportedSQLArgsFormat: If the argument structure is unsupported or malformed.
+    """
+    # If no args provided
+    if args is None:
+        return None
+
+    # Handle args conversion (dict or list of dict so no need to modify)
+    if isinstance(args, dict) or (
+        isinstance(args, list) and all(isinstance(a, dict) for a in args)
+    ):
+        return cast(Union[list[dict[str, Any]], dict[str, Any]], args)
+
+    # Handle df
+    if _is_dataframe(args):
+        return _dataframe_to_params(cast(pd.DataFrame, args))
+
+    # Helper to convert a tuple to a param dict
+    def convert_tuple(tup: tuple[Any, ...]) -> dict[str, Any]:
+        return {f"param{i + 1}": val for i, val in enumerate(tup)}
+
+    # Single tuple
+    if isinstance(args, tuple):
+        return convert_tuple(args)
+
+    # List of tuples
+    if isinstance(args, list) and all(isinstance(a, tuple) for a in args):
+        return [convert_tuple(cast(tuple[Any, ...], tup)) for tup in args]
+
+    # All accepted cases got passed by so raise error because invalid args format
+    raise UnsupportedSQLArgsFormat(args)
+
+
 def _convert_dbapi_to_sqlalchemy_style(
     sql: str,
     args: Optional[
@@ -39,12 +128,12 @@ def _convert_dbapi_to_sqlalchemy_style(
     """
     Converts a DBAPI-style SQL query and arguments to SQLAlchemy-compatible format.
 
-    This function replaces parameter placeholders in the SQL string:
+    This function replaces parameter placeholders in the SQL string (see `_convert_placeholders`):
         - %(name)s → :name
         - %s or ?  → :param1, :param2, ...
 
     It also transforms argument formats (tuple, dict, list, DataFrame) into a structure
-    compatible with SQLAlchemy's `text()` execution model.
+    compatible with SQLAlchemy's `text()` execution model (see `_convert_args`).
 
     Args:
         sql (str): SQL query string containing DBAPI-style placeholders.
@@ -60,65 +149,86 @@ def _convert_dbapi_to_sqlalchemy_style(
     Raises:
         UnsupportedSQLArgsFormat: If the argument structure is unsupported or malformed.
     """
-    try:
-        # Replace named placeholders: %(param)s → :param
-        sql = re.sub(r"%\((\w+)\)s", r":\1", sql)
-
-        # Replace positional placeholders: %s and ? → :param1, :param2, ...
-        class ReplacePositional:
-            def __init__(self) -> None:
-                self.counter = 0
-
-            def __call__(self, _: re.Match[str]) -> str:
-                self.counter += 1
-                return f":param{self.counter}"
-
-        replacer = ReplacePositional()
-        sql = re.sub(r"(%s|\?)", replacer, sql)
-
-        # If no args provided, return just the SQL
-        if args is None:
-            return sql, None
-
-        # Handle args conversion (dict or list of dict so no need to modify)
-        if isinstance(args, dict) or (
-            isinstance(args, list) and all(isinstance(a, dict) for a in args)
-        ):
-            return sql, cast(Union[list[dict[str, Any]], dict[str, Any]], args)
-
-        # Handle df
-        if isinstance(args, pd.DataFrame):
-            df = args.copy().where(pd.notnull(args), None)
-
-            for col in df.select_dtypes(include=["datetime64[ns]", "datetimetz"]):
-                # Check if the column looks like date-only (all timestamps are 00:00:00)
-                if df[col].dropna().dt.time.nunique() == 1 and df[
-                    col
-                ].dropna().dt.time.iloc[0] == datetime.time(0, 0):
-                    df[col] = df[col].dt.date  # convert to datetime.date
-                else:
-                    df[col] = np.array(
-                        df[col].dt.to_pydatetime()
-                    )  # keep full timestamp
-            return sql, df.to_dict(orient="records")
-
-        # Helper to convert a tuple to a param dict
-        def convert_tuple(tup: tuple[Any, ...]) -> dict[str, Any]:
-            return {f"param{i + 1}": val for i, val in enumerate(tup)}
-
-        # Single tuple
-        if isinstance(args, tuple):
-            return sql, convert_tuple(args)
-
-        # List of tuples
-        if isinstance(args, list) and all(isinstance(a, tuple) for a in args):
-            return sql, [convert_tuple(cast(tuple[Any, ...], tup)) for tup in args]
-
-        # All accepted cases got passed by so raise error because invalid args format
-        raise UnsupportedSQLArgsFormat(args)
-
-    except UnsupportedSQLArgsFormat:
-        raise
+    return _convert_placeholders(sql), _convert_args(args)
+
+
+def _date_only_columns(df: pd.DataFrame) -> set[int]:
+    """
+    Find the datetime columns of a DataFrame whose values are all at midnight.
+
+    These columns are bound as `datetime.date` rather than `datetime.datetime`.
+
+    Args:
+        df (pandas.DataFrame): DataFrame to inspect.
+
+    Returns:
+        set[int]: Positions of the date-only columns.
+    """
+    date_only = set()
+    for position, dtype in enumerate(df.dtypes):
+        if not pd.api.types.is_datetime64_any_dtype(dtype):
+            continue
+        values = df.iloc[:, position].dropna()
+        if not values.empty and (values == values.dt.normalize()).all():
+            date_only.add(position)
+    return date_only
+
+
+def _column_to_params(column: pd.Series, date_only: bool) -> list[Any]:
+    """
+    Convert one DataFrame column to a list of Python values ready to be bound.
+
+    Missing values (`None`, `NaN`, `NaT`, `pd.NA`) become `None` and datetimes become `datetime.date`
+    or `datetime.datetime`. The column data is never modified in place.
+
+    Args:
+        column (pandas.Series): Column (or slice of a column) to convert.
+        date_only (bool): If True, datetime values are converted to `datetime.date`.
+
+    Returns:
+        list[Any]: Values of the column, in order.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        if date_only:
+            values = column.dt.date.to_numpy(dtype=object)
+        else:
+            values = np.asarray(column.array.to_pydatetime(), dtype=object)
+    elif isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+        values = column.to_numpy()
+    else:
+        values = column.to_numpy(dtype=object)
+
+    mask = column.isna().to_numpy()
+    if mask.any():
+        values = values.astype(object)  # copy, never write into the frame
+        values[mask] = None
+    return cast(list[Any], values.tolist())
+
+
+def _dataframe_to_params(
+    df: pd.DataFrame, date_only_columns: Optional[set[int]] = None
+) -> list[dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of parameter dicts, one per row, column by column.
+
+    Each column is converted from its underlying array in one pass, without copying the whole frame.
+
+    Args:
+        df (pandas.DataFrame): Rows to convert.
+        date_only_columns (Optional[set[int]]): Positions of the datetime columns bound as dates. If None,
+            computed from `df`. Pass it when converting slices of a larger frame so that all slices agree.
+
+    Returns:
+        list[dict[str, Any]]: Parameters keyed by column name.
+    """
+    if date_only_columns is None:
+        date_only_columns = _date_only_columns(df)
+    columns = list(df.columns)
+    column_values = [
+        _column_to_params(df.iloc[:, position], position in date_only_columns)
+        for position in range(len(columns))
+    ]
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
 
 
 def _validate_args_for_bulk(args: Any) -> None:
@@ -131,15 +241,14 @@ def _validate_args_for_bulk(args: Any) -> None:
     Raises:
         BadArgumentsBulk: If args are empty or invalid.
     """
-    valid_arg_types = (list, dict, tuple, pd.DataFrame)
-
     if args is None:
         raise BadArgumentsBulk("Bad arguments for bulk insert/execute: args is None")
 
-    if not isinstance(args, valid_arg_types):
+    is_dataframe = _is_dataframe(args)
+    if not (is_dataframe or isinstance(args, (list, dict, tuple))):
         raise BadArgumentsBulk(f"Bad arguments for bulk insert/execute: {type(args)}")
 
-    if isinstance(args, pd.DataFrame):
+    if is_dataframe:
         if args.empty:
             raise BadArgumentsBulk(
                 "Bad arguments for bulk insert/execute: DataFrame is empty"
@@ -206,6 +315,60 @@ def _build_insert_statement(table_name: str, columns: list[str], db_type: str) -
         raise
 
 
+def _build_multi_row_insert_statement(
+    table_name: str, columns: list[str], db_type: str, num_rows: int
+) -> str:
+    """
+    Build a parameterized INSERT INTO statement inserting several rows at once.
+
+    Placeholders are named `:p{row}_{column}` by position, e.g. `:p0_1` for the second column of
+    the first row. Use `_flatten_rows_to_params` to build the matching parameters.
+
+    Args:
+        table_name (str): Full table name (optionally schema-qualified).
+        columns (list[str]): List of column names.
+        db_type (str): Database type.
+        num_rows (int): Number of rows in the VALUES clause.
+
+    Returns:
+        str: Complete INSERT SQL statement.
+
+    Raises:
+        UnsupportedDatabaseType: If db_type is not supported.
+
+    Example:
+        _build_multi_row_insert_statement("t", ["a", "b"], "sqlite", 2)
+        → 'INSERT INTO "t" ("a", "b") VALUES (:p0_0, :p0_1), (:p1_0, :p1_1)'
+    """
+    single_row_sql = _build_insert_statement(table_name, columns, db_type)
+    prefix = single_row_sql[: single_row_sql.rindex(" VALUES ")]
+    values = ", ".join(
+        "(" + ", ".join(f":p{row}_{col}" for col in range(len(columns))) + ")"
+        for row in range(num_rows)
+    )
+    return f"{prefix} VALUES {values}"
+
+
+def _flatten_rows_to_params(
+    rows: list[dict[str, Any]], columns: list[str]
+) -> dict[str, Any]:
+    """
+    Flatten rows into the parameters of a statement built by `_build_multi_row_insert_statement`.
+
+    Args:
+        rows (list[dict[str, Any]]): Rows keyed by column name.
+        columns (list[str]): Column names, in statement order.
+
+    Returns:
+        dict[str, Any]: Parameters keyed `p{row}_{column}`.
+    """
+    return {
+        f"p{row_index}_{col_index}": row[col]
+        for row_index, row in enumerate(rows)
+        for col_index, col in enumerate(columns)
+    }
+
+
 def _parse_datetime_key_based_pagination(
     key_value: Union[dt, str, int],
     label: str,
@@ -256,59 +419,173 @@ def _parse_datetime_key_based_pagination(
         )
 
 
-def _validate_select_no_limit_offset(sql: str) -> None:
+# Lexer for SELECT validation: only strings, quoted names, comments, parentheses, ";" and words
+# are matched, everything else (numbers, operators, whitespace) is skipped by the scan
+_SQL_SCAN_TOKEN = re.compile(
+    r"""
+    (?P<skip>
+        '(?:''|\\.|[^'\\])*'                        # single-quoted string
+      | "(?:""|[^"])*"                             # double-quoted identifier
+      | `(?:``|[^`])*`                             # backtick-quoted identifier
+      | (?:--|\#\s)[^\n]*                          # line comment
+      | /\*.*?\*/                                  # block comment
+      | \$(?P<tag>[A-Za-z_]\w*|)\$.*?\$(?P=tag)\$  # dollar-quoted string
+    )
+  | (?P<open>\()
+  | (?P<close>\))
+  | (?P<end>;)
+  | (?P<word>[A-Za-z_][\w$]*)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Statements starting with one of these keywords modify data
+_DML_KEYWORDS = {"SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "REPLACE"}
+
+# Validation results are memoized for statements up to this length (long generated SQL is rarely repeated)
+_MEMOIZE_MAX_SQL_LENGTH = 10_000
+
+
+def _scan_select(sql: str) -> tuple[bool, Optional[str]]:
     """
-    Ensure SQL is a SELECT statement without LIMIT or OFFSET clauses.
+    Tokenize just enough of the first SQL statement to validate it as a query.
+
+    The statement is a SELECT if its first keyword is SELECT (possibly inside parentheses), or
+    if it starts with WITH and the first data keyword after the CTEs, at the top level, is SELECT.
+    LIMIT and OFFSET are only reported at the top level, those of subqueries are allowed.
 
     Args:
-        sql (str): SQL query to validate.
+        sql (str): SQL query to scan.
 
-    Raises:
-        QuerySelectOnlyError: If query is not SELECT.
-        QueryDisallowedClauseError: If LIMIT or OFFSET is present.
+    Returns:
+        tuple[bool, Optional[str]]: Whether the statement is a SELECT, and the first top-level
+            LIMIT/OFFSET keyword found (upper-cased), or None.
     """
-    statements = sqlparse.parse(sql)
+    is_select = False
+    leading: Optional[str] = None
+    clause: Optional[str] = None
+    depth = 0
+    for match in _SQL_SCAN_TOKEN.finditer(sql):
+        kind = match.lastgroup
+        if kind == "word":
+            word = match.group().upper()
+            if leading is None:
+                leading = word
+                is_select = word == "SELECT"
+            elif leading == "WITH" and depth == 0 and word in _DML_KEYWORDS:
+                leading = word
+                is_select = word == "SELECT"
+            if depth == 0 and word in ("LIMIT", "OFFSET") and clause is None:
+                clause = word
+        elif kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth = max(depth - 1, 0)
+        elif kind == "end" and depth == 0 and leading is not None:
+            break
+    if leading == "WITH":
+        is_select = False
+    return is_select, clause
+
+
+def _scan_select_sqlparse(sql: str) -> tuple[bool, Optional[str]]:
+    """
+    Same as `_scan_select`, with a full sqlparse parse (strict mode).
+
+    The statement is a SELECT if a top-level token of the first statement is the SELECT keyword,
+    and LIMIT/OFFSET are reported anywhere in the statement, subqueries included. Statements
+    too large for sqlparse fall back to the lexer.
+
+    Args:
+        sql (str): SQL query to parse.
+
+    Returns:
+        tuple[bool, Optional[str]]: Whether the statement is a SELECT, and the first LIMIT/OFFSET
+            keyword found (upper-cased), or None.
+    """
+    import sqlparse
+    from sqlparse.exceptions import SQLParseError
+    from sqlparse.tokens import DML, Keyword
+
+    try:
+        statements = sqlparse.parse(sql)
+    except SQLParseError:
+        # sqlparse refuses statements with too many tokens (e.g. huge IN lists), use the lexer
+        return _scan_select(sql)
     if not statements:
-        raise QuerySelectOnlyError()
+        return False, None
 
     stmt = statements[0]
 
     # Check that the first keyword is SELECT
-    found_select = False
-    for token in stmt.tokens:
-        if token.ttype is DML and token.value.upper() == "SELECT":
-            found_select = True
-            break
-    if not found_select:
-        raise QuerySelectOnlyError()
+    is_select = any(
+        token.ttype is DML and token.value.upper() == "SELECT" for token in stmt.tokens
+    )
 
     # Flatten the token tree and look for LIMIT or OFFSET
     for token in stmt.flatten():
         if token.ttype is Keyword and token.value.upper() in ("LIMIT", "OFFSET"):
-            raise QueryDisallowedClauseError(token)
+            return is_select, token.value.upper()
+    return is_select, None
 
 
-def _validate_select(sql: str) -> None:
+# Memoized scanners, per statement
+_scan_select_cached = functools.lru_cache(maxsize=1024)(_scan_select)
+_scan_select_sqlparse_cached = functools.lru_cache(maxsize=1024)(_scan_select_sqlparse)
+
+
+def _check_select(sql: str, strict: bool) -> tuple[bool, Optional[str]]:
     """
-    Ensure SQL is a valid SELECT statement.
+    Runs the lexer (or sqlparse in strict mode) on a statement, memoized for short statements.
+
+    Args:
+        sql (str): SQL query to scan.
+        strict (bool): Use a full sqlparse parse instead of the lexer.
+
+    Returns:
+        tuple[bool, Optional[str]]: Whether the statement is a SELECT, and the LIMIT/OFFSET keyword found or None.
+    """
+    if len(sql) > _MEMOIZE_MAX_SQL_LENGTH:
+        return _scan_select_sqlparse(sql) if strict else _scan_select(sql)
+    return _scan_select_sqlparse_cached(sql) if strict else _scan_select_cached(sql)
+
+
+def _validate_select_no_limit_offset(sql: str, strict: bool = False) -> None:
+    """
+    Ensure SQL is a SELECT statement without LIMIT or OFFSET clauses.
+
+    By default a lightweight lexer only looks at the leading keyword and at top-level LIMIT/OFFSET.
+    In strict mode the statement is fully parsed with sqlparse and LIMIT/OFFSET are also rejected in subqueries.
 
     Args:
         sql (str): SQL query to validate.
+        strict (bool): Validate with a full sqlparse parse. Defaults to False.
 
     Raises:
-        QuerySelectOnlyError: If the statement is not a SELECT.
+        QuerySelectOnlyError: If query is not SELECT.
+        QueryDisallowedClauseError: If LIMIT or OFFSET is present.
     """
-    statements = sqlparse.parse(sql)
-    if not statements:
+    is_select, clause = _check_select(sql, strict)
+    if not is_select:
         raise QuerySelectOnlyError()
+    if clause is not None:
+        raise QueryDisallowedClauseError(clause)
 
-    stmt = statements[0]
 
-    # Check that the first keyword is SELECT
-    found_select = False
-    for token in stmt.tokens:
-        if token.ttype is DML and token.value.upper() == "SELECT":
-            found_select = True
-            break
-    if not found_select:
+def _validate_select(sql: str, strict: bool = False) -> None:
+    """
+    Ensure SQL is a valid SELECT statement.
+
+    By default a lightweight lexer only looks at the leading keyword (SELECT, or WITH followed by a SELECT).
+    In strict mode the statement is fully parsed with sqlparse.
+
+    Args:
+        sql (str): SQL query to validate.
+        strict (bool): Validate with a full sqlparse parse. Defaults to False.
+
+    Raises:
+        QuerySelectOnlyError: If the statement is not a SELECT.
+    """
+    is_select, _ = _check_select(sql, strict)
+    if not is_select:
         raise QuerySelectOnlyError()
@@ -0,0 +1,165 @@
+### --- Standard library imports --- ###
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional
+
+### --- Third-party imports --- ###
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+### --- Internal package imports --- ###
+from SQLThunder.utils.insert_helpers import _apply_on_duplicate_clause
+from SQLThunder.utils.sql_conversion import (
+    _convert_placeholders,
+    _validate_select,
+    _validate_select_no_limit_offset,
+)
+
+### --- Utils --- ###
+
+# Default number of prepared statements kept per DBClient
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+# SELECT checks that can be run while preparing a statement
+_VALIDATORS: dict[str, Callable[[str, bool], None]] = {
+    "select": _validate_select,
+    "select_no_limit_offset": _validate_select_no_limit_offset,
+}
+
+
+class StatementCacheInfo(NamedTuple):
+    """Hit/miss statistics of a statement cache, in the style of `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _PreparedStatement:
+    """
+    A statement ready to execute: the SQLAlchemy-style SQL string and its `text()` clause.
+
+    Only statements that passed validation are ever built, so a cached entry also records that
+    the raw SQL is valid for the requested check.
+    """
+
+    __slots__ = ("sql", "clause")
+
+    def __init__(self, sql: str, clause: TextClause) -> None:
+        self.sql = sql
+        self.clause = clause
+
+
+def _prepare_statement(
+    sql: str,
+    db_type: str,
+    validate: Optional[str] = None,
+    convert: bool = True,
+    on_duplicate: Optional[str] = None,
+    strict: bool = False,
+) -> _PreparedStatement:
+    """
+    Run the per-statement preparation steps on a raw SQL string.
+
+    Steps, in order: optional SELECT validation of the raw SQL, placeholder conversion
+    (`%(name)s`, `%s` and `?` to SQLAlchemy binds), duplicate handling and `text()` construction.
+    None of them depend on the bound values, so the result can be reused for every execution.
+
+    Args:
+        sql (str): Raw SQL string as given by the caller.
+        db_type (str): Database type ("mysql", "postgresql" or "sqlite").
+        validate (Optional[str]): "select" or "select_no_limit_offset" to check the statement first,
+            None to skip validation.
+        convert (bool): Whether to convert DBAPI-style placeholders. Defaults to True.
+        on_duplicate (Optional[str]): Duplicate handling mode ("ignore", "replace" or None).
+        strict (bool): Validate with a full sqlparse parse instead of the lexer. Defaults to False.
+
+    Returns:
+        _PreparedStatement: The converted SQL and its TextClause.
+
+    Raises:
+        QuerySelectOnlyError: If validation is requested and the SQL is not a SELECT.
+        QueryDisallowedClauseError: If "select_no_limit_offset" is requested and the SQL has LIMIT/OFFSET.
+        UnsupportedDuplicateHandling: If on_duplicate is not a supported mode.
+        UnsupportedDatabaseType: If on_duplicate is set for an unsupported database type.
+    """
+    if validate is not None:
+        _VALIDATORS[validate](sql, strict)
+    if convert:
+        sql = _convert_placeholders(sql)
+    if on_duplicate is not None:
+        sql = _apply_on_duplicate_clause(sql, db_type, on_duplicate)
+    return _PreparedStatement(sql, text(sql))
+
+
+class _StatementCache:
+    """
+    Thread-safe LRU cache of prepared statements.
+
+    Preparation errors are not cached: an invalid statement raises every time it is prepared.
+    A `maxsize` of 0 (or less) disables caching: every lookup is a miss and nothing is stored.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_STATEMENT_CACHE_SIZE) -> None:
+        """
+        Initializes a _StatementCache.
+
+        Args:
+            maxsize (int): Maximum number of statements kept. Defaults to DEFAULT_STATEMENT_CACHE_SIZE.
+        """
+        self._maxsize = max(maxsize, 0)
+        self._entries: "OrderedDict[Hashable, _PreparedStatement]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Hashable, prepare: Callable[[], _PreparedStatement]
+    ) -> _PreparedStatement:
+        """
+        Returns the cached statement for `key`, preparing and storing it on a miss.
+
+        Args:
+            key (Hashable): Cache key (raw SQL plus every option that changes the result).
+            prepare (Callable[[], _PreparedStatement]): Builds the statement on a miss. Exceptions propagate.
+
+        Returns:
+            _PreparedStatement: The prepared statement.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+
+        # Prepare outside the lock, two threads racing on the same new statement both build it
+        entry = prepare()
+        if self._maxsize:
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def info(self) -> StatementCacheInfo:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            StatementCacheInfo: Hits, misses, maximum size and current size.
+        """
+        with self._lock:
+            return StatementCacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """Removes every cached statement and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
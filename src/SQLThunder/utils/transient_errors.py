@@ -0,0 +1,65 @@
+### --- Standard library imports --- ###
+import builtins
+
+### --- Third-party imports --- ###
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+### --- Utils --- ###
+
+# SQLSTATE codes of transient errors: serialization failure, deadlock, lock not available,
+# statement timeout / cancel, connection failures and admin shutdown
+TRANSIENT_SQLSTATES = frozenset(
+    {"40001", "40P01", "55P03", "57014", "57P01", "08000", "08003", "08006"}
+)
+
+# MySQL error numbers of transient errors: lock wait timeout, deadlock, too many connections,
+# server gone away, lost connection, max execution time exceeded
+TRANSIENT_MYSQL_ERRNOS = frozenset({1205, 1213, 1040, 2006, 2013, 3024})
+
+# Fallback on the message, for drivers without error codes (e.g. SQLite "database is locked")
+_TRANSIENT_MESSAGES = (
+    "deadlock",
+    "lock wait timeout",
+    "database is locked",
+    "could not serialize",
+    "timeout",
+    "timed out",
+    "connection reset",
+    "server has gone away",
+    "lost connection",
+)
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """
+    Tell whether an error is due to contention or to the connection rather than to the data.
+
+    Transient errors (deadlocks, lock and statement timeouts, pool timeouts, dropped connections) may
+    succeed when retried later or with less concurrency. Other errors (constraint violations, bad
+    values, syntax errors) fail the same way every time.
+
+    SQLAlchemy errors are classified on the DBAPI error they wrap: its SQLSTATE (`pgcode`/`sqlstate`),
+    its MySQL error number (first argument), then its message.
+
+    Args:
+        error (BaseException): The error raised while executing or fetching a chunk.
+
+    Returns:
+        bool: True if the error is transient.
+    """
+    if isinstance(error, (PoolTimeoutError, builtins.TimeoutError, ConnectionError)):
+        return True
+    if getattr(error, "connection_invalidated", False):
+        return True
+
+    original = getattr(error, "orig", None) or error
+    sqlstate = getattr(original, "pgcode", None) or getattr(original, "sqlstate", None)
+    if sqlstate in TRANSIENT_SQLSTATES:
+        return True
+
+    args = getattr(original, "args", ())
+    if args and isinstance(args[0], int) and args[0] in TRANSIENT_MYSQL_ERRNOS:
+        return True
+
+    message = str(original).lower()
+    return any(pattern in message for pattern in _TRANSIENT_MESSAGES)
@@ -83,6 +83,7 @@ def mysql_config_path(tmp_path_factory) -> Path:
         "host": "localhost",
         "port": 3307,
         "database": "test_db",
+        "local_infile": True,
     }
     return write_temp_config(tmp_path_factory.mktemp("configs"), config)
 
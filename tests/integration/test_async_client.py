@@ -0,0 +1,168 @@
+### --- Standard library imports --- ###
+import asyncio
+
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.core.async_client import AsyncDBClient
+from SQLThunder.exceptions import (
+    DBClientClosedError,
+    InvalidSQLOperation,
+    UnsupportedMultiThreadedDatabase,
+)
+
+pytest.importorskip("aiosqlite")
+
+### --- Helpers --- ###
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _create_table(client: AsyncDBClient, table: str) -> None:
+    await client.execute(f"DROP TABLE IF EXISTS {table}")
+    await client.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, name TEXT)")
+
+
+### --- Test AsyncDBClient (SQLite, aiosqlite) --- ###
+
+
+class TestAsyncDBClient:
+
+    def test_insert_and_query(self, sqlite_config_path):
+        async def scenario():
+            async with AsyncDBClient(str(sqlite_config_path)) as client:
+                await _create_table(client, "async_items")
+                df = pd.DataFrame(
+                    {"id": range(1, 101), "name": [f"n{i}" for i in range(100)]}
+                )
+                failures, success = await client.insert_many(
+                    df, "async_items", return_status=True
+                )
+                rows = await client.query(
+                    "SELECT * FROM async_items WHERE id <= ?", (2,), return_type="list"
+                )
+                return failures, success, rows
+
+        failures, success, rows = run(scenario())
+        assert failures.empty and success
+        assert rows == [{"id": 1, "name": "n0"}, {"id": 2, "name": "n1"}]
+
+    def test_query_keyed_and_iterators(self, sqlite_config_path):
+        async def scenario():
+            async with AsyncDBClient(str(sqlite_config_path)) as client:
+                await _create_table(client, "async_keyed")
+                df = pd.DataFrame({"id": range(1, 251), "name": ["x"] * 250})
+                await client.insert_many(df, "async_keyed", method="values")
+                keyed, last_key = await client.query_keyed(
+                    "SELECT * FROM async_keyed",
+                    key_column="id",
+                    key_column_type="int",
+                    chunk_size=100,
+                    return_last_key=True,
+                )
+                pages = [
+                    len(page)
+                    async for page in client.iter_keyed(
+                        "SELECT * FROM async_keyed", "id", "int", chunk_size=100
+                    )
+                ]
+                batches = [
+                    len(batch)
+                    async for batch in client.iter_query(
+                        "SELECT * FROM async_keyed", chunk_size=100
+                    )
+                ]
+                return keyed, last_key, pages, batches
+
+        keyed, last_key, pages, batches = run(scenario())
+        assert len(keyed) == 250 and last_key == 250
+        assert pages == [100, 100, 50]
+        assert batches == [100, 100, 50]
+
+    def test_concurrent_queries(self, sqlite_config_path):
+        async def scenario():
+            async with AsyncDBClient(str(sqlite_config_path)) as client:
+                return await asyncio.gather(
+                    *(
+                        client.query("SELECT 1 AS one", return_type="list")
+                        for _ in range(20)
+                    )
+                )
+
+        assert run(scenario()) == [[{"one": 1}]] * 20
+
+    def test_failed_execute_returns_failures(self, sqlite_config_path):
+        async def scenario():
+            async with AsyncDBClient(str(sqlite_config_path)) as client:
+                await _create_table(client, "async_dups")
+                await client.execute("INSERT INTO async_dups VALUES (1, 'a')")
+                return await client.execute(
+                    "INSERT INTO async_dups VALUES (:id, :name)",
+                    {"id": 1, "name": "b"},
+                    return_status=True,
+                )
+
+        failures, success = run(scenario())
+        assert not success
+        assert "error_message" in failures.columns
+
+    def test_batch_and_bulk_load_methods_raise(self, sqlite_config_path):
+        async def scenario():
+            async with AsyncDBClient(str(sqlite_config_path)) as client:
+                with pytest.raises(UnsupportedMultiThreadedDatabase):
+                    await client.query_batch("SELECT 1")
+                with pytest.raises(InvalidSQLOperation):
+                    await client.insert_many(
+                        pd.DataFrame({"id": [1]}), "t", method="copy"
+                    )
+
+        run(scenario())
+
+    def test_closed_client_raises(self, sqlite_config_path):
+        async def scenario():
+            client = AsyncDBClient(str(sqlite_config_path))
+            await client.close()
+            assert client.is_closed
+            assert not await client.test_connection()
+            with pytest.raises(DBClientClosedError):
+                await client.query("SELECT 1")
+
+        run(scenario())
+
+
+### --- Test AsyncDBClient batch arguments (MySQL, PostgreSQL) --- ###
+
+
+class TestAsyncBatchArguments:
+
+    @pytest.mark.parametrize(
+        "db, driver", [("mysql", "aiomysql"), ("postgres", "asyncpg")]
+    )
+    @pytest.mark.parametrize("chunk_size", [0, -5])
+    def test_invalid_chunk_size_raises(self, db_config_paths, db, driver, chunk_size):
+        pytest.importorskip(driver)
+        df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+        async def scenario():
+            async with AsyncDBClient(db_config_paths[db]) as client:
+                with pytest.raises(InvalidSQLOperation):
+                    await client.execute_batch(
+                        "INSERT INTO async_items VALUES (:id, :name)",
+                        df,
+                        chunk_size=chunk_size,
+                    )
+                for method in ("insert", "values"):
+                    with pytest.raises(InvalidSQLOperation):
+                        await client.insert_batch(
+                            df, "async_items", chunk_size=chunk_size, method=method
+                        )
+                with pytest.raises(InvalidSQLOperation):
+                    await client.query_batch(
+                        "SELECT * FROM async_items", chunk_size=chunk_size
+                    )
+
+        run(scenario())
@@ -82,6 +82,25 @@ class TestCLIExecute:
         assert res.returncode == 0
         assert "executed successfully" in res.stdout.lower()
 
+    def test_cli_execute_failure_exits_with_status_1(self, sqlite_config_path):
+        res = subprocess.run(
+            [
+                "python",
+                "-m",
+                "SQLThunder",
+                "execute",
+                "DELETE FROM missing_table",
+                "-c",
+                str(sqlite_config_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert res.returncode == 1
+        assert "statement failed" in res.stdout.lower()
+        assert "executed successfully" not in res.stdout.lower()
+
 
 ### --- Test CLI Insert --- ###
 
@@ -129,6 +148,56 @@ class TestCLIInsert:
 
         assert res.returncode == 0
 
+    @pytest.mark.parametrize("db_client", [{"db": "mysql"}], indirect=True)
+    def test_cli_insert_batch_bisect_failures(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        mysql_config_path,
+        sample_data_path,
+        tmp_path,
+    ):
+        # Bob already exists, Alice is in the same chunk
+        db_client.execute(
+            f"INSERT INTO {setup_test_table} (id, name, value, created_at) "
+            "VALUES (2, 'Bob', 200.0, '2023-01-02')"
+        )
+        failed_path = tmp_path / "failed.csv"
+        res = subprocess.run(
+            [
+                "python",
+                "-m",
+                "SQLThunder",
+                "insert",
+                sample_data_path,
+                setup_test_table,
+                "-c",
+                mysql_config_path,
+                "--batch",
+                "--chunk_size",
+                "2",
+                "--max_retries",
+                "2",
+                "--retry_backoff",
+                "0.01",
+                "--bisect_failures",
+                "--output",
+                "csv",
+                "--output_path",
+                str(failed_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert res.returncode == 0
+        assert pd.read_csv(failed_path)["id"].tolist() == [2]
+        out = db_client.query(
+            f"SELECT id FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert [row["id"] for row in out] == [1, 2]
+
 
 ### --- Test CLI Query --- ###
 
@@ -58,6 +58,23 @@ class TestExecute:
         )
         assert len(res[0]) == 1
 
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": "sqlite"}, {"db": "mysql"}, {"db": "postgres"}],
+        indirect=True,
+    )
+    def test_execute_status_only(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        sql = f"INSERT INTO {setup_test_table} VALUES (:id, :name, :value, :created_at)"
+        row = {"id": 1, "name": "A", "value": 1.0, "created_at": "2024-01-01"}
+        assert db_client.execute(
+            sql, args=row, return_failures=False, return_status=True
+        ) == (None, True)
+        assert db_client.execute(
+            sql, args=row, return_failures=False, return_status=True
+        ) == (None, False)
+
 
 ### --- Test Execute_many --- ###
 
@@ -111,6 +128,26 @@ class TestExecuteMany:
         with pytest.raises(BadArgumentsBulk):
             db_client.execute_many(sql, args=[])
 
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": "sqlite"}, {"db": "mysql"}, {"db": "postgres"}],
+        indirect=True,
+    )
+    def test_execute_many_status_only(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        sql = f"INSERT INTO {setup_test_table} VALUES (:id, :name, :value, :created_at)"
+        rows = [
+            {"id": 30, "name": "A", "value": 1, "created_at": "2024-01-01"},
+            {"id": 31, "name": "B", "value": 2, "created_at": "2024-01-02"},
+        ]
+        assert db_client.execute_many(
+            sql, args=rows, return_failures=False, return_status=True
+        ) == (None, True)
+        assert db_client.execute_many(
+            sql, args=rows, return_failures=False, return_status=True
+        ) == (None, False)
+
 
 ### --- Test Execute_batch --- ###
 
@@ -138,6 +175,50 @@ class TestExecuteBatch:
         )[0]["count"]
         assert count == len(large_dataframe)
 
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_execute_batch_auto_chunk_size(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+        failures, success = db_client.execute_batch(
+            sql,
+            args=large_dataframe.to_dict(orient="records"),
+            chunk_size="auto",
+            return_failures=True,
+            return_status=True,
+        )
+        assert success is True
+        assert failures is None or failures.empty
+        out = db_client.query(
+            f"SELECT id, name FROM {setup_test_table} ORDER BY id", return_type="df"
+        )
+        pd.testing.assert_frame_equal(
+            out, large_dataframe[["id", "name"]], check_dtype=False
+        )
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_execute_batch_auto_max_workers(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+        failures, success = db_client.execute_batch(
+            sql,
+            args=large_dataframe.iloc[:20_000],
+            chunk_size=500,
+            max_workers="auto",
+            return_failures=True,
+            return_status=True,
+        )
+        assert success is True
+        assert failures is None or failures.empty
+        info = db_client.concurrency_info()
+        assert info.max_limit == db_client._total_pool_capacity
+        assert 1 <= info.final <= info.peak <= info.max_limit
+
     @pytest.mark.parametrize(
         "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
     )
@@ -185,9 +266,153 @@ class TestExecuteBatch:
         assert "error_message" in failures.columns
         assert len(failures) >= 5
 
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_execute_batch_bisect_failures(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        executor,
+    ):
+        df = large_dataframe.iloc[:2000]
+        db_client.insert_many(df.iloc[[3, 1207]], setup_test_table)
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+        failures, success = db_client.execute_batch(
+            sql,
+            args=df,
+            chunk_size=500,
+            max_workers=2,
+            executor=executor,
+            max_retries=2,
+            retry_backoff=0.01,
+            bisect_failures=True,
+            return_failures=True,
+            return_status=True,
+        )
+        # Only the two duplicates fail, the other rows of their chunks are committed
+        assert success is False
+        assert sorted(failures["id"].tolist()) == [3, 1207]
+        assert sorted(failures["chunk_index"].tolist()) == [0, 2]
+        assert failures["error_message"].str.len().gt(0).all()
+        out = db_client.query(
+            f"SELECT id FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert [row["id"] for row in out] == list(range(2000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_execute_batch_status_only(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+        args = large_dataframe.iloc[:1000].to_dict(orient="records")
+        assert db_client.execute_batch(
+            sql, args=args, chunk_size=100, return_failures=False, return_status=True
+        ) == (None, True)
+        assert db_client.execute_batch(
+            sql, args=args, chunk_size=100, return_failures=False, return_status=True
+        ) == (None, False)
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_execute_batch_process_executor(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+        failures, success = db_client.execute_batch(
+            sql,
+            args=large_dataframe.iloc[:10000],
+            chunk_size=1000,
+            max_workers=2,
+            executor="process",
+            return_failures=True,
+            return_status=True,
+        )
+        assert success is True
+        assert failures is None or failures.empty
+        out = db_client.query(
+            f"SELECT id FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert [row["id"] for row in out] == list(range(10000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_execute_batch_process_failures_match_threads(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        df = large_dataframe.iloc[:2000]
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+
+        def run(executor):
+            # Rows 3 and 1207 already exist, so chunks 0 and 2 fail
+            db_client.execute(f"DELETE FROM {setup_test_table}")
+            db_client.insert_many(df.iloc[[3, 1207]], setup_test_table)
+            failures, success = db_client.execute_batch(
+                sql,
+                args=df,
+                chunk_size=500,
+                max_workers=2,
+                executor=executor,
+                return_failures=True,
+                return_status=True,
+            )
+            assert success is False
+            count = db_client.query(
+                f"SELECT COUNT(*) as count FROM {setup_test_table}",
+                return_type="list",
+            )[0]["count"]
+            assert count == 1002
+            assert failures["error_message"].str.len().gt(0).all()
+            return (
+                failures.drop(columns="error_message")
+                .sort_values("id")
+                .reset_index(drop=True)
+            )
+
+        thread_failures = run("thread")
+        process_failures = run("process")
+        assert sorted(set(thread_failures["chunk_index"])) == [0, 2]
+        assert len(thread_failures) == 1000
+        pd.testing.assert_frame_equal(
+            process_failures, thread_failures, check_dtype=False
+        )
+
     @pytest.mark.parametrize("db_client", [{"db": "sqlite"}], indirect=True)
     def test_execute_batch_raises_on_sqlite(self, db_client, setup_test_table):
         sql = f"INSERT INTO {setup_test_table} VALUES (:id, :name, :value, :created_at)"
         rows = [{"id": 1, "name": "X", "value": 10, "created_at": "2024-01-01"}]
         with pytest.raises(UnsupportedMultiThreadedDatabase):
             db_client.execute_batch(sql, args=rows)
+
+
+class TestStatementCache:
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": "sqlite"}, {"db": "mysql"}, {"db": "postgres"}],
+        indirect=True,
+    )
+    def test_repeated_statements_hit_the_cache(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        db_client.clear_statement_cache()
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (%s, %s, %s, %s)"
+        for i in range(5):
+            db_client.execute(sql, args=(i, f"name_{i}", 1.0, "2024-01-01"))
+        query_sql = f"SELECT COUNT(*) AS count FROM {setup_test_table} WHERE id >= ?"
+        counts = [
+            db_client.query(query_sql, args=(i,), return_type="list")[0]["count"]
+            for i in range(3)
+        ]
+        assert counts == [5, 4, 3]
+        info = db_client.statement_cache_info()
+        assert info.misses == 2
+        assert info.hits == 6
+        assert info.currsize == 2
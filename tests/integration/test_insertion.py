@@ -1,3 +1,6 @@
+### --- Standard library imports --- ###
+import os
+
 ### --- Third-party imports --- ###
 import pandas as pd
 import pytest
@@ -5,6 +8,7 @@ import pytest
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions.execution import (
     BadArgumentsBulk,
+    InvalidSQLOperation,
     UnsupportedDuplicateHandling,
     UnsupportedMultiThreadedDatabase,
 )
@@ -159,6 +163,44 @@ class TestInsertBatch:
         )[0]["count"]
         assert count == 100_000
 
+    @pytest.mark.parametrize(
+        "db_client, method",
+        [
+            ({"db": "mysql"}, "insert"),
+            ({"db": "mysql"}, "values"),
+            ({"db": "mysql"}, "load_data"),
+            ({"db": "postgres"}, "insert"),
+            ({"db": "postgres"}, "values"),
+            ({"db": "postgres"}, "copy"),
+        ],
+        indirect=["db_client"],
+    )
+    def test_auto_chunk_size(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        method,
+    ):
+        failures, success = db_client.insert_batch(
+            large_dataframe,
+            table_name=setup_test_table,
+            chunk_size="auto",
+            method=method,
+            return_failures=True,
+            return_status=True,
+        )
+        assert success is True
+        assert failures is None or failures.empty
+
+        out = db_client.query(
+            f"SELECT id, name FROM {setup_test_table} ORDER BY id", return_type="df"
+        )
+        pd.testing.assert_frame_equal(
+            out, large_dataframe[["id", "name"]], check_dtype=False
+        )
+
     @pytest.mark.parametrize(
         "db_client",
         [
@@ -227,9 +269,732 @@ class TestInsertBatch:
         assert failures.iloc[0]["id"] == 999
         assert "error_message" in failures.columns
 
+    @pytest.mark.parametrize(
+        "db_client",
+        [
+            {"db": "mysql"},
+            {"db": "postgres"},
+        ],
+        indirect=True,
+    )
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_auto_max_workers(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        executor,
+    ):
+        failures, success = db_client.insert_batch(
+            large_dataframe.iloc[:20_000],
+            table_name=setup_test_table,
+            chunk_size=500,
+            max_workers="auto",
+            executor=executor,
+            return_failures=True,
+            return_status=True,
+        )
+        assert success is True
+        assert failures is None or failures.empty
+
+        info = db_client.concurrency_info()
+        assert info.max_limit == (
+            db_client._total_pool_capacity
+            if executor == "thread"
+            else (os.cpu_count() or 1)
+        )
+        assert 1 <= info.final <= info.peak <= info.max_limit
+
+        count = db_client.query(
+            f"SELECT COUNT(*) as count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 20_000
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [
+            {"db": "mysql"},
+            {"db": "postgres"},
+        ],
+        indirect=True,
+    )
+    def test_process_executor_large_dataset(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        failures, success = db_client.insert_batch(
+            large_dataframe,
+            table_name=setup_test_table,
+            chunk_size=5000,
+            max_workers=2,
+            executor="process",
+            return_failures=True,
+            return_status=True,
+        )
+        assert success is True
+        assert failures is None or failures.empty
+
+        count = db_client.query(
+            f"SELECT COUNT(*) as count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 100_000
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [
+            {"db": "mysql"},
+            {"db": "postgres"},
+        ],
+        indirect=True,
+    )
+    def test_process_executor_failures_match_threads(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        df = large_dataframe.iloc[:2000]
+
+        def run(executor):
+            # Rows 3 and 1207 already exist, so chunks 0 and 2 fail
+            db_client.execute(f"DELETE FROM {setup_test_table}")
+            db_client.insert_many(df.iloc[[3, 1207]], setup_test_table)
+            failures, success = db_client.insert_batch(
+                df,
+                setup_test_table,
+                chunk_size=500,
+                max_workers=2,
+                executor=executor,
+                return_failures=True,
+                return_status=True,
+            )
+            assert success is False
+            count = db_client.query(
+                f"SELECT COUNT(*) as count FROM {setup_test_table}",
+                return_type="list",
+            )[0]["count"]
+            assert count == 1002
+            assert failures["error_message"].str.len().gt(0).all()
+            return (
+                failures.drop(columns="error_message")
+                .sort_values("id")
+                .reset_index(drop=True)
+            )
+
+        thread_failures = run("thread")
+        process_failures = run("process")
+        assert sorted(set(thread_failures["chunk_index"])) == [0, 2]
+        assert len(thread_failures) == 1000
+        pd.testing.assert_frame_equal(
+            process_failures, thread_failures, check_dtype=False
+        )
+
+    @pytest.mark.parametrize(
+        "db_client, method",
+        [
+            ({"db": "mysql"}, "insert"),
+            ({"db": "mysql"}, "values"),
+            ({"db": "mysql"}, "load_data"),
+            ({"db": "postgres"}, "insert"),
+            ({"db": "postgres"}, "values"),
+            ({"db": "postgres"}, "copy"),
+        ],
+        indirect=["db_client"],
+    )
+    def test_bisect_failures(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        method,
+    ):
+        df = large_dataframe.iloc[:2000]
+        db_client.insert_many(df.iloc[[3, 1207]], setup_test_table)
+        failures, success = db_client.insert_batch(
+            df,
+            setup_test_table,
+            chunk_size=500,
+            max_workers=2,
+            method=method,
+            max_retries=2,
+            retry_backoff=0.01,
+            bisect_failures=True,
+            return_failures=True,
+            return_status=True,
+        )
+        # Only the two duplicates fail, the other rows of their chunks are committed
+        assert success is False
+        assert sorted(failures["id"].tolist()) == [3, 1207]
+        assert sorted(failures["chunk_index"].tolist()) == [0, 2]
+        assert failures["error_message"].str.len().gt(0).all()
+        out = db_client.query(
+            f"SELECT id FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert [row["id"] for row in out] == list(range(2000))
+
     @pytest.mark.parametrize("db_client", [{"db": "sqlite"}], indirect=True)
     def test_raises_on_sqlite(
         self, db_client, setup_test_table, truncate_test_table, large_dataframe
     ):
         with pytest.raises(UnsupportedMultiThreadedDatabase):
             db_client.insert_batch(large_dataframe, setup_test_table)
+
+
+### --- Test multi-row VALUES inserts --- ###
+
+
+class TestInsertValues:
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": "sqlite"}, {"db": "mysql"}, {"db": "postgres"}],
+        indirect=True,
+    )
+    def test_insert_many_values_with_remainder(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        df = large_dataframe.iloc[:2500]  # Two full statements and a partial one
+        failures, success = db_client.insert_many(
+            df, setup_test_table, method="values", return_status=True
+        )
+        assert success is True
+        assert failures.empty
+
+        out = db_client.query(
+            f"SELECT COUNT(*) AS count, MAX(id) AS max_id FROM {setup_test_table}",
+            return_type="list",
+        )[0]
+        assert out["count"] == 2500
+        assert out["max_id"] == 2499
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_insert_batch_values_large_dataset(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        failures, success = db_client.insert_batch(
+            large_dataframe,
+            setup_test_table,
+            chunk_size=5000,
+            method="values",
+            return_status=True,
+        )
+        assert success is True
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 100_000
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": "sqlite"}, {"db": "mysql"}, {"db": "postgres"}],
+        indirect=True,
+    )
+    def test_values_on_duplicate_ignore(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df1 = pd.DataFrame(
+            [{"id": 1, "name": "X", "value": 1.0, "created_at": "2024-01-01"}]
+        )
+        df2 = pd.DataFrame(
+            [
+                {"id": 1, "name": "Y", "value": 2.0, "created_at": "2024-01-02"},
+                {"id": 2, "name": "Z", "value": None, "created_at": None},
+            ]
+        )
+        db_client.insert_many(df1, setup_test_table, method="values")
+        failures, success = db_client.insert_many(
+            df2,
+            setup_test_table,
+            method="values",
+            on_duplicate="ignore",
+            return_status=True,
+        )
+        assert success is True
+
+        out = db_client.query(
+            f"SELECT * FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert [row["name"] for row in out] == ["X", "Z"]
+        assert out[1]["value"] is None
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": "sqlite"}, {"db": "mysql"}, {"db": "postgres"}],
+        indirect=True,
+    )
+    def test_values_duplicate_fails_without_on_duplicate(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [
+                {"id": i, "name": "x", "value": 1.0, "created_at": "2024-01-01"}
+                for i in (1, 2, 2)
+            ]
+        )
+        failures, success = db_client.insert_many(
+            df, setup_test_table, method="values", return_status=True
+        )
+        assert success is False
+        assert len(failures) == 3
+        assert "error_message" in failures.columns
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_insert_batch_values_binds_datetimes_alike_in_every_chunk(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        # The first chunk only has midnight values, the second one does not
+        df = pd.DataFrame(
+            {
+                "id": [0, 1, 2, 3],
+                "name": pd.to_datetime(
+                    ["2024-01-01", "2024-01-02", "2024-01-03 05:00", "2024-01-04"],
+                    format="ISO8601",
+                ),
+            }
+        )
+        failures, success = db_client.insert_batch(
+            df, setup_test_table, chunk_size=2, method="values", return_status=True
+        )
+        assert success is True
+
+        out = db_client.query(
+            f"SELECT name FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        # Stored as text: dates would lose the time part in the first chunk
+        assert [row["name"][:19] for row in out] == [
+            "2024-01-01 00:00:00",
+            "2024-01-02 00:00:00",
+            "2024-01-03 05:00:00",
+            "2024-01-04 00:00:00",
+        ]
+
+
+### --- Test COPY bulk load --- ###
+
+
+class TestInsertCopy:
+
+    @pytest.mark.parametrize("db_client", [{"db": "postgres"}], indirect=True)
+    def test_insert_batch_copy_large_dataset(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        failures, success = db_client.insert_batch(
+            large_dataframe,
+            table_name=setup_test_table,
+            chunk_size=20_000,
+            method="copy",
+            return_status=True,
+        )
+        assert success is True
+        assert failures.empty
+
+        out = db_client.query(
+            f"SELECT COUNT(*) AS count, MAX(id) AS max_id FROM {setup_test_table}",
+            return_type="list",
+        )[0]
+        assert out["count"] == 100_000
+        assert out["max_id"] == 99_999
+
+    @pytest.mark.parametrize("db_client", [{"db": "postgres"}], indirect=True)
+    def test_insert_many_copy_special_values(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [
+                {"id": 1, "name": 'a,"b"\nc', "value": None, "created_at": None},
+                {"id": 2, "name": None, "value": 2.5, "created_at": "2024-01-02"},
+                {"id": 3, "name": "\\N", "value": 3.0, "created_at": "2024-01-03"},
+                {"id": 4, "name": "", "value": 4.0, "created_at": "2024-01-04"},
+            ]
+        )
+        failures, success = db_client.insert_many(
+            df, setup_test_table, method="copy", return_status=True
+        )
+        assert success is True
+
+        out = db_client.query(
+            f"SELECT * FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert out[0]["name"] == 'a,"b"\nc'
+        assert out[0]["value"] is None and out[0]["created_at"] is None
+        assert out[1]["name"] is None
+        assert out[2]["name"] == "\\N"
+        assert out[3]["name"] == ""
+
+    @pytest.mark.parametrize("db_client", [{"db": "postgres"}], indirect=True)
+    def test_copy_on_duplicate_ignore(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df1 = pd.DataFrame(
+            [{"id": 10, "name": "Foo", "value": 5.0, "created_at": "2024-01-01"}]
+        )
+        df2 = pd.DataFrame(
+            [
+                {"id": 10, "name": "Bar", "value": 8.8, "created_at": "2024-01-02"},
+                {"id": 11, "name": "Baz", "value": 1.0, "created_at": "2024-01-02"},
+            ]
+        )
+        db_client.insert_many(df1, setup_test_table, method="copy")
+
+        failures, success = db_client.insert_batch(
+            df2,
+            setup_test_table,
+            chunk_size=1,
+            method="copy",
+            on_duplicate="ignore",
+            return_status=True,
+        )
+        assert success is True
+
+        out = db_client.query(
+            f"SELECT * FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert [row["name"] for row in out] == ["Foo", "Baz"]
+
+        with pytest.raises(UnsupportedDuplicateHandling):
+            db_client.insert_many(
+                df2, setup_test_table, method="copy", on_duplicate="replace"
+            )
+
+    @pytest.mark.parametrize("db_client", [{"db": "postgres"}], indirect=True)
+    def test_copy_failed_chunk_reported(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [
+                {"id": i, "name": "x", "value": 1.0, "created_at": "2024-01-01"}
+                for i in (1, 2, 2, 3)
+            ]
+        )
+        failures, success = db_client.insert_batch(
+            df,
+            setup_test_table,
+            chunk_size=2,
+            max_workers=1,  # chunk 0 loads first, chunk 1 holds the duplicate
+            method="copy",
+            return_status=True,
+        )
+        assert success is False
+        assert failures["id"].tolist() == [2, 3]
+        assert set(failures["chunk_index"]) == {1}
+        assert "error_message" in failures.columns
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "sqlite"}, {"db": "mysql"}], indirect=True
+    )
+    def test_copy_raises_outside_postgres(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [{"id": 1, "name": "x", "value": 1.0, "created_at": "2024-01-01"}]
+        )
+        with pytest.raises(InvalidSQLOperation):
+            db_client.insert_many(df, setup_test_table, method="copy")
+
+
+### --- Test LOAD DATA bulk load --- ###
+
+
+class TestInsertLoadData:
+
+    @pytest.mark.parametrize("db_client", [{"db": "mysql"}], indirect=True)
+    def test_insert_batch_load_data_large_dataset(
+        self, db_client, setup_test_table, truncate_test_table, large_dataframe
+    ):
+        failures, success = db_client.insert_batch(
+            large_dataframe,
+            table_name=setup_test_table,
+            chunk_size=20_000,
+            method="load_data",
+            return_status=True,
+        )
+        assert success is True
+        assert failures.empty
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 100_000
+
+    @pytest.mark.parametrize("db_client", [{"db": "mysql"}], indirect=True)
+    def test_insert_many_load_data_special_values(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [
+                {"id": 1, "name": "a\tb\\c\nd", "value": None, "created_at": None},
+                {"id": 2, "name": None, "value": 2.5, "created_at": "2024-01-02"},
+            ]
+        )
+        failures, success = db_client.insert_many(
+            df, setup_test_table, method="load_data", return_status=True
+        )
+        assert success is True
+
+        out = db_client.query(
+            f"SELECT * FROM {setup_test_table} ORDER BY id", return_type="list"
+        )
+        assert out[0]["name"] == "a\tb\\c\nd"
+        assert out[0]["value"] is None and out[0]["created_at"] is None
+        assert out[1]["name"] is None
+
+    @pytest.mark.parametrize("db_client", [{"db": "mysql"}], indirect=True)
+    @pytest.mark.parametrize("mode", ["ignore", "replace"])
+    def test_load_data_on_duplicate_modes(
+        self, db_client, setup_test_table, truncate_test_table, mode
+    ):
+        df1 = pd.DataFrame(
+            [{"id": 10, "name": "Foo", "value": 5.0, "created_at": "2024-01-01"}]
+        )
+        df2 = pd.DataFrame(
+            [{"id": 10, "name": "Bar", "value": 8.8, "created_at": "2024-01-02"}]
+        )
+        db_client.insert_many(df1, setup_test_table, method="load_data")
+
+        failures, success = db_client.insert_batch(
+            df2,
+            setup_test_table,
+            method="load_data",
+            on_duplicate=mode,
+            return_status=True,
+        )
+        assert success is True
+
+        out = db_client.query(
+            f"SELECT * FROM {setup_test_table} WHERE id = 10", return_type="list"
+        )[0]
+        assert out["name"] == ("Foo" if mode == "ignore" else "Bar")
+
+    @pytest.mark.parametrize("db_client", [{"db": "mysql"}], indirect=True)
+    def test_load_data_duplicate_fails_without_on_duplicate(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [
+                {"id": i, "name": "x", "value": 1.0, "created_at": "2024-01-01"}
+                for i in (1, 2, 2, 3)
+            ]
+        )
+        failures, success = db_client.insert_batch(
+            df,
+            setup_test_table,
+            chunk_size=2,
+            max_workers=1,  # chunk 0 loads first, chunk 1 holds the duplicate
+            method="load_data",
+            return_status=True,
+        )
+        assert success is False
+        assert failures["id"].tolist() == [2, 3]
+        assert set(failures["chunk_index"]) == {1}
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 2
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "sqlite"}, {"db": "postgres"}], indirect=True
+    )
+    def test_load_data_raises_outside_mysql(
+        self, db_client, setup_test_table, truncate_test_table
+    ):
+        df = pd.DataFrame(
+            [{"id": 1, "name": "x", "value": 1.0, "created_at": "2024-01-01"}]
+        )
+        with pytest.raises(InvalidSQLOperation):
+            db_client.insert_many(df, setup_test_table, method="load_data")
+
+
+### --- Test streamed file insert --- ###
+
+
+class TestInsertFile:
+
+    @pytest.mark.parametrize(
+        "db_client, batch",
+        [
+            ({"db": "sqlite"}, False),
+            ({"db": "mysql"}, True),
+            ({"db": "postgres"}, True),
+        ],
+        indirect=["db_client"],
+    )
+    def test_insert_csv_in_chunks(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        tmp_path,
+        batch,
+    ):
+        path = tmp_path / "data.csv"
+        large_dataframe.iloc[:25_000].to_csv(path, index=False)
+
+        failures, success = db_client.insert_file(
+            str(path),
+            setup_test_table,
+            read_chunk_size=10_000,
+            batch=batch,
+            chunk_size=2000,
+            return_status=True,
+        )
+        assert success is True
+        assert failures.empty
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 25_000
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_insert_csv_auto_chunk_size(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        tmp_path,
+    ):
+        path = tmp_path / "data.csv"
+        large_dataframe.iloc[:25_000].to_csv(path, index=False)
+
+        failures, success = db_client.insert_file(
+            str(path),
+            setup_test_table,
+            read_chunk_size=10_000,
+            chunk_size="auto",
+            return_status=True,
+        )
+        assert success is True
+        assert failures.empty
+
+        out = db_client.query(
+            f"SELECT id, name FROM {setup_test_table} ORDER BY id", return_type="df"
+        )
+        pd.testing.assert_frame_equal(
+            out, large_dataframe[["id", "name"]].iloc[:25_000], check_dtype=False
+        )
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_insert_csv_auto_max_workers_shares_one_limiter(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        tmp_path,
+        monkeypatch,
+    ):
+        path = tmp_path / "data.csv"
+        large_dataframe.iloc[:25_000].to_csv(path, index=False)
+
+        limiters = []
+        create_limiter = db_client._concurrency_limiter
+
+        def spy(*args, **kwargs):
+            limiter = create_limiter(*args, **kwargs)
+            limiters.append(limiter)
+            return limiter
+
+        monkeypatch.setattr(db_client, "_concurrency_limiter", spy)
+        failures, success = db_client.insert_file(
+            str(path),
+            setup_test_table,
+            read_chunk_size=5000,
+            chunk_size=500,
+            max_workers="auto",
+            return_status=True,
+        )
+        assert success is True
+        assert failures.empty
+
+        # insert_file and each of its 5 file chunks got the same limiter
+        assert len(limiters) == 6
+        assert all(limiter is limiters[0] for limiter in limiters)
+        assert db_client.concurrency_info() == limiters[0].info()
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 25_000
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_insert_csv_bisect_failures(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        tmp_path,
+        executor,
+    ):
+        path = tmp_path / "data.csv"
+        large_dataframe.iloc[:3000].to_csv(path, index=False)
+        db_client.insert_many(large_dataframe.iloc[[3, 2500]], setup_test_table)
+
+        failures, success = db_client.insert_file(
+            str(path),
+            setup_test_table,
+            read_chunk_size=1000,
+            chunk_size=250,
+            max_workers=2,
+            executor=executor,
+            max_retries=2,
+            retry_backoff=0.01,
+            bisect_failures=True,
+            return_status=True,
+        )
+        assert success is False
+        assert failures["id"].tolist() == [3, 2500]
+        assert failures["file_chunk_index"].tolist() == [0, 2]
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 3000
+
+    @pytest.mark.parametrize("db_client", [{"db": "sqlite"}], indirect=True)
+    def test_failures_are_consolidated(
+        self, db_client, setup_test_table, truncate_test_table, tmp_path
+    ):
+        path = tmp_path / "data.csv"
+        pd.DataFrame(
+            [
+                {"id": i, "name": "x", "value": 1.0, "created_at": "2024-01-01"}
+                for i in (1, 2, 3, 3, 4, 5)
+            ]
+        ).to_csv(path, index=False)
+
+        failures, success = db_client.insert_file(
+            str(path),
+            setup_test_table,
+            read_chunk_size=2,
+            batch=False,
+            return_status=True,
+        )
+        assert success is False
+        assert failures["id"].tolist() == [3, 3]
+        assert set(failures["file_chunk_index"]) == {1}
+
+        count = db_client.query(
+            f"SELECT COUNT(*) AS count FROM {setup_test_table}", return_type="list"
+        )[0]["count"]
+        assert count == 4
+
+    @pytest.mark.parametrize("db_client", [{"db": "sqlite"}], indirect=True)
+    def test_batch_raises_on_sqlite(self, db_client, setup_test_table, tmp_path):
+        path = tmp_path / "data.csv"
+        pd.DataFrame([{"id": 1}]).to_csv(path, index=False)
+        with pytest.raises(UnsupportedMultiThreadedDatabase):
+            db_client.insert_file(str(path), setup_test_table)
@@ -0,0 +1,138 @@
+### --- Third-party imports --- ###
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.core.client import DBClient
+
+### --- Fixtures --- ###
+
+
+@pytest.fixture
+def progress_client(db_client, db_config_paths):
+    """
+    Second client on the same database as db_client, reporting progress to a list.
+
+    Yields:
+        tuple[DBClient, list[ProgressEvent]]: The client and the events it reported.
+    """
+    db = "mysql" if db_client._db_type == "mysql" else "postgres"
+    events = []
+    client = DBClient(config_file_path=db_config_paths[db], progress=events.append)
+    yield client, events
+    client.close()
+
+
+def _operations(events):
+    """Group events by operation, in the order the operations started."""
+    operations = {}
+    for event in events:
+        operations.setdefault(event.operation_id, []).append(event)
+    return list(operations.values())
+
+
+def _check_operation(events, description, total_chunks, rows):
+    """Check one operation reports its start, each chunk once, then its finish."""
+    assert all(e.description == description for e in events)
+    assert all(e.total_chunks == total_chunks for e in events)
+    assert events[0].chunks == 0 and events[0].rows == 0
+    assert not any(e.finished for e in events[:-1])
+    assert events[-1].finished
+    # One event per chunk, then the finish event repeats the final counts
+    chunks = [e.chunks for e in events[1:-1]]
+    assert chunks == list(range(1, len(chunks) + 1))
+    assert (events[-1].chunks, events[-1].rows) == (chunks[-1], events[-2].rows)
+    assert events[-1].rows == rows
+    return len(chunks)
+
+
+### --- Test Progress Events --- ###
+
+
+class TestProgressEvents:
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_execute_batch(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        progress_client,
+    ):
+        client, events = progress_client
+        sql = f"INSERT INTO {setup_test_table} (id, name, value, created_at) VALUES (:id, :name, :value, :created_at)"
+        client.execute_batch(sql, args=large_dataframe.iloc[:10_000], chunk_size=1000)
+
+        (operation,) = _operations(events)
+        assert _check_operation(operation, "Inserting chunks", 10, 10_000) == 10
+        assert all(
+            later.rows - earlier.rows == 1000
+            for earlier, later in zip(operation[:-2], operation[1:-1])
+        )
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    @pytest.mark.parametrize("key_column", [None, "id"])
+    def test_query_batch(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        progress_client,
+        key_column,
+    ):
+        db_client.insert_many(large_dataframe.iloc[:10_000], setup_test_table)
+        client, events = progress_client
+        df = client.query_batch(
+            f"SELECT * FROM {setup_test_table}",
+            chunk_size=1000,
+            max_workers=4,
+            key_column=key_column,
+        )
+        assert len(df) == 10_000
+
+        (operation,) = _operations(events)
+        if key_column is None:
+            # Workers claim offsets until an empty chunk, the total is not known
+            assert _check_operation(operation, "Querying chunks", None, 10_000) == 10
+        else:
+            total = operation[0].total_chunks
+            assert total is not None
+            assert (
+                _check_operation(operation, "Querying chunks", total, 10_000) == total
+            )
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": "mysql"}, {"db": "postgres"}], indirect=True
+    )
+    def test_insert_file(
+        self,
+        db_client,
+        setup_test_table,
+        truncate_test_table,
+        large_dataframe,
+        progress_client,
+        tmp_path,
+    ):
+        path = tmp_path / "data.csv"
+        large_dataframe.iloc[:25_000].to_csv(path, index=False)
+        client, events = progress_client
+        client.insert_file(
+            str(path), setup_test_table, read_chunk_size=10_000, chunk_size=2000
+        )
+
+        # The file operation, then one insert_batch operation per file chunk
+        file_operation, *batch_operations = _operations(events)
+        assert all(e.unit == "file chunk" for e in file_operation)
+        assert _check_operation(file_operation, "Inserting file", None, 25_000) == 3
+        assert [
+            _check_operation(operation, "Inserting chunks", total, rows)
+            for operation, total, rows in zip(
+                batch_operations, [5, 5, 3], [10_000, 10_000, 5000]
+            )
+        ] == [5, 5, 3]
+        assert len(batch_operations) == 3
@@ -4,7 +4,9 @@ import pytest
 
 ### --- Internal package imports --- ###
 from SQLThunder.exceptions.execution import (
+    InvalidSQLOperation,
     QueryDisallowedClauseError,
+    QueryExecutionError,
     QueryResultFormatError,
     QuerySelectOnlyError,
     UnsupportedMultiThreadedDatabase,
@@ -73,6 +75,35 @@ class TestQuery:
         assert hasattr(res[0], "_mapping")
         assert res[0][0] == 20
 
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_query_return_type_arrow(self, db_client, setup_test_table):
+        pa = pytest.importorskip("pyarrow")
+        res = db_client.query(
+            f"SELECT * FROM {setup_test_table} WHERE id BETWEEN 30 AND 39",
+            return_type="arrow",
+        )
+        assert isinstance(res, pa.Table)
+        assert res.num_rows == 10
+        assert res.column("id").to_pylist() == list(range(30, 40))
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_query_return_type_df_arrow(self, db_client, setup_test_table):
+        pytest.importorskip("pyarrow")
+        res = db_client.query(
+            f"SELECT * FROM {setup_test_table} WHERE id < 10", return_type="df_arrow"
+        )
+        assert isinstance(res, pd.DataFrame)
+        assert len(res) == 10
+        assert isinstance(res["id"].dtype, pd.ArrowDtype)
+
     @pytest.mark.parametrize(
         "db_client",
         [{"db": db} for db in ("sqlite", "mysql", "postgres")],
@@ -141,6 +172,78 @@ class TestQuery:
             db_client.query("SELECT * FROM test_table", return_type="unsupported")
 
 
+### --- Test Iter_query --- ###
+
+
+class TestIterQuery:
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_query_yields_fixed_size_batches(self, db_client, setup_test_table):
+        batches = list(
+            db_client.iter_query(
+                f"SELECT * FROM {setup_test_table} ORDER BY id",
+                chunk_size=30_000,
+                return_type="df",
+            )
+        )
+        assert [len(batch) for batch in batches] == [30_000, 30_000, 30_000, 10_000]
+        assert all(isinstance(batch, pd.DataFrame) for batch in batches)
+        assert pd.concat(batches)["id"].tolist() == list(range(100_000))
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_query_aggregate_with_args(self, db_client, setup_test_table):
+        batches = list(
+            db_client.iter_query(
+                f"SELECT created_at, COUNT(*) AS n FROM {setup_test_table} "
+                "WHERE id < :max_id GROUP BY created_at",
+                args={"max_id": 1440 * 3},
+                chunk_size=2,
+                return_type="list",
+            )
+        )
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert all(row["n"] == 1440 for batch in batches for row in batch)
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_query_early_close_releases_connection(
+        self, db_client, setup_test_table
+    ):
+        batches = db_client.iter_query(
+            f"SELECT * FROM {setup_test_table}", chunk_size=100
+        )
+        next(batches)
+        batches.close()
+        assert db_client._engine.pool.checkedout() == 0
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_query_errors(self, db_client, setup_test_table):
+        with pytest.raises(QuerySelectOnlyError):
+            db_client.iter_query(f"DELETE FROM {setup_test_table}")
+        with pytest.raises(QueryResultFormatError):
+            db_client.iter_query(
+                f"SELECT * FROM {setup_test_table}", return_type="none"
+            )
+        batches = db_client.iter_query("SELECT * FROM nonexistent_table")
+        with pytest.raises(QueryExecutionError):
+            next(batches)
+
+
 ### --- Test Query_keyed --- ###
 
 
@@ -228,6 +331,24 @@ class TestQueryKeyed:
         )
         assert res is None
 
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_keyed_query_return_arrow(self, db_client, setup_test_table):
+        pa = pytest.importorskip("pyarrow")
+        res = db_client.query_keyed(
+            f"SELECT * FROM {setup_test_table}",
+            key_column="id",
+            key_column_type="int",
+            end_key=999,
+            chunk_size=300,
+            return_type="arrow",
+        )
+        assert isinstance(res, pa.Table)
+        assert res.column("id").to_pylist() == list(range(1000))
+
     @pytest.mark.parametrize(
         "db_client",
         [{"db": db} for db in ("sqlite", "mysql", "postgres")],
@@ -294,6 +415,179 @@ class TestQueryKeyed:
             )
 
 
+### --- Test Iter_keyed --- ###
+
+
+class TestIterKeyed:
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_keyed_yields_pages_in_key_order(self, db_client, setup_test_table):
+        pages = list(
+            db_client.iter_keyed(
+                sql=f"SELECT * FROM {setup_test_table}",
+                key_column="id",
+                key_column_type="int",
+                chunk_size=30_000,
+                return_type="df",
+            )
+        )
+        assert [len(page) for page in pages] == [30_000, 30_000, 30_000, 10_000]
+        assert all(isinstance(page, pd.DataFrame) for page in pages)
+        ids = pd.concat(pages)["id"]
+        assert ids.is_monotonic_increasing
+        assert len(ids) == 100_000
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_keyed_desc_with_bounds_return_list(self, db_client, setup_test_table):
+        pages = list(
+            db_client.iter_keyed(
+                sql=f"SELECT * FROM {setup_test_table}",
+                key_column="id",
+                key_column_type="int",
+                start_key=999,
+                end_key=500,
+                order="desc",
+                chunk_size=200,
+                return_type="list",
+            )
+        )
+        assert [len(page) for page in pages] == [200, 200, 100]
+        assert isinstance(pages[0][0], dict)
+        assert pages[0][0]["id"] == 999
+        assert pages[-1][-1]["id"] == 500
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_keyed_validates_eagerly(self, db_client, setup_test_table):
+        with pytest.raises(QueryDisallowedClauseError):
+            db_client.iter_keyed(
+                sql=f"SELECT * FROM {setup_test_table} LIMIT 10",
+                key_column="id",
+                key_column_type="int",
+            )
+        with pytest.raises(QueryResultFormatError):
+            db_client.iter_keyed(
+                sql=f"SELECT * FROM {setup_test_table}",
+                key_column="id",
+                key_column_type="int",
+                return_type="none",
+            )
+
+    @pytest.mark.parametrize(
+        "db_client",
+        [{"db": db} for db in ("sqlite", "mysql", "postgres")],
+        indirect=True,
+    )
+    def test_iter_keyed_raises_on_failed_page(self, db_client, setup_test_table):
+        pages = db_client.iter_keyed(
+            sql="SELECT * FROM nonexistent_table",
+            key_column="id",
+            key_column_type="int",
+        )
+        with pytest.raises(QueryExecutionError):
+            next(pages)
+
+
+### --- Test Query_keyed_parallel --- ###
+
+
+class TestQueryKeyedParallel:
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_parallel_keyed_int_range_in_order(self, db_client, setup_test_table):
+        df, success = db_client.query_keyed_parallel(
+            sql=f"SELECT * FROM {setup_test_table}",
+            key_column="id",
+            key_column_type="int",
+            start_key=100,
+            end_key=20_099,
+            chunk_size=1000,
+            num_ranges=7,
+            return_status=True,
+        )
+        assert success is True
+        assert df["id"].tolist() == list(range(100, 20_100))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_parallel_keyed_desc_return_list(self, db_client, setup_test_table):
+        rows = db_client.query_keyed_parallel(
+            sql=f"SELECT * FROM {setup_test_table} WHERE id < :max_id",
+            key_column="id",
+            key_column_type="int",
+            start_key=5000,
+            end_key=0,
+            order="desc",
+            args={"max_id": 3000},
+            chunk_size=400,
+            num_ranges=4,
+            return_type="list",
+        )
+        assert [row["id"] for row in rows] == list(range(2999, -1, -1))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_parallel_keyed_date_range(self, db_client, setup_test_table):
+        df = db_client.query_keyed_parallel(
+            sql=f"SELECT * FROM {setup_test_table}",
+            key_column="created_at",
+            key_column_type="date",
+            start_key="2023-01-02",
+            end_key="2023-01-05",
+            chunk_size=2000,
+            num_ranges=4,
+        )
+        assert len(df) == 4 * 1440
+        assert df["created_at"].is_monotonic_increasing
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_parallel_keyed_requires_bounds(self, db_client, setup_test_table):
+        with pytest.raises(InvalidSQLOperation):
+            db_client.query_keyed_parallel(
+                sql=f"SELECT * FROM {setup_test_table}",
+                key_column="id",
+                key_column_type="int",
+                start_key=0,
+                end_key=None,
+            )
+        with pytest.raises(InvalidSQLOperation):
+            db_client.query_keyed_parallel(
+                sql=f"SELECT * FROM {setup_test_table}",
+                key_column="name",
+                key_column_type="string",
+                start_key="a",
+                end_key="z",
+            )
+
+    @pytest.mark.parametrize("db_client", [{"db": "sqlite"}], indirect=True)
+    def test_parallel_keyed_sqlite_raises(self, db_client, setup_test_table):
+        with pytest.raises(UnsupportedMultiThreadedDatabase):
+            db_client.query_keyed_parallel(
+                sql=f"SELECT * FROM {setup_test_table}",
+                key_column="id",
+                key_column_type="int",
+                start_key=0,
+                end_key=10,
+            )
+
+
 ### --- Test Query_batch --- ###
 
 
@@ -321,6 +615,166 @@ class TestQueryBatch:
         assert df["id"].min() == 1000
         assert df["id"].max() == 3000
 
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_key_ranges_full_table(self, db_client, setup_test_table):
+        df, success = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table}",
+            chunk_size=7000,
+            key_column="id",
+            return_status=True,
+        )
+        assert success is True
+        assert df["id"].tolist() == list(range(100_000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_key_ranges_with_filters(self, db_client, setup_test_table):
+        df = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table} WHERE id BETWEEN :low AND :high",
+            args={"low": 1000, "high": 3000},
+            chunk_size=300,
+            key_column="id",
+        )
+        assert df["id"].tolist() == list(range(1000, 3001))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_key_ranges_on_date_column(self, db_client, setup_test_table):
+        df = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table} WHERE id < 10000",
+            chunk_size=1000,
+            key_column="created_at",
+        )
+        assert len(df) == 10_000
+        assert df["created_at"].is_monotonic_increasing
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_key_ranges_empty_result(self, db_client, setup_test_table):
+        df, success = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table} WHERE id < 0",
+            key_column="id",
+            return_status=True,
+        )
+        assert success is True
+        assert df.empty
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    @pytest.mark.parametrize("chunk_size", [100, "auto"])
+    def test_query_batch_key_ranges_null_keys(
+        self, db_client, setup_test_table, chunk_size
+    ):
+        df, success = db_client.query_batch(
+            f"SELECT id, CASE WHEN id % 10 = 0 THEN NULL ELSE id END AS k "
+            f"FROM {setup_test_table} WHERE id < 1000",
+            chunk_size=chunk_size,
+            key_column="k",
+            return_status=True,
+        )
+        assert success is True
+        assert len(df) == 1000
+        assert df["k"].isna().sum() == 100
+        assert sorted(df["id"].tolist()) == list(range(1000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_auto_chunk_size_key_ranges(self, db_client, setup_test_table):
+        df, success = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table}",
+            chunk_size="auto",
+            max_workers=4,
+            key_column="id",
+            return_status=True,
+        )
+        assert success is True
+        assert df["id"].tolist() == list(range(100_000))
+        assert df["name"].tolist() == [f"name_{i}" for i in range(100_000)]
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_auto_chunk_size_offsets(self, db_client, setup_test_table):
+        df, success = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table} WHERE id < 30000",
+            chunk_size="auto",
+            max_workers=4,
+            return_status=True,
+        )
+        assert success is True
+        assert len(df) == 30_000
+        assert sorted(df["id"].tolist()) == list(range(30_000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    @pytest.mark.parametrize("key_column", [None, "id"])
+    def test_query_batch_auto_max_workers(
+        self, db_client, setup_test_table, key_column
+    ):
+        df = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table}",
+            chunk_size=2000,
+            max_workers="auto",
+            key_column=key_column,
+        )
+        assert sorted(df["id"].tolist()) == list(range(100_000))
+        info = db_client.concurrency_info()
+        assert info.max_limit == db_client._total_pool_capacity
+        assert 1 <= info.final <= info.peak <= info.max_limit
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_key_ranges_text_key_raises(self, db_client, setup_test_table):
+        with pytest.raises(InvalidSQLOperation):
+            db_client.query_batch(
+                f"SELECT * FROM {setup_test_table}", key_column="name"
+            )
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_key_ranges_return_arrow(self, db_client, setup_test_table):
+        pa = pytest.importorskip("pyarrow")
+        table = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table}",
+            chunk_size=7000,
+            key_column="id",
+            return_type="arrow",
+        )
+        assert isinstance(table, pa.Table)
+        assert table.column("id").to_pylist() == list(range(100_000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_return_df_arrow(self, db_client, setup_test_table):
+        pytest.importorskip("pyarrow")
+        df = db_client.query_batch(
+            f"SELECT * FROM {setup_test_table} WHERE id < 1000",
+            chunk_size=100,
+            return_type="df_arrow",
+        )
+        assert isinstance(df["id"].dtype, pd.ArrowDtype)
+        assert sorted(df["id"].tolist()) == list(range(1000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_query_batch_df_matches_query(self, db_client, setup_test_table):
+        sql = f"SELECT * FROM {setup_test_table} WHERE id < 5000"
+        expected = db_client.query(sql)
+        df = db_client.query_batch(sql, chunk_size=700, key_column="id")
+        pd.testing.assert_frame_equal(df, expected)
+
     @pytest.mark.parametrize(
         "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
     )
@@ -404,3 +858,83 @@ class TestQueryBatch:
             db_client.query_batch(
                 f"SELECT * FROM {setup_test_table} OFFSET 50", chunk_size=1000
             )
+
+
+### --- Test Iter_query_batch --- ###
+
+
+class TestIterQueryBatch:
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_iter_query_batch_key_ranges_in_order(self, db_client, setup_test_table):
+        chunks = list(
+            db_client.iter_query_batch(
+                f"SELECT * FROM {setup_test_table} WHERE id < 10000",
+                chunk_size=700,
+                max_workers=4,
+                key_column="id",
+                max_buffered_chunks=2,
+            )
+        )
+        assert len(chunks) > 1
+        assert pd.concat(chunks)["id"].tolist() == list(range(10_000))
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_iter_query_batch_offset_chunks_return_list(
+        self, db_client, setup_test_table
+    ):
+        chunks = list(
+            db_client.iter_query_batch(
+                f"SELECT * FROM {setup_test_table} WHERE id < 1000",
+                chunk_size=300,
+                max_workers=2,
+                return_type="list",
+            )
+        )
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        assert isinstance(chunks[0][0], dict)
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_iter_query_batch_early_close(self, db_client, setup_test_table):
+        chunks = db_client.iter_query_batch(
+            f"SELECT * FROM {setup_test_table}", chunk_size=1000, max_workers=2
+        )
+        assert len(next(chunks)) == 1000
+        chunks.close()
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    def test_iter_query_batch_failed_chunk_raises(self, db_client):
+        chunks = db_client.iter_query_batch(
+            "SELECT * FROM missing_table_iter_batch", max_workers=2
+        )
+        with pytest.raises(QueryExecutionError):
+            list(chunks)
+
+    @pytest.mark.parametrize(
+        "db_client", [{"db": db} for db in ("mysql", "postgres")], indirect=True
+    )
+    @pytest.mark.parametrize("key_column", [None, "id"])
+    @pytest.mark.parametrize("chunk_size", [0, -5])
+    def test_iter_query_batch_invalid_chunk_size_raises(
+        self, db_client, setup_test_table, key_column, chunk_size
+    ):
+        # Raised on the call, before the iterator is advanced
+        with pytest.raises(InvalidSQLOperation):
+            db_client.iter_query_batch(
+                f"SELECT * FROM {setup_test_table}",
+                chunk_size=chunk_size,
+                key_column=key_column,
+            )
+
+    @pytest.mark.parametrize("db_client", [{"db": "sqlite"}], indirect=True)
+    def test_iter_query_batch_sqlite_raises(self, db_client, setup_test_table):
+        with pytest.raises(UnsupportedMultiThreadedDatabase):
+            db_client.iter_query_batch(f"SELECT * FROM {setup_test_table}")
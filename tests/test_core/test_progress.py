@@ -0,0 +1,99 @@
+### --- Standard library imports --- ###
+import io
+import threading
+
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.core.progress import (
+    ProgressEvent,
+    TqdmProgress,
+    _payload_nbytes,
+    _ProgressTracker,
+)
+
+### --- Test Progress Tracker --- ###
+
+
+class TestProgressTracker:
+
+    def test_reports_start_updates_and_finish(self):
+        events = []
+        with _ProgressTracker(events.append, "Querying chunks", 2) as progress:
+            progress.update(rows=10)
+            progress.update(rows=5)
+        assert [e.chunks for e in events] == [0, 1, 2, 2]
+        assert [e.rows for e in events] == [0, 10, 15, 15]
+        assert [e.finished for e in events] == [False, False, False, True]
+        assert all(e.total_chunks == 2 for e in events)
+        assert len({e.operation_id for e in events}) == 1
+
+    def test_counts_dataframe_bytes(self):
+        events = []
+        df = pd.DataFrame({"a": range(100)})
+        with _ProgressTracker(events.append, "Inserting chunks") as progress:
+            progress.update(rows=len(df), payload=df)
+        assert events[-1].bytes == df["a"].nbytes
+
+    def test_no_callback_is_a_no_op(self):
+        with _ProgressTracker(None, "Querying chunks") as progress:
+            progress.update(rows=10, payload=object())
+
+    def test_thread_safe_updates(self):
+        events = []
+        with _ProgressTracker(events.append, "Querying chunks") as progress:
+            threads = [
+                threading.Thread(
+                    target=lambda: [progress.update(rows=1) for _ in range(200)]
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert events[-1].chunks == 800
+        assert events[-1].rows == 800
+
+    def test_operation_ids_are_unique(self):
+        first = _ProgressTracker(lambda e: None, "a")
+        second = _ProgressTracker(lambda e: None, "b")
+        assert first._operation_id != second._operation_id
+
+
+### --- Test Progress Event --- ###
+
+
+class TestProgressEvent:
+
+    def test_rates(self):
+        event = ProgressEvent(1, "op", "chunk", 4, None, 1000, 2000, 2.0, False)
+        assert event.chunks_per_second == 2.0
+        assert event.rows_per_second == 500.0
+        assert event.bytes_per_second == 1000.0
+
+    def test_rates_at_zero_elapsed(self):
+        event = ProgressEvent(1, "op", "chunk", 0, None, 0, 0, 0.0, False)
+        assert event.rows_per_second == 0.0
+
+    def test_payload_nbytes_unknown_is_zero(self):
+        assert _payload_nbytes([(1, 2)]) == 0
+
+
+### --- Test Tqdm Progress --- ###
+
+
+class TestTqdmProgress:
+
+    def test_draws_and_closes_one_bar_per_operation(self):
+        pytest.importorskip("tqdm")
+        stream = io.StringIO()
+        callback = TqdmProgress(file=stream)
+        with _ProgressTracker(callback, "Inserting chunks", 3) as progress:
+            for _ in range(3):
+                progress.update(rows=100)
+        assert "Inserting chunks" in stream.getvalue()
+        assert "3/3" in stream.getvalue()
+        assert callback._bars == {}
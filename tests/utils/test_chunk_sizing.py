@@ -0,0 +1,114 @@
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import InvalidSQLOperation
+from SQLThunder.utils.chunk_sizing import (
+    _AdaptiveChunkSizer,
+    _check_chunk_size,
+    _estimate_row_bytes,
+    _iter_adaptive_chunks,
+)
+
+### --- Test Check Chunk Size --- ###
+
+
+class TestCheckChunkSize:
+
+    @pytest.mark.parametrize("chunk_size", [1, 512, "auto"])
+    def test_valid(self, chunk_size):
+        _check_chunk_size(chunk_size)
+
+    @pytest.mark.parametrize("chunk_size", [0, -5, "fast", 1.5, True])
+    def test_invalid(self, chunk_size):
+        with pytest.raises(InvalidSQLOperation):
+            _check_chunk_size(chunk_size)
+
+
+### --- Test Adaptive Chunk Sizer --- ###
+
+
+class TestAdaptiveChunkSizer:
+
+    def test_grows_at_most_twice_per_chunk(self):
+        sizer = _AdaptiveChunkSizer(100, target_seconds=0.2)
+        sizer.record(rows=100, seconds=0.001)
+        assert sizer.size == 200
+
+    def test_shrinks_at_most_half_per_chunk(self):
+        sizer = _AdaptiveChunkSizer(1000, target_seconds=0.2, min_size=1)
+        sizer.record(rows=1000, seconds=10.0)
+        assert sizer.size == 500
+
+    def test_converges_to_target_duration(self):
+        # 10,000 rows/second and a 0.2 s target: 2,000 rows per chunk
+        sizer = _AdaptiveChunkSizer(100, target_seconds=0.2)
+        for _ in range(20):
+            size = sizer.size
+            sizer.record(rows=size, seconds=size / 10_000)
+        assert sizer.size == 2000
+
+    def test_row_bounds(self):
+        sizer = _AdaptiveChunkSizer(10, min_size=50, max_size=300)
+        assert sizer.size == 50
+        for _ in range(10):
+            sizer.record(rows=sizer.size, seconds=0.0001)
+        assert sizer.size == 300
+
+    def test_memory_cap(self):
+        sizer = _AdaptiveChunkSizer(10_000, max_bytes=1000, row_bytes=100)
+        assert sizer.size == 10
+        sizer.record(rows=10, seconds=0.0001, nbytes=10 * 400)
+        assert sizer.size < 10
+
+    def test_ignores_empty_chunks(self):
+        sizer = _AdaptiveChunkSizer(100)
+        sizer.record(rows=0, seconds=1.0)
+        assert sizer.size == 100
+        assert sizer.rows_per_second is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(InvalidSQLOperation):
+            _AdaptiveChunkSizer(100, target_seconds=0)
+        with pytest.raises(InvalidSQLOperation):
+            _AdaptiveChunkSizer(100, min_size=10, max_size=5)
+
+
+### --- Test Chunk Slicing --- ###
+
+
+class TestIterAdaptiveChunks:
+
+    def test_follows_size_changes(self):
+        sizer = _AdaptiveChunkSizer(2, min_size=1)
+        chunks = _iter_adaptive_chunks(list(range(10)), sizer)
+        assert next(chunks) == ([0, 1], 0)
+        sizer.record(rows=2, seconds=0.0001)
+        assert next(chunks) == ([2, 3, 4, 5], 1)
+        assert list(chunks) == [([6, 7, 8, 9], 2)]
+
+    def test_dataframe(self):
+        df = pd.DataFrame({"a": range(5)})
+        sizer = _AdaptiveChunkSizer(2, min_size=1)
+        chunks = list(_iter_adaptive_chunks(df, sizer))
+        assert [len(chunk) for chunk, _ in chunks] == [2, 2, 1]
+        assert [num for _, num in chunks] == [0, 1, 2]
+
+
+### --- Test Estimate Row Bytes --- ###
+
+
+class TestEstimateRowBytes:
+
+    def test_dataframe_counts_strings(self):
+        short = pd.DataFrame({"s": ["a"] * 10})
+        long = pd.DataFrame({"s": ["a" * 1000] * 10})
+        assert _estimate_row_bytes(long) > _estimate_row_bytes(short) + 900
+
+    def test_records(self):
+        assert _estimate_row_bytes([{"a": "x" * 100}, {"a": "x" * 100}]) > 100
+        assert _estimate_row_bytes([(1, 2)]) > 0
+
+    def test_empty(self):
+        assert _estimate_row_bytes([]) == 0
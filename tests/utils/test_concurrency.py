@@ -0,0 +1,190 @@
+### --- Standard library imports --- ###
+import threading
+import time
+from types import SimpleNamespace
+
+### --- Third-party imports --- ###
+import pytest
+import yaml
+
+### --- Internal package imports --- ###
+from SQLThunder.core.client import DBClient
+from SQLThunder.exceptions import InvalidSQLOperation
+from SQLThunder.utils import concurrency
+from SQLThunder.utils.concurrency import ConcurrencyInfo, _ConcurrencyLimiter
+
+### --- Test Concurrency Limiter --- ###
+
+
+class _Clock:
+    """Deterministic stand-in for time.perf_counter."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(concurrency, "time", SimpleNamespace(perf_counter=fake))
+    return fake
+
+
+def _run_window(
+    limiter: _ConcurrencyLimiter, clock: _Clock, rows: int, seconds: float
+) -> None:
+    """Records one full window of identical chunks, taking `seconds` of clock time."""
+    chunks = limiter.limit
+    clock.now += seconds
+    for _ in range(chunks):
+        limiter.record(rows, 0.001)
+
+
+class TestConcurrencyLimiter:
+
+    def test_initial_limit_is_capped(self):
+        assert _ConcurrencyLimiter(max_limit=1).limit == 1
+        assert _ConcurrencyLimiter(max_limit=10, initial=4).limit == 4
+
+    def test_invalid_bounds(self):
+        with pytest.raises(InvalidSQLOperation):
+            _ConcurrencyLimiter(max_limit=2, min_limit=3)
+        with pytest.raises(InvalidSQLOperation):
+            _ConcurrencyLimiter(max_limit=2, min_limit=0)
+
+    def test_additive_increase_while_throughput_improves(self, clock):
+        limiter = _ConcurrencyLimiter(max_limit=4, initial=1)
+        _run_window(limiter, clock, rows=100, seconds=0.01)
+        assert limiter.limit == 2
+        _run_window(limiter, clock, rows=1000, seconds=0.01)
+        assert limiter.limit == 3
+
+    def test_no_increase_when_throughput_is_flat(self, clock):
+        limiter = _ConcurrencyLimiter(max_limit=10, initial=2)
+        _run_window(limiter, clock, rows=100, seconds=0.02)
+        assert limiter.limit == 3
+        # Same rows per second with one more worker: no gain
+        _run_window(limiter, clock, rows=100 * 2 // 3, seconds=0.02)
+        assert limiter.limit <= 3
+
+    def test_never_exceeds_max_limit(self, clock):
+        limiter = _ConcurrencyLimiter(max_limit=3, initial=3)
+        _run_window(limiter, clock, rows=100, seconds=0.01)
+        assert limiter.limit == 3
+        assert limiter.info().peak == 3
+
+    def test_resume_ignores_pause(self, clock):
+        limiter = _ConcurrencyLimiter(max_limit=10, initial=2)
+        _run_window(limiter, clock, rows=100, seconds=0.01)
+        assert limiter.limit == 3
+        # Long pause between two runs sharing the limiter, then the same throughput
+        clock.now += 10.0
+        limiter.resume()
+        _run_window(limiter, clock, rows=100, seconds=0.015)
+        assert limiter.limit == 3
+        assert limiter.info().decreases == 0
+
+    def test_transient_error_halves_limit(self):
+        limiter = _ConcurrencyLimiter(max_limit=16, initial=8)
+        limiter.record(0, 1.0, failed=True, transient=True)
+        assert limiter.limit == 4
+        limiter.record(0, 1.0, failed=True, transient=True)
+        assert limiter.limit == 2
+
+    def test_data_error_is_ignored(self):
+        limiter = _ConcurrencyLimiter(max_limit=16, initial=8)
+        limiter.record(0, 1.0, failed=True, transient=False)
+        assert limiter.limit == 8
+
+    def test_latency_spike_halves_limit(self):
+        limiter = _ConcurrencyLimiter(max_limit=100, initial=100)
+        limiter.record(100, 0.1)
+        limiter.record(100, 1.0)
+        assert limiter.limit == 50
+
+    def test_min_limit(self):
+        limiter = _ConcurrencyLimiter(max_limit=8, initial=2, min_limit=2)
+        limiter.record(0, 1.0, failed=True, transient=True)
+        assert limiter.limit == 2
+
+    def test_info(self):
+        limiter = _ConcurrencyLimiter(max_limit=8, initial=4)
+        limiter.record(0, 1.0, failed=True, transient=True)
+        assert limiter.info() == ConcurrencyInfo(
+            initial=4, final=2, peak=4, max_limit=8, increases=0, decreases=1
+        )
+
+    def test_slot_bounds_running_chunks(self):
+        limiter = _ConcurrencyLimiter(max_limit=8, initial=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with limiter.slot():
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                time.sleep(0.01)
+                with lock:
+                    running.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) == 2
+
+
+### --- Test Concurrency Info --- ###
+
+
+@pytest.fixture
+def client(tmp_path):
+    """SQLite client, only used for its adaptive concurrency state (no query is run)."""
+    config_path = tmp_path / "db_config.yaml"
+    config_path.write_text(
+        yaml.dump({"db_type": "sqlite", "path": str(tmp_path / "test.db")})
+    )
+    db_client = DBClient(config_file_path=str(config_path))
+    yield db_client
+    db_client.close()
+
+
+class TestConcurrencyInfo:
+
+    def test_none_before_any_adaptive_batch(self, client):
+        assert client.concurrency_info() is None
+
+    def test_info_is_per_thread(self, client):
+        main_limiter = _ConcurrencyLimiter(max_limit=8, initial=4)
+        other_limiter = _ConcurrencyLimiter(max_limit=8, initial=2)
+        seen = []
+
+        def other_batch():
+            client._store_concurrency_info(other_limiter)
+            seen.append(client.concurrency_info())
+
+        client._store_concurrency_info(main_limiter)
+        thread = threading.Thread(target=other_batch)
+        thread.start()
+        thread.join()
+        assert seen == [other_limiter.info()]
+        assert client.concurrency_info() == main_limiter.info()
+
+    def test_shared_limiter_is_reused(self, client):
+        shared = _ConcurrencyLimiter(max_limit=8)
+        client._concurrency_state.shared_limiter = shared
+        try:
+            assert client._concurrency_limiter("auto") is shared
+            assert client._concurrency_limiter(4) is None
+            # Stored once by the operation that owns it
+            client._store_concurrency_info(shared)
+            assert client.concurrency_info() is None
+        finally:
+            client._concurrency_state.shared_limiter = None
+        assert client._concurrency_limiter("auto") is not shared
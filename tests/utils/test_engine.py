@@ -5,13 +5,20 @@ import sys
 import pytest
 
 from SQLThunder.exceptions import (
+    ConfigFileError,
     InvalidDatabaseConfiguration,
     MissingSQLitePath,
     UnsupportedDatabaseType,
 )
 
 ### --- Internal package imports --- ###
-from SQLThunder.utils.engine import _build_connect_args, _get_db_url
+from SQLThunder.utils.engine import (
+    _build_async_connect_args,
+    _build_connect_args,
+    _build_engine_kwargs,
+    _get_async_db_url,
+    _get_db_url,
+)
 
 ### --- Test Get DB URL --- ###
 
@@ -98,6 +105,11 @@ class TestBuildConnectArgs:
         assert res["connect_timeout"] == 7
         assert res["read_timeout"] == 20
         assert res["write_timeout"] == 25
+        assert "local_infile" not in res
+
+    def test_mysql_local_infile_opt_in(self):
+        res = _build_connect_args("pymysql", {}, {"local_infile": True})
+        assert res["local_infile"] is True
 
     def test_postgres_connect_args_with_ssl_and_metadata(self):
         ssl_paths = {
@@ -117,3 +129,93 @@ class TestBuildConnectArgs:
         assert res["sslkey"] == "/path/client.key"
         assert res["application_name"] == "myapp"
         assert res["options"] == "-c statement_timeout=5000"
+
+
+### --- Test Build Engine Kwargs --- ###
+
+
+class TestBuildEngineKwargs:
+
+    def test_disabled_by_default(self):
+        assert _build_engine_kwargs("psycopg2", {}) == {}
+
+    def test_postgres_values_plus_batch(self):
+        config = {
+            "fast_executemany": True,
+            "executemany_batch_page_size": 500,
+            "insertmanyvalues_page_size": 2000,
+        }
+        res = _build_engine_kwargs("psycopg2", config)
+        assert res["executemany_mode"] == "values_plus_batch"
+        assert res["executemany_batch_page_size"] == 500
+        assert 2000 in (
+            res.get("insertmanyvalues_page_size"),
+            res.get("executemany_values_page_size"),
+        )
+
+    @pytest.mark.parametrize("driver", ["pymysql", "sqlite"])
+    def test_no_psycopg2_options_on_other_drivers(self, driver):
+        res = _build_engine_kwargs(driver, {"fast_executemany": True})
+        assert "executemany_mode" not in res
+        assert "executemany_batch_page_size" not in res
+
+
+### --- Test Async DB URL and Connect Args --- ###
+
+
+class TestGetAsyncDBUrl:
+
+    CONFIG = {
+        "user": "user",
+        "password": "pass",
+        "host": "localhost",
+        "database": "testdb",
+        "connect_timeout": 5,
+    }
+
+    def test_postgres_asyncpg_without_timeout_query(self):
+        url, driver, db_type = _get_async_db_url(self.CONFIG, db_type="postgresql")
+        assert url.startswith("postgresql+asyncpg://")
+        assert "connect_timeout" not in url
+        assert driver == "asyncpg"
+        assert db_type == "postgresql"
+
+    def test_mysql_defaults_to_aiomysql(self):
+        url, driver, _ = _get_async_db_url(self.CONFIG, db_type="mysql")
+        assert url.startswith("mysql+aiomysql://")
+        assert driver == "aiomysql"
+
+    def test_mysql_asyncmy_opt_in(self):
+        config = {**self.CONFIG, "async_driver": "asyncmy"}
+        url, driver, _ = _get_async_db_url(config, db_type="mysql")
+        assert url.startswith("mysql+asyncmy://")
+        assert driver == "asyncmy"
+
+    def test_mysql_unknown_async_driver_raises(self):
+        config = {**self.CONFIG, "async_driver": "pymysql"}
+        with pytest.raises(ConfigFileError):
+            _get_async_db_url(config, db_type="mysql")
+
+    def test_sqlite_memory(self):
+        url, driver, _ = _get_async_db_url({"db_path": ":memory:"}, db_type="sqlite")
+        assert url == "sqlite+aiosqlite://"
+        assert driver == "aiosqlite"
+
+
+class TestBuildAsyncConnectArgs:
+
+    def test_sqlite_args(self):
+        assert _build_async_connect_args("aiosqlite", {}, {}) == {}
+
+    def test_mysql_timeout_and_local_infile(self):
+        res = _build_async_connect_args(
+            "aiomysql", {}, {"connect_timeout": 7, "local_infile": True}
+        )
+        assert res == {"connect_timeout": 7, "local_infile": True}
+
+    def test_postgres_ssl_mode_timeout_and_metadata(self):
+        config = {"ssl_mode": "require", "application_name": "myapp"}
+        res = _build_async_connect_args("asyncpg", {}, config)
+        assert res["ssl"] == "require"
+        assert res["timeout"] == 10
+        assert res["server_settings"] == {"application_name": "myapp"}
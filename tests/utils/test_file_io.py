@@ -1,5 +1,6 @@
 ### --- Standard library imports --- ###
 import os
+import sys
 from tempfile import TemporaryDirectory
 
 import pandas as pd
@@ -11,11 +12,12 @@ from SQLThunder.exceptions import (
     DataFileLoadErrorUnknown,
     DataFileNotFoundError,
     FileOutputSaveError,
+    MissingOptionalDependencyError,
     UnsupportedDataFormatError,
 )
 
 ### --- Internal package imports --- ###
-from SQLThunder.utils.file_io import load_data, save_dataframe
+from SQLThunder.utils.file_io import iter_data, load_data, save_dataframe
 
 ### --- Test Save df --- ###
 
@@ -52,6 +54,26 @@ class TestSaveDataFrame:
             save_dataframe(df, "csv", nested_path)
             assert os.path.exists(nested_path)
 
+    @pytest.mark.parametrize(
+        "output, ext", [("parquet", "parquet"), ("feather", "feather")]
+    )
+    def test_save_columnar_success(self, output, ext):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+        with TemporaryDirectory() as tmpdir:
+            out_path = os.path.join(tmpdir, f"test.{ext}")
+            save_dataframe(df, output, out_path)
+            pd.testing.assert_frame_equal(df, load_data(out_path))
+
+    def test_save_parquet_without_pyarrow_raises(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.dataset", None)
+        with TemporaryDirectory() as tmpdir:
+            with pytest.raises(FileOutputSaveError, match="pyarrow"):
+                save_dataframe(
+                    pd.DataFrame({"a": [1]}), "parquet", os.path.join(tmpdir, "x")
+                )
+
 
 ### --- Test Load df --- ###
 
@@ -93,3 +115,95 @@ class TestLoadData:
                 f.write("some\nbad\ncsv\nstructure\nwith,too,many,columns")
             with pytest.raises(DataFileLoadErrorUnknown):
                 load_data(broken_path)
+
+    @pytest.mark.parametrize("ext", ["parquet", "feather", "arrow"])
+    def test_load_columnar_with_projection_and_filters(self, ext):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"id": range(6), "year": [2022, 2023, 2024] * 2, "x": 1.0})
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, f"input.{ext}")
+            if ext == "parquet":
+                df.to_parquet(path, index=False)
+            else:
+                df.to_feather(path)
+            loaded = load_data(path, columns=["id"], filters=[("year", ">=", 2024)])
+        assert list(loaded.columns) == ["id"]
+        assert loaded["id"].tolist() == [2, 5]
+
+    def test_load_csv_with_columns(self):
+        df = pd.DataFrame({"c": [7, 8], "d": [9, 10]})
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.csv")
+            df.to_csv(path, index=False)
+            loaded = load_data(path, columns=["d"])
+        pd.testing.assert_frame_equal(df[["d"]], loaded)
+
+    def test_filters_on_csv_raise(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.csv")
+            pd.DataFrame({"c": [1]}).to_csv(path, index=False)
+            with pytest.raises(UnsupportedDataFormatError):
+                load_data(path, filters=[("c", "=", 1)])
+
+
+### --- Test Iter Data --- ###
+
+
+class TestIterData:
+
+    def test_iter_csv_in_chunks(self):
+        df = pd.DataFrame({"a": range(10), "b": list("abcdefghij")})
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.csv")
+            df.to_csv(path, index=False)
+            chunks = list(iter_data(path, chunk_size=4))
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    def test_iter_xlsx_in_chunks(self):
+        df = pd.DataFrame({"m": range(5), "n": [1.5, 2.5, None, 4.5, 5.5]})
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.xlsx")
+            df.to_excel(path, index=False)
+            chunks = list(iter_data(path, chunk_size=2))
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    def test_iter_parquet_in_chunks(self):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"x": range(7)})
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.parquet")
+            df.to_parquet(path, index=False)
+            chunks = list(iter_data(path, chunk_size=3))
+        assert [len(c) for c in chunks] == [3, 3, 1]
+
+    def test_iter_feather_in_chunks(self):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"x": range(5)})
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.feather")
+            df.to_feather(path)
+            chunks = list(iter_data(path, chunk_size=2))
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    def test_iter_parquet_without_pyarrow_raises(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.dataset", None)
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "input.parquet")
+            open(path, "wb").close()
+            with pytest.raises(MissingOptionalDependencyError):
+                list(iter_data(path, chunk_size=3))
+
+    def test_file_not_found_raises(self):
+        with pytest.raises(DataFileNotFoundError):
+            list(iter_data("/nonexistent/path.csv", chunk_size=10))
+
+    def test_unsupported_format_raises(self):
+        with TemporaryDirectory() as tmpdir:
+            fake = os.path.join(tmpdir, "unsupported.txt")
+            with open(fake, "w") as f:
+                f.write("unsupported content")
+            with pytest.raises(UnsupportedDataFormatError):
+                list(iter_data(fake, chunk_size=10))
@@ -1,10 +1,21 @@
 ### --- Third-party imports --- ###
+import numpy as np
+import pandas as pd
 import pytest
 
 from SQLThunder.exceptions import UnsupportedDatabaseType, UnsupportedDuplicateHandling
 
 ### --- Internal package imports --- ###
-from SQLThunder.utils.insert_helpers import _apply_on_duplicate_clause
+from SQLThunder.utils.insert_helpers import (
+    MAX_BIND_PARAMS,
+    MAX_ROWS_PER_INSERT,
+    _apply_on_duplicate_clause,
+    _build_copy_statements,
+    _build_load_data_statement,
+    _dataframe_to_csv_buffer,
+    _dataframe_to_tsv,
+    _rows_per_insert_statement,
+)
 
 ### --- Test Apply Duplicate Logic --- ###
 
@@ -66,3 +77,109 @@ class TestApplyOnDuplicateClause:
     def test_postgres_ignore_with_conflict_clause_keeps_original(self):
         sql = "INSERT INTO users (id, name) VALUES (:id, :name) ON CONFLICT DO NOTHING"
         assert _apply_on_duplicate_clause(sql, "postgresql", "ignore") == sql
+
+
+### --- Test Build COPY Statements --- ###
+
+
+class TestBuildCopyStatements:
+
+    def test_direct_copy(self):
+        statements = _build_copy_statements("schema.users", ["id", "name"], None)
+        assert statements == [
+            'COPY "schema"."users" ("id", "name") FROM STDIN WITH (FORMAT csv)'
+        ]
+
+    def test_ignore_goes_through_staging_table(self):
+        create_sql, copy_sql, insert_sql = _build_copy_statements(
+            "users", ["id", "name"], "ignore"
+        )
+        assert create_sql.startswith("CREATE TEMPORARY TABLE sqlthunder_copy_staging")
+        assert "ON COMMIT DROP" in create_sql
+        assert copy_sql.startswith('COPY sqlthunder_copy_staging ("id", "name")')
+        assert insert_sql == (
+            'INSERT INTO "users" ("id", "name") SELECT "id", "name" '
+            "FROM sqlthunder_copy_staging ON CONFLICT DO NOTHING"
+        )
+
+    def test_replace_raises(self):
+        with pytest.raises(UnsupportedDuplicateHandling):
+            _build_copy_statements("users", ["id"], "replace")
+
+
+### --- Test DataFrame to CSV Buffer --- ###
+
+
+class TestDataFrameToCSVBuffer:
+
+    def test_nulls_and_quoting(self):
+        df = pd.DataFrame({"name": ["a,b", None], "value": [1.5, np.nan]})
+        assert _dataframe_to_csv_buffer(df).getvalue() == '"a,b",1.5\n,\n'
+
+    def test_empty_and_backslash_n_strings_are_not_null(self):
+        df = pd.DataFrame({"name": ["\\N", "", None, 'say "hi"']})
+        assert _dataframe_to_csv_buffer(df).getvalue() == (
+            '"\\N"\n""\n\n"say ""hi"""\n'
+        )
+
+    def test_whole_floats_written_as_integers(self):
+        df = pd.DataFrame({"id": [1.0, np.nan, 3.0]})
+        assert _dataframe_to_csv_buffer(df).getvalue() == "1\n\n3\n"
+
+
+### --- Test Build LOAD DATA Statement --- ###
+
+
+class TestBuildLoadDataStatement:
+
+    @pytest.mark.parametrize(
+        "on_duplicate,keyword",
+        [(None, ""), ("ignore", "IGNORE "), ("replace", "REPLACE ")],
+    )
+    def test_duplicate_keywords(self, on_duplicate, keyword):
+        sql = _build_load_data_statement("schema.users", ["id", "name"], on_duplicate)
+        assert sql.startswith(
+            f"LOAD DATA LOCAL INFILE %s {keyword}INTO TABLE `schema`.`users` "
+        )
+        assert sql.endswith("(`id`, `name`)")
+
+    def test_unknown_duplicate_mode(self):
+        with pytest.raises(UnsupportedDuplicateHandling):
+            _build_load_data_statement("users", ["id"], "merge")
+
+
+### --- Test DataFrame to TSV --- ###
+
+
+class TestDataFrameToTSV:
+
+    def test_escaping_nulls_and_booleans(self):
+        df = pd.DataFrame(
+            {
+                "name": ["a\tb\\c\nd", None],
+                "flag": [True, False],
+                "id": [1.0, np.nan],
+            }
+        )
+        assert _dataframe_to_tsv(df) == "a\\tb\\\\c\\nd\t1\t1\n\\N\t0\t\\N\n"
+
+
+### --- Test Rows per Insert Statement --- ###
+
+
+class TestRowsPerInsertStatement:
+
+    @pytest.mark.parametrize("db_type", ["mysql", "postgresql", "sqlite"])
+    def test_stays_under_bind_param_limit(self, db_type):
+        rows = _rows_per_insert_statement(db_type, 200)
+        assert rows * 200 <= MAX_BIND_PARAMS[db_type]
+
+    def test_capped_for_narrow_tables(self):
+        assert _rows_per_insert_statement("postgresql", 2) == MAX_ROWS_PER_INSERT
+
+    def test_at_least_one_row(self):
+        assert _rows_per_insert_statement("sqlite", 10**6) == 1
+
+    def test_unsupported_db_type_raises(self):
+        with pytest.raises(UnsupportedDatabaseType):
+            _rows_per_insert_statement("oracle", 3)
@@ -0,0 +1,75 @@
+### --- Standard library imports --- ###
+import subprocess
+import sys
+
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.utils.lazy_imports import _is_dataframe, _LazyModule
+
+### --- Test Lazy Module --- ###
+
+
+class TestLazyModule:
+
+    def test_imports_on_first_attribute_access(self):
+        lazy = _LazyModule("json")
+        assert "not loaded" in repr(lazy)
+        assert lazy.dumps({"a": 1}) == '{"a": 1}'
+        assert "(loaded)" in repr(lazy)
+        # Attributes are copied on the proxy after the first access
+        assert "loads" in vars(lazy)
+
+    def test_missing_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            _LazyModule("json").does_not_exist
+
+    def test_missing_module_raises_on_access(self):
+        lazy = _LazyModule("sqlthunder_no_such_module")
+        with pytest.raises(ImportError):
+            lazy.anything
+
+
+### --- Test Is DataFrame --- ###
+
+
+class TestIsDataFrame:
+
+    def test_dataframe_and_others(self):
+        assert _is_dataframe(pd.DataFrame({"a": [1]}))
+        assert not _is_dataframe([{"a": 1}])
+        assert not _is_dataframe(None)
+
+
+### --- Test Import Time Regressions --- ###
+
+
+class TestLazyPackageImports:
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import SQLThunder",
+            "from SQLThunder import DBClient, DBSession",
+            "import SQLThunder.__main__",
+        ],
+    )
+    def test_heavy_modules_are_not_imported(self, statement):
+        check = (
+            f"{statement}\nimport sys\n"
+            "print(sorted(m for m in ('pandas', 'numpy', 'sqlparse', 'tqdm') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", check], check=True, capture_output=True, text=True
+        ).stdout.strip()
+        assert output == "[]"
+
+    def test_lazy_attributes(self):
+        import SQLThunder
+
+        assert SQLThunder.DBClient.__name__ == "DBClient"
+        assert "TqdmProgress" in dir(SQLThunder)
+        with pytest.raises(AttributeError):
+            SQLThunder.NotAnAttribute
@@ -0,0 +1,163 @@
+### --- Standard library imports --- ###
+import datetime
+
+### --- Third-party imports --- ###
+import pytest
+
+from SQLThunder.exceptions import InvalidSQLOperation
+
+### --- Internal package imports --- ###
+from SQLThunder.utils.partitioning import (
+    _build_key_range_query,
+    _build_null_key_query,
+    _next_key_bound,
+    _plan_key_partitions,
+    _split_key_range,
+)
+
+### --- Test Split Key Range --- ###
+
+
+class TestSplitKeyRange:
+
+    def test_int_range_even_split(self):
+        assert _split_key_range(0, 99, 4) == [(0, 25), (25, 50), (50, 75), (75, 99)]
+
+    def test_int_range_uneven_split_covers_max(self):
+        bounds = _split_key_range(1, 10, 3)
+        assert bounds == [(1, 5), (5, 9), (9, 10)]
+
+    def test_int_range_capped_by_distinct_keys(self):
+        assert _split_key_range(5, 7, 10) == [(5, 6), (6, 7), (7, 7)]
+
+    def test_single_key(self):
+        assert _split_key_range(3, 3, 4) == [(3, 3)]
+
+    def test_ranges_are_contiguous(self):
+        bounds = _split_key_range(-1000, 123_456, 37)
+        assert bounds[0][0] == -1000
+        assert bounds[-1][1] == 123_456
+        for (_, end), (next_start, _) in zip(bounds, bounds[1:]):
+            assert end == next_start
+
+    def test_datetime_range(self):
+        start = datetime.datetime(2024, 1, 1)
+        end = datetime.datetime(2024, 1, 5)
+        bounds = _split_key_range(start, end, 4)
+        assert bounds == [
+            (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2)),
+            (datetime.datetime(2024, 1, 2), datetime.datetime(2024, 1, 3)),
+            (datetime.datetime(2024, 1, 3), datetime.datetime(2024, 1, 4)),
+            (datetime.datetime(2024, 1, 4), datetime.datetime(2024, 1, 5)),
+        ]
+
+    def test_date_range(self):
+        bounds = _split_key_range(
+            datetime.date(2024, 1, 1), datetime.date(2024, 1, 3), 5
+        )
+        assert bounds == [
+            (datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)),
+            (datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)),
+            (datetime.date(2024, 1, 3), datetime.date(2024, 1, 3)),
+        ]
+
+    @pytest.mark.parametrize(
+        "min_key,max_key,num_partitions",
+        [
+            ("a", "z", 2),
+            (1.0, 2.0, 2),
+            (1, datetime.date(2024, 1, 1), 2),
+            (10, 1, 2),
+            (1, 10, 0),
+            (True, True, 1),
+        ],
+    )
+    def test_invalid_ranges_raise(self, min_key, max_key, num_partitions):
+        with pytest.raises(InvalidSQLOperation):
+            _split_key_range(min_key, max_key, num_partitions)
+
+
+### --- Test Build Key Range Query --- ###
+
+
+class TestBuildKeyRangeQuery:
+
+    def test_inner_partition_is_half_open(self):
+        sql = _build_key_range_query(
+            "SELECT * FROM trades;", "id", last_partition=False
+        )
+        assert sql == (
+            "SELECT * FROM (SELECT * FROM trades) AS sqlthunder_partition "
+            "WHERE id >= :partition_start AND id < :partition_end ORDER BY id"
+        )
+
+    def test_last_partition_is_closed(self):
+        sql = _build_key_range_query("SELECT * FROM trades", "id", last_partition=True)
+        assert "id <= :partition_end" in sql
+
+    def test_null_key_query(self):
+        sql = _build_null_key_query("SELECT * FROM trades;", "id")
+        assert sql == (
+            "SELECT * FROM (SELECT * FROM trades) AS sqlthunder_partition "
+            "WHERE id IS NULL"
+        )
+
+
+### --- Test Plan Key Partitions --- ###
+
+
+class TestPlanKeyPartitions:
+
+    def test_no_null_keys(self):
+        assert _plan_key_partitions(0, 99, 100, 100, 50) == [(0, 50), (50, 99)]
+
+    def test_null_partition_comes_first(self):
+        assert _plan_key_partitions(0, 99, 100, 105, 50) == [
+            (None, None),
+            (0, 50),
+            (50, 99),
+        ]
+
+    def test_only_null_keys(self):
+        assert _plan_key_partitions(None, None, 0, 3, 50) == [(None, None)]
+
+    def test_empty_result(self):
+        assert _plan_key_partitions(None, None, 0, 0, 50) == []
+
+
+### --- Test Next Key Bound --- ###
+
+
+class TestNextKeyBound:
+
+    def test_int_fraction_of_span(self):
+        assert _next_key_bound(0, 0, 99, 0.25) == (25, False)
+        assert _next_key_bound(75, 0, 99, 0.25) == (99, True)
+
+    def test_int_at_least_one_key(self):
+        assert _next_key_bound(10, 0, 99, 0.0001) == (11, False)
+
+    def test_date_on_ordinals(self):
+        start = datetime.date(2024, 1, 1)
+        end = datetime.date(2024, 1, 10)
+        assert _next_key_bound(start, start, end, 0.5) == (
+            datetime.date(2024, 1, 6),
+            False,
+        )
+        assert _next_key_bound(datetime.date(2024, 1, 9), start, end, 0.5) == (
+            end,
+            True,
+        )
+
+    def test_datetime_fraction_of_span(self):
+        start = datetime.datetime(2024, 1, 1)
+        end = datetime.datetime(2024, 1, 2)
+        assert _next_key_bound(start, start, end, 0.25) == (
+            datetime.datetime(2024, 1, 1, 6),
+            False,
+        )
+        assert _next_key_bound(start, start, start, 0.25) == (start, True)
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(InvalidSQLOperation):
+            _next_key_bound("a", "a", "z", 0.5)
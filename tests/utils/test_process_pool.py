@@ -0,0 +1,49 @@
+### --- Standard library imports --- ###
+import sys
+
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.utils.process_pool import _make_shard, _shard_to_params
+
+### --- Test Shards --- ###
+
+
+class TestShards:
+
+    def test_records_are_sent_as_is(self):
+        records = [{"a": 1}, {"a": 2}]
+        shard = _make_shard(records)
+        assert shard.payload is records
+        assert len(shard) == 2
+        assert shard.nbytes == 0
+        assert _shard_to_params(shard, None) == records
+
+    def test_dataframe_round_trip_through_arrow(self):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame(
+            {"id": [1, 2, 3], "name": ["a", None, "c"], "price": [1.5, None, 3.0]}
+        ).iloc[1:]
+        shard = _make_shard(df)
+        assert isinstance(shard.payload, bytes)
+        assert len(shard) == 2
+        assert shard.nbytes == len(shard.payload)
+        assert _shard_to_params(shard, None) == [
+            {"id": 2, "name": None, "price": None},
+            {"id": 3, "name": "c", "price": 3.0},
+        ]
+
+    def test_dataframe_without_pyarrow(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        df = pd.DataFrame({"id": [1, 2]})
+        shard = _make_shard(df)
+        assert shard.payload is df
+        assert _shard_to_params(shard, None) == [{"id": 1}, {"id": 2}]
+
+    def test_unserializable_dataframe_falls_back(self):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({"mixed": [1, "a", object()]})
+        shard = _make_shard(df)
+        assert shard.payload is df
@@ -0,0 +1,121 @@
+### --- Standard library imports --- ###
+import datetime
+
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+
+### --- Internal package imports --- ###
+from SQLThunder.utils.result_conversion import (
+    _arrow_to_pandas,
+    _concat_arrow_tables,
+    _concat_dataframes,
+    _require_pyarrow,
+    _rows_to_arrow,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+### --- Test Rows To Arrow --- ###
+
+
+class TestRowsToArrow:
+
+    def test_builds_one_typed_column_per_result_column(self):
+        rows = [(1, "a", 1.5), (2, None, 2.5)]
+        table = _rows_to_arrow(rows, ["id", "name", "value"])
+        assert table.column_names == ["id", "name", "value"]
+        assert table.schema.field("id").type == pa.int64()
+        assert table.schema.field("name").type == pa.string()
+        assert table.column("name").to_pylist() == ["a", None]
+
+    def test_dates_and_timestamps(self):
+        rows = [(datetime.date(2024, 1, 1), datetime.datetime(2024, 1, 1, 12))]
+        table = _rows_to_arrow(rows, ["d", "ts"])
+        assert pa.types.is_date(table.schema.field("d").type)
+        assert pa.types.is_timestamp(table.schema.field("ts").type)
+
+    def test_empty_rows_keep_columns(self):
+        table = _rows_to_arrow([], ["id", "name"])
+        assert table.num_rows == 0
+        assert table.column_names == ["id", "name"]
+
+
+### --- Test Concat Arrow Tables --- ###
+
+
+class TestConcatArrowTables:
+
+    def test_concatenates_in_order(self):
+        tables = [_rows_to_arrow([(1,), (2,)], ["id"]), _rows_to_arrow([(3,)], ["id"])]
+        assert _concat_arrow_tables(tables, ["id"]).column("id").to_pylist() == [
+            1,
+            2,
+            3,
+        ]
+
+    def test_promotes_all_null_batches(self):
+        tables = [
+            _rows_to_arrow([(None,)], ["name"]),
+            _rows_to_arrow([("a",)], ["name"]),
+        ]
+        table = _concat_arrow_tables(tables, ["name"])
+        assert table.schema.field("name").type == pa.string()
+        assert table.column("name").to_pylist() == [None, "a"]
+
+    def test_no_tables_returns_empty_table(self):
+        table = _concat_arrow_tables([], ["id"])
+        assert table.num_rows == 0
+        assert table.column_names == ["id"]
+
+
+### --- Test Arrow To Pandas --- ###
+
+
+class TestArrowToPandas:
+
+    def test_nullable_int_stays_int(self):
+        df = _arrow_to_pandas(_rows_to_arrow([(1,), (None,)], ["id"]))
+        assert isinstance(df["id"].dtype, pd.ArrowDtype)
+        assert df["id"].isna().tolist() == [False, True]
+        assert df["id"].iloc[0] == 1
+
+    def test_require_pyarrow_returns_module(self):
+        assert _require_pyarrow("arrow") is pa
+
+
+### --- Test Concat Dataframes --- ###
+
+
+class TestConcatDataframes:
+
+    def test_concatenates_with_fresh_index(self):
+        frames = [
+            pd.DataFrame({"id": [1, 2]}),
+            pd.DataFrame({"id": [3]}),
+        ]
+        df = _concat_dataframes(frames, ["id"])
+        assert df["id"].tolist() == [1, 2, 3]
+        assert df.index.tolist() == [0, 1, 2]
+        assert frames == []
+
+    def test_all_null_chunk_takes_dtype_of_other_chunks(self):
+        frames = [
+            pd.DataFrame([(1, None)], columns=["id", "v"]),
+            pd.DataFrame([(2, 1.5)], columns=["id", "v"]),
+        ]
+        df = _concat_dataframes(frames, ["id", "v"])
+        assert df["v"].dtype == "float64"
+        assert df["v"].isna().tolist() == [True, False]
+
+    def test_all_null_chunk_in_int_column_gives_float(self):
+        frames = [
+            pd.DataFrame([(None,)], columns=["n"]),
+            pd.DataFrame([(7,)], columns=["n"]),
+        ]
+        assert _concat_dataframes(frames, ["n"])["n"].dtype == "float64"
+
+    def test_no_frames_returns_empty_dataframe(self):
+        df = _concat_dataframes([], ["id", "name"])
+        assert df.empty
+        assert list(df.columns) == ["id", "name"]
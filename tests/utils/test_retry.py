@@ -0,0 +1,117 @@
+### --- Third-party imports --- ###
+import pandas as pd
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import InvalidSQLOperation
+from SQLThunder.utils import retry
+from SQLThunder.utils.retry import (
+    MAX_RETRY_BACKOFF,
+    _backoff_delay,
+    _check_retry_arguments,
+    _execute_with_retry,
+)
+
+### --- Test Execute With Retry --- ###
+
+
+def _deadlock() -> OperationalError:
+    return OperationalError("UPDATE t", {}, Exception(1213, "Deadlock found"))
+
+
+def _duplicate() -> IntegrityError:
+    return IntegrityError("INSERT", {}, Exception("duplicate key value"))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda seconds: None)
+
+
+class TestExecuteWithRetry:
+
+    def test_success_returns_no_failures(self):
+        executed = []
+        assert _execute_with_retry(executed.append, [1, 2, 3]) == []
+        assert executed == [[1, 2, 3]]
+
+    def test_transient_error_is_retried(self):
+        attempts = []
+        reported = []
+
+        def execute(rows):
+            attempts.append(rows)
+            if len(attempts) < 3:
+                raise _deadlock()
+
+        failures = _execute_with_retry(
+            execute, [1, 2], max_retries=3, on_transient_error=reported.append
+        )
+        assert failures == []
+        assert len(attempts) == 3
+        assert len(reported) == 2
+
+    def test_transient_error_outliving_retries_is_not_bisected(self):
+        attempts = []
+
+        def execute(rows):
+            attempts.append(rows)
+            raise _deadlock()
+
+        failures = _execute_with_retry(
+            execute, [1, 2, 3, 4], max_retries=2, bisect=True
+        )
+        assert len(attempts) == 3
+        assert [rows for rows, _ in failures] == [[1, 2, 3, 4]]
+
+    def test_data_error_is_not_retried(self):
+        attempts = []
+
+        def execute(rows):
+            attempts.append(rows)
+            raise _duplicate()
+
+        failures = _execute_with_retry(execute, [1, 2, 3], max_retries=3)
+        assert len(attempts) == 1
+        assert [rows for rows, _ in failures] == [[1, 2, 3]]
+
+    def test_bisection_isolates_bad_rows(self):
+        committed = []
+
+        def execute(rows):
+            if 3 in rows or 6 in rows:
+                raise _duplicate()
+            committed.extend(rows)
+
+        failures = _execute_with_retry(execute, list(range(8)), bisect=True)
+        assert [rows for rows, _ in failures] == [[3], [6]]
+        assert all(isinstance(error, IntegrityError) for _, error in failures)
+        assert sorted(committed) == [0, 1, 2, 4, 5, 7]
+
+    def test_bisection_splits_dataframes(self):
+        df = pd.DataFrame({"id": range(5)})
+
+        def execute(rows):
+            if (rows["id"] == 4).any():
+                raise _duplicate()
+
+        failures = _execute_with_retry(execute, df, bisect=True)
+        assert len(failures) == 1
+        assert failures[0][0]["id"].tolist() == [4]
+
+
+class TestRetryArguments:
+
+    @pytest.mark.parametrize("max_retries", [-1, 1.5, True, "3"])
+    def test_invalid_max_retries(self, max_retries):
+        with pytest.raises(InvalidSQLOperation):
+            _check_retry_arguments(max_retries, 0.5)
+
+    def test_negative_backoff(self):
+        with pytest.raises(InvalidSQLOperation):
+            _check_retry_arguments(3, -1)
+
+    def test_backoff_delay_is_capped(self):
+        assert 0 <= _backoff_delay(2, 0.5) <= 2.0
+        assert _backoff_delay(50, 1.0) <= MAX_RETRY_BACKOFF
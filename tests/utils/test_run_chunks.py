@@ -0,0 +1,139 @@
+### --- Standard library imports --- ###
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+### --- Third-party imports --- ###
+import pytest
+import yaml
+
+### --- Internal package imports --- ###
+from SQLThunder.core.client import DBClient
+
+### --- Fixtures --- ###
+
+
+@pytest.fixture
+def client(tmp_path):
+    """SQLite client, only used for its chunk pipeline (no query is run)."""
+    config_path = tmp_path / "db_config.yaml"
+    config_path.write_text(
+        yaml.dump({"db_type": "sqlite", "path": str(tmp_path / "test.db")})
+    )
+    db_client = DBClient(config_file_path=str(config_path))
+    yield db_client
+    db_client.close()
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=8)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+class _CountingChunks:
+    """Generator of chunks recording how many were pulled ahead of the completed ones."""
+
+    def __init__(self, num_chunks: int) -> None:
+        self.num_chunks = num_chunks
+        self.pulled = 0
+        self.completed = 0
+        self.max_ahead = 0
+        self.lock = threading.Lock()
+
+    def __iter__(self):
+        for chunk_num in range(self.num_chunks):
+            with self.lock:
+                self.pulled += 1
+                self.max_ahead = max(self.max_ahead, self.pulled - self.completed)
+            yield [chunk_num], chunk_num
+
+    def done(self) -> None:
+        with self.lock:
+            self.completed += 1
+
+
+### --- Test Run Chunks --- ###
+
+
+class TestRunChunks:
+
+    @pytest.mark.parametrize("max_in_flight", [1, 3])
+    def test_pulls_at_most_max_in_flight_ahead(self, client, executor, max_in_flight):
+        chunks = _CountingChunks(20)
+
+        def worker(chunk, chunk_num):
+            time.sleep(0.005)
+            chunks.done()
+
+        client._run_chunks(
+            worker,
+            iter(chunks),
+            total=20,
+            executor=executor,
+            max_in_flight=max_in_flight,
+            desc="Test",
+        )
+        assert chunks.completed == 20
+        assert chunks.max_ahead <= max_in_flight
+
+    def test_failing_chunk_does_not_stall(self, client, executor):
+        chunks = _CountingChunks(20)
+        failures = []
+        finished = []
+
+        # Chunk 0 is slow and fails, it is recorded by the worker like in execute_batch
+        def worker(chunk, chunk_num):
+            try:
+                if chunk_num == 0:
+                    time.sleep(0.1)
+                    raise ValueError("bad row")
+                time.sleep(0.005)
+            except ValueError as e:
+                failures.append((chunk_num, str(e)))
+            finally:
+                finished.append(chunk_num)
+                chunks.done()
+
+        client._run_chunks(
+            worker,
+            iter(chunks),
+            total=20,
+            executor=executor,
+            max_in_flight=4,
+            desc="Test",
+        )
+        assert failures == [(0, "bad row")]
+        assert sorted(finished) == list(range(20))
+        # The other chunks went on around the slow failing one
+        assert finished[-1] == 0
+        assert chunks.max_ahead <= 4
+
+    def test_worker_exception_is_raised(self, client, executor):
+        def worker(chunk, chunk_num):
+            if chunk_num == 2:
+                raise RuntimeError("worker crashed")
+
+        with pytest.raises(RuntimeError, match="worker crashed"):
+            client._run_chunks(
+                worker,
+                (([i], i) for i in range(10)),
+                total=10,
+                executor=executor,
+                max_in_flight=2,
+                desc="Test",
+            )
+
+    def test_on_result_gets_each_chunk(self, client, executor):
+        results = []
+        client._run_chunks(
+            lambda chunk, chunk_num: chunk_num * 2,
+            (([i], i) for i in range(5)),
+            total=5,
+            executor=executor,
+            max_in_flight=2,
+            desc="Test",
+            on_result=lambda result, chunk: results.append((result, chunk)),
+        )
+        assert sorted(results) == [(i * 2, [i]) for i in range(5)]
@@ -18,7 +18,13 @@ from SQLThunder.exceptions import (
 ### --- Internal package imports --- ###
 from SQLThunder.utils.sql_conversion import (
     _build_insert_statement,
+    _build_multi_row_insert_statement,
+    _convert_args,
     _convert_dbapi_to_sqlalchemy_style,
+    _convert_placeholders,
+    _dataframe_to_params,
+    _date_only_columns,
+    _flatten_rows_to_params,
     _parse_datetime_key_based_pagination,
     _quote_identifier,
     _validate_args_for_bulk,
@@ -26,6 +32,27 @@ from SQLThunder.utils.sql_conversion import (
     _validate_select_no_limit_offset,
 )
 
+### --- Test Convert Placeholders and Args --- ###
+
+
+class TestConvertPlaceholdersAndArgs:
+
+    def test_placeholders_are_numbered_per_call(self):
+        sql = "SELECT * FROM t WHERE a = ? AND b = %s AND c = %(c)s"
+        expected = "SELECT * FROM t WHERE a = :param1 AND b = :param2 AND c = :c"
+        assert _convert_placeholders(sql) == expected
+        assert _convert_placeholders(sql) == expected
+
+    def test_args_match_converted_placeholders(self):
+        assert _convert_args((1, "x")) == {"param1": 1, "param2": "x"}
+        assert _convert_args([{"a": 1}]) == [{"a": 1}]
+        assert _convert_args(None) is None
+
+    def test_invalid_args_raise(self):
+        with pytest.raises(UnsupportedSQLArgsFormat):
+            _convert_args("bad")
+
+
 ### --- Test Convert DBAPI to SQLAchemy Style --- ###
 
 
@@ -93,6 +120,53 @@ class TestConvertDBAPIToSQLAlchemyStyle:
             )
 
 
+### --- Test DataFrame to Params --- ###
+
+
+class TestDataFrameToParams:
+
+    def test_missing_values_become_none(self):
+        df = pd.DataFrame(
+            {
+                "i": [1, 2],
+                "f": [1.5, float("nan")],
+                "s": ["a", None],
+                "n": pd.array([1, None], dtype="Int64"),
+            }
+        )
+        assert _dataframe_to_params(df) == [
+            {"i": 1, "f": 1.5, "s": "a", "n": 1},
+            {"i": 2, "f": None, "s": None, "n": None},
+        ]
+        assert type(_dataframe_to_params(df)[0]["i"]) is int
+
+    def test_datetime_columns(self):
+        df = pd.DataFrame(
+            {
+                "d": pd.to_datetime(["2024-01-01", None]),
+                "ts": pd.to_datetime(["2024-01-01 01:00", "2024-01-02 00:00"]),
+            }
+        )
+        assert _date_only_columns(df) == {0}
+        assert _dataframe_to_params(df) == [
+            {"d": datetime.date(2024, 1, 1), "ts": datetime.datetime(2024, 1, 1, 1)},
+            {"d": None, "ts": datetime.datetime(2024, 1, 2)},
+        ]
+
+    def test_slice_uses_given_date_only_columns(self):
+        df = pd.DataFrame(
+            {"ts": pd.to_datetime(["2024-01-01 00:00", "2024-01-02 05:00"])}
+        )
+        first = _dataframe_to_params(df.iloc[:1], _date_only_columns(df))
+        assert first == [{"ts": datetime.datetime(2024, 1, 1)}]
+
+    def test_frame_is_not_modified(self):
+        df = pd.DataFrame({"s": ["a", None], "f": [1.0, float("nan")]})
+        expected = df.copy()
+        _dataframe_to_params(df)
+        pd.testing.assert_frame_equal(df, expected)
+
+
 ### --- Test Validate Arguments for Bulk --- ###
 
 
@@ -152,6 +226,31 @@ class TestBuildInsertStatement:
             _build_insert_statement("table", ["x"], "oracle")
 
 
+### --- Test Build Multi-row Insert Statement --- ###
+
+
+class TestBuildMultiRowInsertStatement:
+
+    def test_two_rows_sqlite(self):
+        stmt = _build_multi_row_insert_statement("t", ["a", "b"], "sqlite", 2)
+        assert (
+            stmt == 'INSERT INTO "t" ("a", "b") VALUES (:p0_0, :p0_1), (:p1_0, :p1_1)'
+        )
+
+    def test_schema_qualified_mysql(self):
+        stmt = _build_multi_row_insert_statement("s.t", ["x"], "mysql", 3)
+        assert stmt == "INSERT INTO `s`.`t` (`x`) VALUES (:p0_0), (:p1_0), (:p2_0)"
+
+    def test_flatten_rows_matches_placeholders(self):
+        rows = [{"a": 1, "b": "x"}, {"a": 2, "b": None}]
+        assert _flatten_rows_to_params(rows, ["a", "b"]) == {
+            "p0_0": 1,
+            "p0_1": "x",
+            "p1_0": 2,
+            "p1_1": None,
+        }
+
+
 ### --- Test Parse Dates for Query Key --- ###
 
 
@@ -250,3 +349,61 @@ class TestValidateSelectNoLimitOffset:
     def test_non_select_statements_raise(self, non_select_sql):
         with pytest.raises(QuerySelectOnlyError):
             _validate_select_no_limit_offset(non_select_sql)
+
+
+### --- Test Lexer-based Validation and Strict Mode --- ###
+
+
+class TestValidateSelectLexer:
+
+    @pytest.mark.parametrize(
+        "valid_sql",
+        [
+            "-- report\n/* daily */ SELECT * FROM t",
+            "(SELECT id FROM a) UNION (SELECT id FROM b)",
+            "WITH x AS (SELECT 1 AS n) SELECT n FROM x",
+            "WITH RECURSIVE r(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM r) SELECT n FROM r",
+        ],
+    )
+    def test_select_forms(self, valid_sql):
+        _validate_select(valid_sql)
+
+    @pytest.mark.parametrize(
+        "invalid_sql",
+        [
+            "INSERT INTO t SELECT * FROM s",
+            "WITH x AS (SELECT 1 AS n) DELETE FROM t",
+            "/* SELECT */ DELETE FROM t",
+            "-- SELECT\nUPDATE t SET a = 1",
+        ],
+    )
+    def test_non_select_forms(self, invalid_sql):
+        with pytest.raises(QuerySelectOnlyError):
+            _validate_select(invalid_sql)
+
+    @pytest.mark.parametrize(
+        "valid_sql",
+        [
+            "SELECT 'limit 5' AS a, \"offset\" FROM t",
+            "SELECT * FROM t WHERE a IN (SELECT b FROM u LIMIT 1)",
+            "SELECT * FROM t -- LIMIT 10",
+            "SELECT $$ OFFSET $$ AS a",
+        ],
+    )
+    def test_limit_offset_outside_the_top_level_are_ignored(self, valid_sql):
+        _validate_select_no_limit_offset(valid_sql)
+
+    def test_top_level_limit_after_subquery(self):
+        with pytest.raises(QueryDisallowedClauseError, match="LIMIT"):
+            _validate_select_no_limit_offset("(SELECT a FROM t) LIMIT 5")
+
+    def test_strict_mode_rejects_subquery_limit(self):
+        sql = "SELECT * FROM t WHERE a IN (SELECT b FROM u LIMIT 1)"
+        with pytest.raises(QueryDisallowedClauseError):
+            _validate_select_no_limit_offset(sql, strict=True)
+
+    def test_strict_mode_falls_back_on_huge_statements(self):
+        sql = "SELECT * FROM t WHERE id IN (" + ", ".join(map(str, range(20000))) + ")"
+        _validate_select(sql, strict=True)
+        with pytest.raises(QueryDisallowedClauseError):
+            _validate_select_no_limit_offset(sql + " LIMIT 5", strict=True)
@@ -0,0 +1,112 @@
+### --- Third-party imports --- ###
+import pytest
+from sqlalchemy.sql.elements import TextClause
+
+### --- Internal package imports --- ###
+from SQLThunder.exceptions import (
+    QueryDisallowedClauseError,
+    QuerySelectOnlyError,
+    UnsupportedDuplicateHandling,
+)
+from SQLThunder.utils.statement_cache import (
+    StatementCacheInfo,
+    _prepare_statement,
+    _StatementCache,
+)
+
+### --- Test Prepare Statement --- ###
+
+
+class TestPrepareStatement:
+
+    def test_converts_placeholders_and_builds_clause(self):
+        statement = _prepare_statement(
+            "SELECT * FROM t WHERE a = ? AND b = %s", "mysql"
+        )
+        assert statement.sql == "SELECT * FROM t WHERE a = :param1 AND b = :param2"
+        assert isinstance(statement.clause, TextClause)
+        assert str(statement.clause) == statement.sql
+
+    def test_no_conversion(self):
+        sql = "SELECT * FROM t WHERE name LIKE 'a%s'"
+        assert _prepare_statement(sql, "mysql", convert=False).sql == sql
+
+    def test_on_duplicate_is_applied_after_conversion(self):
+        statement = _prepare_statement(
+            "INSERT INTO t (a) VALUES (%(a)s)", "sqlite", on_duplicate="ignore"
+        )
+        assert statement.sql == "INSERT OR IGNORE INTO t (a) VALUES (:a)"
+
+    def test_validation_errors_propagate(self):
+        with pytest.raises(QuerySelectOnlyError):
+            _prepare_statement("DELETE FROM t", "mysql", validate="select")
+        with pytest.raises(QueryDisallowedClauseError):
+            _prepare_statement(
+                "SELECT * FROM t LIMIT 5", "mysql", validate="select_no_limit_offset"
+            )
+
+    def test_invalid_on_duplicate(self):
+        with pytest.raises(UnsupportedDuplicateHandling):
+            _prepare_statement(
+                "INSERT INTO t VALUES (1)", "mysql", on_duplicate="merge"
+            )
+
+
+### --- Test Statement Cache --- ###
+
+
+class TestStatementCache:
+
+    @staticmethod
+    def prepare(sql):
+        return lambda: _prepare_statement(sql, "postgresql")
+
+    def test_hits_and_misses(self):
+        cache = _StatementCache(maxsize=4)
+        first = cache.get("a", self.prepare("SELECT ?"))
+        second = cache.get("a", self.prepare("SELECT ?"))
+        assert first is second
+        assert cache.info() == StatementCacheInfo(
+            hits=1, misses=1, maxsize=4, currsize=1
+        )
+
+    def test_least_recently_used_is_evicted(self):
+        cache = _StatementCache(maxsize=2)
+        cache.get("a", self.prepare("SELECT 1"))
+        cache.get("b", self.prepare("SELECT 2"))
+        cache.get("a", self.prepare("SELECT 1"))  # "b" is now the oldest
+        cache.get("c", self.prepare("SELECT 3"))
+        assert cache.info().currsize == 2
+        cache.get("a", self.prepare("SELECT 1"))
+        cache.get("b", self.prepare("SELECT 2"))
+        assert cache.info().hits == 2
+        assert cache.info().misses == 4
+
+    def test_errors_are_not_cached(self):
+        cache = _StatementCache()
+
+        def failing():
+            return _prepare_statement("DELETE FROM t", "mysql", validate="select")
+
+        for _ in range(2):
+            with pytest.raises(QuerySelectOnlyError):
+                cache.get("bad", failing)
+        assert cache.info().misses == 2
+        assert cache.info().currsize == 0
+
+    def test_size_zero_disables_cache(self):
+        cache = _StatementCache(maxsize=0)
+        cache.get("a", self.prepare("SELECT 1"))
+        cache.get("a", self.prepare("SELECT 1"))
+        assert cache.info() == StatementCacheInfo(
+            hits=0, misses=2, maxsize=0, currsize=0
+        )
+
+    def test_clear(self):
+        cache = _StatementCache()
+        cache.get("a", self.prepare("SELECT 1"))
+        cache.get("a", self.prepare("SELECT 1"))
+        cache.clear()
+        assert cache.info() == StatementCacheInfo(
+            hits=0, misses=0, maxsize=cache.info().maxsize, currsize=0
+        )
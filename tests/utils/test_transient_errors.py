@@ -0,0 +1,48 @@
+### --- Third-party imports --- ###
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+### --- Internal package imports --- ###
+from SQLThunder.utils.transient_errors import _is_transient_error
+
+### --- Test Is Transient Error --- ###
+
+
+class _PgError(Exception):
+    def __init__(self, message: str, pgcode: str) -> None:
+        super().__init__(message)
+        self.pgcode = pgcode
+
+
+class TestIsTransientError:
+
+    @pytest.mark.parametrize("pgcode", ["40P01", "40001", "55P03", "57014"])
+    def test_postgres_sqlstate(self, pgcode):
+        error = OperationalError("UPDATE t", {}, _PgError("error", pgcode))
+        assert _is_transient_error(error)
+
+    @pytest.mark.parametrize("errno", [1205, 1213, 2006, 2013])
+    def test_mysql_errno(self, errno):
+        error = OperationalError("UPDATE t", {}, Exception(errno, "error"))
+        assert _is_transient_error(error)
+
+    def test_message_fallback(self):
+        error = OperationalError("INSERT", {}, Exception("database is locked"))
+        assert _is_transient_error(error)
+
+    def test_pool_timeout_and_connection_errors(self):
+        assert _is_transient_error(PoolTimeoutError("QueuePool limit reached"))
+        assert _is_transient_error(ConnectionResetError())
+        assert _is_transient_error(TimeoutError())
+
+    def test_data_errors_are_not_transient(self):
+        duplicate = IntegrityError(
+            "INSERT", {}, _PgError("duplicate key value violates unique", "23505")
+        )
+        assert not _is_transient_error(duplicate)
+        mysql_duplicate = IntegrityError(
+            "INSERT", {}, Exception(1062, "Duplicate entry '1'")
+        )
+        assert not _is_transient_error(mysql_duplicate)
+        assert not _is_transient_error(ValueError("invalid literal"))